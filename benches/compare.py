@@ -1,292 +1,356 @@
 #!/usr/bin/env python3
 """
-Benchmark comparison script for Pain vs Python/Rust/C++
+Benchmark comparison script for Pain vs Python/NumPy/Rust/C++
 
 Usage:
-    python compare.py [benchmark_name] [iterations] [warmup]
+    python compare.py [benchmark_name] [iterations] [warmup] [--phases] [--adaptive ...]
 
 Examples:
     python compare.py fibonacci 10 3
     python compare.py all 20 5
+    python compare.py all 20 5 --serial  # one job at a time (default: physical cores - 1, pinned)
+    python compare.py all 20 5 --serial --strict-env --no-aslr  # refuse a noisy machine, fixed layout
     python compare.py all  # Uses defaults: 10 iterations, 3 warmup
+    python compare.py fibonacci 10 3 --phases  # Split startup / compile / execute
+    python compare.py all --adaptive --ci-width 0.02 --budget 30
+    python compare.py compare --baseline main --threshold 0.05
+    python compare.py sum 5 1 --sweep  # Fit time vs n, per-iteration cost, crossover
+    python compare.py fibonacci --backends all  # Pain interpreter vs JIT vs LLVM AOT vs PGO
+    python compare.py fibonacci --counters  # perf stat: cycles, IPC, misses, instructions per call
+    python compare.py matmul --size large  # Phase 2 numerical kernels, GFLOP/s and GB/s
+    python compare.py mlp_forward --sweep  # Phase 3 ML: per-batch latency and samples/s, batch 1..4096
+    python compare.py nbody --workers 1,2,4  # Phase 4 strong/weak scaling of the parallel kernels
+    python compare.py fibonacci --warm --calls 5000  # one resident process: per-call latency, warmup curve
+    python compare.py lsp --lines 100,10000 --edits 20  # pain-lsp request latency on generated files
+    python compare.py frontend --shapes nesting --lines 1000,4000,16000  # check/build lines/s and scaling
+    python compare.py painpkg --packages 100,1000,10000  # resolver/index/install on synthetic registries
+    python compare.py pml --sizes 1K,1M,100M  # pml_load_file vs json/tomllib: load, memory, cold start
+    python compare.py stdlib --functions substring,contains  # ns per call of the documented builtins
+    python compare.py calls --max-depth 1000000  # call/argument/method cost, safe recursion depth, TCO
+    python compare.py fibonacci --profile  # perf / stack-sampler flamegraphs per language under target/
+    python compare.py profile-diff --baseline main  # hot-path shifts between two commits' profiles
 """
 
+import argparse
+import functools
+import json
+import random
+import shlex
+import shutil
+import signal
+import string
 import subprocess
 import sys
 import time
 import os
-import platform
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
 
-BENCHMARKS = {
-    "fibonacci": {"pain_n": 20, "python_n": 20, "rust_n": 20, "cpp_n": 20},
-    "factorial": {"pain_n": 15, "python_n": 15, "rust_n": 15, "cpp_n": 15},
-    "sum": {"pain_n": 10000, "python_n": 10000, "rust_n": 10000, "cpp_n": 10000},
-}
+from harness import (
+    buildcache, call_suite, counters, environment, flamegraph, lsp, pauses, profiler, scheduler, stdlib_suite,
+    warm,
+)
+from harness.manifest import (
+    BENCH_DIR, DEFAULT_MANIFEST, Benchmark, ManifestError, load_manifest, output_matches,
+)
+from harness.buildcache import EXE_EXT
+from harness.documents import FORMATS, Document, generate as generate_document
+from harness.launcher import Usage, launch
+from harness.pain import (
+    COMPILED_BACKENDS, FRONTEND_STAGES, PAIN_BACKENDS, backend_unavailable, build_executable, compiler_binary,
+    frontend_command, jit_compiler_binary, lsp_command, main_return_type, pain_command, painpkg_command, repl_command,
+)
+from harness.history import DEFAULT_HISTORY, History, resolve_commit
+from harness.registry import PROBE_PACKAGE, Registry, generate as generate_registry
+from harness.scaling import (
+    MODELS, crossover, fits_by_language, least_squares, local_exponents, per_unit_cost, power_law,
+)
+from harness.stats import OUTLIER_METHODS, Summary, mann_whitney_greater, percentile, summarize
+from harness.synthetic import SHAPES, Program, generate_program
 
-def run_command(cmd: List[str], input_data: str = None, capture_output: bool = True) -> Tuple[float, str]:
-    """Run command and measure execution time"""
-    start = time.perf_counter()
-    try:
-        result = subprocess.run(
-            cmd,
-            input=input_data,
-            capture_output=capture_output,
-            text=True,
-            check=True,
-            timeout=300,
-            creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" and capture_output else 0
-        )
-        elapsed = time.perf_counter() - start
-        output = result.stdout.strip() if capture_output else ""
-        return elapsed, output
-    except subprocess.TimeoutExpired:
-        return float('inf'), "TIMEOUT"
-    except subprocess.CalledProcessError as e:
-        error_msg = e.stderr.strip() if e.stderr else str(e)
-        return float('inf'), f"ERROR: {error_msg}"
-
-def benchmark_pain(benchmark: str, n: int, iterations: int, warmup: int = 2) -> List[float]:
-    """Benchmark Pain interpreter"""
-    times = []
-    source_file = Path(f"benches/pain/{benchmark}.pain")
-    
-    # Update source file with correct n value
-    if benchmark == "fibonacci":
-        source = f"""
-fn fib(n: int) -> int:
-    if n <= 1:
-        return n
-    return fib(n - 1) + fib(n - 2)
-
-fn main() -> int:
-    return fib({n})
-"""
-    elif benchmark == "factorial":
-        source = f"""
-fn fact(n: int) -> int:
-    if n <= 1:
-        return 1
-    return n * fact(n - 1)
+# When this variable is set, the benchmark programs time their own kernel and
+# report it on stderr as "bench-timing: execute_ns=<int>".
+TIMING_ENV = "PAIN_BENCH_TIMING"
+TIMING_PREFIX = "bench-timing:"
 
-fn main() -> int:
-    return fact({n})
-"""
-    elif benchmark == "sum":
-        source = f"""
-fn sum(n: int) -> int:
-    var result = 0
-    var i = 0
-    var limit = n
-    while i <= limit:
-        result = result + i
-        i = i + 1
-    return result
-
-fn main() -> int:
-    return sum({n})
-"""
-    else:
-        return []
-    
-    source_file.parent.mkdir(parents=True, exist_ok=True)
-    source_file.write_text(source)
+class Sampling(NamedTuple):
+    """How many runs to take per (benchmark, language).
     
-    # Try to use compiled binary first, fallback to cargo run
-    exe_ext = ".exe" if platform.system() == "Windows" else ""
-    exe_path = Path(f"target/release/pain-compiler{exe_ext}")
-    if not exe_path.exists():
-        exe_path = Path(f"target/debug/pain-compiler{exe_ext}")
+    In fixed mode exactly `iterations` runs are taken. In adaptive mode
+    `iterations` is the minimum; sampling stops once the 95% confidence
+    interval of the median is narrower than `ci_width` (relative to the
+    median), or when `max_runs` or the `budget` in seconds is exhausted.
+    """
+    iterations: int
+    warmup: int = 3
+    adaptive: bool = False
+    max_runs: int = 500
+    ci_width: float = 0.02
+    budget: float = 60.0
+    outliers: str = "mad"
+    counters: bool = False  # wrap measured runs in perf stat
+    workers: int = 1  # `${workers}` for programs that run in parallel
+    no_aslr: bool = False  # run under `setarch -R`
+    heartbeats: bool = False  # timestamp the program's "batch" lines (benchmarks with pauses = true)
+
+class Measurement(NamedTuple):
+    """One measured run: wall-clock total plus the in-process kernel time, if reported"""
+    total: float
+    execute: Optional[float] = None
+    counters: Optional[Dict[str, float]] = None
+    usage: Optional[Usage] = None
+    batch_times: Optional[List[float]] = None  # gaps between heartbeat lines (pauses = true)
+
+def parse_timing(stderr: str) -> Optional[float]:
+    """Extract the self-reported kernel time (in seconds) from program stderr"""
+    for line in stderr.splitlines():
+        line = line.strip()
+        if not line.startswith(TIMING_PREFIX):
+            continue
+        for field in line[len(TIMING_PREFIX):].split():
+            key, _, value = field.partition("=")
+            if key == "execute_ns":
+                try:
+                    return int(value) / 1e9
+                except ValueError:
+                    return None
+    return None
+
+def run_command(cmd: List[str], input_data: str = None, check: bool = True,
+                heartbeats: bool = False,
+                status: Optional[int] = None) -> Tuple[float, str, str, Optional[Usage], Optional[List[float]]]:
+    """Run command and measure execution time. Returns (elapsed, stdout, stderr, usage, batch times)
     
-    cmd = [str(exe_path.absolute()), "run", "--input", str(source_file.absolute())] if exe_path.exists() else [
-        "cargo", "run", "--release", "--bin", "pain-compiler", "--",
-        "run", "--input", str(source_file.absolute())
-    ]
+    `usage` is the child's rusage (peak RSS, faults, context switches, CPU
+    time) where the platform provides it. With `check=False` a non-zero exit
+    status is not an error; LLVM-built Pain executables return main's value as
+    their exit code, which `status` (if given) must then equal. A run killed
+    by a signal is always an error. With `heartbeats` the gaps between the
+    program's "batch" lines are returned as batch times (see harness/pauses.py).
+    """
+    env = dict(os.environ)
+    env[TIMING_ENV] = "1"
+    try:
+        result = launch(cmd, input_data, env=env, timeout=300, stamp_lines=heartbeats)
+    except OSError as e:
+        return float('inf'), f"ERROR: {e}", "", None, None
+    if result.timed_out:
+        return float('inf'), "TIMEOUT", "", None, None
+    if result.returncode < 0:
+        try:
+            return float('inf'), f"ERROR: killed by {signal.Signals(-result.returncode).name}", "", None, None
+        except ValueError:
+            return float('inf'), f"ERROR: killed by signal {-result.returncode}", "", None, None
+    if status is not None and result.returncode != status:
+        return float('inf'), f"ERROR: exit status {result.returncode} (expected {status})", "", None, None
+    if check and result.returncode != 0:
+        error_msg = result.stderr.strip() or f"exit status {result.returncode}"
+        return float('inf'), f"ERROR: {error_msg}", "", None, None
+    return (result.elapsed, result.stdout.strip(), result.stderr, result.usage,
+            pauses.batch_durations(result.stdout, result.line_times))
+
+def measure(cmd: List[str], sampling: Sampling, expected: Optional[str] = None,
+            check: bool = True, status: Optional[int] = None) -> List[Measurement]:
+    """Run warmup iterations, then collect successful measurements.
     
-    # Warmup runs
-    for _ in range(warmup):
-        run_command(cmd, capture_output=False)
+    When `expected` (or the exit `status`) is given, runs whose output (or
+    status) does not match are treated as failures so a broken implementation
+    can't post a fast time.
+    """
+    for _ in range(sampling.warmup):
+        run_command(cmd, check=check, status=status)
     
-    # Actual benchmark runs
-    for _ in range(iterations):
-        elapsed, _ = run_command(cmd)
-        if elapsed != float('inf'):
-            times.append(elapsed)
+    measurements = []
+    mismatched = 0
+    limit = sampling.max_runs if sampling.adaptive else sampling.iterations
+    deadline = time.perf_counter() + sampling.budget
+    if sampling.no_aslr:
+        cmd = environment.without_aslr(cmd)
+    perf_output = counters.scratch_file() if sampling.counters else None
+    run_cmd = counters.wrap(cmd, perf_output) if perf_output else cmd
+    for attempt in range(limit):
+        elapsed, output, errors, usage, batch_times = run_command(run_cmd, check=check,
+                                                                  heartbeats=sampling.heartbeats,
+                                                                  status=status)
+        if elapsed == float('inf'):
+            pass
+        elif expected is not None and not output_matches(output, expected):
+            if not mismatched:
+                print(f"\n    Warning: unexpected output {output[-80:]!r} (expected {expected!r})", end="")
+            mismatched += 1
+        else:
+            counts = counters.read_counters(perf_output) if perf_output else None
+            measurements.append(Measurement(elapsed, parse_timing(errors), counts, usage, batch_times))
+        
+        if not sampling.adaptive:
+            continue
+        if not measurements and attempt + 1 >= sampling.iterations:
+            break  # Nothing succeeds; don't burn the budget on errors
+        if len(measurements) >= sampling.iterations:
+            summary = summarize([m.total for m in measurements], sampling.outliers)
+            if summary.ci_width <= sampling.ci_width:
+                break
+        if time.perf_counter() >= deadline:
+            break
     
-    return times
+    if perf_output:
+        perf_output.unlink(missing_ok=True)
+    return measurements
 
-def benchmark_python(benchmark: str, n: int, iterations: int, warmup: int = 2) -> List[float]:
-    """Benchmark Python"""
-    times = []
-    script = Path(f"benches/python/{benchmark}.py")
+class PainBackend:
+    """Runner for one Pain backend.
     
-    if not script.exists():
-        print(f"    Warning: Python script not found at {script}")
-        return []
+    Interpreter and JIT runs go through `pain-compiler run`. The LLVM backends
+    (aot, pgo) compile each (benchmark, n) once; that build time is kept in
+    `build_times` and reported separately instead of being part of the runs.
+    Their runs are checked by exit status where `main` returns an int; the
+    (benchmark, n) pairs that can't be checked are kept in `unvalidated`.
+    """
     
-    cmd = ["python", str(script.absolute()), str(n)]
+    def __init__(self, backend: str):
+        self.backend = backend
+        self.build_times: Dict[Tuple[str, int], float] = {}
+        self.unvalidated: Set[Tuple[str, int]] = set()
+        self._executables: Dict[Tuple[str, int], Optional[Path]] = {}
     
-    # Warmup runs
-    for _ in range(warmup):
-        run_command(cmd, capture_output=False)
+    def __call__(self, bench: Benchmark, n: int, sampling: Sampling) -> List[Measurement]:
+        cmd = self.command(bench, n)
+        if not cmd:
+            return []
+        if self.backend in COMPILED_BACKENDS:
+            # main's value is the exit status, so there is no stdout to validate
+            status = self.expected_status(bench, n)
+            if status is None:
+                self.unvalidated.add((bench.name, n))
+            return measure(cmd, sampling, check=False, status=status)
+        return measure(cmd, sampling, bench.expected_output(n))
     
-    # Actual benchmark runs
-    for _ in range(iterations):
-        elapsed, _ = run_command(cmd)
-        if elapsed != float('inf'):
-            times.append(elapsed)
+    def prepare(self, builds: List[Tuple[Benchmark, int]]) -> None:
+        """Build the JIT compiler or each (benchmark, n) executable before any timed run
+        
+        Scheduled jobs run on worker threads, so they must only look up what
+        was built here; a build inside a job would also load the machine
+        while other jobs are being timed.
+        """
+        if self.backend == "jit":
+            jit_compiler_binary()
+        elif self.backend in COMPILED_BACKENDS:
+            for bench, n in builds:
+                self.command(bench, n)
     
-    return times
+    def expected_status(self, bench: Benchmark, n: int) -> Optional[int]:
+        """Exit status an executable must return: main's int result modulo 256, if known"""
+        expected = bench.expected_output(n)
+        source_file = bench.render_pain(n)
+        if expected is None or source_file is None or main_return_type(source_file) != "int":
+            return None
+        try:
+            return int(expected.strip()) % 256
+        except ValueError:
+            return None
+    
+    def command(self, bench: Benchmark, n: int) -> Optional[List[str]]:
+        """`pain-compiler run` of the rendered program, or its executable (built once, see `prepare`)"""
+        source_file = bench.render_pain(n)
+        if source_file is None:
+            return None
+        
+        if self.backend not in COMPILED_BACKENDS:
+            return pain_command("run", source_file, jit=self.backend == "jit") or None
+        
+        key = (bench.name, n)
+        if key not in self._executables:
+            exe_path, seconds = build_executable(source_file, self.backend, f"{bench.name}-{n}")
+            self._executables[key] = exe_path
+            if exe_path is not None:
+                self.build_times[key] = seconds
+        exe_path = self._executables[key]
+        return [str(exe_path.absolute())] if exe_path is not None else None
 
-def benchmark_rust(benchmark: str, n: int, iterations: int, warmup: int = 2) -> List[float]:
-    """Benchmark Rust"""
-    times = []
-    bin_name = benchmark
-    
-    # Build if needed
-    build_cmd = ["cargo", "build", "--release", "--manifest-path", "benches/rust/Cargo.toml", "--bin", bin_name]
-    result = subprocess.run(
-        build_cmd,
-        capture_output=True,
-        text=True,
-        creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0
-    )
-    if result.returncode != 0:
-        print(f"    Warning: Failed to build Rust benchmark: {result.stderr[:200]}")
+def benchmark_pain_frontend(bench: Benchmark, n: int, sampling: Sampling) -> List[Measurement]:
+    """Time `pain-compiler check` (startup + lex/parse/typecheck, no execution)"""
+    source_file = bench.render_pain(n)
+    if source_file is None:
         return []
     
-    exe_ext = ".exe" if platform.system() == "Windows" else ""
-    # Try multiple possible locations
-    possible_paths = [
-        Path(f"benches/rust/target/release/{bin_name}{exe_ext}"),
-        Path(f"target/release/{bin_name}{exe_ext}"),
-        Path(f"benches/rust/target/release/{bin_name}"),  # Without extension
-    ]
-    
-    exe_path = None
-    for path in possible_paths:
-        if path.exists():
-            exe_path = path
-            break
+    return measure(pain_command("check", source_file), sampling)
+
+def benchmark_python(bench: Benchmark, n: int, sampling: Sampling) -> List[Measurement]:
+    """Benchmark Python"""
+    return run_python_script(bench, "python", n, sampling)
+
+@functools.lru_cache(maxsize=None)
+def python_can_import(module: str) -> bool:
+    """Whether the `python` on PATH can import a module"""
+    try:
+        result = subprocess.run(["python", "-c", f"import {module}"], capture_output=True, timeout=60)
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
+
+def numpy_available() -> bool:
+    """Whether the `python` on PATH can import NumPy"""
+    return python_can_import("numpy")
+
+def benchmark_numpy(bench: Benchmark, n: int, sampling: Sampling) -> List[Measurement]:
+    """Benchmark the NumPy-vectorized Python baseline"""
+    if bench.source("numpy") is None:
+        return []
+    if not numpy_available():
+        print("\n    Warning: NumPy is not installed for `python`; skipping (pip install numpy)", end="")
+        return []
+    return run_python_script(bench, "numpy", n, sampling)
+
+def benchmark_python_mp(bench: Benchmark, n: int, sampling: Sampling) -> List[Measurement]:
+    """Benchmark the multiprocessing (shared memory) Python baseline"""
+    return run_python_script(bench, "python_mp", n, sampling)
+
+def python_script_command(bench: Benchmark, key: str, n: int, workers: int) -> Optional[List[str]]:
+    """`python <script> args...` for a manifest language key, or None without a script"""
+    script = bench.source(key)
+    if script is None:
+        return None
+    if not script.exists():
+        print(f"    Warning: Python script not found at {script}")
+        return None
+    return ["python", str(script.absolute()), *bench.argv(key, n, workers)]
+
+def run_python_script(bench: Benchmark, key: str, n: int, sampling: Sampling) -> List[Measurement]:
+    """Run a benchmark's Python source for a manifest language key under `python`"""
+    cmd = python_script_command(bench, key, n, sampling.workers)
+    if cmd is None:
+        return []
     
+    return measure(cmd, sampling, bench.expected_output(n))
+
+def native_command(bench: Benchmark, key: str, n: int, workers: int) -> Optional[List[str]]:
+    """Command line of the Rust or C++ executable (built through the cache), or None"""
+    source = bench.source(key)
+    if source is None:
+        return None
+    if key == "rust":
+        exe_path = buildcache.build_rust([source.stem])[source.stem]
+    else:
+        exe_path = buildcache.build_cpp(source.stem)
     if exe_path is None:
-        print(f"    Warning: Rust executable not found. Tried: {[str(p) for p in possible_paths]}")
+        return None
+    return [str(exe_path.absolute()), *bench.argv(key, n, workers)]
+
+def benchmark_rust(bench: Benchmark, n: int, sampling: Sampling) -> List[Measurement]:
+    """Benchmark Rust"""
+    cmd = native_command(bench, "rust", n, sampling.workers)
+    if cmd is None:
         return []
     
-    cmd = [str(exe_path.absolute()), str(n)]
-    
-    # Warmup runs
-    for _ in range(warmup):
-        run_command(cmd, capture_output=False)
-    
-    # Actual benchmark runs
-    for _ in range(iterations):
-        elapsed, _ = run_command(cmd)
-        if elapsed != float('inf'):
-            times.append(elapsed)
-    
-    return times
-
-def find_compiler(compilers: List[str]) -> str:
-    """Find available C++ compiler"""
-    for compiler in compilers:
-        try:
-            # Check if compiler exists by trying to get version
-            if compiler == "cl":
-                # MSVC uses different flag
-                result = subprocess.run(
-                    [compiler],
-                    capture_output=True,
-                    timeout=5,
-                    creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0
-                )
-            else:
-                result = subprocess.run(
-                    [compiler, "--version"],
-                    capture_output=True,
-                    timeout=5,
-                    creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0
-                )
-            if result.returncode == 0 or (compiler == "cl" and result.returncode != 9009):
-                return compiler
-        except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
-            continue
-    return None
+    return measure(cmd, sampling, bench.expected_output(n))
 
-def benchmark_cpp(benchmark: str, n: int, iterations: int, warmup: int = 2) -> List[float]:
+def benchmark_cpp(bench: Benchmark, n: int, sampling: Sampling) -> List[Measurement]:
     """Benchmark C++"""
-    times = []
-    exe_ext = ".exe" if platform.system() == "Windows" else ""
-    exe_path = Path(f"benches/cpp/{benchmark}{exe_ext}")
-    
-    # Build if needed
-    if not exe_path.exists():
-        cpp_file = Path(f"benches/cpp/{benchmark}.cpp")
-        if not cpp_file.exists():
-            print(f"    Warning: C++ source file not found at {cpp_file}")
-            return []
-        
-        if platform.system() == "Windows":
-            # On Windows, try to find available compiler
-            compiler = find_compiler(["g++", "clang++", "cl"])
-            if compiler is None:
-                print(f"    Warning: No C++ compiler found (tried g++, clang++, cl). Skipping C++ benchmark.")
-                return []
-            
-            if compiler == "cl":
-                # MSVC compiler
-                compile_cmd = [
-                    compiler, "/O2", "/EHsc", f"/Fe:{exe_path}", str(cpp_file)
-                ]
-            else:
-                # g++ or clang++
-                compile_cmd = [
-                    compiler, "-O3", "-std=c++17", "-o", str(exe_path), str(cpp_file)
-                ]
-            
-            try:
-                result = subprocess.run(
-                    compile_cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=60,
-                    creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0
-                )
-                if result.returncode != 0:
-                    print(f"    Warning: Failed to compile C++ benchmark: {result.stderr[:200] if result.stderr else result.stdout[:200]}")
-                    return []
-            except (FileNotFoundError, subprocess.TimeoutExpired, OSError) as e:
-                print(f"    Warning: Failed to run C++ compiler: {e}")
-                return []
-            
-            if not exe_path.exists():
-                print(f"    Warning: C++ compilation succeeded but executable not found at {exe_path}")
-                return []
-        else:
-            # Unix-like systems: use make
-            make_cmd = ["make", "-C", "benches/cpp", benchmark]
-            result = subprocess.run(make_cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                print(f"    Warning: Failed to build C++ benchmark: {result.stderr[:200]}")
-                return []
-    
-    if exe_path.exists():
-        cmd = [str(exe_path.absolute()), str(n)]
-        
-        # Warmup runs
-        for _ in range(warmup):
-            run_command(cmd, capture_output=False)
-        
-        # Actual benchmark runs
-        for _ in range(iterations):
-            elapsed, _ = run_command(cmd)
-            if elapsed != float('inf'):
-                times.append(elapsed)
-    else:
-        print(f"    Warning: C++ executable not found at {exe_path}")
+    cmd = native_command(bench, "cpp", n, sampling.workers)
+    if cmd is None:
+        return []
     
-    return times
+    return measure(cmd, sampling, bench.expected_output(n))
 
 def format_time(seconds: float) -> str:
     """Format time in appropriate units"""
@@ -299,85 +363,2181 @@ def format_time(seconds: float) -> str:
     else:
         return f"{seconds:.2f} s"
 
-def print_results(benchmark: str, results: Dict[str, List[float]]):
+def mean(values: List[float]) -> float:
+    """Arithmetic mean of a non-empty list"""
+    return sum(values) / len(values)
+
+class Phases(NamedTuple):
+    """Mean wall time of one language split into startup, front end and execution"""
+    startup: float
+    frontend: Optional[float]
+    execute: Optional[float]
+    total: float
+
+def split_phases(measurements: List[Measurement], startup: float, frontend_probe: Optional[float] = None,
+                 has_frontend: bool = True) -> Phases:
+    """Attribute mean wall time to phases.
+    
+    `startup` is the mean wall time of the language's empty program. When the
+    program reported its own kernel time, whatever is left between startup and
+    execution is the front end (parse/compile/import). Otherwise
+    `frontend_probe` (e.g. `pain-compiler check` on the same source) bounds the
+    front end and execution is the remainder.
+    """
+    total = mean([m.total for m in measurements])
+    reported = [m.execute for m in measurements if m.execute is not None]
+    if reported:
+        execute = mean(reported)
+        frontend = max(0.0, total - startup - execute)
+    elif frontend_probe is not None:
+        frontend = max(0.0, frontend_probe - startup)
+        execute = max(0.0, total - startup - frontend)
+    else:
+        frontend = None
+        execute = max(0.0, total - startup)
+    if not has_frontend:
+        frontend = None
+    return Phases(startup, frontend, execute, total)
+
+def print_phase_results(benchmark: str, labels: List[str], phases: Dict[str, Phases]):
+    """Print per-phase breakdown of benchmark results"""
+    print(f"\n{'='*75}")
+    print(f"Benchmark: {benchmark} (phases)")
+    print(f"{'='*75}")
+    print(f"{'Language':<15} {'Startup':<15} {'Compile/Parse':<15} {'Execute':<15} {'Total':<15}")
+    print(f"{'-'*75}")
+    
+    for lang in labels:
+        phase = phases.get(lang)
+        if phase is None:
+            print(f"{lang:<15} {'N/A':<15} {'N/A':<15} {'N/A':<15} {'N/A':<15}")
+            continue
+        
+        frontend = format_time(phase.frontend) if phase.frontend is not None else "-"
+        execute = format_time(phase.execute) if phase.execute is not None else "-"
+        print(f"{lang:<15} {format_time(phase.startup):<15} {frontend:<15} {execute:<15} {format_time(phase.total):<15}")
+
+def describe_sampling(sampling: Sampling) -> str:
+    """Human-readable description of the sampling policy"""
+    if sampling.adaptive:
+        return (f"adaptive: >= {sampling.iterations} runs, CI <= {sampling.ci_width:.1%}, "
+                f"budget {sampling.budget:.0f}s, {sampling.warmup} warmup")
+    return f"{sampling.iterations} iterations, {sampling.warmup} warmup"
+
+def print_results(benchmark: str, labels: List[str], results: Dict[str, List[Measurement]],
+                  outliers: str = "mad"):
     """Print benchmark results"""
-    print(f"\n{'='*60}")
+    width = 100
+    print(f"\n{'='*width}")
     print(f"Benchmark: {benchmark}")
-    print(f"{'='*60}")
-    print(f"{'Language':<15} {'Mean':<15} {'Min':<15} {'Max':<15} {'Speedup':<15}")
-    print(f"{'-'*60}")
+    print(f"{'='*width}")
+    print(f"{'Language':<10} {'Median':<12} {'p90':<12} {'p99':<12} {'Stddev':<12} "
+          f"{'95% CI':<10} {'Runs':<6} {'Outliers':<9} {'Speedup':<10}")
+    print(f"{'-'*width}")
+    
+    summaries: Dict[str, Optional[Summary]] = {
+        lang: summarize([m.total for m in results.get(lang, [])], outliers)
+        for lang in labels
+    }
     
     # Calculate baseline (Python)
-    python_times = results.get("Python", [])
-    if python_times:
-        baseline_mean = sum(python_times) / len(python_times)
-    else:
-        baseline_mean = 1.0
+    python_summary = summaries.get("Python")
+    baseline_median = python_summary.median if python_summary else 1.0
     
-    for lang in ["Pain", "Python", "Rust", "C++"]:
-        times = results.get(lang, [])
-        if not times:
-            print(f"{lang:<15} {'N/A':<15} {'N/A':<15} {'N/A':<15} {'N/A':<15}")
+    for lang, summary in summaries.items():
+        if summary is None:
+            print(f"{lang:<10} {'N/A':<12} {'N/A':<12} {'N/A':<12} {'N/A':<12} "
+                  f"{'N/A':<10} {'0':<6} {'N/A':<9} {'N/A':<10}")
+            continue
+        
+        speedup = baseline_median / summary.median if summary.median > 0 else 0
+        ci = f"±{summary.ci_width / 2:.1%}"
+        runs = summary.count + summary.outliers
+        print(f"{lang:<10} {format_time(summary.median):<12} {format_time(summary.p90):<12} "
+              f"{format_time(summary.p99):<12} {format_time(summary.stddev):<12} "
+              f"{ci:<10} {runs:<6} {summary.outliers:<9} {speedup:.2f}x")
+    print(f"Outlier rejection: {outliers}; statistics exclude rejected runs")
+
+class Row(NamedTuple):
+    """One line of the report: a baseline language or one Pain backend"""
+    label: str
+    language: str
+    runner: Callable[[Benchmark, int, Sampling], List[Measurement]]
+    key: str
+    backend: str
+    ahead_of_time: bool = False  # compiled before the timed runs, so no front-end phase
+
+PAIN_LABELS = {"interpreter": "Pain", "jit": "Pain JIT", "aot": "Pain AOT", "pgo": "Pain PGO"}
+
+# The order here is the order of the report, after the Pain rows.
+BASELINES = [
+    Row("Python", "Python", benchmark_python, "python", "cpython"),
+    Row("Python MP", "Python", benchmark_python_mp, "python_mp", "multiprocessing"),
+    Row("NumPy", "NumPy", benchmark_numpy, "numpy", "numpy"),
+    Row("Rust", "Rust", benchmark_rust, "rust", "release", ahead_of_time=True),
+    Row("C++", "C++", benchmark_cpp, "cpp", "O3", ahead_of_time=True),
+]
+
+def report_rows(backends: List[str]) -> List[Row]:
+    """Pain rows for the requested backends followed by the baselines"""
+    rows = []
+    for backend in backends:
+        reason = backend_unavailable(backend)
+        if reason is not None:
+            print(f"Skipping Pain {backend}: {reason}")
+            continue
+        rows.append(Row(PAIN_LABELS[backend], "Pain", PainBackend(backend), "pain", backend,
+                        ahead_of_time=backend in COMPILED_BACKENDS))
+    return rows + BASELINES
+
+def print_build_times(bench: Benchmark, rows: List[Row], n: int):
+    """Report how long the compiled Pain backends took to build, kept out of the run times"""
+    built = [(row.label, row.runner.build_times[(bench.name, n)]) for row in rows
+             if isinstance(row.runner, PainBackend) and (bench.name, n) in row.runner.build_times]
+    if built:
+        print("Build time (not included above): " +
+              ", ".join(f"{label} {format_time(seconds)}" for label, seconds in built))
+
+def print_unvalidated(bench: Benchmark, rows: List[Row], n: int):
+    """Name the compiled Pain rows whose results could not be checked (main doesn't return an int)"""
+    unchecked = [row.label for row in rows
+                 if isinstance(row.runner, PainBackend) and (bench.name, n) in row.runner.unvalidated]
+    if unchecked:
+        print(f"Unvalidated (main's result is not an exit status): {', '.join(unchecked)}")
+
+def record(history: Optional[History], bench: Benchmark, row: Row, n: int, measurements: List[Measurement],
+           workers: int = 1, schedule: Optional[Dict] = None):
+    """Append one row's raw samples (and per-run counters, if collected) to the history
+    
+    Parallel programs are stored under `<backend>-w<workers>` so runs at
+    different worker counts are never compared with each other. `schedule`
+    notes how many jobs shared the machine and which CPU this one ran on.
+    """
+    if history is None:
+        return
+    backend = f"{row.backend}-w{workers}" if bench.parallel(row.key) else row.backend
+    extra = {}
+    per_run = [m.counters for m in measurements if m.counters]
+    if per_run:
+        extra["counters"] = per_run
+    usage = [m.usage._asdict() for m in measurements if m.usage is not None]
+    if usage:
+        extra["usage"] = usage
+    batch_times = [m.batch_times for m in measurements if m.batch_times]
+    if batch_times:
+        extra["batch_times"] = batch_times
+    if schedule:
+        extra["schedule"] = schedule
+    if isinstance(row.runner, PainBackend) and (bench.name, n) in row.runner.unvalidated:
+        extra["unvalidated"] = True
+    history.append(
+        bench.name, row.language, backend, n,
+        samples=[m.total for m in measurements],
+        execute=[m.execute for m in measurements if m.execute is not None],
+        **extra,
+    )
+
+# (key, column title); ipc and branch_miss_rate are derived per run
+COUNTER_COLUMNS = [
+    ("cycles", "Cycles"),
+    ("instructions", "Instructions"),
+    ("ipc", "IPC"),
+    ("branch_miss_rate", "Br. miss"),
+    ("l1d_misses", "L1d miss"),
+    ("llc_misses", "LLC miss"),
+]
+
+def format_count(value: float) -> str:
+    """Format a large event count with an SI suffix"""
+    for limit, suffix in ((1e9, "G"), (1e6, "M"), (1e3, "k")):
+        if abs(value) >= limit:
+            return f"{value / limit:.2f}{suffix}"
+    return f"{value:.0f}"
+
+def counter_medians(measurements: List[Measurement], outliers: str = "mad") -> Dict[str, float]:
+    """Median of each counter and derived metric, with the same outlier rule as the timings"""
+    per_run = [{**m.counters, **counters.derived(m.counters)} for m in measurements if m.counters]
+    medians = {}
+    for key in {key for run in per_run for key in run}:
+        summary = summarize([run[key] for run in per_run if key in run], outliers)
+        if summary is not None:
+            medians[key] = summary.median
+    return medians
+
+def print_counter_results(bench: Benchmark, labels: List[str], results: Dict[str, List[Measurement]],
+                          ns: Dict[str, int], startup: Dict[str, Dict[str, float]], outliers: str = "mad"):
+    """Print median hardware counters per language, plus instructions per unit of work
+    
+    The per-unit column subtracts the instructions of the same row's empty
+    program first, so interpreter startup isn't spread over the calls of a
+    small input. Without a startup measurement the whole-process count is
+    used and marked with `*`.
+    """
+    width = 100
+    per_unit = f"Instr/{bench.unit}"
+    print(f"\n{'Language':<10} " + " ".join(f"{title:<12}" for _, title in COUNTER_COLUMNS) + f" {per_unit:<12}")
+    print(f"{'-'*width}")
+    for lang in labels:
+        medians = counter_medians(results.get(lang, []), outliers)
+        if not medians:
+            print(f"{lang:<10} {'N/A':<12}")
+            continue
+        cells = []
+        for key, _ in COUNTER_COLUMNS:
+            if key not in medians:
+                cells.append("-")
+            elif key == "ipc":
+                cells.append(f"{medians[key]:.2f}")
+            elif key == "branch_miss_rate":
+                cells.append(f"{medians[key]:.2%}")
+            else:
+                cells.append(format_count(medians[key]))
+        work = bench.work_units(ns[lang]) if lang in ns else 0
+        instructions = medians.get("instructions")
+        baseline = startup.get(lang, {}).get("instructions")
+        if instructions is None or work <= 0:
+            cells.append("-")
+        elif baseline is not None:
+            cells.append(f"{max(0.0, instructions - baseline) / work:.1f}")
+        else:
+            cells.append(f"{instructions / work:.1f}*")
+        print(f"{lang:<10} " + " ".join(f"{cell:<12}" for cell in cells))
+    print(f"perf stat medians per run (whole process, including startup); {per_unit} is net of the "
+          f"empty program's instructions (* = no startup run, whole process)")
+
+def format_bytes(size: float) -> str:
+    """Format a byte count in binary units"""
+    for limit, suffix in ((1 << 30, "GiB"), (1 << 20, "MiB"), (1 << 10, "KiB")):
+        if size >= limit:
+            return f"{size / limit:.1f} {suffix}"
+    return f"{size:.0f} B"
+
+def usage_medians(measurements: List[Measurement], outliers: str = "mad") -> Dict[str, float]:
+    """Median of each rusage field across runs, with the same outlier rule as the timings"""
+    runs = [m.usage for m in measurements if m.usage is not None]
+    if not runs:
+        return {}
+    medians = {}
+    for field in Usage._fields:
+        summary = summarize([float(getattr(u, field)) for u in runs], outliers)
+        if summary is not None:
+            medians[field] = summary.median
+    return medians
+
+def kernel_time(measurements: List[Measurement], outliers: str = "mad") -> Tuple[Optional[float], bool]:
+    """Median self-reported kernel time, else median wall time; returns (seconds, is_kernel_time)"""
+    # Whole-process time includes startup and setup, so it understates throughput
+    reported = [m.execute for m in measurements if m.execute is not None]
+    summary = summarize(reported or [m.total for m in measurements], outliers)
+    return (summary.median if summary else None), bool(reported)
+
+def print_throughput_results(bench: Benchmark, labels: List[str], results: Dict[str, List[Measurement]],
+                             ns: Dict[str, int], outliers: str = "mad"):
+    """Print work units/s, GFLOP/s and GB/s from the manifest's counts and the median kernel time
+    
+    Benchmarks that declare `batches` also get the latency of one batch.
+    """
+    width = 105 if bench.batches else 90
+    rate = f"{bench.unit}s/s"
+    latency = f" {'Per batch':<14}" if bench.batches else ""
+    print(f"\n{'Language':<10} {'n':<10} {'Kernel':<14} {rate:<16} {'GFLOP/s':<10} {'GB/s':<10} "
+          f"{'Per ' + bench.unit:<14}{latency}")
+    print(f"{'-'*width}")
+    wall_only = False
+    for lang in labels:
+        measurements = results.get(lang, [])
+        if not measurements or lang not in ns:
+            print(f"{lang:<10} {'N/A':<10}")
+            continue
+        n = ns[lang]
+        seconds, reported = kernel_time(measurements, outliers)
+        if seconds is None:
+            print(f"{lang:<10} {'N/A':<10}")
+            continue
+        marker = "" if reported else "*"
+        wall_only = wall_only or not reported
+        flops = bench.flop_count(n)
+        moved = bench.byte_count(n)
+        work = bench.work_units(n)
+        units = format_count(work / seconds) if work > 0 and seconds > 0 else "-"
+        gflops = f"{flops / seconds / 1e9:.3f}" if flops and seconds > 0 else "-"
+        gbytes = f"{moved / seconds / 1e9:.3f}" if moved and seconds > 0 else "-"
+        per_unit = format_time(seconds / work) if work > 0 else "-"
+        batches = bench.batch_count(n)
+        per_batch = f" {format_time(seconds / batches):<14}" if batches else ""
+        print(f"{lang:<10} {n:<10} {format_time(seconds) + marker:<14} {units:<16} {gflops:<10} {gbytes:<10} "
+              f"{per_unit:<14}{per_batch}")
+    note = "; * = whole-process time (no kernel timer)" if wall_only else ""
+    print(f"Throughput from the median kernel time; bytes are compulsory traffic{note}")
+
+def print_usage_results(labels: List[str], results: Dict[str, List[Measurement]], outliers: str = "mad"):
+    """Print median peak RSS, page faults, context switches and CPU time per language"""
+    medians = {lang: usage_medians(results.get(lang, []), outliers) for lang in labels}
+    if not any(medians.values()):
+        return
+    width = 100
+    print(f"\n{'Language':<10} {'Max RSS':<12} {'Minor flt':<10} {'Major flt':<10} {'Vol. cs':<9} "
+          f"{'Invol. cs':<10} {'User':<12} {'System':<12} {'CPU/wall':<8}")
+    print(f"{'-'*width}")
+    for lang in labels:
+        usage = medians[lang]
+        if not usage:
+            print(f"{lang:<10} {'N/A':<12}")
+            continue
+        wall = summarize([m.total for m in results[lang]], outliers)
+        cpu = usage["user"] + usage["system"]
+        ratio = f"{cpu / wall.median:.2f}" if wall and wall.median > 0 else "-"
+        if usage["max_rss"] > usage["rss_floor"]:
+            rss = format_bytes(usage["max_rss"])
+        else:
+            rss = f"<= {format_bytes(usage['rss_floor'])}"
+        print(f"{lang:<10} {rss:<12} {usage['minor_faults']:<10.0f} "
+              f"{usage['major_faults']:<10.0f} {usage['voluntary_switches']:<9.0f} "
+              f"{usage['involuntary_switches']:<10.0f} {format_time(usage['user']):<12} "
+              f"{format_time(usage['system']):<12} {ratio:<8}")
+    print("rusage medians per run. Max RSS covers the process tree (perf too with --counters); "
+          "'<=' means below the harness's own peak, which Linux passes on to children")
+
+def print_pause_results(labels: List[str], results: Dict[str, List[Measurement]]):
+    """Print the batch-latency distribution and pause estimates per language"""
+    width = 100
+    print(f"\n{'Language':<10} {'Batches':<9} {'Median':<12} {'p99':<12} {'Max':<12} "
+          f"{'p99 pause':<12} {'Max pause':<12} {'Stalls/run':<10}")
+    print(f"{'-'*width}")
+    buffered = []
+    for lang in labels:
+        summary = pauses.summarize_batches([m.batch_times for m in results.get(lang, []) if m.batch_times])
+        if summary is None:
+            print(f"{lang:<10} {'N/A':<9}")
+            continue
+        if summary.buffered:
+            buffered.append(lang)
+            print(f"{lang:<10} {summary.batches:<9} {'buffered':<12}")
+            continue
+        print(f"{lang:<10} {summary.batches:<9} {format_time(summary.median):<12} {format_time(summary.p99):<12} "
+              f"{format_time(summary.max):<12} {format_time(summary.p99_pause):<12} "
+              f"{format_time(summary.max_pause):<12} {summary.stalls:<10.1f}")
+    print(f"Batch latency from heartbeat arrival times over all runs; pause = batch time above the median "
+          f"batch; stall = over {pauses.STALL_FACTOR:g}x the median")
+    if buffered:
+        print(f"{', '.join(buffered)}: heartbeats arrived in bursts (stdout is buffered), so batch times are unknown")
+
+def measure_startup(empty: Benchmark, rows: List[Row],
+                    sampling: Sampling) -> Tuple[Dict[str, float], Dict[str, Dict[str, float]]]:
+    """Mean wall time of each row's empty program, and its median counters (with --counters)"""
+    print(f"\nMeasuring startup baselines ({describe_sampling(sampling)})...")
+    startup = {}
+    startup_counters = {}
+    for row in rows:
+        n = empty.n_for(None, row.key)
+        if n is None:
+            continue
+        print(f"  Running empty {row.label} program...", end="", flush=True)
+        measurements = row.runner(empty, n, sampling)
+        print(f" Done ({len(measurements)} successful runs)")
+        if measurements:
+            startup[row.label] = mean([m.total for m in measurements])
+            startup_counters[row.label] = counter_medians(measurements, sampling.outliers)
+    return startup, startup_counters
+
+def run_scheduled(benches: List[Tuple[Benchmark, str]], rows: List[Row], sampling: Sampling, jobs: int,
+                  seed: int, history: Optional[History]) -> Dict[Tuple[str, str], Tuple[int, List[Measurement]]]:
+    """Measure every (benchmark, row) at its size class through the scheduler
+    
+    Returns {(benchmark name, row label): (n, measurements)}. Up to `jobs`
+    run at once, each pinned to its own core; the order is shuffled from
+    `seed` and interleaved across rows. Parallel programs run alone at the end.
+    """
+    work = []
+    for bench, size in benches:
+        for row in rows:
+            n = bench.n_for(size, row.key)
+            if n is None:
+                continue
+            if row.key == "pain":
+                bench.render_pain(n)  # Pain rows share one rendered file; write it before any job reads it
+            work.append(scheduler.Job((bench, row, n), row.label, exclusive=bench.parallel(row.key)))
+    
+    cpus = scheduler.pick_cpus(jobs) if scheduler.HAS_AFFINITY else []
+    placement = f"pinned to CPU {', '.join(map(str, cpus))}" if cpus else "unpinned"
+    mode = "serially" if len(cpus) <= 1 else f"{len(cpus)} at a time"
+    print(f"\nRunning {len(work)} jobs {mode}, {placement}, order seed {seed} ({describe_sampling(sampling)})...",
+          end="")
+    
+    def run(job: scheduler.Job) -> List[Measurement]:
+        bench, row, n = job.key
+        return row.runner(bench, n, sampling._replace(heartbeats=bench.pauses))
+    
+    results = {}
+    for done in scheduler.run_jobs(work, run, jobs, seed):
+        bench, row, n = done.job.key
+        threads = f", workers={sampling.workers}" if done.job.exclusive else ""
+        where = f", CPU {done.cpu}" if done.cpu is not None else ""
+        # Runners print warnings as "\n    Warning: ...", so every progress line starts with a newline too
+        print(f"\n  [{done.index}/{len(work)}] {bench.name} {row.label} (n={n}{threads}{where}): "
+              f"{len(done.result)} successful runs", end="", flush=True)
+        results[(bench.name, row.label)] = (n, done.result)
+        record(history, bench, row, n, done.result, sampling.workers,
+               schedule={"jobs": len(cpus) or jobs, "cpu": done.cpu, "seed": seed})
+    print()
+    return results
+
+def run_sweep(bench: Benchmark, rows: List[Row], sampling: Sampling,
+              history: Optional[History]) -> Tuple[Dict[str, Dict[int, float]], Dict[str, Dict[int, float]]]:
+    """Run a benchmark over its geometric size series
+    
+    Returns ({row label: {n: median wall time}}, {row label: {n: median kernel time}});
+    the kernel time falls back to wall time for programs without a timer.
+    """
+    points: Dict[str, Dict[int, float]] = {}
+    kernels: Dict[str, Dict[int, float]] = {}
+    print(f"\nSweeping {bench.name} ({describe_sampling(sampling)})...")
+    for row in rows:
+        values = bench.sweep_values(row.key)
+        if bench.source(row.key) is None or not values:
+            continue
+        print(f"  Running {row.label} (n={values[0]}..{values[-1]}, {len(values)} sizes)...", end="", flush=True)
+        for n in values:
+            measurements = row.runner(bench, n, sampling._replace(heartbeats=bench.pauses))
+            record(history, bench, row, n, measurements, sampling.workers)
+            summary = summarize([m.total for m in measurements], sampling.outliers)
+            if summary is None:
+                print(f" failed at n={n};", end="")
+                break
+            points.setdefault(row.label, {})[n] = summary.median
+            kernels.setdefault(row.label, {})[n] = kernel_time(measurements, sampling.outliers)[0]
+        print(" Done")
+    return points, kernels
+
+def print_sweep_results(bench: Benchmark, rows: List[Row], points: Dict[str, Dict[int, float]]):
+    """Print the sweep table, fitted models, per-unit cost and the Pain/Python crossovers"""
+    langs = [row.label for row in rows if row.label in points]
+    width = 12 + 14 * len(langs)
+    print(f"\n{'='*width}")
+    print(f"Benchmark: {bench.name} (sweep, median wall time)")
+    print(f"{'='*width}")
+    print(f"{'n':<12}" + "".join(f"{lang:<14}" for lang in langs))
+    print(f"{'-'*width}")
+    for n in sorted({n for by_n in points.values() for n in by_n}):
+        cells = [format_time(points[lang][n]) if n in points[lang] else "-" for lang in langs]
+        print(f"{n:<12}" + "".join(f"{cell:<14}" for cell in cells))
+    
+    fits = fits_by_language(points, bench.models or MODELS)
+    work_fits = {}
+    print(f"\n{'Language':<10} {'Model':<22} {'R^2':<8} {'Intercept':<14} {'Per ' + bench.unit:<16} {'R^2 (work)':<10}")
+    print(f"{'-'*82}")
+    for lang in langs:
+        by_n = points[lang]
+        if lang not in fits:
+            print(f"{lang:<10} {'(need >= 3 sizes)':<22}")
+            continue
+        ns = sorted(by_n)
+        work_fit = per_unit_cost(ns, [by_n[n] for n in ns], bench.work_units)
+        work_fits[lang] = work_fit
+        fit = fits[lang]
+        per_unit = format_time(work_fit.per_unit) if work_fit.per_unit > 0 else "below noise"
+        print(f"{lang:<10} {fit.describe():<22} {fit.r2:<8.4f} {format_time(max(0.0, work_fit.intercept)):<14} "
+              f"{per_unit:<16} {work_fit.r2:<10.4f}")
+    print(f"Intercept = size-independent cost (startup, parsing); per-{bench.unit} cost from t = a + b * work(n)")
+    
+    if "Python" not in work_fits:
+        return
+    for row in rows:
+        if row.language != "Pain" or row.label not in work_fits:
+            continue
+        label = row.label
+        measured = sorted(set(points[label]) | set(points["Python"]))
+        lo, hi = measured[0], measured[-1] * 10
+        n = crossover(work_fits[label].predict, work_fits["Python"].predict, lo, hi)
+        if n is None:
+            print(f"Crossover: {label} does not overtake CPython for n <= {hi}")
+        elif n == lo:
+            print(f"Crossover: {label} is already faster than CPython at n = {lo}")
+        else:
+            note = "" if n <= measured[-1] else " (extrapolated)"
+            print(f"Crossover: {label} overtakes CPython from n = {n}{note}")
+
+def print_batch_results(bench: Benchmark, rows: List[Row], kernels: Dict[str, Dict[int, float]]):
+    """Per-batch latency and samples/s at every swept batch size"""
+    langs = [row.label for row in rows if row.label in kernels]
+    width = 12 + 24 * len(langs)
+    print(f"\n{'='*width}")
+    print(f"Benchmark: {bench.name} (per-batch latency / {bench.unit}s per second, kernel time)")
+    print(f"{'='*width}")
+    print(f"{'Batch':<12}" + "".join(f"{lang:<24}" for lang in langs))
+    print(f"{'-'*width}")
+    for n in sorted({n for by_n in kernels.values() for n in by_n}):
+        cells = []
+        for lang in langs:
+            seconds = kernels[lang].get(n)
+            if not seconds:
+                cells.append("-")
+                continue
+            latency = format_time(seconds / bench.batch_count(n))
+            cells.append(f"{latency} / {format_count(bench.work_units(n) / seconds)}")
+        print(f"{n:<12}" + "".join(f"{cell:<24}" for cell in cells))
+    print("Latency matters for serving one request at a time (batch 1); throughput for offline batches")
+
+class WarmResult(NamedTuple):
+    """Per-call latencies of one resident process"""
+    latencies: List[float]
+    timing: str  # what a latency covers: "kernel", "call" or "round trip"
+    floor: Optional[float] = None  # REPL round trip of a bare literal
+
+def warm_pain(bench: Benchmark, n: int, backend: str, calls: int, budget: float) -> Optional[WarmResult]:
+    """Load the program into one `pain-compiler repl` and time `main()` over and over"""
+    source_file = bench.render_pain(n)
+    cmd = repl_command(jit=backend == "jit")
+    if source_file is None or not cmd:
+        return None
+    try:
+        session = warm.Session(cmd)
+    except OSError as e:
+        print(f"\n    Warning: could not start the Pain REPL: {e}", end="")
+        return None
+    try:
+        if not warm.load_program(session, source_file.read_text()):
+            print(f"\n    Warning: the REPL did not load the program: {session.errors()[-200:]}", end="")
+            return None
+        floor = []
+        for _ in range(50):
+            seconds, value = session.call("0")
+            if value is None:
+                break
+            floor.append(seconds)
+        expected = bench.expected_output(n)
+        latencies = []
+        deadline = time.perf_counter() + budget
+        for _ in range(calls):
+            seconds, value = session.call("main()")
+            if value is None:
+                print(f"\n    Warning: the REPL stopped answering: {session.errors()[-200:]}", end="")
+                break
+            if not latencies and expected is not None and not output_matches(value, expected):
+                print(f"\n    Warning: unexpected output {value[-80:]!r} (expected {expected!r})", end="")
+                return None
+            latencies.append(seconds)
+            if time.perf_counter() >= deadline:
+                break
+    finally:
+        session.close()
+    if not latencies:
+        return None
+    return WarmResult(latencies, "round trip", mean(floor) if floor else None)
+
+def warm_python(bench: Benchmark, key: str, n: int, calls: int, budget: float,
+                workers: int = 1) -> Optional[WarmResult]:
+    """Call the script's main() in one Python process (harness/timeit_loop.py)"""
+    script = bench.source(key)
+    if script is None or not script.exists():
+        return None
+    cmd = ["python", str(warm.TIMEIT_LOOP.absolute()), str(script.absolute()), str(calls), str(budget),
+           *bench.argv(key, n, workers)]
+    result = launch(cmd, timeout=budget + 300)
+    if result.timed_out or result.returncode != 0:
+        message = "timed out" if result.timed_out else result.stderr.strip()[-200:]
+        print(f"\n    Warning: in-process loop failed: {message}", end="")
+        return None
+    try:
+        report = json.loads(result.stdout.strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        print("\n    Warning: in-process loop printed no report", end="")
+        return None
+    expected = bench.expected_output(n)
+    if expected is not None and not output_matches(report["output"], expected):
+        print(f"\n    Warning: unexpected output {report['output'][-80:]!r} (expected {expected!r})", end="")
+        return None
+    kernel = report["kernel_ns"]
+    if kernel and all(k is not None for k in kernel):
+        return WarmResult([k / 1e9 for k in kernel], "kernel")
+    return WarmResult([w / 1e9 for w in report["wall_ns"]], "call")
+
+def run_warm(bench: Benchmark, rows: List[Row], size: str, calls: int, sampling: Sampling,
+             history: Optional[History]) -> Dict[str, WarmResult]:
+    """Warm mode for every row that can keep a process resident (Pain REPL, Python, NumPy)"""
+    results: Dict[str, WarmResult] = {}
+    print(f"\nWarm run of {bench.name} [{size}] (up to {calls} calls or {sampling.budget:.0f}s per language)...")
+    for row in rows:
+        n = bench.n_for(size, row.key)
+        if n is None:
+            continue
+        if row.language == "Pain" and row.ahead_of_time:
+            print(f"  Skipping {row.label}: native executables have no REPL")
+            continue
+        if row.key not in ("pain", "python", "numpy"):
+            continue
+        if row.key == "numpy" and not numpy_available():
+            continue
+        print(f"  Running {row.label} (n={n})...", end="", flush=True)
+        if row.key == "pain":
+            result = warm_pain(bench, n, row.backend, calls, sampling.budget)
+        else:
+            result = warm_python(bench, row.key, n, calls, sampling.budget, sampling.workers)
+        if result is None:
+            print(" Failed")
+            continue
+        print(f" Done ({len(result.latencies)} calls)")
+        results[row.label] = result
+        summary = warm.summarize_curve(result.latencies)
+        if history is not None and summary is not None:
+            steady = result.latencies[-max(4, len(result.latencies) // 4):]
+            history.append(bench.name, row.language, f"{row.backend}-warm", n, samples=steady)
+    return results
+
+def print_warm_results(bench: Benchmark, results: Dict[str, WarmResult]):
+    """Print first-call vs steady-state latency, the warmup length and each warmup curve"""
+    if not results:
+        return
+    width = 110
+    print(f"\n{'='*width}")
+    print(f"Benchmark: {bench.name} (warm, one process per language)")
+    print(f"{'='*width}")
+    print(f"{'Language':<10} {'Calls':<7} {'Timing':<11} {'First call':<12} {'Steady':<12} {'p99':<12} "
+          f"{'Warm after':<11} {'Warmup cost':<12} {'Floor':<12}")
+    print(f"{'-'*width}")
+    summaries = {}
+    for lang, result in results.items():
+        summary = warm.summarize_curve(result.latencies)
+        if summary is None:
+            print(f"{lang:<10} {len(result.latencies):<7} (need >= 8 calls)")
+            continue
+        summaries[lang] = summary
+        warm_after = f"{summary.warm_after} calls" if summary.warm_after is not None else "not flat"
+        floor = format_time(result.floor) if result.floor is not None else "-"
+        print(f"{lang:<10} {summary.calls:<7} {result.timing:<11} {format_time(summary.first):<12} "
+              f"{format_time(summary.steady):<12} {format_time(summary.p99):<12} {warm_after:<11} "
+              f"{format_time(summary.excess):<12} {floor:<12}")
+    print("Steady = median of the last quarter of calls; warm after = rolling median stays within 5% "
+          "(or the noise) of it;")
+    print("Floor = REPL round trip of a bare literal, included in every Pain latency")
+    
+    for lang, summary in summaries.items():
+        result = results[lang]
+        print(f"\n{lang} warmup curve (median per range of calls, relative to steady state):")
+        for first, last, median in warm.curve_buckets(result.latencies):
+            ratio = median / summary.steady if summary.steady > 0 else 0.0
+            calls = f"{first}" if first == last else f"{first}-{last}"
+            bar = "#" * max(1, min(50, round(ratio * 10)))
+            print(f"  {calls:<12} {format_time(median):<12} {ratio:>6.2f}x {bar}")
+        path = warm.write_series(bench.name, lang, result.latencies)
+        print(f"  Per-call series: {path}")
+
+def row_command(row: Row, bench: Benchmark, n: int, workers: int) -> Optional[List[str]]:
+    """The command a row's runner measures, or None if the row can't run this benchmark"""
+    if isinstance(row.runner, PainBackend):
+        return row.runner.command(bench, n)
+    if row.key in ("rust", "cpp"):
+        return native_command(bench, row.key, n, workers)
+    if row.key == "numpy" and (bench.source("numpy") is None or not numpy_available()):
+        return None
+    return python_script_command(bench, row.key, n, workers)
+
+class Profile(NamedTuple):
+    """One row's sampled profile and where it was written"""
+    samples: int
+    hottest: List[Tuple[str, float]]  # (function, self share), hottest first
+    folded: Path
+    svg: Path
+
+def run_profile(bench: Benchmark, rows: List[Row], size: str, sampling: Sampling,
+                commit: str) -> Dict[str, Profile]:
+    """One profiled run per row: perf record for native processes, the stack sampler for Python"""
+    results: Dict[str, Profile] = {}
+    print(f"\nProfiling {bench.name} [{size}]...")
+    for row in rows:
+        n = bench.n_for(size, row.key)
+        if n is None:
+            continue
+        native = row.language not in ("Python", "NumPy")
+        if native and profiler.perf_unavailable():
+            continue
+        cmd = row_command(row, bench, n, sampling.workers)
+        if cmd is None:
+            continue
+        out_dir = profiler.profile_dir(commit, bench.name, n)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        stem = profiler.profile_name(row.language, row.backend)
+        folded = out_dir / f"{stem}.folded"
+        data = out_dir / f"{stem}.data"
+        folded.unlink(missing_ok=True)
+        print(f"  Running {row.label} (n={n})...", end="", flush=True)
+        
+        profiled = profiler.perf_command(cmd, data) if native else profiler.python_command(cmd, folded)
+        # perf record may not pass the exit status through; the output is checked instead
+        elapsed, output, _, _, _ = run_command(profiled, check=False)
+        expected = None if row.ahead_of_time and row.language == "Pain" else bench.expected_output(n)
+        if elapsed == float('inf'):
+            print(f" Failed ({output[:80]})")
+            data.unlink(missing_ok=True)
+            continue
+        if expected is not None and not output_matches(output, expected):
+            print(f" Failed (unexpected output {output[-80:]!r})")
+            data.unlink(missing_ok=True)
+            continue
+        
+        if native:
+            stacks = profiler.read_perf(data)
+            if stacks:
+                flamegraph.write_folded(folded, stacks)
+        else:
+            stacks = flamegraph.read_folded(folded) if folded.exists() else None
+        if not stacks:
+            print(" No samples")
             continue
+        samples = sum(stacks.values())
+        svg = folded.with_suffix(".svg")
+        svg.write_text(flamegraph.render(stacks, f"{bench.name} n={n}: {row.label}",
+                                         f"{commit}, {samples} samples"))
+        hottest = sorted(flamegraph.self_shares(stacks).items(), key=lambda item: item[1], reverse=True)
+        results[row.label] = Profile(samples, hottest[:5], folded, svg)
+        print(f" Done ({samples} samples)")
+    return results
+
+def print_profile_results(bench: Benchmark, results: Dict[str, Profile]):
+    """Print each row's hottest functions by self time and the flamegraph paths"""
+    if not results:
+        return
+    width = 100
+    print(f"\n{'='*width}")
+    print(f"Benchmark: {bench.name} (hottest functions by self samples)")
+    print(f"{'='*width}")
+    print(f"{'Language':<10} {'Samples':<9} {'Self':<8} {'Function':<70}")
+    print(f"{'-'*width}")
+    for lang, result in results.items():
+        for i, (function, share) in enumerate(result.hottest):
+            label, samples = (lang, str(result.samples)) if i == 0 else ("", "")
+            print(f"{label:<10} {samples:<9} {share:<8.1%} {function[:70]:<70}")
+    print()
+    for lang, result in results.items():
+        print(f"{lang}: {result.svg} (folded: {result.folded.name})")
+
+class ScalingPoint(NamedTuple):
+    """Median kernel time of one row at one worker count"""
+    workers: int
+    n: int
+    seconds: float
+
+def run_scaling(bench: Benchmark, rows: List[Row], sampling: Sampling, size: str, worker_counts: List[int],
+                history: Optional[History]) -> Dict[str, Dict[str, List[ScalingPoint]]]:
+    """Run the parallel rows at each worker count; returns {row label: {"strong"/"weak": points}}
+    
+    Strong scaling keeps n fixed at the size class; weak scaling grows it with
+    the benchmark's `weak` expression so the work per worker stays constant.
+    """
+    curves: Dict[str, Dict[str, List[ScalingPoint]]] = {}
+    print(f"\nScaling {bench.name} [{size}] over {', '.join(map(str, worker_counts))} workers "
+          f"({describe_sampling(sampling)})...")
+    for row in rows:
+        n = bench.n_for(size, row.key)
+        if n is None or not bench.parallel(row.key):
+            continue
+        for mode in ("strong", "weak") if bench.weak else ("strong",):
+            print(f"  Running {row.label} ({mode})...", end="", flush=True)
+            done = {point.workers: point for point in curves.get(row.label, {}).get("strong", [])}
+            for workers in worker_counts:
+                n_w = n if mode == "strong" else bench.weak_n(n, workers)
+                if n_w == n and workers in done:
+                    point = done[workers]  # weak scaling at 1 worker is the strong-scaling run
+                else:
+                    measurements = row.runner(bench, n_w, sampling._replace(workers=workers))
+                    record(history, bench, row, n_w, measurements, workers)
+                    seconds, _ = kernel_time(measurements, sampling.outliers)
+                    if seconds is None:
+                        print(f" failed at {workers} workers;", end="")
+                        break
+                    point = ScalingPoint(workers, n_w, seconds)
+                curves.setdefault(row.label, {}).setdefault(mode, []).append(point)
+            print(" Done")
+    return curves
+
+def print_scaling_results(bench: Benchmark, curves: Dict[str, Dict[str, List[ScalingPoint]]]):
+    """Print strong scaling (speedup, efficiency) and weak scaling (efficiency) per row"""
+    width = 75
+    for mode, title in (("strong", "strong scaling, fixed n"), ("weak", f"weak scaling, n = {bench.weak}")):
+        langs = [lang for lang, by_mode in curves.items() if by_mode.get(mode)]
+        if not langs:
+            continue
+        print(f"\n{'='*width}")
+        print(f"Benchmark: {bench.name} ({title})")
+        print(f"{'='*width}")
+        print(f"{'Language':<10} {'Workers':<8} {'n':<10} {'Kernel':<14} {'Speedup':<9} {'Efficiency':<10}")
+        print(f"{'-'*width}")
+        for lang in langs:
+            points = curves[lang][mode]
+            base = points[0]
+            for point in points:
+                ratio = base.seconds / point.seconds if point.seconds > 0 else 0.0
+                relative = point.workers / base.workers
+                # Weak scaling: ideal time is constant, so efficiency is t(base) / t(w)
+                speedup = f"{ratio:.2f}x" if mode == "strong" else "-"
+                efficiency = ratio / relative if mode == "strong" else ratio
+                print(f"{lang:<10} {point.workers:<8} {point.n:<10} {format_time(point.seconds):<14} "
+                      f"{speedup:<9} {efficiency:<10.1%}")
+    cores = os.cpu_count() or 1
+    print(f"Relative to the smallest worker count; kernel time where reported; {cores} CPUs available")
+
+def compare_main(argv: List[str]) -> int:
+    """`compare` subcommand: test stored results against a baseline commit"""
+    parser = argparse.ArgumentParser(
+        prog="compare.py compare",
+        description="Compare stored benchmark results of two commits and fail on significant slowdowns"
+    )
+    parser.add_argument("--baseline", required=True, help="baseline commit, branch or tag")
+    parser.add_argument("--candidate", default="HEAD", help="candidate commit (default: HEAD)")
+    parser.add_argument("--threshold", type=float, default=0.05,
+                        help="relative slowdown of the median that fails the gate (default: 0.05)")
+    parser.add_argument("--alpha", type=float, default=0.01,
+                        help="significance level of the Mann-Whitney test (default: 0.01)")
+    parser.add_argument("--benchmark", help="only compare this benchmark")
+    parser.add_argument("--language", help="only compare this language (e.g. Pain)")
+    parser.add_argument("--any-host", action="store_true",
+                        help="pool results across machines instead of matching host fingerprints")
+    parser.add_argument("--include-dirty", action="store_true",
+                        help="also pool runs taken with uncommitted changes in the tree (skipped by default)")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY, help="results store")
+    args = parser.parse_args(argv)
+    
+    history = History(args.history)
+    baseline_commit = resolve_commit(args.baseline)
+    candidate_commit = resolve_commit(args.candidate)
+    baseline = history.samples_for(baseline_commit, args.any_host, args.include_dirty)
+    candidate = history.samples_for(candidate_commit, args.any_host, args.include_dirty)
+    for role, ref, commit, pooled in (("baseline", args.baseline, baseline_commit, baseline),
+                                      ("candidate", args.candidate, candidate_commit, candidate)):
+        if pooled:
+            continue
+        print(f"No stored results for {role} {ref} ({commit[:12]}) in {args.history}")
+        if not args.include_dirty and history.samples_for(commit, args.any_host, include_dirty=True):
+            print("Only runs with uncommitted changes exist for it; commit them or pass --include-dirty")
+        return 2
+    
+    for role, commit in (("baseline", baseline_commit), ("candidate", candidate_commit)):
+        compilers = history.compiler_commits_for(commit, args.include_dirty)
+        if len(compilers) > 1:
+            print(f"Warning: the {role} results were measured with {len(compilers)} pain-compiler commits "
+                  f"({', '.join((c or 'none')[:12] for c in compilers)}) and are pooled")
+    
+    changed = environment.differences(history.environments_for(baseline_commit, args.include_dirty),
+                                      history.environments_for(candidate_commit, args.include_dirty))
+    if changed:
+        print("Note: the environment differs between the two commits' runs; "
+              "a change below may not be the code:")
+        for line in changed:
+            print(f"  {line}")
+    
+    width = 100
+    print(f"\nBaseline {baseline_commit[:12]} vs candidate {candidate_commit[:12]} "
+          f"(threshold {args.threshold:.1%}, alpha {args.alpha})")
+    print(f"{'='*width}")
+    print(f"{'Benchmark':<12} {'Language':<10} {'Backend':<12} {'n':<8} {'Baseline':<12} "
+          f"{'Candidate':<12} {'Change':<9} {'p-value':<9} {'Verdict':<10}")
+    print(f"{'-'*width}")
+    
+    regressions = 0
+    compared = 0
+    for key in sorted(set(baseline) & set(candidate)):
+        bench, lang, backend, n, _ = key
+        if args.benchmark and bench != args.benchmark:
+            continue
+        if args.language and lang.lower() != args.language.lower():
+            continue
+        base_summary = summarize(baseline[key])
+        cand_summary = summarize(candidate[key])
+        change = cand_summary.median / base_summary.median - 1.0 if base_summary.median > 0 else 0.0
+        _, p_value = mann_whitney_greater(baseline[key], candidate[key])
+        _, p_faster = mann_whitney_greater(candidate[key], baseline[key])
+        
+        if change > args.threshold and p_value < args.alpha:
+            verdict = "REGRESSION"
+            regressions += 1
+        elif change < -args.threshold and p_faster < args.alpha:
+            verdict = "improved"
+        else:
+            verdict = "ok"
+        compared += 1
+        print(f"{bench:<12} {lang:<10} {backend:<12} {n:<8} {format_time(base_summary.median):<12} "
+              f"{format_time(cand_summary.median):<12} {change:<+9.1%} {p_value:<9.4f} {verdict:<10}")
+    
+    if compared == 0:
+        print("No configuration was measured at both commits")
+        return 2
+    if regressions:
+        print(f"\n{regressions} significant slowdown(s) above {args.threshold:.1%}")
+        return 1
+    print("\nNo significant slowdowns")
+    return 0
+
+def profile_commit_dir(ref: str) -> Optional[Path]:
+    """Profile directory of a commit, falling back to its `-dirty` run"""
+    commit = resolve_commit(ref)[:12]
+    for name in (commit, f"{commit}-dirty"):
+        if (profiler.PROFILE_ROOT / name).is_dir():
+            return profiler.PROFILE_ROOT / name
+    return None
+
+def profile_diff_main(argv: List[str]) -> int:
+    """`profile-diff` subcommand: compare the stored profiles of two commits"""
+    parser = argparse.ArgumentParser(
+        prog="compare.py profile-diff",
+        description="Compare --profile results of two commits: self-time shifts and differential flamegraphs"
+    )
+    parser.add_argument("--baseline", required=True, help="baseline commit, branch or tag")
+    parser.add_argument("--candidate", default="HEAD", help="candidate commit (default: HEAD)")
+    parser.add_argument("--benchmark", help="only compare this benchmark")
+    parser.add_argument("--top", type=int, default=10, help="functions listed per profile (default: 10)")
+    args = parser.parse_args(argv)
+    
+    base_dir = profile_commit_dir(args.baseline)
+    cand_dir = profile_commit_dir(args.candidate)
+    for ref, directory in ((args.baseline, base_dir), (args.candidate, cand_dir)):
+        if directory is None:
+            print(f"No profiles for {ref} under {profiler.PROFILE_ROOT} "
+                  f"(check it out and run compare.py <benchmark> --profile)")
+            return 2
+    
+    out_root = profiler.PROFILE_ROOT / f"diff-{base_dir.name}-{cand_dir.name}"
+    pairs = sorted(path.relative_to(cand_dir) for path in cand_dir.glob("*/*.folded")
+                   if (base_dir / path.relative_to(cand_dir)).exists())
+    if args.benchmark:
+        pairs = [p for p in pairs if p.parent.name.rsplit("-n", 1)[0] == args.benchmark]
+    if not pairs:
+        print(f"No profile was taken at both {base_dir.name} and {cand_dir.name}")
+        return 2
+    
+    width = 100
+    for pair in pairs:
+        baseline = flamegraph.read_folded(base_dir / pair)
+        candidate = flamegraph.read_folded(cand_dir / pair)
+        if not baseline or not candidate:
+            continue
+        title = f"{pair.parent.name} {pair.stem}"
+        print(f"\n{'='*width}")
+        print(f"{title}: {base_dir.name} ({sum(baseline.values())} samples) vs "
+              f"{cand_dir.name} ({sum(candidate.values())} samples), self share")
+        print(f"{'='*width}")
+        print(f"{'Baseline':<10} {'Candidate':<10} {'Change':<9} {'Function':<69}")
+        print(f"{'-'*width}")
+        for change in flamegraph.diff(baseline, candidate, args.top):
+            print(f"{change.baseline:<10.1%} {change.candidate:<10.1%} {change.delta:<+9.1%} "
+                  f"{change.function[:69]:<69}")
+        svg = out_root / pair.with_suffix(".svg")
+        svg.parent.mkdir(parents=True, exist_ok=True)
+        svg.write_text(flamegraph.render(candidate, title,
+                                         f"{base_dir.name} -> {cand_dir.name}: red = larger share, blue = smaller",
+                                         deltas=flamegraph.path_deltas(baseline, candidate)))
+        print(f"Differential flamegraph: {svg}")
+    return 0
+
+def print_lsp_results(program: Program, session: lsp.SessionResult, pipelined: List[lsp.PipelineResult]):
+    """Per-request latency percentiles, time to first diagnostic and pipelining behaviour"""
+    width = 80
+    sync = "incremental" if session.sync == lsp.SYNC_INCREMENTAL else "full"
+    print(f"\n{'='*width}")
+    print(f"pain-lsp: {program.lines} lines, {sync} sync, initialize {format_time(session.initialize)}")
+    print(f"{'='*width}")
+    print(f"{'Request':<28} {'Count':<7} {'p50':<12} {'p99':<12} {'Max':<12}")
+    print(f"{'-'*width}")
+    rows = [(method, latencies) for method, latencies in sorted(session.requests.items())]
+    if session.open_diagnostics is not None:
+        rows.append(("diagnostics after open", [session.open_diagnostics]))
+    rows.append(("diagnostics after edit", session.edit_diagnostics))
+    for name, latencies in rows:
+        if not latencies:
+            print(f"{name:<28} {0:<7} {'N/A':<12} {'N/A':<12} {'N/A':<12}")
+            continue
+        print(f"{name:<28} {len(latencies):<7} {format_time(percentile(latencies, 50)):<12} "
+              f"{format_time(percentile(latencies, 99)):<12} {format_time(max(latencies)):<12}")
+    if session.failures:
+        print(f"{session.failures} request(s) failed or timed out")
+    
+    if pipelined:
+        print(f"\n{'Pipelined depth':<16} {'p50':<12} {'p99':<12} {'Wall':<12} {'Requests/s':<12} {'Failed':<6}")
+        print(f"{'-'*width}")
+        for result in pipelined:
+            if not result.latencies:
+                print(f"{result.depth:<16} {'N/A':<12} {'N/A':<12} {format_time(result.wall):<12} "
+                      f"{'N/A':<12} {result.failures:<6}")
+                continue
+            rate = len(result.latencies) / result.wall if result.wall > 0 else 0.0
+            print(f"{result.depth:<16} {format_time(percentile(result.latencies, 50)):<12} "
+                  f"{format_time(percentile(result.latencies, 99)):<12} {format_time(result.wall):<12} "
+                  f"{rate:<12.0f} {result.failures:<6}")
+    print("Edit diagnostics: last keystroke of a typing burst to the first publishDiagnostics for it")
+
+def lsp_main(argv: List[str]) -> int:
+    """`lsp` subcommand: latency of pain-lsp on generated files under scripted editing sessions"""
+    parser = argparse.ArgumentParser(
+        prog="compare.py lsp",
+        description="Replay editing sessions against pain-lsp over stdio and report request latencies"
+    )
+    parser.add_argument("--lines", default="100,1000,10000,50000",
+                        help="comma-separated sizes of the generated file in lines (default: 100,1000,10000,50000)")
+    parser.add_argument("--edits", type=int, default=20,
+                        help="typing bursts per session (default: 20)")
+    parser.add_argument("--depths", default="1,8,32,128",
+                        help="comma-separated numbers of requests to pipeline at once (default: 1,8,32,128)")
+    parser.add_argument("--timeout", type=float, default=60.0,
+                        help="seconds to wait for any single reply or diagnostics (default: 60)")
+    parser.add_argument("--server", help="command that starts the server (default: target/release/pain-lsp)")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY, help="results store")
+    parser.add_argument("--no-record", action="store_true", help="do not store results in the history")
+    args = parser.parse_args(argv)
+    
+    try:
+        sizes = [int(v) for v in args.lines.split(",") if v.strip()]
+        depths = [int(v) for v in args.depths.split(",") if v.strip()]
+    except ValueError:
+        sizes, depths = [], []
+    if not sizes or min(sizes + depths or [0]) < 1:
+        print("Invalid --lines/--depths (expected positive integers, e.g. 100,1000)")
+        return 1
+    cmd = shlex.split(args.server) if args.server else lsp_command()
+    history = None if args.no_record else History(args.history, environment.collect())
+    
+    failed = False
+    for lines in sizes:
+        program = generate_program(lines)
+        print(f"\nReplaying {args.edits} edits on {program.lines} lines ({' '.join(cmd)})...", end="", flush=True)
+        try:
+            client = lsp.LspClient(cmd)
+        except OSError as e:
+            print(f" failed to start the server: {e}")
+            return 1
+        try:
+            session, doc = lsp.replay_session(client, program, args.edits, args.timeout)
+            pipelined = [lsp.pipeline(client, doc, depth, args.timeout) for depth in depths]
+        except (lsp.LspError, OSError) as e:
+            print(f" failed: {e}")
+            failed = True
+            continue
+        finally:
+            client.close()
+        print(" Done")
+        print_lsp_results(program, session, pipelined)
+        failed = failed or session.failures > 0
         
-        mean_time = sum(times) / len(times)
-        min_time = min(times)
-        max_time = max(times)
-        speedup = baseline_mean / mean_time if mean_time > 0 else 0
+        if history is not None:
+            series = dict(session.requests)
+            series["diagnostics"] = session.edit_diagnostics
+            for method, latencies in series.items():
+                history.append(f"lsp-{method.rsplit('/', 1)[-1]}", "Pain", "pain-lsp", program.lines,
+                               samples=latencies)
+    return 1 if failed else 0
+
+FRONTEND_DIR = Path("target/bench-frontend")
+
+# Local exponent above which a doubling is flagged as superlinear
+SUPERLINEAR = 1.15
+
+STAGE_TITLES = {"check": "pain check", "ir": "build (IR)", "exe": "build --executable"}
+
+def frontend_stage(stage: str, source: Path, sampling: Sampling) -> List[Measurement]:
+    """Time one front-end stage on a source file"""
+    suffix = ".ll" if stage == "ir" else EXE_EXT
+    output = FRONTEND_DIR / "out" / f"{source.stem}{suffix}"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    return measure(frontend_command(stage, source, output), sampling)
+
+def describe_scaling(ns: List[int], ts: List[float], unit: str) -> str:
+    """Fitted t ~ n^k plus the local exponent of every step, flagging superlinear ones"""
+    fit = power_law(ns, ts)
+    if fit is None:
+        return "not enough sizes"
+    steps = []
+    for (lo, hi), k in zip(zip(ns, ns[1:]), local_exponents(ns, ts)):
+        if k is not None:
+            flag = " superlinear" if k > SUPERLINEAR else ""
+            steps.append(f"{lo}->{hi}: {k:.2f}{flag}")
+    return f"t ~ {unit}^{fit.exponent:.2f} (R² {fit.r2:.3f}); " + "; ".join(steps)
+
+def print_frontend_results(shape: str, stages: List[str], startup: Dict[str, float],
+                           times: Dict[str, Dict[int, float]]):
+    """Wall time and net lines/s per size, then the fitted scaling exponent per stage"""
+    width = 12 + 28 * len(stages)
+    print(f"\n{'='*width}")
+    print(f"Front end: {shape} programs")
+    print(f"{'='*width}")
+    print(f"{'Lines':<12}" + "".join(f"{STAGE_TITLES[stage]:<14} {'Lines/s':<13}" for stage in stages))
+    print(f"{'-'*width}")
+    sizes = sorted({n for by_n in times.values() for n in by_n})
+    for n in sizes:
+        line = f"{n:<12}"
+        for stage in stages:
+            seconds = times.get(stage, {}).get(n)
+            if seconds is None:
+                line += f"{'N/A':<14} {'N/A':<13}"
+                continue
+            net = seconds - startup.get(stage, 0.0)
+            rate = f"{n / net:,.0f}" if net > 0 else "N/A"
+            line += f"{format_time(seconds):<14} {rate:<13}"
+        print(line)
+    
+    print("\nScaling of net time (minus the empty-program time) with program size:")
+    for stage in stages:
+        by_n = times.get(stage, {})
+        ns = sorted(by_n)
+        print(f"  {STAGE_TITLES[stage]:<20} " +
+              describe_scaling(ns, [by_n[n] - startup.get(stage, 0.0) for n in ns], "lines"))
+    print(f"Exponent 1 is linear; steps above {SUPERLINEAR} point at a superlinear pass")
+
+def frontend_main(argv: List[str]) -> int:
+    """`frontend` subcommand: pain check/build throughput on generated programs"""
+    parser = argparse.ArgumentParser(
+        prog="compare.py frontend",
+        description="Time pain check and pain build on generated programs and fit how they scale"
+    )
+    parser.add_argument("--shapes", default="all",
+                        help=f"comma-separated program shapes: {', '.join(SHAPES)} or 'all' (default: all)")
+    parser.add_argument("--lines", default="1000,2000,4000,8000,16000,32000",
+                        help="comma-separated program sizes in lines (default: 1000,2000,...,32000)")
+    parser.add_argument("--stages", default=",".join(FRONTEND_STAGES),
+                        help=f"comma-separated stages: {', '.join(FRONTEND_STAGES)} (default: all)")
+    parser.add_argument("--runs", type=int, default=5, help="measured runs per stage and size (default: 5)")
+    parser.add_argument("--warmup", type=int, default=1, help="warmup runs per stage and size (default: 1)")
+    parser.add_argument("--outliers", choices=OUTLIER_METHODS, default="mad",
+                        help="outlier rejection rule (default: mad)")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY, help="results store")
+    parser.add_argument("--no-record", action="store_true", help="do not store results in the history")
+    args = parser.parse_args(argv)
+    
+    shapes = list(SHAPES) if args.shapes == "all" else [v.strip() for v in args.shapes.split(",") if v.strip()]
+    stages = [v.strip() for v in args.stages.split(",") if v.strip()]
+    try:
+        sizes = sorted({int(v) for v in args.lines.split(",") if v.strip()})
+    except ValueError:
+        sizes = []
+    if not sizes or sizes[0] < 1:
+        print(f"Invalid --lines '{args.lines}' (expected positive integers, e.g. 1000,2000)")
+        return 1
+    unknown = [v for v in shapes if v not in SHAPES] + [v for v in stages if v not in FRONTEND_STAGES]
+    if unknown:
+        print(f"Unknown shape or stage: {', '.join(unknown)}")
+        return 1
+    if "exe" in stages and backend_unavailable("aot"):
+        print(f"Skipping build --executable: {backend_unavailable('aot')}")
+        stages.remove("exe")
+    if compiler_binary() is None:
+        print("Warning: no prebuilt pain-compiler in target/; every run goes through `cargo run` "
+              "(cargo build --release -p pain-compiler first for cleaner numbers)")
+    
+    sampling = Sampling(iterations=args.runs, warmup=args.warmup, outliers=args.outliers)
+    history = None if args.no_record else History(args.history, environment.collect())
+    FRONTEND_DIR.mkdir(parents=True, exist_ok=True)
+    
+    # Process startup and fixed per-run work, subtracted before computing throughput
+    empty = FRONTEND_DIR / "empty.pain"
+    empty.write_text("fn main() -> int:\n    return 0\n")
+    startup = {}
+    print(f"\nMeasuring empty program ({describe_sampling(sampling)})...")
+    for stage in stages:
+        summary = summarize([m.total for m in frontend_stage(stage, empty, sampling)], sampling.outliers)
+        if summary is not None:
+            startup[stage] = summary.median
+    
+    for shape in shapes:
+        times: Dict[str, Dict[int, float]] = {}
+        print(f"\nTiming {shape} programs...")
+        for lines in sizes:
+            program = generate_program(lines, shape)
+            source = FRONTEND_DIR / f"{shape}-{program.lines}.pain"
+            source.write_text(program.text)
+            print(f"  {program.lines} lines...", end="", flush=True)
+            for stage in stages:
+                measurements = frontend_stage(stage, source, sampling)
+                summary = summarize([m.total for m in measurements], sampling.outliers)
+                if summary is None:
+                    print(f" {stage} failed;", end="")
+                    continue
+                times.setdefault(stage, {})[program.lines] = summary.median
+                if history is not None:
+                    history.append(f"frontend-{stage}-{shape}", "Pain", "pain-compiler", program.lines,
+                                   samples=[m.total for m in measurements])
+            print(" Done")
+        print_frontend_results(shape, stages, startup, times)
+    return 0
+
+# docs/REGISTRY.md doesn't say how to point painpkg at another registry; the
+# location goes in this variable, and registry_ignored() checks it took effect
+REGISTRY_ENV = "PAINPKG_REGISTRY"
+MISSING_PACKAGE = "zz-no-such-package"
+
+# In dependency order: install-noop reuses what install left behind
+PAINPKG_OPERATIONS = ("index-cold", "index", "resolve-conflict", "install", "install-noop")
+
+def clean_project(project: Path):
+    """Remove installed packages and lock files so the next install starts from scratch"""
+    shutil.rmtree(project / ".pain", ignore_errors=True)
+    for lock in project.glob("*.lock"):
+        lock.unlink()
+
+def painpkg_env(registry: Registry, home: Path) -> Dict[str, str]:
+    """Environment pointing painpkg at a generated registry, with a scratch HOME
+    
+    rustup and cargo find their toolchains through HOME unless told otherwise,
+    so the real locations are passed on for the `cargo run` fallback.
+    """
+    return {**os.environ, REGISTRY_ENV: registry.url, "HOME": str(home.absolute()),
+            "USERPROFILE": str(home.absolute()),
+            "RUSTUP_HOME": os.environ.get("RUSTUP_HOME", os.path.expanduser("~/.rustup")),
+            "CARGO_HOME": os.environ.get("CARGO_HOME", os.path.expanduser("~/.cargo"))}
+
+def registry_ignored(registry: Registry, home: Path, timeout: float) -> Optional[str]:
+    """Why painpkg is not using the generated registry, or None if `search` finds its probe package"""
+    home.mkdir(parents=True, exist_ok=True)
+    result = launch([*painpkg_command(), "search", PROBE_PACKAGE], env=painpkg_env(registry, home),
+                    timeout=timeout, cwd=str(registry.app))
+    if result.timed_out:
+        return "painpkg search timed out"
+    if result.returncode != 0:
+        return (result.stderr.strip() or result.stdout.strip() or f"exit status {result.returncode}")[-200:]
+    if PROBE_PACKAGE not in result.stdout:
+        return (f"painpkg search did not find {PROBE_PACKAGE}, so it is not reading {registry.url} "
+                f"(is {REGISTRY_ENV} the variable this painpkg reads?)")
+    return None
+
+def painpkg_operation(operation: str, registry: Registry, home: Path, sampling: Sampling,
+                      timeout: float) -> Tuple[List[Measurement], int]:
+    """Time one painpkg operation; returns (successful runs, runs with the wrong outcome)
+    
+    index-cold and index search for a missing package, which loads the whole
+    index; index-cold starts each run with an empty HOME so painpkg has to
+    rebuild its copy of the registry. resolve-conflict must fail, every other
+    operation must succeed.
+    """
+    if operation.startswith("index"):
+        cmd, project = [*painpkg_command(), "search", MISSING_PACKAGE], registry.app
+    else:
+        cmd, project = [*painpkg_command(), "install"], registry.conflict if "conflict" in operation else registry.app
+    env = painpkg_env(registry, home)
+    
+    measurements = []
+    wrong = 0
+    for attempt in range(sampling.warmup + sampling.iterations):
+        if operation == "index-cold":
+            shutil.rmtree(home, ignore_errors=True)
+        if operation == "install":
+            clean_project(project)
+        home.mkdir(parents=True, exist_ok=True)
+        result = launch(cmd, env=env, timeout=timeout, cwd=str(project))
+        expected = result.returncode != 0 if operation == "resolve-conflict" else result.returncode == 0
+        if result.timed_out or not expected:
+            if not wrong:
+                detail = "timed out" if result.timed_out else \
+                    (result.stderr.strip() or result.stdout.strip() or f"exit status {result.returncode}")[-120:]
+                print(f"\n    Warning: {operation} {'resolved' if result.returncode == 0 else 'failed'}: "
+                      f"{detail}", end="")
+            wrong += 1
+            continue
+        if attempt >= sampling.warmup:
+            measurements.append(Measurement(result.elapsed, usage=result.usage))
+    return measurements, wrong
+
+def print_painpkg_results(registries: List[Registry], results: Dict[str, Dict[int, List[Measurement]]],
+                          outliers: str = "mad"):
+    """Median time and peak RSS per operation and registry size, then how each operation scales"""
+    width = 100
+    print(f"\n{'='*width}")
+    print("painpkg on synthetic registries")
+    print(f"{'='*width}")
+    print(f"{'Operation':<18} {'Packages':<10} {'Versions':<10} {'Edges':<10} {'Median':<12} "
+          f"{'p90':<12} {'Peak RSS':<12} {'Runs':<6}")
+    print(f"{'-'*width}")
+    medians: Dict[str, Dict[int, float]] = {}
+    for operation, by_size in results.items():
+        for registry in registries:
+            runs = by_size.get(registry.packages, [])
+            summary = summarize([m.total for m in runs], outliers)
+            sizes = f"{operation:<18} {registry.packages:<10} {registry.versions:<10} {registry.edges:<10}"
+            if summary is None:
+                print(f"{sizes} {'N/A':<12} {'N/A':<12} {'N/A':<12} {0:<6}")
+                continue
+            medians.setdefault(operation, {})[registry.packages] = summary.median
+            # Peaks at or below the harness's own RSS at spawn say nothing about painpkg
+            peaks = [m.usage.max_rss for m in runs if m.usage is not None and m.usage.max_rss > m.usage.rss_floor]
+            peak = format_bytes(max(peaks)) if peaks else "N/A"
+            print(f"{sizes} {format_time(summary.median):<12} {format_time(summary.p90):<12} "
+                  f"{peak:<12} {len(runs):<6}")
+    
+    print("\nScaling with the number of packages:")
+    for operation, by_n in medians.items():
+        ns = sorted(by_n)
+        print(f"  {operation:<18} " + describe_scaling(ns, [by_n[n] for n in ns], "packages"))
+    print(f"Exponent 1 is linear; steps above {SUPERLINEAR} show where painpkg stops scaling")
+
+def painpkg_main(argv: List[str]) -> int:
+    """`painpkg` subcommand: index load, resolution and install against growing synthetic registries"""
+    parser = argparse.ArgumentParser(
+        prog="compare.py painpkg",
+        description="Generate file:// registries of growing size and time painpkg on them"
+    )
+    parser.add_argument("--packages", default="100,500,2000,8000",
+                        help="comma-separated registry sizes (default: 100,500,2000,8000)")
+    parser.add_argument("--operations", default=",".join(PAINPKG_OPERATIONS),
+                        help=f"comma-separated operations: {', '.join(PAINPKG_OPERATIONS)} (default: all)")
+    parser.add_argument("--runs", type=int, default=5, help="measured runs per operation and size (default: 5)")
+    parser.add_argument("--warmup", type=int, default=1, help="warmup runs per operation and size (default: 1)")
+    parser.add_argument("--seed", type=int, default=1, help="registry generator seed (default: 1)")
+    parser.add_argument("--timeout", type=float, default=600.0, help="seconds per painpkg run (default: 600)")
+    parser.add_argument("--outliers", choices=OUTLIER_METHODS, default="mad",
+                        help="outlier rejection rule (default: mad)")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY, help="results store")
+    parser.add_argument("--no-record", action="store_true", help="do not store results in the history")
+    args = parser.parse_args(argv)
+    
+    try:
+        sizes = sorted({int(v) for v in args.packages.split(",") if v.strip()})
+    except ValueError:
+        sizes = []
+    if not sizes or sizes[0] < 1:
+        print(f"Invalid --packages '{args.packages}' (expected positive integers, e.g. 100,1000)")
+        return 1
+    selected = {v.strip() for v in args.operations.split(",") if v.strip()}
+    unknown = selected - set(PAINPKG_OPERATIONS)
+    if unknown:
+        print(f"Unknown operation(s): {', '.join(sorted(unknown))} (expected {', '.join(PAINPKG_OPERATIONS)})")
+        return 1
+    operations = [op for op in PAINPKG_OPERATIONS if op in selected]
+    if painpkg_command()[0] == "cargo":
+        print("Warning: no prebuilt painpkg in target/; every run goes through `cargo run` "
+              "(cargo build --release -p painpkg first for cleaner numbers)")
+    
+    sampling = Sampling(iterations=args.runs, warmup=args.warmup, outliers=args.outliers)
+    history = None if args.no_record else History(args.history, environment.collect())
+    registries = []
+    results: Dict[str, Dict[int, List[Measurement]]] = {}
+    for n in sizes:
+        print(f"\nGenerating registry of {n} packages...", end="", flush=True)
+        registry = generate_registry(n, args.seed)
+        registries.append(registry)
+        print(f" {registry.versions} versions, {registry.edges} requirements in {registry.root}")
+        home = registry.root / "home"
+        reason = registry_ignored(registry, home, args.timeout)
+        if reason is not None:
+            print(f"Error: painpkg does not use the generated registry: {reason}")
+            print("Timings against another registry would be meaningless; stopping")
+            return 1
+        for operation in operations:
+            print(f"  Running {operation} ({describe_sampling(sampling)})...", end="", flush=True)
+            measurements, wrong = painpkg_operation(operation, registry, home, sampling, args.timeout)
+            print(f" Done ({len(measurements)} successful runs)")
+            results.setdefault(operation, {})[registry.packages] = measurements
+            if history is not None:
+                history.append(f"painpkg-{operation}", "Pain", "painpkg", registry.packages,
+                               samples=[m.total for m in measurements],
+                               usage=[m.usage._asdict() for m in measurements if m.usage is not None])
+    print_painpkg_results(registries, results, sampling.outliers)
+    return 0
+
+# Format -> (language, parser) of the loader timed on it
+CONFIG_PARSERS = {"pml": ("Pain", "pml_load_file"), "json": ("Python", "json"), "toml": ("Python", "tomllib")}
+CONFIG_LOADERS = {"pain": BENCH_DIR / "pain" / "load_config.pain", "python": BENCH_DIR / "python" / "load_config.py"}
+
+def parse_size(text: str) -> int:
+    """Byte count with an optional binary K/M/G suffix, e.g. 64K or 100M"""
+    text = text.strip().upper().removesuffix("B")
+    for suffix, factor in (("K", 1 << 10), ("M", 1 << 20), ("G", 1 << 30)):
+        if text.endswith(suffix):
+            return int(float(text[:-1]) * factor)
+    return int(text)
+
+def config_command(fmt: str, path: Optional[Path]) -> List[str]:
+    """Command that starts, loads the config at `path` and exits; with None it only starts"""
+    if fmt != "pml":
+        return ["python", str(CONFIG_LOADERS["python"].absolute()), fmt, str(path.absolute()) if path else "-"]
+    if path is None:
+        return pain_command("run", BENCH_DIR / "pain" / "empty.pain")
+    source = path.with_suffix(".pain")
+    source.write_text(string.Template(CONFIG_LOADERS["pain"].read_text()).substitute(path=path.absolute().as_posix()))
+    return pain_command("run", source)
+
+def load_times(measurements: List[Measurement], startup: float) -> List[float]:
+    """Per-run parse time: self-reported where the loader times itself, else wall time minus startup"""
+    return [m.execute if m.execute is not None else max(0.0, m.total - startup) for m in measurements]
+
+def print_pml_results(documents: List[Document], formats: List[str], startup: Dict[str, Tuple[float, float]],
+                      results: Dict[str, Dict[int, List[Measurement]]], outliers: str = "mad"):
+    """Cold start, parse time, throughput and memory per document size, then how parse time scales"""
+    width = 110
+    print(f"\n{'='*width}")
+    print("Config load: Pain pml_load_file vs Python json and tomllib")
+    print(f"{'='*width}")
+    print(f"{'Parser':<24} {'File':<12} {'Cold start':<12} {'Parse':<12} {'MB/s':<10} "
+          f"{'Peak RSS':<12} {'Over startup':<14}")
+    print(f"{'-'*width}")
+    parse: Dict[str, Dict[int, float]] = {}
+    for document in documents:
+        for fmt in formats:
+            language, loader = CONFIG_PARSERS[fmt]
+            size = document.sizes[fmt]
+            label = f"{f'{language} {loader}':<24} {format_bytes(size):<12}"
+            measurements = results.get(fmt, {}).get(document.sizes["pml"], [])
+            base_time, base_rss = startup.get(fmt, (0.0, 0.0))
+            cold = summarize([m.total for m in measurements], outliers)
+            load = summarize(load_times(measurements, base_time), outliers)
+            if cold is None or load is None:
+                print(f"{label} {'N/A':<12} {'N/A':<12} {'N/A':<10} {'N/A':<12} {'N/A':<14}")
+                continue
+            parse.setdefault(fmt, {})[size] = load.median
+            rate = f"{size / load.median / 1e6:.1f}" if load.median > 0 else "-"
+            rss = usage_medians(measurements, outliers).get("max_rss")
+            peak = format_bytes(rss) if rss is not None else "N/A"
+            extra = format_bytes(max(0.0, rss - base_rss)) if rss is not None and base_rss else "N/A"
+            print(f"{label} {format_time(cold.median):<12} {format_time(load.median):<12} {rate:<10} "
+                  f"{peak:<12} {extra:<14}")
+        print()
+    print("Cold start is process launch + load + exit. Parse is in-process for Python and cold start")
+    print("minus the empty program for Pain; Over startup is peak RSS above the loader run without a file.")
+    
+    print("\nScaling of parse time with file size:")
+    for fmt, by_size in parse.items():
+        language, loader = CONFIG_PARSERS[fmt]
+        sizes = sorted(by_size)
+        print(f"  {f'{language} {loader}':<24} " + describe_scaling(sizes, [by_size[n] for n in sizes], "bytes"))
+    print(f"Exponent 1 is linear; steps above {SUPERLINEAR} point at a superlinear parser")
+
+def pml_main(argv: List[str]) -> int:
+    """`pml` subcommand: PML load time and memory against CPython's json and tomllib"""
+    parser = argparse.ArgumentParser(
+        prog="compare.py pml",
+        description="Generate equivalent PML/JSON/TOML configs and time loading them in a fresh process"
+    )
+    parser.add_argument("--sizes", default="1K,10K,100K,1M,10M,100M",
+                        help="comma-separated PML document sizes, K/M suffixes allowed (default: 1K,10K,...,100M)")
+    parser.add_argument("--formats", default=",".join(FORMATS),
+                        help=f"comma-separated formats: {', '.join(FORMATS)} (default: all)")
+    parser.add_argument("--runs", type=int, default=5, help="measured runs per format and size (default: 5)")
+    parser.add_argument("--warmup", type=int, default=1, help="warmup runs per format and size (default: 1)")
+    parser.add_argument("--seed", type=int, default=1, help="document generator seed (default: 1)")
+    parser.add_argument("--outliers", choices=OUTLIER_METHODS, default="mad",
+                        help="outlier rejection rule (default: mad)")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY, help="results store")
+    parser.add_argument("--no-record", action="store_true", help="do not store results in the history")
+    args = parser.parse_args(argv)
+    
+    try:
+        sizes = sorted({parse_size(v) for v in args.sizes.split(",") if v.strip()})
+    except ValueError:
+        sizes = []
+    if not sizes or sizes[0] < 1:
+        print(f"Invalid --sizes '{args.sizes}' (expected sizes such as 1K,64K,10M)")
+        return 1
+    formats = [v.strip() for v in args.formats.split(",") if v.strip()]
+    unknown = [v for v in formats if v not in FORMATS]
+    if unknown:
+        print(f"Unknown format(s): {', '.join(unknown)} (expected {', '.join(FORMATS)})")
+        return 1
+    if "toml" in formats and not python_can_import("tomllib"):
+        print("Skipping TOML: the `python` on PATH has no tomllib (Python 3.11+)")
+        formats.remove("toml")
+    if "pml" in formats and compiler_binary() is None:
+        print("Warning: no prebuilt pain-compiler in target/; every run goes through `cargo run` "
+              "(cargo build --release -p pain-compiler first for cleaner numbers)")
+    
+    sampling = Sampling(iterations=args.runs, warmup=args.warmup, outliers=args.outliers)
+    history = None if args.no_record else History(args.history, environment.collect())
+    
+    # Each loader started without a file: runtime startup and parser import
+    startup: Dict[str, Tuple[float, float]] = {}
+    print(f"\nMeasuring loaders without a file ({describe_sampling(sampling)})...")
+    for fmt in formats:
+        measurements = measure(config_command(fmt, None), sampling)
+        summary = summarize([m.total for m in measurements], sampling.outliers)
+        if summary is not None:
+            startup[fmt] = (summary.median, usage_medians(measurements, sampling.outliers).get("max_rss", 0.0))
+    
+    documents = []
+    results: Dict[str, Dict[int, List[Measurement]]] = {}
+    for size in sizes:
+        print(f"\nGenerating {format_bytes(size)} document...", end="", flush=True)
+        document = generate_document(size, args.seed)
+        documents.append(document)
+        print(f" {document.sections} sections")
+        for fmt in formats:
+            language, loader = CONFIG_PARSERS[fmt]
+            print(f"  Loading {format_bytes(document.sizes[fmt])} of {fmt.upper()} with {loader}...",
+                  end="", flush=True)
+            measurements = measure(config_command(fmt, document.paths[fmt]), sampling, str(document.sections))
+            print(f" Done ({len(measurements)} successful runs)")
+            results.setdefault(fmt, {})[document.sizes["pml"]] = measurements
+            if history is not None and measurements:
+                history.append(
+                    f"config-load-{fmt}", language, loader, size,
+                    samples=[m.total for m in measurements],
+                    execute=load_times(measurements, startup.get(fmt, (0.0, 0.0))[0]),
+                    usage=[m.usage._asdict() for m in measurements if m.usage is not None],
+                )
+    print_pml_results(documents, formats, startup, results, sampling.outliers)
+    return 0
+
+def iteration_times(measurements: List[Measurement]) -> List[float]:
+    """In-process kernel times when every run reported one, else wall times"""
+    if measurements and all(m.execute is not None for m in measurements):
+        return [m.execute for m in measurements]
+    return [m.total for m in measurements]
+
+def per_iteration(short: List[Measurement], long: List[Measurement], counts: List[int],
+                  outliers: str = "mad") -> Optional[List[float]]:
+    """Seconds per loop iteration of each long run: the slope between the two loop counts
+    
+    Startup, setup and process exit are the same at both counts, so they
+    cancel; this is what lets Pain, which has no clock, be timed per call.
+    """
+    base = summarize(iteration_times(short), outliers)
+    if base is None or not long:
+        return None
+    return [(t - base.median) / (counts[1] - counts[0]) for t in iteration_times(long)]
+
+def print_stdlib_results(items: List[Tuple[str, str]], labels: List[str],
+                         costs: Dict[Tuple[str, str], Dict[str, float]], missing: List[stdlib_suite.Builtin]):
+    """ns per call of every builtin and input variant, net of the bare loop"""
+    width = 44 + 13 * len(labels) + 10
+    print(f"\n{'='*width}")
+    print("Stdlib builtins: ns per call (loop overhead subtracted)")
+    print(f"{'='*width}")
+    pain = next((label for label in labels if label.startswith("Pain")), None)
+    print(f"{'Builtin':<34} {'Input':<9} " + "".join(f"{label:<13}" for label in labels)
+          + (f"{pain + '/Py':<10}" if pain and "Python" in labels else ""))
+    print(f"{'-'*width}")
+    loop = costs.get((stdlib_suite.LOOP, "scalar"), {})
+    for item in items:
+        key, variant = item
+        by_label = costs.get(item, {})
+        cells = []
+        net = {}
+        for label in labels:
+            if label not in by_label:
+                cells.append(f"{'N/A':<13}")
+                continue
+            seconds = by_label[label] if key == stdlib_suite.LOOP else by_label[label] - loop.get(label, 0.0)
+            net[label] = seconds
+            cells.append(f"{seconds * 1e9:<13.1f}" if seconds > 0 else f"{'< noise':<13}")
+        ratio = ""
+        if pain and net.get(pain, 0) > 0 and net.get("Python", 0) > 0:
+            ratio = f"{net[pain] / net['Python']:.2f}x"
+        title = "(loop iteration)" if key == stdlib_suite.LOOP else key
+        print(f"{title:<34} {variant:<9} " + "".join(cells) + f"{ratio:<10}")
+    print(f"Slope between two loop counts, so startup cancels; the bare loop's cost per iteration")
+    print(f"(first row) is subtracted from every builtin. Inputs: strings of {stdlib_suite.SHORT_STRING} / "
+          f"{stdlib_suite.LONG_STRING} chars, lists of {stdlib_suite.SMALL_LIST} / {stdlib_suite.LARGE_LIST} ints.")
+    if missing:
+        print(f"Documented but not benchmarked (no template in harness/stdlib_suite.py): "
+              f"{', '.join(b.key for b in missing)}")
+
+def stdlib_main(argv: List[str]) -> int:
+    """`stdlib` subcommand: ns per call of every builtin documented in docs/stdlib.md"""
+    parser = argparse.ArgumentParser(
+        prog="compare.py stdlib",
+        description="Generate a Pain and a Python loop per documented stdlib builtin and report ns per call"
+    )
+    parser.add_argument("--functions", help="comma-separated builtin names to run (default: every one)")
+    parser.add_argument("--calls", type=int, default=100_000,
+                        help="loop iterations of the long run; the short run does a quarter (default: 100000)")
+    parser.add_argument("--backends", default="interpreter",
+                        help=f"comma-separated Pain backends: {', '.join(PAIN_BACKENDS)} or 'all' "
+                             "(default: interpreter)")
+    parser.add_argument("--runs", type=int, default=5, help="measured runs per loop count (default: 5)")
+    parser.add_argument("--warmup", type=int, default=1, help="warmup runs per loop count (default: 1)")
+    parser.add_argument("--doc", type=Path, default=stdlib_suite.STDLIB_DOC,
+                        help=f"stdlib reference to read (default: {stdlib_suite.STDLIB_DOC})")
+    parser.add_argument("--outliers", choices=OUTLIER_METHODS, default="mad",
+                        help="outlier rejection rule (default: mad)")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY, help="results store")
+    parser.add_argument("--no-record", action="store_true", help="do not store results in the history")
+    args = parser.parse_args(argv)
+    
+    if args.calls < 8:
+        print(f"Invalid --calls {args.calls} (expected at least 8)")
+        return 1
+    backends = PAIN_BACKENDS if args.backends == "all" else [b.strip() for b in args.backends.split(",") if b.strip()]
+    unknown = [b for b in backends if b not in PAIN_BACKENDS]
+    if unknown:
+        print(f"Unknown Pain backend(s): {', '.join(unknown)} (expected {', '.join(PAIN_BACKENDS)} or 'all')")
+        return 1
+    try:
+        builtins = stdlib_suite.documented(args.doc)
+    except OSError as e:
+        print(f"Error: cannot read {args.doc}: {e}")
+        return 1
+    if args.functions:
+        wanted = {name.strip() for name in args.functions.split(",") if name.strip()}
+        builtins = [b for b in builtins if b.name in wanted]
+        if not builtins:
+            print(f"No documented builtin named {', '.join(sorted(wanted))} in {args.doc}")
+            return 1
+    
+    counts = [args.calls // 4, args.calls]
+    rows = [row for row in report_rows(backends) if row.key in ("pain", "python")]
+    labels = [row.label for row in rows]
+    sampling = Sampling(iterations=args.runs, warmup=args.warmup, outliers=args.outliers)
+    history = None if args.no_record else History(args.history, environment.collect())
+    items = [(stdlib_suite.LOOP, "scalar")] + [
+        (b.key, variant) for b in builtins if b.key in stdlib_suite.CASES
+        for variant in stdlib_suite.CASES[b.key].variants
+    ]
+    
+    costs: Dict[Tuple[str, str], Dict[str, float]] = {}
+    samples: Dict[Tuple[str, str], Dict[str, List[float]]] = {}
+    print(f"\nTiming {len(items) - 1} builtin/input pairs at {counts[0]} and {counts[1]} calls "
+          f"({describe_sampling(sampling)})...")
+    for key, variant in items:
+        bench = stdlib_suite.generate(key, variant, counts)
+        print(f"  {key} ({variant})...", end="", flush=True)
+        for row in rows:
+            per_run = per_iteration(row.runner(bench, counts[0], sampling), row.runner(bench, counts[1], sampling),
+                                    counts, sampling.outliers)
+            summary = summarize(per_run, sampling.outliers) if per_run else None
+            if summary is None:
+                print(f" {row.label} failed;", end="")
+                continue
+            costs.setdefault((key, variant), {})[row.label] = summary.median
+            samples.setdefault((key, variant), {})[row.label] = per_run
+        print(" Done")
+    
+    if history is not None:
+        loop = costs.get((stdlib_suite.LOOP, "scalar"), {})
+        for (key, variant), by_label in samples.items():
+            if key == stdlib_suite.LOOP:
+                continue
+            for row in rows:
+                if row.label in by_label:
+                    history.append(f"stdlib-{stdlib_suite.slug(key)}-{variant}", row.language, row.backend,
+                                   args.calls, samples=[t - loop.get(row.label, 0.0) for t in by_label[row.label]])
+    print_stdlib_results(items, labels, costs, stdlib_suite.uncovered(stdlib_suite.documented(args.doc)))
+    return 0
+
+def print_call_results(labels: List[str], costs: Dict[str, Dict[str, float]]):
+    """ns per call of every call case net of the bare loop, and the fitted cost per argument"""
+    width = 18 + 13 * len(labels)
+    print(f"\n{'='*width}")
+    print("Call overhead: ns per call (loop overhead subtracted)")
+    print(f"{'='*width}")
+    print(f"{'Case':<18}" + "".join(f"{label:<13}" for label in labels))
+    print(f"{'-'*width}")
+    loop = costs.get(call_suite.LOOP.name, {})
+    net: Dict[str, Dict[str, float]] = {}
+    for case in call_suite.CALL_CASES:
+        cells = []
+        for label in labels:
+            if label not in costs.get(case.name, {}):
+                cells.append(f"{'N/A':<13}")
+                continue
+            seconds = costs[case.name][label]
+            if case is not call_suite.LOOP:
+                seconds -= loop.get(label, 0.0)
+                net.setdefault(label, {})[case.name] = seconds
+            cells.append(f"{seconds * 1e9:<13.2f}" if seconds > 0 else f"{'< noise':<13}")
+        title = "(loop iteration)" if case is call_suite.LOOP else case.name
+        print(f"{title:<18}" + "".join(cells))
+    
+    cells = []
+    for label in labels:
+        points = [(call_suite.arity(case), net[label][case.name]) for case in call_suite.ARGUMENT_CASES
+                  if case.name in net.get(label, {})]
+        if len(points) < 2:
+            cells.append(f"{'N/A':<13}")
+            continue
+        _, slope, _ = least_squares([k for k, _ in points], [t for _, t in points])
+        cells.append(f"{slope * 1e9:<13.2f}")
+    print(f"{'per argument':<18}" + "".join(cells))
+    print("Slope between two loop counts, so startup cancels; the bare loop's cost per iteration")
+    print(f"(first row) is subtracted from every call. `per argument` is the least-squares slope over "
+          f"call0..call{call_suite.MAX_ARITY}.")
+
+TCO_BYTES_PER_FRAME = 1.0  # below this, tail recursion is taken to run in constant stack
+CRASH_PREFIX = "signal"
+
+class Recursion(NamedTuple):
+    """One row's recursion limit and cost per frame for one form"""
+    max_safe: int  # deepest probe that succeeded
+    failed_at: Optional[int]  # shallowest probe that failed, None if --max-depth passed
+    failure: str
+    per_frame: Optional[List[float]]  # seconds per frame of each measured run
+    bytes_per_frame: Optional[float]
+    from_stack_limit: bool = False  # bytes_per_frame estimated as the stack limit over max_safe
+
+def recursion_probe(row: Row, bench: Benchmark, depth: int) -> Tuple[bool, str]:
+    """Run one recursion depth once; returns (succeeded, how it failed)"""
+    cmd = row_command(row, bench, depth, 1)
+    if cmd is None:
+        return False, "not available"
+    try:
+        result = launch(cmd, timeout=300)
+    except OSError as e:
+        return False, str(e)
+    if result.timed_out:
+        return False, "timeout"
+    if result.returncode < 0:
+        try:
+            return False, signal.Signals(-result.returncode).name
+        except ValueError:
+            return False, f"{CRASH_PREFIX} {-result.returncode}"
+    if row.ahead_of_time and row.language == "Pain":
+        # main's value is the exit status
+        if result.returncode == depth % 256:
+            return True, ""
+    elif result.returncode == 0 and output_matches(result.stdout, str(depth)):
+        return True, ""
+    lines = result.stderr.strip().splitlines()
+    return False, (lines[-1].strip() if lines else f"exit status {result.returncode}")[:60]
+
+def run_recursion(bench: Benchmark, row: Row, max_depth: int, bisect: int, sampling: Sampling) -> Recursion:
+    """Find a row's maximum safe depth, then time and size its frames below it
+    
+    Depths go up by decades to `max_depth`; after the first failure the gap
+    to the last success is bisected `bisect` times. Frames are measured
+    between a quarter and half of the safe depth (all of it when nothing
+    failed), so a limit that moves a little between runs doesn't crash them.
+    """
+    good, bad, failure = 0, None, ""
+    for depth in call_suite.decades(max_depth):
+        ok, why = recursion_probe(row, bench, depth)
+        if not ok:
+            bad, failure = depth, why
+            break
+        good = depth
+    if bad is not None and good > 0:
+        for _ in range(bisect):
+            if bad - good <= 1:
+                break
+            mid = (good + bad) // 2
+            ok, why = recursion_probe(row, bench, mid)
+            if ok:
+                good = mid
+            else:
+                bad, failure = mid, why
+    
+    high = good if bad is None else good // 2
+    low = high // 4
+    if low < 1:
+        return Recursion(good, bad, failure, None, None)
+    short, long = row.runner(bench, low, sampling), row.runner(bench, high, sampling)
+    per_frame = per_iteration(short, long, [low, high], sampling.outliers)
+    bytes_per_frame = None
+    before, after = usage_medians(short, sampling.outliers), usage_medians(long, sampling.outliers)
+    if "max_rss" in before and "max_rss" in after and after["max_rss"] > after.get("rss_floor", 0):
+        bytes_per_frame = max(0.0, (after["max_rss"] - before["max_rss"]) / (high - low))
+    limit = call_suite.stack_limit()
+    crashed = failure.startswith(("SIG", CRASH_PREFIX))
+    if bytes_per_frame is None and crashed and limit is not None:
+        return Recursion(good, bad, failure, per_frame, limit / good, from_stack_limit=True)
+    return Recursion(good, bad, failure, per_frame, bytes_per_frame)
+
+def tail_calls_verdict(tail: Recursion, direct: Optional[Recursion]) -> str:
+    """Whether tail calls run in constant space
+    
+    Tail recursion that fails is not optimized. One that reaches --max-depth
+    is, when its frames cost no memory or when direct recursion of the same
+    program overflowed; otherwise the frames may just be small or on the heap.
+    """
+    if tail.max_safe == 0:
+        return "N/A"
+    if tail.failed_at is not None:
+        return "no"
+    if tail.bytes_per_frame is not None:
+        return "yes" if tail.bytes_per_frame < TCO_BYTES_PER_FRAME else "no (heap)"
+    if direct is not None and direct.failed_at is not None:
+        return "yes"
+    return "unclear"
+
+def print_recursion_results(labels: List[str], results: Dict[str, Dict[str, Recursion]], max_depth: int,
+                            outliers: str = "mad"):
+    """Maximum safe depth, time and memory per frame of each form, and whether tail calls are optimized"""
+    width = 124
+    print(f"\n{'='*width}")
+    print(f"Recursion depth (probed up to {max_depth})")
+    print(f"{'='*width}")
+    print(f"{'Language':<10} {'Form':<7} {'Max safe depth':<16} {'Fails at':<10} {'Failure':<42} "
+          f"{'Time/frame':<12} {'Memory/frame':<13} {'TCO':<10}")
+    print(f"{'-'*width}")
+    for label in labels:
+        for form in call_suite.RECURSION_CASES:
+            result = results.get(label, {}).get(form.name)
+            if result is None:
+                continue
+            if result.max_safe == 0:
+                depth, fails = "N/A", "-"
+            elif result.failed_at is None:
+                depth, fails = f">= {result.max_safe}", "-"
+            else:
+                depth, fails = str(result.max_safe), str(result.failed_at)
+            summary = summarize(result.per_frame, outliers) if result.per_frame else None
+            per_frame = format_time(summary.median) if summary and summary.median > 0 else "N/A"
+            memory = "N/A"
+            if result.bytes_per_frame is not None:
+                memory = ("~" if result.from_stack_limit else "") + format_bytes(result.bytes_per_frame)
+            tco = tail_calls_verdict(result, results[label].get("direct")) if form.name == "tail" else ""
+            print(f"{label:<10} {form.name:<7} {depth:<16} {fails:<10} {result.failure[:42]:<42} "
+                  f"{per_frame:<12} {memory:<13} {tco:<10}")
+    print("Max safe depth: deepest run that printed the right result; past it the run crashed or raised.")
+    print("Time and memory per frame are slopes between a quarter and half of that depth (peak RSS, N/A")
+    print("while under the harness's own footprint); ~ marks a stack overflow's `ulimit -s` / max safe depth.")
+    print("TCO: tail recursion reached --max-depth in constant memory, or where direct recursion overflowed.")
+
+def calls_main(argv: List[str]) -> int:
+    """`calls` subcommand: per-call and per-argument cost, method calls, recursion depth and tail calls"""
+    parser = argparse.ArgumentParser(
+        prog="compare.py calls",
+        description="Measure call overhead (0-8 arguments, methods) and the safe recursion depth, "
+                    "direct and tail-recursive"
+    )
+    parser.add_argument("--suite", choices=("all", "calls", "recursion"), default="all",
+                        help="run only the call overhead or only the recursion part (default: all)")
+    parser.add_argument("--backends", default="interpreter,jit,aot",
+                        help=f"comma-separated Pain backends: {', '.join(PAIN_BACKENDS)} or 'all' "
+                             "(default: interpreter,jit,aot)")
+    parser.add_argument("--calls", type=int, default=1_000_000,
+                        help="loop iterations of the long run; the short run does a quarter (default: 1000000)")
+    parser.add_argument("--max-depth", type=int, default=1_000_000,
+                        help="deepest recursion to probe (default: 1000000)")
+    parser.add_argument("--bisect", type=int, default=10,
+                        help="bisection steps between the last good and first failing depth (default: 10)")
+    parser.add_argument("--runs", type=int, default=5, help="measured runs per count or depth (default: 5)")
+    parser.add_argument("--warmup", type=int, default=1, help="warmup runs per count or depth (default: 1)")
+    parser.add_argument("--outliers", choices=OUTLIER_METHODS, default="mad",
+                        help="outlier rejection rule (default: mad)")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY, help="results store")
+    parser.add_argument("--no-record", action="store_true", help="do not store results in the history")
+    args = parser.parse_args(argv)
+    
+    if args.calls < 8:
+        print(f"Invalid --calls {args.calls} (expected at least 8)")
+        return 1
+    if args.max_depth < 10:
+        print(f"Invalid --max-depth {args.max_depth} (expected at least 10)")
+        return 1
+    backends = PAIN_BACKENDS if args.backends == "all" else [b.strip() for b in args.backends.split(",") if b.strip()]
+    unknown = [b for b in backends if b not in PAIN_BACKENDS]
+    if unknown:
+        print(f"Unknown Pain backend(s): {', '.join(unknown)} (expected {', '.join(PAIN_BACKENDS)} or 'all')")
+        return 1
+    
+    rows = [row for row in report_rows(backends) if row.key in ("pain", "python", "rust", "cpp")]
+    labels = [row.label for row in rows]
+    sampling = Sampling(iterations=args.runs, warmup=args.warmup, outliers=args.outliers)
+    history = None if args.no_record else History(args.history, environment.collect())
+    
+    if args.suite in ("all", "calls"):
+        counts = [args.calls // 4, args.calls]
+        costs: Dict[str, Dict[str, float]] = {}
+        samples: Dict[str, Dict[str, List[float]]] = {}
+        print(f"\nTiming {len(call_suite.CALL_CASES)} call cases at {counts[0]} and {counts[1]} calls "
+              f"({describe_sampling(sampling)})...")
+        for case in call_suite.CALL_CASES:
+            bench = call_suite.benchmark(case)
+            print(f"  {case.name}...", end="", flush=True)
+            for row in rows:
+                per_run = per_iteration(row.runner(bench, counts[0], sampling),
+                                        row.runner(bench, counts[1], sampling), counts, sampling.outliers)
+                summary = summarize(per_run, sampling.outliers) if per_run else None
+                if summary is None:
+                    print(f" {row.label} failed;", end="")
+                    continue
+                costs.setdefault(case.name, {})[row.label] = summary.median
+                samples.setdefault(case.name, {})[row.label] = per_run
+            print(" Done")
         
-        print(f"{lang:<15} {format_time(mean_time):<15} {format_time(min_time):<15} {format_time(max_time):<15} {speedup:.2f}x")
+        if history is not None:
+            loop = costs.get(call_suite.LOOP.name, {})
+            for case in call_suite.CALL_CASES[1:]:
+                for row in rows:
+                    if row.label in samples.get(case.name, {}):
+                        history.append(f"calls-{case.name}", row.language, row.backend, args.calls,
+                                       samples=[t - loop.get(row.label, 0.0) for t in samples[case.name][row.label]])
+        print_call_results(labels, costs)
+    
+    if args.suite in ("all", "recursion"):
+        results: Dict[str, Dict[str, Recursion]] = {}
+        print(f"\nProbing recursion depth up to {args.max_depth} ({describe_sampling(sampling)})...")
+        for form in call_suite.RECURSION_CASES:
+            bench = call_suite.benchmark(form, prefix="recursion")
+            for row in rows:
+                print(f"  {row.label} {form.name}...", end="", flush=True)
+                result = run_recursion(bench, row, args.max_depth, args.bisect, sampling)
+                results.setdefault(row.label, {})[form.name] = result
+                print(f" max safe depth {result.max_safe}" + (f" ({result.failure})" if result.failure else ""))
+                if history is not None and result.per_frame:
+                    history.append(bench.name, row.language, row.backend, result.max_safe,
+                                   samples=result.per_frame, max_safe_depth=result.max_safe,
+                                   failed_at=result.failed_at, bytes_per_frame=result.bytes_per_frame,
+                                   bytes_from_stack_limit=result.from_stack_limit)
+        print_recursion_results(labels, results, args.max_depth, sampling.outliers)
+    return 0
+
+def native_sources(benches: List[Benchmark], key: str) -> List[str]:
+    """Artifact names (source stems) of a compiled language across benchmarks"""
+    return [b.source(key).stem for b in benches if b.source(key) is not None]
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "compare":
+        sys.exit(compare_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == "lsp":
+        sys.exit(lsp_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == "frontend":
+        sys.exit(frontend_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == "painpkg":
+        sys.exit(painpkg_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == "pml":
+        sys.exit(pml_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == "stdlib":
+        sys.exit(stdlib_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == "calls":
+        sys.exit(calls_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == "profile-diff":
+        sys.exit(profile_diff_main(sys.argv[2:]))
+    
+    parser = argparse.ArgumentParser(description="Benchmark comparison for Pain vs Python/Rust/C++")
+    parser.add_argument("benchmark", help="benchmark name from the manifest, or 'all'")
+    parser.add_argument("iterations", nargs="?", type=int, default=10,
+                        help="runs per language (minimum runs with --adaptive)")
+    parser.add_argument("warmup", nargs="?", type=int, default=3)
+    parser.add_argument("--size", help="size class from the manifest (default: each benchmark's default_size)")
+    parser.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST,
+                        help=f"benchmark manifest (default: {DEFAULT_MANIFEST})")
+    parser.add_argument("--sweep", action="store_true",
+                        help="run each benchmark over its geometric size series and fit complexity models")
+    parser.add_argument("--backends", default="interpreter",
+                        help="comma-separated Pain backends to compare: "
+                             f"{', '.join(PAIN_BACKENDS)} or 'all' (default: interpreter)")
+    parser.add_argument("--phases", action="store_true",
+                        help="report startup, compile/parse and execute time separately")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="sample until the median's 95%% CI is within --ci-width or --budget runs out")
+    parser.add_argument("--ci-width", type=float, default=0.02,
+                        help="target CI width relative to the median (default: 0.02 = 2%%)")
+    parser.add_argument("--budget", type=float, default=60.0,
+                        help="seconds of sampling per benchmark and language in adaptive and warm mode")
+    parser.add_argument("--max-runs", type=int, default=500,
+                        help="hard cap on runs per benchmark and language in adaptive mode")
+    parser.add_argument("--outliers", choices=OUTLIER_METHODS, default="mad",
+                        help="outlier rejection rule (default: mad)")
+    parser.add_argument("--warm", action="store_true",
+                        help="keep one process per language (Pain REPL, in-process Python loop) and "
+                             "report per-call latency and the warmup curve")
+    parser.add_argument("--calls", type=int, default=2000,
+                        help="calls per language in warm mode (default: 2000)")
+    parser.add_argument("--workers",
+                        help="comma-separated worker counts: strong/weak scaling of the parallel kernels "
+                             "(default: one run with every CPU)")
+    parser.add_argument("--jobs", type=int,
+                        help="benchmark jobs to run at once, each pinned to its own core "
+                             f"(default: physical cores - 1, here {scheduler.default_jobs()})")
+    parser.add_argument("--serial", action="store_true",
+                        help="run one job at a time with the rest of the machine idle (same as --jobs 1)")
+    parser.add_argument("--seed", type=int, help="seed of the shuffled run order (default: random, printed)")
+    parser.add_argument("--strict-env", action="store_true",
+                        help="refuse to run when the preflight finds a noisy machine (high load, powersave governor)")
+    parser.add_argument("--no-aslr", action="store_true",
+                        help="run every benchmark process under `setarch -R` (no address-space randomization)")
+    parser.add_argument("--counters", action="store_true",
+                        help="record hardware counters (cycles, instructions, IPC, misses) with perf stat")
+    parser.add_argument("--profile", action="store_true",
+                        help="run each benchmark once per language under a sampling profiler and write "
+                             "folded stacks and SVG flamegraphs under target/bench-profile/")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY,
+                        help=f"results store (default: {DEFAULT_HISTORY})")
+    parser.add_argument("--no-record", action="store_true", help="do not store results in the history")
     if len(sys.argv) < 2:
-        print("Usage: python compare.py [benchmark_name] [iterations] [warmup]")
-        print("Available benchmarks:", ", ".join(BENCHMARKS.keys()))
+        parser.print_usage()
+        try:
+            print("Available benchmarks:", ", ".join(load_manifest(DEFAULT_MANIFEST).names()))
+        except ManifestError as e:
+            print(f"Error: {e}")
+        sys.exit(1)
+    args = parser.parse_args()
+    
+    try:
+        manifest = load_manifest(args.manifest)
+    except ManifestError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    benchmark_name = args.benchmark.lower()
+    try:
+        worker_counts = sorted({int(w) for w in args.workers.split(",") if w.strip()}) if args.workers else []
+    except ValueError:
+        worker_counts = [0]
+    if worker_counts and worker_counts[0] < 1:
+        print(f"Invalid --workers '{args.workers}' (expected positive integers, e.g. 1,2,4)")
+        sys.exit(1)
+    sampling = Sampling(
+        iterations=args.iterations,
+        warmup=args.warmup,
+        adaptive=args.adaptive,
+        max_runs=args.max_runs,
+        ci_width=args.ci_width,
+        budget=args.budget,
+        outliers=args.outliers,
+        counters=args.counters,
+        workers=os.cpu_count() or 1,
+    )
+    jobs = 1 if args.serial else args.jobs or scheduler.default_jobs()
+    if jobs < 1:
+        print(f"Invalid --jobs {args.jobs} (expected a positive integer)")
         sys.exit(1)
+    seed = args.seed if args.seed is not None else random.randrange(2**32)
+    if sampling.counters and counters.unavailable_reason():
+        print(f"Warning: {counters.unavailable_reason()}; continuing without counters")
+        sampling = sampling._replace(counters=False)
+    if args.no_aslr and environment.setarch_unavailable():
+        print(f"Warning: {environment.setarch_unavailable()}; continuing with ASLR")
+    elif args.no_aslr:
+        sampling = sampling._replace(no_aslr=True)
     
-    benchmark_name = sys.argv[1].lower()
-    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 10
-    warmup = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+    fingerprint = {**environment.collect(), "no_aslr": sampling.no_aslr}
+    for line in environment.describe(fingerprint):
+        print(line)
+    for note in environment.notes(fingerprint):
+        if not (sampling.no_aslr and note.startswith("ASLR")):
+            print(f"Note: {note}")
+    problems = environment.noise_problems(fingerprint)
+    for problem in problems:
+        print(f"Warning: {problem}")
+    if problems and args.strict_env:
+        print("Refusing to benchmark on a noisy machine (--strict-env)")
+        sys.exit(1)
     
     if benchmark_name == "all":
-        benchmarks_to_run = list(BENCHMARKS.keys())
-    elif benchmark_name in BENCHMARKS:
-        benchmarks_to_run = [benchmark_name]
+        names = manifest.names()
+    elif benchmark_name in manifest:
+        names = [benchmark_name]
     else:
         print(f"Unknown benchmark: {benchmark_name}")
-        print("Available benchmarks:", ", ".join(BENCHMARKS.keys()))
+        print("Available benchmarks:", ", ".join(manifest.names()))
+        sys.exit(1)
+    
+    try:
+        benchmarks_to_run = [manifest.get(name) for name in names]
+        empty = manifest.startup() if args.phases or args.counters else None
+    except ManifestError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    backends = PAIN_BACKENDS if args.backends == "all" else [b.strip() for b in args.backends.split(",") if b.strip()]
+    unknown = [b for b in backends if b not in PAIN_BACKENDS]
+    if unknown:
+        print(f"Unknown Pain backend(s): {', '.join(unknown)} (expected {', '.join(PAIN_BACKENDS)} or 'all')")
         sys.exit(1)
+    rows = report_rows(backends)
+    
+    # Profiled runs are slowed down by the sampler, so they are never recorded
+    history = None if args.no_record or args.profile else History(args.history, fingerprint)
+    if args.profile:
+        profile_commit = profiler.current_commit()
+        if profiler.perf_unavailable():
+            print(f"Warning: {profiler.perf_unavailable()}; profiling only the Python baselines")
+    
+    # Plain runs of every benchmark go through the scheduler together, so the
+    # jobs of one benchmark interleave with all the others
+    scheduled = []
+    if not (args.sweep or args.warm or args.profile or worker_counts):
+        for bench in benchmarks_to_run:
+            size = args.size or bench.default_size
+            if size in bench.sizes:
+                scheduled.append((bench, size))
+    
+    # Compile every baseline before measuring anything; cached builds are reused
+    native = benchmarks_to_run + ([empty] if empty else [])
+    print("Preparing Rust and C++ builds...", end="", flush=True)
+    buildcache.prepare(native_sources(native, "rust"), native_sources(native, "cpp"))
+    print(" Done")
+    # The JIT compiler and the AOT/PGO executables (with PGO's training run)
+    # too, so no scheduled job builds while others are timed
+    pain_rows = [row for row in rows if isinstance(row.runner, PainBackend) and row.backend != "interpreter"]
+    if pain_rows:
+        sized = scheduled + ([(empty, None)] if empty else [])
+        builds = [(bench, bench.n_for(size, "pain")) for bench, size in sized
+                  if bench.n_for(size, "pain") is not None]
+        print("Preparing Pain builds...", end="", flush=True)
+        for row in pain_rows:
+            row.runner.prepare(builds)
+        print(" Done")
+    startup, startup_counters = measure_startup(empty, rows, sampling) if empty else ({}, {})
+    
+    measured = run_scheduled(scheduled, rows, sampling, jobs, seed, history) if scheduled else {}
     
     for bench in benchmarks_to_run:
-        config = BENCHMARKS[bench]
-        results = {}
+        if args.sweep:
+            if bench.sweep is None:
+                print(f"\nSkipping {bench.name}: no sweep defined in {args.manifest}")
+                continue
+            points, kernels = run_sweep(bench, rows, sampling, history)
+            print_sweep_results(bench, rows, points)
+            if bench.batches:
+                print_batch_results(bench, rows, kernels)
+            continue
         
-        print(f"\nRunning {bench} benchmark ({iterations} iterations, {warmup} warmup)...")
+        if args.warm:
+            size = args.size or bench.default_size
+            if size not in bench.sizes:
+                print(f"\nSkipping {bench.name}: no size class '{size}' (has {', '.join(bench.sizes)})")
+                continue
+            print_warm_results(bench, run_warm(bench, rows, size, args.calls, sampling, history))
+            continue
         
-        # Pain
-        print("  Running Pain...", end="", flush=True)
-        pain_times = benchmark_pain(bench, config["pain_n"], iterations, warmup)
-        results["Pain"] = pain_times
-        print(f" Done ({len(pain_times)} successful runs)")
+        if args.profile:
+            size = args.size or bench.default_size
+            if size not in bench.sizes:
+                print(f"\nSkipping {bench.name}: no size class '{size}' (has {', '.join(bench.sizes)})")
+                continue
+            print_profile_results(bench, run_profile(bench, rows, size, sampling, profile_commit))
+            continue
+        
+        if worker_counts:
+            size = args.size or bench.default_size
+            if not any(bench.parallel(row.key) for row in rows) or size not in bench.sizes:
+                print(f"\nSkipping {bench.name}: no parallel implementation at size '{size}'")
+                continue
+            print_scaling_results(bench, run_scaling(bench, rows, sampling, size, worker_counts, history))
+            continue
         
-        # Python
-        print("  Running Python...", end="", flush=True)
-        python_times = benchmark_python(bench, config["python_n"], iterations, warmup)
-        results["Python"] = python_times
-        print(f" Done ({len(python_times)} successful runs)")
+        results = {}
+        ns = {}
+        size = args.size or bench.default_size
+        if size not in bench.sizes:
+            print(f"\nSkipping {bench.name}: no size class '{size}' (has {', '.join(bench.sizes)})")
+            continue
         
-        # Rust
-        print("  Running Rust...", end="", flush=True)
-        rust_times = benchmark_rust(bench, config["rust_n"], iterations, warmup)
-        results["Rust"] = rust_times
-        print(f" Done ({len(rust_times)} successful runs)")
+        for row in rows:
+            if (bench.name, row.label) in measured:
+                ns[row.label], results[row.label] = measured[(bench.name, row.label)]
+            else:
+                results[row.label] = []
         
-        # C++
-        print("  Running C++...", end="", flush=True)
-        cpp_times = benchmark_cpp(bench, config["cpp_n"], iterations, warmup)
-        results["C++"] = cpp_times
-        print(f" Done ({len(cpp_times)} successful runs)")
+        # Only the languages this benchmark has a source for
+        labels = [row.label for row in rows if bench.source(row.key) is not None]
+        print_results(bench.name, labels, results, sampling.outliers)
+        if bench.flops or bench.bytes or bench.batches:
+            print_throughput_results(bench, labels, results, ns, sampling.outliers)
+        print_usage_results(labels, results, sampling.outliers)
+        if bench.pauses:
+            print_pause_results(labels, results)
+        if sampling.counters:
+            print_counter_results(bench, labels, results, ns, startup_counters, sampling.outliers)
+        pain_n = bench.n_for(size, "pain")
+        if pain_n is not None:
+            print_build_times(bench, rows, pain_n)
+            print_unvalidated(bench, rows, pain_n)
         
-        print_results(bench, results)
+        if args.phases:
+            # Pain has no in-process timer; `check` runs startup + front end only,
+            # which the interpreter and the JIT share.
+            probe = None
+            if pain_n is not None and any(row.language == "Pain" and not row.ahead_of_time for row in rows):
+                print("  Running Pain front end (check)...", end="", flush=True)
+                check = benchmark_pain_frontend(bench, pain_n, sampling)
+                print(f" Done ({len(check)} successful runs)")
+                if check:
+                    probe = mean([m.total for m in check])
+            
+            phases = {}
+            for row in rows:
+                if results[row.label] and row.label in startup:
+                    phases[row.label] = split_phases(
+                        results[row.label], startup[row.label],
+                        probe if row.language == "Pain" else None,
+                        has_frontend=not row.ahead_of_time,
+                    )
+            print_phase_results(bench.name, labels, phases)
 
 if __name__ == "__main__":
     main()
-
@@ -0,0 +1,53 @@
+// List allocation churn benchmark for C++
+//
+// Usage: alloc_lists <n>
+// Each of the 100 batches builds and drops n vectors of 16 ints
+// (block[k] = b + i + k) and sums block[i % 16]; "batch <b>" follows each batch.
+
+#include <iostream>
+#include <vector>
+#include <cstdlib>
+#include <cstdint>
+#include <chrono>
+
+const int64_t BATCHES = 100;
+
+// Keep the allocation: compilers may otherwise elide new/delete pairs
+static void escape(void* p) {
+#if defined(__GNUC__) || defined(__clang__)
+    asm volatile("" : : "g"(p) : "memory");
+#else
+    (void)p;
+#endif
+}
+
+int64_t churn(int64_t b, int64_t count) {
+    int64_t total = 0;
+    for (int64_t i = 0; i < count; i++) {
+        int64_t v = b + i;
+        std::vector<int64_t> block{
+            v, v + 1, v + 2, v + 3, v + 4, v + 5, v + 6, v + 7,
+            v + 8, v + 9, v + 10, v + 11, v + 12, v + 13, v + 14, v + 15,
+        };
+        escape(block.data());
+        total += block[i % 16];
+    }
+    return total;
+}
+
+int main(int argc, char* argv[]) {
+    int64_t n = argc > 1 ? std::atoll(argv[1]) : 10000;
+    auto start = std::chrono::steady_clock::now();
+    int64_t total = 0;
+    for (int64_t b = 0; b < BATCHES; b++) {
+        total += churn(b, n);
+        std::cout << "batch " << b << std::endl;
+    }
+    auto elapsed = std::chrono::duration_cast<std::chrono::nanoseconds>(
+        std::chrono::steady_clock::now() - start).count();
+    std::cout << total << std::endl;
+    if (std::getenv("PAIN_BENCH_TIMING")) {
+        std::cerr << "bench-timing: execute_ns=" << elapsed << std::endl;
+    }
+    return 0;
+}
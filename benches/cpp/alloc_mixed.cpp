@@ -0,0 +1,58 @@
+// Long-lived plus short-lived allocation benchmark for C++
+//
+// Usage: alloc_mixed <depth>
+// A binary tree of the given depth lives for the whole run while each of the
+// 100 batches builds, counts and frees 16 trees of depth 8; "batch <b>"
+// follows each batch.
+
+#include <iostream>
+#include <memory>
+#include <cstdlib>
+#include <cstdint>
+#include <chrono>
+
+const int64_t BATCHES = 100;
+const int64_t TREES = 16;
+const int DEPTH = 8;
+
+struct Node {
+    std::unique_ptr<Node> left;
+    std::unique_ptr<Node> right;
+};
+
+std::unique_ptr<Node> make(int depth) {
+    auto node = std::make_unique<Node>();
+    if (depth > 0) {
+        node->left = make(depth - 1);
+        node->right = make(depth - 1);
+    }
+    return node;
+}
+
+int64_t check(const Node& node) {
+    if (!node.left) {
+        return 1;
+    }
+    return 1 + check(*node.left) + check(*node.right);
+}
+
+int main(int argc, char* argv[]) {
+    int depth = argc > 1 ? std::atoi(argv[1]) : 16;
+    auto start = std::chrono::steady_clock::now();
+    auto long_lived = make(depth);
+    int64_t total = 0;
+    for (int64_t b = 0; b < BATCHES; b++) {
+        for (int64_t t = 0; t < TREES; t++) {
+            total += check(*make(DEPTH));
+        }
+        std::cout << "batch " << b << std::endl;
+    }
+    total += check(*long_lived);
+    auto elapsed = std::chrono::duration_cast<std::chrono::nanoseconds>(
+        std::chrono::steady_clock::now() - start).count();
+    std::cout << total << std::endl;
+    if (std::getenv("PAIN_BENCH_TIMING")) {
+        std::cerr << "bench-timing: execute_ns=" << elapsed << std::endl;
+    }
+    return 0;
+}
@@ -0,0 +1,42 @@
+// String concatenation churn benchmark for C++
+//
+// Usage: alloc_strings <n>
+// Each of the 100 batches builds n strings by appending std::to_string(b + i + k)
+// for k = 0..15 and sums their lengths; "batch <b>" follows each batch.
+
+#include <iostream>
+#include <string>
+#include <cstdlib>
+#include <cstdint>
+#include <chrono>
+
+const int64_t BATCHES = 100;
+
+int64_t churn(int64_t b, int64_t count) {
+    int64_t total = 0;
+    for (int64_t i = 0; i < count; i++) {
+        std::string s;
+        for (int64_t k = 0; k < 16; k++) {
+            s = s + std::to_string(b + i + k);
+        }
+        total += static_cast<int64_t>(s.size());
+    }
+    return total;
+}
+
+int main(int argc, char* argv[]) {
+    int64_t n = argc > 1 ? std::atoll(argv[1]) : 5000;
+    auto start = std::chrono::steady_clock::now();
+    int64_t total = 0;
+    for (int64_t b = 0; b < BATCHES; b++) {
+        total += churn(b, n);
+        std::cout << "batch " << b << std::endl;
+    }
+    auto elapsed = std::chrono::duration_cast<std::chrono::nanoseconds>(
+        std::chrono::steady_clock::now() - start).count();
+    std::cout << total << std::endl;
+    if (std::getenv("PAIN_BENCH_TIMING")) {
+        std::cerr << "bench-timing: execute_ns=" << elapsed << std::endl;
+    }
+    return 0;
+}
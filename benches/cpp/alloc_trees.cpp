@@ -0,0 +1,51 @@
+// Binary-tree allocation benchmark for C++
+//
+// Usage: alloc_trees <depth>
+// Each of the 100 batches builds a complete binary tree of the given depth,
+// counts its nodes and frees it; "batch <b>" follows each batch.
+
+#include <iostream>
+#include <memory>
+#include <cstdlib>
+#include <cstdint>
+#include <chrono>
+
+const int64_t BATCHES = 100;
+
+struct Node {
+    std::unique_ptr<Node> left;
+    std::unique_ptr<Node> right;
+};
+
+std::unique_ptr<Node> make(int depth) {
+    auto node = std::make_unique<Node>();
+    if (depth > 0) {
+        node->left = make(depth - 1);
+        node->right = make(depth - 1);
+    }
+    return node;
+}
+
+int64_t check(const Node& node) {
+    if (!node.left) {
+        return 1;
+    }
+    return 1 + check(*node.left) + check(*node.right);
+}
+
+int main(int argc, char* argv[]) {
+    int depth = argc > 1 ? std::atoi(argv[1]) : 12;
+    auto start = std::chrono::steady_clock::now();
+    int64_t total = 0;
+    for (int64_t b = 0; b < BATCHES; b++) {
+        total += check(*make(depth));
+        std::cout << "batch " << b << std::endl;
+    }
+    auto elapsed = std::chrono::duration_cast<std::chrono::nanoseconds>(
+        std::chrono::steady_clock::now() - start).count();
+    std::cout << total << std::endl;
+    if (std::getenv("PAIN_BENCH_TIMING")) {
+        std::cerr << "bench-timing: execute_ns=" << elapsed << std::endl;
+    }
+    return 0;
+}
@@ -0,0 +1,142 @@
+// Call overhead and recursion depth benchmark for C++
+//
+// Usage: calls <mode> <n>, modes as in harness/call_suite.py. Callees are
+// noinline so every call is a real call; the direct recursion passes its
+// result through an empty asm statement so GCC can't turn it into a loop.
+// Tail calls are left to the optimizer, which is the point; the barrier on
+// the accumulator only stops it from folding the resulting loop into `n`.
+
+#include <iostream>
+#include <cstdlib>
+#include <cstdint>
+#include <chrono>
+
+#define NOINLINE __attribute__((noinline))
+
+template <typename T>
+static inline T opaque(T value) {
+    asm volatile("" : "+r"(value));
+    return value;
+}
+
+NOINLINE int64_t f0() {
+    return opaque<int64_t>(1);  // a constant result would let GCC hoist the call out of the loop
+}
+
+NOINLINE int64_t f1(int64_t a0) {
+    return a0;
+}
+
+NOINLINE int64_t f2(int64_t a0, int64_t a1) {
+    return a0 + a1;
+}
+
+NOINLINE int64_t f3(int64_t a0, int64_t a1, int64_t a2) {
+    return a0 + a1 + a2;
+}
+
+NOINLINE int64_t f4(int64_t a0, int64_t a1, int64_t a2, int64_t a3) {
+    return a0 + a1 + a2 + a3;
+}
+
+NOINLINE int64_t f5(int64_t a0, int64_t a1, int64_t a2, int64_t a3, int64_t a4) {
+    return a0 + a1 + a2 + a3 + a4;
+}
+
+NOINLINE int64_t f6(int64_t a0, int64_t a1, int64_t a2, int64_t a3, int64_t a4, int64_t a5) {
+    return a0 + a1 + a2 + a3 + a4 + a5;
+}
+
+NOINLINE int64_t f7(int64_t a0, int64_t a1, int64_t a2, int64_t a3, int64_t a4, int64_t a5, int64_t a6) {
+    return a0 + a1 + a2 + a3 + a4 + a5 + a6;
+}
+
+NOINLINE int64_t f8(int64_t a0, int64_t a1, int64_t a2, int64_t a3, int64_t a4, int64_t a5, int64_t a6, int64_t a7) {
+    return a0 + a1 + a2 + a3 + a4 + a5 + a6 + a7;
+}
+
+class Counter {
+public:
+    explicit Counter(int64_t step) : step_(step) {}
+
+    NOINLINE int64_t add(int64_t x) const {
+        return x + step_;
+    }
+
+private:
+    int64_t step_;
+};
+
+NOINLINE int64_t depth(int64_t n) {
+    if (n == 0) {
+        return 0;
+    }
+    return 1 + opaque(depth(n - 1));
+}
+
+NOINLINE int64_t depth_tail(int64_t n, int64_t acc) {
+    if (n == 0) {
+        return acc;
+    }
+    return depth_tail(n - 1, opaque(acc + 1));
+}
+
+int64_t run(int mode, int64_t n) {
+    Counter counter(opaque<int64_t>(1));
+    int64_t acc = 0;
+    switch (mode) {
+    case 0:
+        for (int64_t i = 0; i < n; i++) acc += opaque(i);
+        break;
+    case 1:
+        for (int64_t i = 0; i < n; i++) acc += f0();
+        break;
+    case 2:
+        for (int64_t i = 0; i < n; i++) acc += f1(i);
+        break;
+    case 3:
+        for (int64_t i = 0; i < n; i++) acc += f2(i, i);
+        break;
+    case 4:
+        for (int64_t i = 0; i < n; i++) acc += f3(i, i, i);
+        break;
+    case 5:
+        for (int64_t i = 0; i < n; i++) acc += f4(i, i, i, i);
+        break;
+    case 6:
+        for (int64_t i = 0; i < n; i++) acc += f5(i, i, i, i, i);
+        break;
+    case 7:
+        for (int64_t i = 0; i < n; i++) acc += f6(i, i, i, i, i, i);
+        break;
+    case 8:
+        for (int64_t i = 0; i < n; i++) acc += f7(i, i, i, i, i, i, i);
+        break;
+    case 9:
+        for (int64_t i = 0; i < n; i++) acc += f8(i, i, i, i, i, i, i, i);
+        break;
+    case 10:
+        for (int64_t i = 0; i < n; i++) acc += counter.add(i);
+        break;
+    case 11:
+        acc = depth(n);
+        break;
+    default:
+        acc = depth_tail(n, 0);
+    }
+    return acc;
+}
+
+int main(int argc, char* argv[]) {
+    int mode = argc > 1 ? std::atoi(argv[1]) : 0;
+    int64_t n = argc > 2 ? std::atoll(argv[2]) : 1000;
+    auto start = std::chrono::steady_clock::now();
+    int64_t result = run(mode, opaque(n));
+    auto elapsed = std::chrono::duration_cast<std::chrono::nanoseconds>(
+        std::chrono::steady_clock::now() - start).count();
+    std::cout << result << std::endl;
+    if (std::getenv("PAIN_BENCH_TIMING")) {
+        std::cerr << "bench-timing: execute_ns=" << elapsed << std::endl;
+    }
+    return 0;
+}
@@ -0,0 +1,78 @@
+// Cholesky factorization and solve benchmark for C++ (flat row-major std::vector<double>)
+
+#include <iostream>
+#include <cmath>
+#include <cstdlib>
+#include <cstdint>
+#include <chrono>
+#include <numeric>
+#include <vector>
+
+void make_system(size_t n, std::vector<double>& s, std::vector<double>& b) {
+    s.assign(n * n, 0.0);
+    b.assign(n, 0.0);
+    for (size_t i = 0; i < n; ++i) {
+        for (size_t j = 0; j < n; ++j) {
+            s[i * n + j] = static_cast<double>((i + j) % 5 + 1);
+        }
+        s[i * n + i] = 5.0 * static_cast<double>(n);
+    }
+    // Right-hand side S @ ones, so the exact solution is all ones
+    for (size_t i = 0; i < n; ++i) {
+        b[i] = std::accumulate(s.begin() + i * n, s.begin() + (i + 1) * n, 0.0);
+    }
+}
+
+std::vector<double> cholesky_solve(const std::vector<double>& s, const std::vector<double>& b, size_t n) {
+    // Factor S = L L^T in place (lower triangle)
+    std::vector<double> l(s);
+    for (size_t j = 0; j < n; ++j) {
+        double acc = l[j * n + j];
+        for (size_t k = 0; k < j; ++k) {
+            acc -= l[j * n + k] * l[j * n + k];
+        }
+        double d = std::sqrt(acc);
+        l[j * n + j] = d;
+        for (size_t i = j + 1; i < n; ++i) {
+            double acc_i = l[i * n + j];
+            for (size_t k = 0; k < j; ++k) {
+                acc_i -= l[i * n + k] * l[j * n + k];
+            }
+            l[i * n + j] = acc_i / d;
+        }
+    }
+    // Forward substitution L z = b, then back substitution L^T x = z
+    std::vector<double> z(n, 0.0);
+    for (size_t i = 0; i < n; ++i) {
+        double acc = b[i];
+        for (size_t k = 0; k < i; ++k) {
+            acc -= l[i * n + k] * z[k];
+        }
+        z[i] = acc / l[i * n + i];
+    }
+    std::vector<double> x(n, 0.0);
+    for (size_t i = n; i-- > 0;) {
+        double acc = z[i];
+        for (size_t k = i + 1; k < n; ++k) {
+            acc -= l[k * n + i] * x[k];
+        }
+        x[i] = acc / l[i * n + i];
+    }
+    return x;
+}
+
+int main(int argc, char* argv[]) {
+    size_t n = argc > 1 ? std::strtoull(argv[1], nullptr, 10) : 64;
+    std::vector<double> s, b;
+    make_system(n, s, b);
+    auto start = std::chrono::steady_clock::now();
+    std::vector<double> x = cholesky_solve(s, b, n);
+    auto elapsed = std::chrono::duration_cast<std::chrono::nanoseconds>(
+        std::chrono::steady_clock::now() - start).count();
+    double sum = std::accumulate(x.begin(), x.end(), 0.0);
+    std::cout << static_cast<int64_t>(std::llround(sum * 1000000.0)) << std::endl;
+    if (std::getenv("PAIN_BENCH_TIMING")) {
+        std::cerr << "bench-timing: execute_ns=" << elapsed << std::endl;
+    }
+    return 0;
+}
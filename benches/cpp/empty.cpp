@@ -0,0 +1,8 @@
+// Empty program for C++: measures process startup only
+
+#include <iostream>
+
+int main() {
+    std::cout << 0 << std::endl;
+    return 0;
+}
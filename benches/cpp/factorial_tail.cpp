@@ -0,0 +1,30 @@
+// Tail-recursive factorial benchmark for C++
+
+#include <iostream>
+#include <cstdlib>
+#include <cstdint>
+#include <chrono>
+
+int64_t fact_tail(int64_t n, int64_t acc) {
+    if (n <= 1) {
+        return acc;
+    }
+    return fact_tail(n - 1, n * acc);
+}
+
+int64_t fact(int64_t n) {
+    return fact_tail(n, 1);
+}
+
+int main(int argc, char* argv[]) {
+    int64_t n = argc > 1 ? std::atoll(argv[1]) : 15;
+    auto start = std::chrono::steady_clock::now();
+    int64_t result = fact(n);
+    auto elapsed = std::chrono::duration_cast<std::chrono::nanoseconds>(
+        std::chrono::steady_clock::now() - start).count();
+    std::cout << result << std::endl;
+    if (std::getenv("PAIN_BENCH_TIMING")) {
+        std::cerr << "bench-timing: execute_ns=" << elapsed << std::endl;
+    }
+    return 0;
+}
@@ -0,0 +1,65 @@
+// 2D Jacobi heat stencil benchmark for C++, rows split across threads each step
+//
+// Usage: jacobi <n> [workers]
+// n x n grid, top edge held at 100, other edges at 0, STEPS sweeps of
+// u'[i][j] = (up + down + left + right) * 0.25.
+
+#include <iostream>
+#include <algorithm>
+#include <cmath>
+#include <cstdlib>
+#include <cstdint>
+#include <chrono>
+#include <thread>
+#include <vector>
+
+const int STEPS = 50;
+
+void sweep_rows(const std::vector<double>& src, std::vector<double>& dst, size_t n, size_t lo, size_t hi) {
+    for (size_t i = lo; i < hi; ++i) {
+        for (size_t j = 1; j + 1 < n; ++j) {
+            dst[i * n + j] = (src[(i - 1) * n + j] + src[(i + 1) * n + j]
+                              + src[i * n + j - 1] + src[i * n + j + 1]) * 0.25;
+        }
+    }
+}
+
+std::vector<double> jacobi(size_t n, size_t workers) {
+    std::vector<double> a(n * n, 0.0);
+    for (size_t j = 0; j < n; ++j) {
+        a[j] = 100.0;
+    }
+    std::vector<double> b(a);
+    size_t interior = n - 2;
+    for (int step = 0; step < STEPS; ++step) {
+        std::vector<std::thread> threads;
+        for (size_t w = 0; w < workers; ++w) {
+            size_t lo = 1 + interior * w / workers;
+            size_t hi = 1 + interior * (w + 1) / workers;
+            threads.emplace_back(sweep_rows, std::cref(a), std::ref(b), n, lo, hi);
+        }
+        for (auto& t : threads) {
+            t.join();
+        }
+        std::swap(a, b);
+    }
+    return a;
+}
+
+int main(int argc, char* argv[]) {
+    size_t n = argc > 1 ? std::strtoull(argv[1], nullptr, 10) : 128;
+    size_t workers = argc > 2 ? std::max<size_t>(1, std::strtoull(argv[2], nullptr, 10)) : 1;
+    auto start = std::chrono::steady_clock::now();
+    std::vector<double> grid = jacobi(n, workers);
+    auto elapsed = std::chrono::duration_cast<std::chrono::nanoseconds>(
+        std::chrono::steady_clock::now() - start).count();
+    double total = 0.0;
+    for (double cell : grid) {
+        total += cell;
+    }
+    std::cout << static_cast<int64_t>(std::floor(total * 1000.0 + 0.5)) << std::endl;
+    if (std::getenv("PAIN_BENCH_TIMING")) {
+        std::cerr << "bench-timing: execute_ns=" << elapsed << std::endl;
+    }
+    return 0;
+}
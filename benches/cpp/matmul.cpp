@@ -0,0 +1,49 @@
+// Dense matrix multiplication benchmark for C++ (flat row-major std::vector<double>, i-k-j loop order)
+
+#include <iostream>
+#include <cstdlib>
+#include <cstdint>
+#include <chrono>
+#include <numeric>
+#include <vector>
+
+void make_matrices(size_t n, std::vector<double>& a, std::vector<double>& b) {
+    a.assign(n * n, 0.0);
+    b.assign(n * n, 0.0);
+    for (size_t i = 0; i < n; ++i) {
+        for (size_t j = 0; j < n; ++j) {
+            a[i * n + j] = static_cast<double>((i + j) % 7 + 1);
+            b[i * n + j] = static_cast<double>((i + j) % 5 + 1);
+        }
+    }
+}
+
+std::vector<double> matmul(const std::vector<double>& a, const std::vector<double>& b, size_t n) {
+    std::vector<double> c(n * n, 0.0);
+    for (size_t i = 0; i < n; ++i) {
+        double* row = &c[i * n];
+        for (size_t k = 0; k < n; ++k) {
+            double aik = a[i * n + k];
+            const double* col = &b[k * n];
+            for (size_t j = 0; j < n; ++j) {
+                row[j] += aik * col[j];
+            }
+        }
+    }
+    return c;
+}
+
+int main(int argc, char* argv[]) {
+    size_t n = argc > 1 ? std::strtoull(argv[1], nullptr, 10) : 64;
+    std::vector<double> a, b;
+    make_matrices(n, a, b);
+    auto start = std::chrono::steady_clock::now();
+    std::vector<double> c = matmul(a, b, n);
+    auto elapsed = std::chrono::duration_cast<std::chrono::nanoseconds>(
+        std::chrono::steady_clock::now() - start).count();
+    std::cout << static_cast<int64_t>(std::accumulate(c.begin(), c.end(), 0.0)) << std::endl;
+    if (std::getenv("PAIN_BENCH_TIMING")) {
+        std::cerr << "bench-timing: execute_ns=" << elapsed << std::endl;
+    }
+    return 0;
+}
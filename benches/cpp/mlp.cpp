@@ -0,0 +1,168 @@
+// MLP benchmarks (forward pass, backprop step) for C++
+//
+// Usage: mlp <forward|backward> <batch>
+// A 16 -> 32 (ReLU) -> 4 network applied layer by layer to the whole batch
+// (row-major activations). Each run processes SAMPLES samples as
+// max(1, SAMPLES / batch) batches; the empty asm barrier keeps them from being folded.
+
+#include <iostream>
+#include <algorithm>
+#include <cstdlib>
+#include <cstdint>
+#include <chrono>
+#include <cstring>
+#include <numeric>
+#include <vector>
+
+const size_t SAMPLES = 4096;
+const size_t IN = 16;
+const size_t HIDDEN = 32;
+const size_t OUT = 4;
+
+template <typename T>
+inline void clobber(T* p) {
+#if defined(__GNUC__)
+    asm volatile("" : : "g"(p) : "memory");
+#else
+    static volatile T* sink;
+    sink = p;
+#endif
+}
+
+struct Params {
+    std::vector<double> w1, b1, w2, b2;
+};
+
+struct Activations {
+    std::vector<double> z1, h, out;
+};
+
+Params make_params() {
+    Params p{std::vector<double>(IN * HIDDEN), std::vector<double>(HIDDEN),
+             std::vector<double>(HIDDEN * OUT), std::vector<double>(OUT)};
+    for (size_t i = 0; i < IN; ++i) {
+        for (size_t j = 0; j < HIDDEN; ++j) {
+            p.w1[i * HIDDEN + j] = (static_cast<double>((i * 3 + j * 5) % 7) - 3.0) / 8.0;
+        }
+    }
+    for (size_t j = 0; j < HIDDEN; ++j) {
+        p.b1[j] = (static_cast<double>((j * 5) % 9) - 4.0) / 8.0;
+        for (size_t k = 0; k < OUT; ++k) {
+            p.w2[j * OUT + k] = (static_cast<double>((j * 2 + k * 3) % 5) - 2.0) / 8.0;
+        }
+    }
+    for (size_t k = 0; k < OUT; ++k) {
+        p.b2[k] = (static_cast<double>(k) - 1.0) / 4.0;
+    }
+    return p;
+}
+
+// z1 = x W1 + b1, h = relu(z1), out = h W2 + b2 for every sample in the batch
+void forward_pass(const std::vector<double>& x, const Params& p, Activations& a) {
+    size_t batch = x.size() / IN;
+    for (size_t b = 0; b < batch; ++b) {
+        double* z = &a.z1[b * HIDDEN];
+        std::copy(p.b1.begin(), p.b1.end(), z);
+        for (size_t i = 0; i < IN; ++i) {
+            double xi = x[b * IN + i];
+            for (size_t j = 0; j < HIDDEN; ++j) {
+                z[j] += xi * p.w1[i * HIDDEN + j];
+            }
+        }
+        for (size_t j = 0; j < HIDDEN; ++j) {
+            a.h[b * HIDDEN + j] = std::max(z[j], 0.0);
+        }
+        double* o = &a.out[b * OUT];
+        std::copy(p.b2.begin(), p.b2.end(), o);
+        for (size_t j = 0; j < HIDDEN; ++j) {
+            double hj = a.h[b * HIDDEN + j];
+            for (size_t k = 0; k < OUT; ++k) {
+                o[k] += hj * p.w2[j * OUT + k];
+            }
+        }
+    }
+}
+
+double forward(const std::vector<double>& x, const Params& p, Activations& a) {
+    forward_pass(x, p, a);
+    return std::accumulate(a.out.begin(), a.out.end(), 0.0);
+}
+
+double backward(const std::vector<double>& x, const std::vector<double>& y, const Params& p, Activations& a) {
+    forward_pass(x, p, a);
+    size_t batch = x.size() / IN;
+    std::vector<double> dw1(IN * HIDDEN, 0.0), db1(HIDDEN, 0.0), dw2(HIDDEN * OUT, 0.0), db2(OUT, 0.0);
+    double dz[HIDDEN];
+    for (size_t b = 0; b < batch; ++b) {
+        double dout[OUT];
+        for (size_t k = 0; k < OUT; ++k) {
+            dout[k] = a.out[b * OUT + k] - y[b * OUT + k];
+            db2[k] += dout[k];
+        }
+        for (size_t j = 0; j < HIDDEN; ++j) {
+            double hj = a.h[b * HIDDEN + j];
+            double acc = 0.0;
+            for (size_t k = 0; k < OUT; ++k) {
+                dw2[j * OUT + k] += hj * dout[k];
+                acc += dout[k] * p.w2[j * OUT + k];
+            }
+            dz[j] = a.z1[b * HIDDEN + j] > 0.0 ? acc : 0.0;
+            db1[j] += dz[j];
+        }
+        for (size_t i = 0; i < IN; ++i) {
+            double xi = x[b * IN + i];
+            for (size_t j = 0; j < HIDDEN; ++j) {
+                dw1[i * HIDDEN + j] += xi * dz[j];
+            }
+        }
+    }
+    double total = 0.0;
+    for (const auto* grad : {&dw1, &db1, &dw2, &db2}) {
+        total += std::accumulate(grad->begin(), grad->end(), 0.0);
+    }
+    return total;
+}
+
+int main(int argc, char* argv[]) {
+    const char* mode = argc > 1 ? argv[1] : "forward";
+    size_t batch = argc > 2 ? std::strtoull(argv[2], nullptr, 10) : 64;
+    size_t reps = std::max<size_t>(1, SAMPLES / batch);
+    Params params = make_params();
+    std::vector<double> x(batch * IN), y(batch * OUT);
+    for (size_t b = 0; b < batch; ++b) {
+        for (size_t i = 0; i < IN; ++i) {
+            x[b * IN + i] = (static_cast<double>((b * 7 + i * 3) % 11) - 5.0) / 4.0;
+        }
+        for (size_t k = 0; k < OUT; ++k) {
+            y[b * OUT + k] = static_cast<double>((b + k) % 3) - 1.0;
+        }
+    }
+    Activations act{std::vector<double>(batch * HIDDEN), std::vector<double>(batch * HIDDEN),
+                    std::vector<double>(batch * OUT)};
+    auto start = std::chrono::steady_clock::now();
+    double total = 0.0;
+    double scale;
+    if (std::strcmp(mode, "forward") == 0) {
+        for (size_t r = 0; r < reps; ++r) {
+            clobber(x.data());
+            total += forward(x, params, act);
+        }
+        scale = 256.0;
+    } else if (std::strcmp(mode, "backward") == 0) {
+        for (size_t r = 0; r < reps; ++r) {
+            clobber(x.data());
+            total += backward(x, y, params, act);
+        }
+        scale = 8192.0;
+    } else {
+        std::cerr << "unknown mode: " << mode << std::endl;
+        return 1;
+    }
+    auto elapsed = std::chrono::duration_cast<std::chrono::nanoseconds>(
+        std::chrono::steady_clock::now() - start).count();
+    std::cout << static_cast<int64_t>(total * scale) << std::endl;
+    if (std::getenv("PAIN_BENCH_TIMING")) {
+        std::cerr << "bench-timing: execute_ns=" << elapsed << std::endl;
+    }
+    return 0;
+}
@@ -0,0 +1,93 @@
+// All-pairs gravitational n-body benchmark for C++, bodies split across threads each step
+//
+// Usage: nbody <n> [workers]
+// Body i starts at (i % 7 - 3, i % 11 - 5, i % 13 - 6) at rest with mass 1/n;
+// STEPS symplectic Euler steps with softening EPS2. The checksum is the sum of
+// squared distances from the origin (the centre of mass itself never moves).
+
+#include <iostream>
+#include <algorithm>
+#include <cmath>
+#include <cstdlib>
+#include <cstdint>
+#include <chrono>
+#include <thread>
+#include <vector>
+
+const int STEPS = 10;
+const double DT = 0.01;
+const double EPS2 = 0.01;
+
+struct Bodies {
+    std::vector<double> x, y, z, vx, vy, vz, ax, ay, az;
+    double mass;
+};
+
+void accelerate(Bodies& b, size_t lo, size_t hi) {
+    size_t n = b.x.size();
+    for (size_t i = lo; i < hi; ++i) {
+        double ax = 0.0, ay = 0.0, az = 0.0;
+        for (size_t j = 0; j < n; ++j) {
+            double dx = b.x[j] - b.x[i];
+            double dy = b.y[j] - b.y[i];
+            double dz = b.z[j] - b.z[i];
+            double d2 = dx * dx + dy * dy + dz * dz + EPS2;
+            double s = b.mass / (d2 * std::sqrt(d2));
+            ax += dx * s;
+            ay += dy * s;
+            az += dz * s;
+        }
+        b.ax[i] = ax;
+        b.ay[i] = ay;
+        b.az[i] = az;
+    }
+}
+
+void simulate(Bodies& b, size_t workers) {
+    size_t n = b.x.size();
+    for (int step = 0; step < STEPS; ++step) {
+        std::vector<std::thread> threads;
+        for (size_t w = 0; w < workers; ++w) {
+            threads.emplace_back(accelerate, std::ref(b), n * w / workers, n * (w + 1) / workers);
+        }
+        for (auto& t : threads) {
+            t.join();
+        }
+        for (size_t i = 0; i < n; ++i) {
+            b.vx[i] += b.ax[i] * DT;
+            b.vy[i] += b.ay[i] * DT;
+            b.vz[i] += b.az[i] * DT;
+            b.x[i] += b.vx[i] * DT;
+            b.y[i] += b.vy[i] * DT;
+            b.z[i] += b.vz[i] * DT;
+        }
+    }
+}
+
+int main(int argc, char* argv[]) {
+    size_t n = argc > 1 ? std::strtoull(argv[1], nullptr, 10) : 256;
+    size_t workers = argc > 2 ? std::max<size_t>(1, std::strtoull(argv[2], nullptr, 10)) : 1;
+    Bodies b;
+    for (auto* v : {&b.x, &b.y, &b.z, &b.vx, &b.vy, &b.vz, &b.ax, &b.ay, &b.az}) {
+        v->assign(n, 0.0);
+    }
+    for (size_t i = 0; i < n; ++i) {
+        b.x[i] = static_cast<double>(i % 7) - 3.0;
+        b.y[i] = static_cast<double>(i % 11) - 5.0;
+        b.z[i] = static_cast<double>(i % 13) - 6.0;
+    }
+    b.mass = 1.0 / static_cast<double>(n);
+    auto start = std::chrono::steady_clock::now();
+    simulate(b, workers);
+    auto elapsed = std::chrono::duration_cast<std::chrono::nanoseconds>(
+        std::chrono::steady_clock::now() - start).count();
+    double total = 0.0;
+    for (size_t i = 0; i < n; ++i) {
+        total += b.x[i] * b.x[i] + b.y[i] * b.y[i] + b.z[i] * b.z[i];
+    }
+    std::cout << static_cast<int64_t>(std::floor(total * 1000000.0 + 0.5)) << std::endl;
+    if (std::getenv("PAIN_BENCH_TIMING")) {
+        std::cerr << "bench-timing: execute_ns=" << elapsed << std::endl;
+    }
+    return 0;
+}
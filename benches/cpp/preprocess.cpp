@@ -0,0 +1,108 @@
+// CSV preprocessing benchmark (parse, min-max normalize, one-hot) for C++
+//
+// Usage: preprocess <rows>
+// The CSV text (id,age,income,segment) is generated up front; each of the
+// max(1, SAMPLES / rows) repetitions parses it, normalizes age and income to
+// [0, 1] and one-hot encodes the segment. The checksum adds floor(1000 * each
+// normalized value) and the 1-based index of each hot column.
+
+#include <iostream>
+#include <algorithm>
+#include <cmath>
+#include <cstdlib>
+#include <cstdint>
+#include <chrono>
+#include <string>
+#include <string_view>
+#include <vector>
+
+const size_t SAMPLES = 4096;
+const char* const SEGMENTS[] = {"north", "south", "east", "west", "central"};
+const size_t NUM_SEGMENTS = 5;
+
+template <typename T>
+inline void clobber(T* p) {
+#if defined(__GNUC__)
+    asm volatile("" : : "g"(p) : "memory");
+#else
+    static volatile T* sink;
+    sink = p;
+#endif
+}
+
+std::string make_csv(size_t rows) {
+    std::string text = "id,age,income,segment\n";
+    for (size_t i = 0; i < rows; ++i) {
+        text += std::to_string(i) + "," + std::to_string(18 + (i * 37) % 60) + "," +
+                std::to_string((i * 7919) % 100000) + "." + std::to_string((i * 31) % 10) + "," +
+                SEGMENTS[(i * 3) % 5] + "\n";
+    }
+    return text;
+}
+
+void normalize(std::vector<double>& values) {
+    auto [lo_it, hi_it] = std::minmax_element(values.begin(), values.end());
+    double lo = *lo_it, hi = *hi_it;
+    for (auto& v : values) {
+        v = hi == lo ? 0.0 : (v - lo) / (hi - lo);
+    }
+}
+
+int64_t preprocess(const std::string& text) {
+    std::vector<double> ages, incomes;
+    std::vector<size_t> codes;
+    size_t pos = text.find('\n') + 1;  // skip the header
+    while (pos < text.size()) {
+        size_t end = text.find('\n', pos);
+        std::string_view line(text.data() + pos, end - pos);
+        size_t c1 = line.find(',');
+        size_t c2 = line.find(',', c1 + 1);
+        size_t c3 = line.find(',', c2 + 1);
+        ages.push_back(std::strtod(std::string(line.substr(c1 + 1, c2 - c1 - 1)).c_str(), nullptr));
+        incomes.push_back(std::strtod(std::string(line.substr(c2 + 1, c3 - c2 - 1)).c_str(), nullptr));
+        std::string_view segment = line.substr(c3 + 1);
+        size_t code = 0;
+        while (code < NUM_SEGMENTS && segment != SEGMENTS[code]) {
+            ++code;
+        }
+        codes.push_back(code);
+        pos = end + 1;
+    }
+    normalize(ages);
+    normalize(incomes);
+    std::vector<double> one_hot(codes.size() * NUM_SEGMENTS, 0.0);
+    for (size_t row = 0; row < codes.size(); ++row) {
+        one_hot[row * NUM_SEGMENTS + codes[row]] = 1.0;
+    }
+
+    int64_t total = 0;
+    for (size_t row = 0; row < ages.size(); ++row) {
+        total += static_cast<int64_t>(std::floor(ages[row] * 1000.0)) +
+                 static_cast<int64_t>(std::floor(incomes[row] * 1000.0));
+        double weighted = 0.0;
+        for (size_t k = 0; k < NUM_SEGMENTS; ++k) {
+            weighted += static_cast<double>(k + 1) * one_hot[row * NUM_SEGMENTS + k];
+        }
+        total += static_cast<int64_t>(weighted);
+    }
+    return total;
+}
+
+int main(int argc, char* argv[]) {
+    size_t rows = argc > 1 ? std::strtoull(argv[1], nullptr, 10) : 64;
+    size_t reps = std::max<size_t>(1, SAMPLES / rows);
+    std::string text = make_csv(rows);
+    auto start = std::chrono::steady_clock::now();
+    int64_t total = 0;
+    for (size_t r = 0; r < reps; ++r) {
+        clobber(text.data());
+        total += preprocess(text);
+    }
+    auto elapsed = std::chrono::duration_cast<std::chrono::nanoseconds>(
+        std::chrono::steady_clock::now() - start).count();
+    std::cout << total << std::endl;
+    if (std::getenv("PAIN_BENCH_TIMING")) {
+        std::cerr << "bench-timing: execute_ns=" << elapsed << std::endl;
+    }
+    return 0;
+}
@@ -0,0 +1,77 @@
+// Large reductions (sum, min, max, 16-bin histogram) benchmark for C++, split across threads
+//
+// Usage: reduce <n> [workers]
+// v[i] = (i * 7919) % 1000; the checksum combines all four results.
+
+#include <iostream>
+#include <algorithm>
+#include <cstdlib>
+#include <cstdint>
+#include <chrono>
+#include <thread>
+#include <vector>
+
+const int BINS = 16;
+const int64_t BIN_WIDTH = 64;
+
+struct Partial {
+    int64_t sum = 0;
+    int64_t min = INT64_MAX;
+    int64_t max = INT64_MIN;
+    int64_t hist[BINS] = {0};
+};
+
+void reduce_range(const std::vector<int64_t>& v, size_t lo, size_t hi, Partial& out) {
+    Partial p;
+    for (size_t i = lo; i < hi; ++i) {
+        int64_t x = v[i];
+        p.sum += x;
+        p.min = std::min(p.min, x);
+        p.max = std::max(p.max, x);
+        p.hist[x / BIN_WIDTH] += 1;
+    }
+    out = p;
+}
+
+int64_t reduce(const std::vector<int64_t>& v, size_t workers) {
+    std::vector<Partial> partials(workers);
+    std::vector<std::thread> threads;
+    for (size_t w = 0; w < workers; ++w) {
+        size_t lo = v.size() * w / workers;
+        size_t hi = v.size() * (w + 1) / workers;
+        threads.emplace_back(reduce_range, std::cref(v), lo, hi, std::ref(partials[w]));
+    }
+    Partial total;
+    for (size_t w = 0; w < workers; ++w) {
+        threads[w].join();
+        total.sum += partials[w].sum;
+        total.min = std::min(total.min, partials[w].min);
+        total.max = std::max(total.max, partials[w].max);
+        for (int b = 0; b < BINS; ++b) {
+            total.hist[b] += partials[w].hist[b];
+        }
+    }
+    int64_t checksum = total.sum + total.min + total.max;
+    for (int b = 0; b < BINS; ++b) {
+        checksum += (b + 1) * total.hist[b];
+    }
+    return checksum;
+}
+
+int main(int argc, char* argv[]) {
+    size_t n = argc > 1 ? std::strtoull(argv[1], nullptr, 10) : 1000000;
+    size_t workers = argc > 2 ? std::max<size_t>(1, std::strtoull(argv[2], nullptr, 10)) : 1;
+    std::vector<int64_t> v(n);
+    for (size_t i = 0; i < n; ++i) {
+        v[i] = static_cast<int64_t>((i * 7919) % 1000);
+    }
+    auto start = std::chrono::steady_clock::now();
+    int64_t result = reduce(v, workers);
+    auto elapsed = std::chrono::duration_cast<std::chrono::nanoseconds>(
+        std::chrono::steady_clock::now() - start).count();
+    std::cout << result << std::endl;
+    if (std::getenv("PAIN_BENCH_TIMING")) {
+        std::cerr << "bench-timing: execute_ns=" << elapsed << std::endl;
+    }
+    return 0;
+}
@@ -3,6 +3,7 @@
 #include <iostream>
 #include <cstdlib>
 #include <cstdint>
+#include <chrono>
 
 int64_t sum_n(int64_t n) {
     int64_t result = 0;
@@ -16,8 +17,14 @@ int64_t sum_n(int64_t n) {
 
 int main(int argc, char* argv[]) {
     int64_t n = argc > 1 ? std::atoll(argv[1]) : 10000;
+    auto start = std::chrono::steady_clock::now();
     int64_t result = sum_n(n);
+    auto elapsed = std::chrono::duration_cast<std::chrono::nanoseconds>(
+        std::chrono::steady_clock::now() - start).count();
     std::cout << result << std::endl;
+    if (std::getenv("PAIN_BENCH_TIMING")) {
+        std::cerr << "bench-timing: execute_ns=" << elapsed << std::endl;
+    }
     return 0;
 }
 
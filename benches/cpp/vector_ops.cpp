@@ -0,0 +1,93 @@
+// Vector operation benchmarks (dot, axpy, norm) for C++
+//
+// Usage: vector_ops <dot|axpy|norm> <n>
+// Short vectors are repeated so every size performs about VECTOR_WORK element
+// operations; the empty asm barrier keeps the repetitions from being folded.
+
+#include <iostream>
+#include <cmath>
+#include <cstdlib>
+#include <cstdint>
+#include <chrono>
+#include <cstring>
+#include <numeric>
+#include <vector>
+
+const size_t VECTOR_WORK = size_t(1) << 22;
+const double ALPHA = 2.0;
+
+template <typename T>
+inline void clobber(T* p) {
+#if defined(__GNUC__)
+    asm volatile("" : : "g"(p) : "memory");
+#else
+    static volatile T* sink;
+    sink = p;
+#endif
+}
+
+double dot(const std::vector<double>& x, const std::vector<double>& y, size_t reps) {
+    double total = 0.0;
+    for (size_t r = 0; r < reps; ++r) {
+        clobber(x.data());
+        double acc = 0.0;
+        for (size_t i = 0; i < x.size(); ++i) {
+            acc += x[i] * y[i];
+        }
+        total += acc;
+    }
+    return total;
+}
+
+double axpy(const std::vector<double>& x, std::vector<double>& y, size_t reps) {
+    for (size_t r = 0; r < reps; ++r) {
+        clobber(y.data());
+        for (size_t i = 0; i < x.size(); ++i) {
+            y[i] += ALPHA * x[i];
+        }
+    }
+    return std::accumulate(y.begin(), y.end(), 0.0);
+}
+
+double norm(const std::vector<double>& x, size_t reps) {
+    double total = 0.0;
+    for (size_t r = 0; r < reps; ++r) {
+        clobber(x.data());
+        double acc = 0.0;
+        for (size_t i = 0; i < x.size(); ++i) {
+            acc += x[i] * x[i];
+        }
+        total += std::sqrt(acc);
+    }
+    return std::floor(total * 1000.0);
+}
+
+int main(int argc, char* argv[]) {
+    const char* op = argc > 1 ? argv[1] : "dot";
+    size_t n = argc > 2 ? std::strtoull(argv[2], nullptr, 10) : 65536;
+    size_t reps = std::max<size_t>(1, VECTOR_WORK / n);
+    std::vector<double> x(n), y(n);
+    for (size_t i = 0; i < n; ++i) {
+        x[i] = static_cast<double>(i % 7 + 1);
+        y[i] = static_cast<double>(i % 5 + 1);
+    }
+    auto start = std::chrono::steady_clock::now();
+    double result;
+    if (std::strcmp(op, "dot") == 0) {
+        result = dot(x, y, reps);
+    } else if (std::strcmp(op, "axpy") == 0) {
+        result = axpy(x, y, reps);
+    } else if (std::strcmp(op, "norm") == 0) {
+        result = norm(x, reps);
+    } else {
+        std::cerr << "unknown operation: " << op << std::endl;
+        return 1;
+    }
+    auto elapsed = std::chrono::duration_cast<std::chrono::nanoseconds>(
+        std::chrono::steady_clock::now() - start).count();
+    std::cout << static_cast<int64_t>(result) << std::endl;
+    if (std::getenv("PAIN_BENCH_TIMING")) {
+        std::cerr << "bench-timing: execute_ns=" << elapsed << std::endl;
+    }
+    return 0;
+}
@@ -0,0 +1 @@
+"""Support modules for compare.py (statistics, storage, build helpers)"""
@@ -0,0 +1,220 @@
+"""
+Content-addressed build cache for the Rust and C++ baselines.
+
+An artifact is identified by a hash of its source, the compiler identity
+(full version output) and the flags/profile it is built with. The hash is part
+of the cached file name, so a stale binary built from other sources or flags
+can never be picked up: a changed input simply maps to a different path.
+"""
+
+import functools
+import hashlib
+import os
+import platform
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+BUILD_ROOT = Path("target/bench-build")
+
+RUST_DIR = Path("benches/rust")
+RUST_PROFILE = "release"
+
+CPP_DIR = Path("benches/cpp")
+# Keep in sync with CXXFLAGS in benches/cpp/Makefile (warnings don't affect codegen)
+CPP_FLAGS = ["-O3", "-std=c++17", "-pthread"]
+MSVC_FLAGS = ["/O2", "/EHsc"]
+
+EXE_EXT = ".exe" if platform.system() == "Windows" else ""
+CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0
+
+def content_key(*parts) -> str:
+    """SHA-256 over the given str/bytes parts, separated so they can't run together"""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode()
+        digest.update(len(part).to_bytes(8, "little"))
+        digest.update(part)
+    return digest.hexdigest()
+
+@functools.lru_cache(maxsize=None)
+def tool_identity(*cmd: str) -> Optional[str]:
+    """Full version output of a tool, or None if it cannot be run"""
+    try:
+        result = subprocess.run(
+            list(cmd),
+            capture_output=True,
+            text=True,
+            timeout=30,
+            creationflags=CREATION_FLAGS
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
+        return None
+    # MSVC prints its banner to stderr and exits non-zero without arguments
+    output = (result.stdout + result.stderr).strip()
+    if result.returncode != 0 and cmd[0] != "cl":
+        return None
+    return output or None
+
+def find_compiler(compilers: List[str]) -> Optional[str]:
+    """Find available C++ compiler"""
+    for compiler in compilers:
+        try:
+            # Check if compiler exists by trying to get version
+            if compiler == "cl":
+                # MSVC uses different flag
+                result = subprocess.run(
+                    [compiler],
+                    capture_output=True,
+                    timeout=5,
+                    creationflags=CREATION_FLAGS
+                )
+            else:
+                result = subprocess.run(
+                    [compiler, "--version"],
+                    capture_output=True,
+                    timeout=5,
+                    creationflags=CREATION_FLAGS
+                )
+            if result.returncode == 0 or (compiler == "cl" and result.returncode != 9009):
+                return compiler
+        except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
+            continue
+    return None
+
+@functools.lru_cache(maxsize=None)
+def cpp_compiler() -> Optional[str]:
+    """C++ compiler to use: $CXX if set, else the first of g++/clang++ (and cl on Windows)"""
+    candidates = ["g++", "clang++"]
+    if platform.system() == "Windows":
+        candidates.append("cl")
+    if os.environ.get("CXX"):
+        candidates.insert(0, os.environ["CXX"])
+    return find_compiler(candidates)
+
+def cpp_flags(compiler: str) -> List[str]:
+    """Optimization flags for the given compiler driver"""
+    return MSVC_FLAGS if compiler == "cl" else CPP_FLAGS
+
+def cached_path(lang: str, name: str, key: str) -> Path:
+    """Location of an artifact in the cache"""
+    return BUILD_ROOT / lang / f"{name}-{key[:16]}{EXE_EXT}"
+
+def rust_key(name: str) -> Optional[str]:
+    """Cache key of a Rust benchmark binary"""
+    source = RUST_DIR / f"{name}.rs"
+    manifest = RUST_DIR / "Cargo.toml"
+    identity = tool_identity("rustc", "-vV")
+    if not source.exists() or identity is None:
+        return None
+    return content_key(source.read_bytes(), manifest.read_bytes(), identity, RUST_PROFILE)
+
+def cpp_key(name: str) -> Optional[str]:
+    """Cache key of a C++ benchmark binary"""
+    source = CPP_DIR / f"{name}.cpp"
+    compiler = cpp_compiler()
+    if not source.exists() or compiler is None:
+        return None
+    identity = tool_identity(compiler) if compiler == "cl" else tool_identity(compiler, "--version")
+    return content_key(source.read_bytes(), compiler, identity or "", *cpp_flags(compiler))
+
+def _install(built: Path, target: Path) -> None:
+    """Atomically copy a freshly built binary into the cache"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = target.with_name(target.name + ".tmp")
+    shutil.copy2(built, staging)
+    os.replace(staging, target)
+
+def build_rust(names: Iterable[str]) -> Dict[str, Optional[Path]]:
+    """Return cached Rust binaries, building every missing one in a single cargo call"""
+    artifacts: Dict[str, Optional[Path]] = {}
+    missing = []
+    for name in names:
+        key = rust_key(name)
+        if key is None:
+            print(f"    Warning: Rust source or toolchain not found for {name}")
+            artifacts[name] = None
+            continue
+        path = cached_path("rust", name, key)
+        artifacts[name] = path
+        if not path.exists():
+            missing.append((name, path))
+
+    if not missing:
+        return artifacts
+
+    # One invocation lets cargo build the binaries in parallel
+    target_dir = BUILD_ROOT / "cargo"
+    build_cmd = [
+        "cargo", "build", "--profile", RUST_PROFILE,
+        "--manifest-path", str(RUST_DIR / "Cargo.toml"),
+        "--target-dir", str(target_dir),
+    ]
+    for name, _ in missing:
+        build_cmd += ["--bin", name]
+    result = subprocess.run(build_cmd, capture_output=True, text=True, creationflags=CREATION_FLAGS)
+    if result.returncode != 0:
+        print(f"    Warning: Failed to build Rust benchmarks: {result.stderr[-400:]}")
+        for name, _ in missing:
+            artifacts[name] = None
+        return artifacts
+
+    for name, path in missing:
+        built = target_dir / RUST_PROFILE / f"{name}{EXE_EXT}"
+        if not built.exists():
+            print(f"    Warning: Rust executable not found at {built}")
+            artifacts[name] = None
+            continue
+        _install(built, path)
+    return artifacts
+
+def build_cpp(name: str) -> Optional[Path]:
+    """Return the cached C++ binary, compiling it if its key is not cached yet"""
+    key = cpp_key(name)
+    if key is None:
+        if cpp_compiler() is None:
+            print("    Warning: No C++ compiler found (tried $CXX, g++, clang++, cl). Skipping C++ benchmark.")
+        else:
+            print(f"    Warning: C++ source file not found at {CPP_DIR / f'{name}.cpp'}")
+        return None
+    path = cached_path("cpp", name, key)
+    if path.exists():
+        return path
+
+    compiler = cpp_compiler()
+    source = CPP_DIR / f"{name}.cpp"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = path.with_name(path.name + ".tmp" + EXE_EXT)
+    if compiler == "cl":
+        compile_cmd = [compiler, *cpp_flags(compiler), f"/Fe:{staging}", str(source)]
+    else:
+        compile_cmd = [compiler, *cpp_flags(compiler), "-o", str(staging), str(source)]
+
+    try:
+        result = subprocess.run(
+            compile_cmd,
+            capture_output=True,
+            text=True,
+            timeout=120,
+            creationflags=CREATION_FLAGS
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired, OSError) as e:
+        print(f"    Warning: Failed to run C++ compiler: {e}")
+        return None
+    if result.returncode != 0 or not staging.exists():
+        print(f"    Warning: Failed to compile C++ benchmark: {(result.stderr or result.stdout)[:200]}")
+        return None
+    os.replace(staging, path)
+    return path
+
+def prepare(rust_names: Iterable[str], cpp_names: Iterable[str], jobs: Optional[int] = None) -> None:
+    """Build every missing artifact up front, C++ units and the cargo build concurrently"""
+    cpp_names = list(cpp_names)
+    with ThreadPoolExecutor(max_workers=jobs or (os.cpu_count() or 1)) as pool:
+        futures = [pool.submit(build_rust, list(rust_names))]
+        futures += [pool.submit(build_cpp, name) for name in cpp_names]
+        for future in futures:
+            future.result()
@@ -0,0 +1,94 @@
+"""
+Call overhead and recursion depth for `compare.py calls`.
+
+One program per language (benches/{pain,python,rust,cpp}/calls.*) runs one
+case, selected by a mode number:
+
+    0        loop       the bare loop: `acc = acc + i`, n times
+    1-9      call0-8    the same loop calling a function of 0..8 int arguments
+    10       method     the same loop calling a method on a user class
+    11       direct     `depth(n)`: n nested calls, the result added on return
+    12       tail       `depth_tail(n, 0)`: n calls in tail position
+
+The call cases are timed like `compare.py stdlib`: the slope between two
+loop counts, minus the bare loop. The recursion cases are probed instead:
+the depth is raised until the program crashes (a stack overflow, Python's
+RecursionError) and the last good depth is the maximum safe depth. Pain AOT
+executables return main's value as their exit status, so a run there
+succeeded when the status is the depth modulo 256.
+
+Memory per frame comes from peak RSS where it rises above the harness's own
+footprint (see harness/launcher.py). A native stack overflow usually happens
+below that, so for a run that died of a signal it is estimated as the stack
+size limit over the maximum safe depth instead.
+"""
+
+from typing import List, NamedTuple, Optional
+
+from harness.manifest import BENCH_DIR, Benchmark
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+MAX_ARITY = 8
+
+class Case(NamedTuple):
+    """One mode of the calls programs and what it prints at n"""
+    name: str
+    mode: int
+    result: str  # manifest `result` expression
+
+CALL_CASES: List[Case] = [
+    Case("loop", 0, "n * (n - 1) // 2"),
+    Case("call0", 1, "n"),
+    *[Case(f"call{k}", k + 1, f"{k} * n * (n - 1) // 2") for k in range(1, MAX_ARITY + 1)],
+    Case("method", 10, "n * (n - 1) // 2 + n"),
+]
+
+RECURSION_CASES: List[Case] = [
+    Case("direct", 11, "n"),
+    Case("tail", 12, "n"),
+]
+
+LOOP = CALL_CASES[0]
+ARGUMENT_CASES = CALL_CASES[1:MAX_ARITY + 2]  # call0 .. call8
+
+def arity(case: Case) -> int:
+    """Number of arguments of a callN case"""
+    return case.mode - 1
+
+def benchmark(case: Case, prefix: str = "calls") -> Benchmark:
+    """Benchmark running one case of the calls programs, named `<prefix>-<case>`"""
+    args = ["${mode}", "${n}"]
+    return Benchmark(
+        name=f"{prefix}-{case.name}",
+        description=f"{prefix}: {case.name}",
+        sources={lang: BENCH_DIR / lang / f"calls.{ext}"
+                 for lang, ext in (("pain", "pain"), ("python", "py"), ("rust", "rs"), ("cpp", "cpp"))},
+        args={"python": args, "rust": args, "cpp": args},
+        sizes={},
+        default_size="",
+        expected={},
+        result=case.result,
+        work="n",
+        unit="frame" if prefix == "recursion" else "call",
+        template={"mode": str(case.mode)},
+    )
+
+def decades(max_depth: int) -> List[int]:
+    """Probe depths: 10, 100, ... up to max_depth, which is always the last"""
+    depths = []
+    depth = 10
+    while depth < max_depth:
+        depths.append(depth)
+        depth *= 10
+    return depths + [max_depth]
+
+def stack_limit() -> Optional[int]:
+    """Soft stack size limit the benchmark processes inherit (`ulimit -s`), in bytes, or None if unlimited"""
+    if resource is None:
+        return None
+    soft, _ = resource.getrlimit(resource.RLIMIT_STACK)
+    return None if soft == resource.RLIM_INFINITY else soft
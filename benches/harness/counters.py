@@ -0,0 +1,99 @@
+"""
+Hardware performance counters via `perf stat` (Linux only).
+
+Each measured run is wrapped in `perf stat -x,` writing CSV to a scratch file,
+so the program's own stdout/stderr (and its bench-timing line) are untouched.
+Counters the CPU or kernel can't provide are simply missing from the result.
+"""
+
+import functools
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# perf event name -> short key used in reports and the history
+EVENTS = {
+    "cycles": "cycles",
+    "instructions": "instructions",
+    "branches": "branches",
+    "branch-misses": "branch_misses",
+    "L1-dcache-load-misses": "l1d_misses",
+    "LLC-load-misses": "llc_misses",
+}
+
+@functools.lru_cache(maxsize=None)
+def unavailable_reason() -> Optional[str]:
+    """Why counters can't be collected here, or None if perf works"""
+    if platform.system() != "Linux":
+        return "perf stat is only available on Linux"
+    if shutil.which("perf") is None:
+        return "perf not found (install linux-tools for your kernel)"
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "probe.csv"
+        try:
+            result = subprocess.run(
+                ["perf", "stat", "-x", ",", "-o", str(output), "-e", "cycles,instructions", "--", "true"],
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+        except (subprocess.TimeoutExpired, OSError) as e:
+            return f"perf stat failed: {e}"
+        counts = parse_perf_csv(output.read_text()) if output.exists() else {}
+    if result.returncode != 0 or "instructions" not in counts:
+        paranoid = Path("/proc/sys/kernel/perf_event_paranoid")
+        level = paranoid.read_text().strip() if paranoid.exists() else "?"
+        return (f"perf stat cannot read hardware counters (perf_event_paranoid={level}; "
+                f"try: sudo sysctl kernel.perf_event_paranoid=1)")
+    return None
+
+def wrap(cmd: List[str], output: Path) -> List[str]:
+    """Prefix a command with perf stat writing CSV counters to `output`"""
+    return ["perf", "stat", "-x", ",", "-o", str(output), "-e", ",".join(EVENTS), "--", *cmd]
+
+def parse_perf_csv(text: str) -> Dict[str, float]:
+    """Parse `perf stat -x,` output into {short key: count}, skipping unsupported events"""
+    counts = {}
+    for line in text.splitlines():
+        fields = line.split(",")
+        if len(fields) < 3 or line.startswith("#"):
+            continue
+        value, event = fields[0], fields[2]
+        # Hybrid CPUs report e.g. "cpu_core/cycles/"; fold those into the plain name
+        event = event.split("/")[1] if event.count("/") >= 2 else event
+        event = event.split(":")[0]
+        key = EVENTS.get(event)
+        if key is None:
+            continue
+        try:
+            counts[key] = counts.get(key, 0.0) + float(value)
+        except ValueError:
+            continue  # <not counted> / <not supported>
+    return counts
+
+def read_counters(output: Path) -> Optional[Dict[str, float]]:
+    """Counters written by one wrapped run, or None if perf produced nothing"""
+    try:
+        counts = parse_perf_csv(output.read_text())
+    except OSError:
+        return None
+    return counts or None
+
+def scratch_file() -> Path:
+    """Temporary file for perf stat output; the caller removes it"""
+    fd, name = tempfile.mkstemp(prefix="bench-perf-", suffix=".csv")
+    os.close(fd)
+    return Path(name)
+
+def derived(counts: Dict[str, float]) -> Dict[str, float]:
+    """IPC and branch miss rate from raw counts, where both inputs are present"""
+    metrics = {}
+    if counts.get("cycles") and "instructions" in counts:
+        metrics["ipc"] = counts["instructions"] / counts["cycles"]
+    if counts.get("branches") and "branch_misses" in counts:
+        metrics["branch_miss_rate"] = counts["branch_misses"] / counts["branches"]
+    return metrics
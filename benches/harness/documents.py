@@ -0,0 +1,164 @@
+"""
+Large configuration documents in PML, JSON and TOML for the parser benchmark.
+
+`generate(size)` writes three files holding the same tree. Each is built
+from `section_<i>` entries, and enough sections are added for the PML file to
+reach the requested size. A section nests maps SECTION_DEPTH levels deep
+(PML_SPEC.md: one tab per level); below a few KB sections get shallower, so
+the smallest documents stay near 1 KB. Every level carries the scalar types
+PML knows (quoted strings, some with `:` and `#` in them, ints, floats and
+bools), a list of scalars and a list of flat maps, which is the
+`- key: value` form used for UI trees. A trailing `meta` map records how many sections
+there are, so a loader can prove it parsed the whole file.
+
+There is no null, because TOML has none. JSON and PML keep insertion order;
+TOML puts every table's scalars before its sub-tables, which changes the
+order but not the data.
+
+Files are written one section at a time, so even 100 MB documents never
+build the whole tree in memory. Output is deterministic for a given
+(size, seed) and reused when it already exists.
+"""
+
+import json
+import random
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Tuple
+
+from harness.buildcache import BUILD_ROOT
+
+DOCUMENT_ROOT = BUILD_ROOT.parent / "bench-pml"
+
+# Bump when the generated layout changes so cached documents are rebuilt
+GENERATOR_VERSION = 1
+
+FORMATS = ("pml", "json", "toml")
+
+SECTION_DEPTH = 8
+LEVEL_BYTES = 450  # PML bytes per nesting level, roughly
+LIST_ITEMS = 3
+
+SERVICES = ("auth", "billing", "search", "gateway", "cache", "queue", "render", "audit")
+REGIONS = ("eu-west", "us-east", "ap-south")
+
+class Document(NamedTuple):
+    """One generated document in every format"""
+    paths: Dict[str, Path]  # format -> file
+    sizes: Dict[str, int]  # format -> bytes
+    sections: int
+
+def level(rng: random.Random, section: int, depth: int, levels: int) -> Dict:
+    """One nesting level: scalars, a scalar list, a list of maps and the next level"""
+    service = SERVICES[(section + depth) % len(SERVICES)]
+    node = {
+        "name": f"{service}-{section}-{depth}",
+        "description": f"Service {section}: {service} tier {depth} # {REGIONS[section % len(REGIONS)]}",
+        "port": 1024 + rng.randrange(60000),
+        "weight": round(rng.random() * 100, 3),
+        "enabled": rng.random() < 0.8,
+        "tags": [f"{service}-{k}" for k in range(LIST_ITEMS)],
+        "endpoints": [
+            {"path": f"/{service}/v{k}", "timeout": rng.randrange(100, 5000), "retry": rng.random() < 0.5}
+            for k in range(LIST_ITEMS)
+        ],
+    }
+    if depth + 1 < levels:
+        node[f"level_{depth + 1}"] = level(rng, section, depth + 1, levels)
+    return node
+
+def section(rng: random.Random, index: int, levels: int) -> Dict:
+    return {"id": index, "region": REGIONS[index % len(REGIONS)], "level_0": level(rng, index, 0, levels)}
+
+def pml_scalar(value) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return json.dumps(value)  # same escapes as PML's quoted strings for ASCII
+
+def pml_lines(node: Dict, depth: int) -> Iterator[str]:
+    """PML for a map at `depth` tabs"""
+    indent = "\t" * depth
+    for key, value in node.items():
+        if isinstance(value, dict):
+            yield f"{indent}{key}:"
+            yield from pml_lines(value, depth + 1)
+        elif isinstance(value, list):
+            yield f"{indent}{key}:"
+            for item in value:
+                if isinstance(item, dict):
+                    # First field after the dash, the rest aligned under it
+                    fields = [f"{k}: {pml_scalar(v)}" for k, v in item.items()]
+                    yield f"{indent}\t- {fields[0]}"
+                    yield from (f"{indent}\t  {field}" for field in fields[1:])
+                else:
+                    yield f"{indent}\t- {pml_scalar(item)}"
+        else:
+            yield f"{indent}{key}: {pml_scalar(value)}"
+
+def toml_scalar(value) -> str:
+    if isinstance(value, list):
+        return "[" + ", ".join(toml_scalar(v) for v in value) + "]"
+    return pml_scalar(value)
+
+def toml_lines(path: str, node: Dict, array: bool = False) -> Iterator[str]:
+    """TOML for a table: its scalars under the header, then sub-tables and arrays of tables"""
+    yield f"[[{path}]]" if array else f"[{path}]"
+    nested: List[Tuple[str, object]] = []
+    for key, value in node.items():
+        if isinstance(value, dict) or (isinstance(value, list) and value and isinstance(value[0], dict)):
+            nested.append((key, value))
+        else:
+            yield f"{key} = {toml_scalar(value)}"
+    for key, value in nested:
+        yield ""
+        if isinstance(value, dict):
+            yield from toml_lines(f"{path}.{key}", value)
+        else:
+            for k, item in enumerate(value):
+                if k:
+                    yield ""
+                yield from toml_lines(f"{path}.{key}", item, array=True)
+
+def json_member(key: str, value) -> str:
+    """`"key": value` indented one tab, as json.dump(indent="\\t") writes it inside the top-level object"""
+    return json.dumps({key: value}, indent="\t")[2:-2]
+
+def generate(size: int, seed: int = 1) -> Document:
+    """Documents whose PML form is about `size` bytes (at least one section), generated on first use"""
+    root = DOCUMENT_ROOT / f"b{size}-s{seed}"
+    paths = {fmt: root / f"config.{fmt}" for fmt in FORMATS}
+    summary_path = root / "document.json"
+    if summary_path.exists():
+        summary = json.loads(summary_path.read_text())
+        if summary.get("generator") == GENERATOR_VERSION and all(p.exists() for p in paths.values()):
+            return Document(paths, summary["sizes"], summary["sections"])
+    root.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed * 1_000_003 + size)
+    levels = max(1, min(SECTION_DEPTH, size // LEVEL_BYTES))
+
+    files = {fmt: path.open("w", encoding="utf-8", newline="\n") for fmt, path in paths.items()}
+    try:
+        files["json"].write("{\n")
+        written = 0
+        count = 0
+        while not count or written < size:
+            name = f"section_{count}"
+            node = section(rng, count, levels)
+            pml = "".join(f"{line}\n" for line in pml_lines({name: node}, 0))
+            files["pml"].write(pml)
+            written += len(pml.encode())
+            files["toml"].write("".join(f"{line}\n" for line in toml_lines(name, node)) + "\n")
+            files["json"].write(json_member(name, node) + ",\n")
+            count += 1
+        meta = {"generator": GENERATOR_VERSION, "sections": count}
+        files["pml"].write("".join(f"{line}\n" for line in pml_lines({"meta": meta}, 0)))
+        files["toml"].write("".join(f"{line}\n" for line in toml_lines("meta", meta)))
+        files["json"].write(json_member("meta", meta) + "\n}\n")
+    finally:
+        for handle in files.values():
+            handle.close()
+
+    sizes = {fmt: path.stat().st_size for fmt, path in paths.items()}
+    summary_path.write_text(json.dumps({"generator": GENERATOR_VERSION, "sizes": sizes, "sections": count}))
+    return Document(paths, sizes, count)
@@ -0,0 +1,162 @@
+"""
+Environment fingerprint and noise preflight for compare.py.
+
+Before anything is measured the harness records what the numbers depend on
+besides the code: CPU model and topology, frequency governor, turbo and SMT
+state, kernel, ASLR setting, load average and the versions of every
+toolchain. The fingerprint is stored with each result in the history, so a
+slowdown can be checked against a changed governor or compiler before it is
+blamed on a commit.
+
+`noise_problems` lists conditions that make timings unreliable (a busy
+machine, the powersave governor); compare.py warns about them, or refuses to
+run with --strict-env. `without_aslr` runs a command under `setarch -R` so
+address-space layout is identical from run to run.
+"""
+
+import functools
+import os
+import platform
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from harness.buildcache import cpp_compiler, tool_identity
+from harness.pain import compiler_binary
+from harness.scheduler import allowed_cpus, physical_cores
+
+CPU_ROOT = Path("/sys/devices/system/cpu")
+
+# One-minute load per allowed CPU above which the machine counts as busy
+LOAD_LIMIT = 0.1
+
+# Fields that describe the machine rather than the moment; differences in
+# these between two runs are worth pointing out when comparing them
+STABLE_FIELDS = ("cpu", "cores", "governor", "turbo", "smt", "kernel", "aslr", "no_aslr",
+                 "python", "rustc", "cxx", "pain_compiler")
+
+# Fingerprint field -> name to show when the tool is missing
+TOOLS = (("python", "python"), ("rustc", "rustc"), ("cxx", "C++ compiler"), ("pain_compiler", "pain-compiler"))
+
+def read(path: Path) -> Optional[str]:
+    """Stripped contents of a sysfs/procfs file, or None if it can't be read"""
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+def cpu_model() -> str:
+    for line in (read(Path("/proc/cpuinfo")) or "").splitlines():
+        key, _, value = line.partition(":")
+        if key.strip() in ("model name", "Hardware", "cpu model"):
+            return value.strip()
+    return platform.processor() or platform.machine()
+
+def governors(cpus: List[int]) -> Optional[str]:
+    """Frequency governors of the allowed CPUs, e.g. "performance" or "powersave,schedutil" """
+    found = sorted({read(CPU_ROOT / f"cpu{cpu}" / "cpufreq" / "scaling_governor") for cpu in cpus} - {None})
+    return ",".join(found) or None
+
+def turbo() -> Optional[str]:
+    """"on"/"off" for Intel turbo boost or AMD/acpi-cpufreq boost; None if not exposed"""
+    no_turbo = read(CPU_ROOT / "intel_pstate" / "no_turbo")
+    if no_turbo is not None:
+        return "off" if no_turbo == "1" else "on"
+    boost = read(CPU_ROOT / "cpufreq" / "boost")
+    if boost is not None:
+        return "on" if boost == "1" else "off"
+    return None
+
+def first_line(text: Optional[str]) -> Optional[str]:
+    return text.splitlines()[0].strip() if text else None
+
+def collect() -> Dict:
+    """Fingerprint of this machine and toolchain right now"""
+    cpus = allowed_cpus()
+    try:
+        load = [round(value, 2) for value in os.getloadavg()]
+    except (AttributeError, OSError):
+        load = None
+    compiler = cpp_compiler()
+    pain = compiler_binary()
+    return {
+        "cpu": cpu_model(),
+        "cpus": len(cpus),
+        "cores": len(physical_cores(cpus)),
+        "governor": governors(cpus),
+        "turbo": turbo(),
+        "smt": read(CPU_ROOT / "smt" / "control"),
+        "kernel": f"{platform.system()} {platform.release()}",
+        "aslr": read(Path("/proc/sys/kernel/randomize_va_space")),
+        "load": load,
+        "python": first_line(tool_identity("python", "--version")),
+        "rustc": first_line(tool_identity("rustc", "--version")),
+        "cxx": first_line(tool_identity(compiler, "--version")) if compiler and compiler != "cl" else compiler,
+        "pain_compiler": first_line(tool_identity(str(pain.absolute()), "--version")) if pain else None,
+    }
+
+def describe(env: Dict) -> List[str]:
+    """Human-readable summary lines of a fingerprint"""
+    topology = f"{env['cpus']} CPUs, {env['cores']} cores"
+    if env.get("smt"):
+        topology += f", SMT {env['smt']}"
+    machine = [env["cpu"], topology, env["kernel"]]
+    if env.get("governor"):
+        machine.append(f"governor {env['governor']}")
+    if env.get("turbo"):
+        machine.append(f"turbo {env['turbo']}")
+    if env.get("load"):
+        machine.append(f"load {env['load'][0]:.2f}")
+    tools = [env[name] or f"{label} not found" for name, label in TOOLS]
+    return [f"Environment: {'; '.join(machine)}", f"Tools: {'; '.join(tools)}"]
+
+def noise_problems(env: Dict) -> List[str]:
+    """Conditions under which timings are unreliable"""
+    problems = []
+    if env.get("load") and env["load"][0] > max(1.0, LOAD_LIMIT * env["cpus"]):
+        problems.append(f"load average {env['load'][0]:.2f} over the last minute on {env['cpus']} CPUs; "
+                        "other processes are competing for the machine")
+    if env.get("governor") and "powersave" in env["governor"].split(","):
+        problems.append("CPU frequency governor is powersave "
+                        "(try: sudo cpupower frequency-set -g performance)")
+    return problems
+
+def notes(env: Dict) -> List[str]:
+    """Settings that add variance but don't make a run worthless"""
+    found = []
+    if env.get("turbo") == "on":
+        found.append("turbo boost is on; clock speed depends on temperature and active cores")
+    if env.get("aslr") not in (None, "0"):
+        found.append("ASLR is on; --no-aslr runs the benchmarks under setarch -R")
+    return found
+
+def differences(baseline: List[Dict], candidate: List[Dict]) -> List[str]:
+    """Stable fingerprint fields whose values differ between two sets of runs"""
+    if not baseline or not candidate:
+        return []  # recorded before fingerprints were stored
+    changed = []
+    for field in STABLE_FIELDS:
+        before = sorted({str(env.get(field)) for env in baseline})
+        after = sorted({str(env.get(field)) for env in candidate})
+        if before != after:
+            changed.append(f"{field}: {', '.join(before)} -> {', '.join(after)}")
+    return changed
+
+@functools.lru_cache(maxsize=None)
+def setarch_unavailable() -> Optional[str]:
+    """Why `setarch -R` can't be used here, or None if it works"""
+    if platform.system() != "Linux":
+        return "setarch is only available on Linux"
+    try:
+        result = subprocess.run(["setarch", platform.machine(), "-R", "true"],
+                                capture_output=True, text=True, timeout=10)
+    except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
+        return "setarch not found (part of util-linux)"
+    if result.returncode != 0:
+        # Containers often forbid the personality() call
+        return f"setarch -R failed: {result.stderr.strip()[-200:] or f'exit status {result.returncode}'}"
+    return None
+
+def without_aslr(cmd: List[str]) -> List[str]:
+    """Prefix a command with setarch so it runs with address-space randomization disabled"""
+    return ["setarch", platform.machine(), "-R", *cmd]
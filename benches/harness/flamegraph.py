@@ -0,0 +1,168 @@
+"""
+Folded stacks, SVG flamegraphs and profile diffs for `compare.py --profile`.
+
+Every profile is reduced to folded stacks: one `root;...;leaf <count>` line
+per distinct stack, the format of Brendan Gregg's stackcollapse scripts, so
+the files also work with flamegraph.pl, inferno or speedscope. `render`
+draws the standard flamegraph (root at the bottom, width = share of samples,
+siblings sorted by name) as a self-contained SVG with a tooltip per frame.
+
+A diff compares two profiles by share of samples rather than by count,
+because the runs differ in length and sample rate. `render` takes the
+per-frame change as `deltas` and colors the candidate's graph by it: red
+frames take a larger share than in the baseline, blue ones a smaller share.
+"""
+
+import hashlib
+from collections import Counter
+from html import escape
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+WIDTH = 1200
+FRAME_HEIGHT = 16
+FONT_SIZE = 11
+CHAR_WIDTH = 6.5  # average glyph width at FONT_SIZE, for truncating labels
+MIN_WIDTH = 0.1  # frames narrower than this (pixels) are not drawn
+PAD = 10
+TOP = 40  # title and subtitle
+
+Stacks = Dict[str, int]
+
+def read_folded(path: Path) -> Stacks:
+    """Folded stacks from a file; malformed lines are skipped"""
+    stacks: Counter = Counter()
+    for line in path.read_text(errors="replace").splitlines():
+        stack, _, count = line.rpartition(" ")
+        if stack and count.isdigit():
+            stacks[stack] += int(count)
+    return dict(stacks)
+
+def write_folded(path: Path, stacks: Stacks):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as f:
+        for stack in sorted(stacks):
+            f.write(f"{stack} {stacks[stack]}\n")
+
+def self_shares(stacks: Stacks) -> Dict[str, float]:
+    """Share of all samples spent in each function itself (as the leaf)"""
+    total = sum(stacks.values())
+    shares: Counter = Counter()
+    for stack, count in stacks.items():
+        shares[stack.rsplit(";", 1)[-1]] += count / total
+    return dict(shares)
+
+def path_shares(stacks: Stacks) -> Dict[str, float]:
+    """Inclusive share of every frame, keyed by its path from the root"""
+    total = sum(stacks.values())
+    shares: Counter = Counter()
+    for stack, count in stacks.items():
+        frames = stack.split(";")
+        for depth in range(1, len(frames) + 1):
+            shares[";".join(frames[:depth])] += count / total
+    return dict(shares)
+
+class Change(NamedTuple):
+    """One function's share of samples in two profiles"""
+    function: str
+    baseline: float
+    candidate: float
+
+    @property
+    def delta(self) -> float:
+        return self.candidate - self.baseline
+
+def diff(baseline: Stacks, candidate: Stacks, limit: int = 15) -> List[Change]:
+    """Functions whose self share changed most between two profiles, largest change first"""
+    before, after = self_shares(baseline), self_shares(candidate)
+    changes = [Change(f, before.get(f, 0.0), after.get(f, 0.0)) for f in set(before) | set(after)]
+    changes.sort(key=lambda c: abs(c.delta), reverse=True)
+    return changes[:limit]
+
+def path_deltas(baseline: Stacks, candidate: Stacks) -> Dict[str, float]:
+    """Change in inclusive share of every frame path present in the candidate"""
+    before, after = path_shares(baseline), path_shares(candidate)
+    return {path: share - before.get(path, 0.0) for path, share in after.items()}
+
+class Node:
+    __slots__ = ("count", "children")
+
+    def __init__(self):
+        self.count = 0
+        self.children: Dict[str, "Node"] = {}
+
+def build_tree(stacks: Stacks) -> Node:
+    root = Node()
+    for stack, count in stacks.items():
+        root.count += count
+        node = root
+        for frame in stack.split(";"):
+            node = node.children.setdefault(frame, Node())
+            node.count += count
+    return root
+
+def depth_of(stacks: Stacks) -> int:
+    return max((stack.count(";") + 1 for stack in stacks), default=0)
+
+def hashed_color(name: str) -> str:
+    """Warm flamegraph palette, stable per function name"""
+    digest = hashlib.md5(name.encode()).digest()
+    return f"rgb({205 + digest[0] % 50},{digest[1] % 230},{digest[2] % 55})"
+
+def delta_color(delta: float, scale: float) -> str:
+    """White for no change, towards red for a larger share, towards blue for a smaller one"""
+    strength = min(1.0, abs(delta) / scale) if scale > 0 else 0.0
+    fade = round(255 * (1 - strength))
+    return f"rgb(255,{fade},{fade})" if delta > 0 else f"rgb({fade},{fade},255)"
+
+def render(stacks: Stacks, title: str, subtitle: str = "", deltas: Optional[Dict[str, float]] = None) -> str:
+    """SVG flamegraph of folded stacks; with `deltas` (see path_deltas) a differential one"""
+    root = build_tree(stacks)
+    total = max(1, root.count)
+    levels = depth_of(stacks)
+    height = TOP + levels * FRAME_HEIGHT + 2 * PAD
+    scale = (WIDTH - 2 * PAD) / total
+    delta_scale = max((abs(d) for d in deltas.values()), default=0.0) if deltas else 0.0
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{WIDTH}" height="{height}" '
+        f'viewBox="0 0 {WIDTH} {height}" font-family="Verdana, sans-serif" font-size="{FONT_SIZE}">',
+        f'<rect width="100%" height="100%" fill="#f8f8f8"/>',
+        f'<text x="{WIDTH / 2}" y="18" text-anchor="middle" font-size="15">{escape(title)}</text>',
+        f'<text x="{WIDTH / 2}" y="33" text-anchor="middle" fill="#666">{escape(subtitle)}</text>',
+    ]
+
+    # Iterative walk: deep recursion benchmarks produce stacks thousands of frames deep
+    pending = []
+    x = PAD
+    for name in sorted(root.children):
+        pending.append((root.children[name], name, name, x, 1))
+        x += root.children[name].count * scale
+    while pending:
+        node, path, name, x, depth = pending.pop()
+        width = node.count * scale
+        if width < MIN_WIDTH:
+            continue
+        y = height - PAD - depth * FRAME_HEIGHT
+        share = node.count / total
+        if deltas is not None:
+            delta = deltas.get(path, 0.0)
+            fill = delta_color(delta, delta_scale)
+            tip = f"{name} ({node.count} samples, {share:.2%}, {delta:+.2%})"
+        else:
+            fill = hashed_color(name)
+            tip = f"{name} ({node.count} samples, {share:.2%})"
+        parts.append(f'<g><title>{escape(tip)}</title>'
+                     f'<rect x="{x:.2f}" y="{y}" width="{width:.2f}" height="{FRAME_HEIGHT - 1}" '
+                     f'fill="{fill}" rx="2"/>')
+        chars = int((width - 6) / CHAR_WIDTH)
+        if chars >= 3:
+            label = name if len(name) <= chars else name[:chars - 2] + ".."
+            parts.append(f'<text x="{x + 3:.2f}" y="{y + FRAME_HEIGHT - 4}">{escape(label)}</text>')
+        parts.append("</g>")
+        for child_name in sorted(node.children):
+            child = node.children[child_name]
+            pending.append((child, f"{path};{child_name}", child_name, x, depth + 1))
+            x += child.count * scale
+    parts.append("</svg>")
+    return "\n".join(parts) + "\n"
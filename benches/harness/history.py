@@ -0,0 +1,206 @@
+"""
+Persistent benchmark history.
+
+Every compare.py run appends one JSON object per (benchmark, language,
+backend, n) to a JSON-lines file under target/. Records are keyed by the git
+commit of the workspace (plus the pain-compiler submodule commit, which is
+where interpreter changes land) and by a host fingerprint, so runs from
+different machines are never compared by accident. Runs from a working tree
+with uncommitted changes are marked `dirty` and left out of comparisons
+unless asked for. Each record also carries
+the environment fingerprint of its run (governor, turbo, toolchain versions;
+see harness/environment.py).
+"""
+
+import hashlib
+import json
+import os
+import platform
+import subprocess
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+DEFAULT_HISTORY = Path("target/bench-history/results.jsonl")
+
+SCHEMA_VERSION = 1
+
+def git_commit(path: str = ".") -> Optional[str]:
+    """Full commit hash of the checkout at `path`, or None outside git"""
+    try:
+        result = subprocess.run(
+            ["git", "-C", path, "rev-parse", "HEAD"],
+            capture_output=True, text=True, timeout=10
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+def git_dirty(path: str = ".") -> bool:
+    """True when tracked files in the checkout at `path` have local changes"""
+    try:
+        result = subprocess.run(
+            ["git", "-C", path, "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True, text=True, timeout=10
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
+        return False
+    return result.returncode == 0 and bool(result.stdout.strip())
+
+def resolve_commit(ref: str) -> str:
+    """Resolve a ref (branch, tag, short hash) to a full hash when possible"""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--verify", f"{ref}^{{commit}}"],
+            capture_output=True, text=True, timeout=10
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()
+    except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
+        pass
+    return ref
+
+def host_fingerprint() -> str:
+    """Short stable hash identifying the machine a result was measured on"""
+    parts = [
+        platform.node(),
+        platform.system(),
+        platform.machine(),
+        platform.processor(),
+        str(os.cpu_count()),
+    ]
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()[:12]
+
+class Record(NamedTuple):
+    """One stored result set"""
+    commit: str
+    compiler_commit: Optional[str]
+    dirty: bool
+    timestamp: float
+    host: str
+    benchmark: str
+    language: str
+    backend: str
+    n: int
+    samples: List[float]
+    execute: List[float]
+    environment: Optional[Dict] = None
+
+    def key(self) -> Tuple[str, str, str, int, str]:
+        """Identity of the measured configuration, independent of the commit"""
+        return (self.benchmark, self.language, self.backend, self.n, self.host)
+
+class History:
+    """Append-only JSON-lines result store"""
+
+    def __init__(self, path: Path = DEFAULT_HISTORY, environment: Optional[Dict] = None):
+        self.path = Path(path)
+        self.environment = environment
+        self._context: Optional[Dict] = None
+
+    def context(self) -> Dict:
+        """Commit and host fields shared by every record of this process"""
+        if self._context is None:
+            # An uninitialized submodule is a plain directory; git -C would
+            # then report the workspace commit instead.
+            has_compiler = Path("pain-compiler/.git").exists()
+            self._context = {
+                "commit": git_commit() or "unknown",
+                "compiler_commit": git_commit("pain-compiler") if has_compiler else None,
+                "dirty": git_dirty() or (has_compiler and git_dirty("pain-compiler")),
+                "host": host_fingerprint(),
+            }
+            if self.environment is not None:
+                self._context["environment"] = self.environment
+        return self._context
+
+    def append(self, benchmark: str, language: str, backend: str, n: int,
+               samples: List[float], execute: Optional[List[float]] = None, **extra) -> None:
+        """Store the raw samples of one (benchmark, language, backend, n)"""
+        if not samples:
+            return
+        entry = {
+            "schema": SCHEMA_VERSION,
+            **self.context(),
+            "timestamp": time.time(),
+            "benchmark": benchmark,
+            "language": language,
+            "backend": backend,
+            "n": n,
+            "samples": samples,
+            "execute": execute or [],
+        }
+        entry.update(extra)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, sort_keys=True) + "\n")
+
+    def records(self) -> Iterator[Record]:
+        """Iterate over every stored record, skipping malformed lines"""
+        if not self.path.exists():
+            return
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    raw = json.loads(line)
+                    yield Record(
+                        commit=raw["commit"],
+                        compiler_commit=raw.get("compiler_commit"),
+                        dirty=raw.get("dirty", False),
+                        timestamp=raw["timestamp"],
+                        host=raw["host"],
+                        benchmark=raw["benchmark"],
+                        language=raw["language"],
+                        backend=raw.get("backend", ""),
+                        n=raw["n"],
+                        samples=raw["samples"],
+                        execute=raw.get("execute", []),
+                        environment=raw.get("environment"),
+                    )
+                except (ValueError, KeyError, TypeError):
+                    continue
+
+    def records_for(self, commit: str, include_dirty: bool = False) -> Iterator[Record]:
+        """Records measured at `commit` (a hash prefix)
+        
+        Runs from a working tree with uncommitted changes are stored under the
+        same commit hash but measured different code, so they are skipped
+        unless `include_dirty` is given.
+        """
+        for record in self.records():
+            if record.commit.startswith(commit) and (include_dirty or not record.dirty):
+                yield record
+
+    def samples_for(self, commit: str, any_host: bool = False,
+                    include_dirty: bool = False) -> Dict[Tuple, List[float]]:
+        """Pool samples of every configuration measured at `commit`.
+        
+        `commit` may be a hash prefix. With `any_host` the host is dropped from
+        the key so results from several machines are pooled.
+        """
+        pooled: Dict[Tuple, List[float]] = {}
+        for record in self.records_for(commit, include_dirty):
+            key = record.key()
+            if any_host:
+                key = key[:-1] + ("*",)
+            pooled.setdefault(key, []).extend(record.samples)
+        return pooled
+
+    def environments_for(self, commit: str, include_dirty: bool = False) -> List[Dict]:
+        """Distinct environment fingerprints stored for `commit` (a hash prefix)"""
+        found = []
+        for record in self.records_for(commit, include_dirty):
+            if record.environment and record.environment not in found:
+                found.append(record.environment)
+        return found
+
+    def compiler_commits_for(self, commit: str, include_dirty: bool = False) -> List[Optional[str]]:
+        """Distinct pain-compiler commits the records of `commit` were measured with"""
+        found: List[Optional[str]] = []
+        for record in self.records_for(commit, include_dirty):
+            if record.compiler_commit not in found:
+                found.append(record.compiler_commit)
+        return found
@@ -0,0 +1,187 @@
+"""
+Process launcher that reports the child's resource usage.
+
+On POSIX the child is reaped with `os.wait4`, which returns its rusage: peak
+RSS, page faults, context switches and user/system CPU time. That is the same
+accounting `/usr/bin/time -v` prints, without an extra process in between.
+Where `os.wait4` doesn't exist (Windows) only the wall time is available.
+
+Linux carries the parent's peak RSS over into the child at exec, so a child's
+max RSS is never below the harness's own peak at spawn time. That floor is
+recorded with every run so reports can tell a real peak from the floor.
+
+With `stamp_lines=True` stdout is read line by line as the child writes it,
+and the arrival time of every line (seconds since launch) is kept. Programs
+that print a line per batch of work get a batch-latency series that way
+without needing a clock of their own.
+
+The child leads its own process group, so a timeout kills everything it
+started (`cargo run` and the pain-compiler under it), not just the direct
+child. A command that cannot be started comes back as a failed `Completed`
+with the error on stderr, like a timeout, instead of raising.
+"""
+
+import os
+import platform
+import signal
+import subprocess
+import threading
+import time
+from typing import List, NamedTuple, Optional
+
+HAS_WAIT4 = hasattr(os, "wait4")
+
+if HAS_WAIT4:
+    import resource
+
+# ru_maxrss is in kilobytes on Linux and in bytes on macOS
+MAXRSS_SCALE = 1 if platform.system() == "Darwin" else 1024
+
+CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0
+
+# How long to wait for the output pipes to close once the child has exited;
+# a grandchild that inherited them and lives on is killed after this.
+DRAIN_GRACE = 5.0
+
+class Usage(NamedTuple):
+    """Resource usage of one finished child process"""
+    max_rss: int  # bytes
+    minor_faults: int
+    major_faults: int
+    voluntary_switches: int
+    involuntary_switches: int
+    user: float  # seconds of CPU time
+    system: float
+    rss_floor: int = 0  # harness peak RSS at spawn; max_rss at or below it is not the child's own
+
+    @classmethod
+    def from_rusage(cls, rusage, rss_floor: int = 0) -> "Usage":
+        return cls(
+            max_rss=rusage.ru_maxrss * MAXRSS_SCALE,
+            minor_faults=rusage.ru_minflt,
+            major_faults=rusage.ru_majflt,
+            voluntary_switches=rusage.ru_nvcsw,
+            involuntary_switches=rusage.ru_nivcsw,
+            user=rusage.ru_utime,
+            system=rusage.ru_stime,
+            rss_floor=rss_floor,
+        )
+
+class Completed(NamedTuple):
+    """Outcome of `launch`"""
+    returncode: int
+    stdout: str
+    stderr: str
+    elapsed: float
+    usage: Optional[Usage]
+    timed_out: bool = False
+    line_times: Optional[List[float]] = None  # arrival of each stdout line, with stamp_lines
+
+def _exit_code(status: int) -> int:
+    """Decode a wait status like subprocess does (negative signal number if killed)"""
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+def _drain(stream, chunks: List[str]) -> None:
+    # Line by line, so whatever arrived is kept if the pipe never closes
+    for line in stream:
+        chunks.append(line)
+    stream.close()
+
+def _drain_lines(stream, chunks: List[str], times: List[float], start: float) -> None:
+    for line in stream:
+        times.append(time.perf_counter() - start)
+        chunks.append(line)
+    stream.close()
+
+def _not_started(error: OSError) -> Completed:
+    """Result of a command that could not be started (missing binary, permissions)"""
+    return Completed(-1, "", f"{error}", float('inf'), None)
+
+def _kill_group(pgid: int) -> None:
+    """SIGKILL the child's process group: the child and every descendant that stayed in it"""
+    try:
+        os.killpg(pgid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass  # already gone
+
+def launch(cmd: List[str], input_data: Optional[str] = None, env: Optional[dict] = None,
+           timeout: float = 300, cwd: Optional[str] = None, stamp_lines: bool = False) -> Completed:
+    """Run a command to completion, capturing output, wall time and rusage"""
+    if not HAS_WAIT4:
+        start = time.perf_counter()
+        try:
+            result = subprocess.run(cmd, input=input_data, capture_output=True, text=True,
+                                    timeout=timeout, env=env, cwd=cwd, creationflags=CREATION_FLAGS)
+        except subprocess.TimeoutExpired:
+            return Completed(-1, "", "", float('inf'), None, timed_out=True)
+        except OSError as e:
+            return _not_started(e)
+        return Completed(result.returncode, result.stdout, result.stderr,
+                         time.perf_counter() - start, None)
+
+    rss_floor = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * MAXRSS_SCALE
+    start = time.perf_counter()
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE if input_data is not None else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            env=env,
+            cwd=cwd,
+            start_new_session=True,  # own process group, see _kill_group
+        )
+    except OSError as e:
+        return _not_started(e)
+    # Drain the pipes concurrently so a chatty child can't block on a full pipe
+    out_chunks: List[str] = []
+    err_chunks: List[str] = []
+    line_times: List[float] = []
+    if stamp_lines:
+        out_reader = threading.Thread(target=_drain_lines, args=(proc.stdout, out_chunks, line_times, start),
+                                      daemon=True)
+    else:
+        out_reader = threading.Thread(target=_drain, args=(proc.stdout, out_chunks), daemon=True)
+    readers = [
+        out_reader,
+        threading.Thread(target=_drain, args=(proc.stderr, err_chunks), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+    if input_data is not None:
+        try:
+            proc.stdin.write(input_data)
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+
+    timed_out = threading.Event()
+    def kill():
+        timed_out.set()
+        _kill_group(proc.pid)
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+    try:
+        _, status, rusage = os.wait4(proc.pid, 0)
+    finally:
+        timer.cancel()
+    elapsed = time.perf_counter() - start
+    proc.returncode = _exit_code(status)  # already reaped; stop Popen from waiting again
+
+    # A grandchild that inherited stdout/stderr keeps the pipes open after the
+    # child is gone; don't wait on it past the timeout
+    drain_deadline = max(start + timeout, time.perf_counter()) + DRAIN_GRACE
+    for reader in readers:
+        reader.join(max(0.0, drain_deadline - time.perf_counter()))
+    if any(reader.is_alive() for reader in readers):
+        _kill_group(proc.pid)
+        drain_deadline = time.perf_counter() + DRAIN_GRACE
+        for reader in readers:
+            reader.join(max(0.0, drain_deadline - time.perf_counter()))
+    if timed_out.is_set():
+        return Completed(proc.returncode, "", "", float('inf'), None, timed_out=True)
+    return Completed(proc.returncode, "".join(out_chunks), "".join(err_chunks), elapsed,
+                     Usage.from_rusage(rusage, rss_floor), line_times=line_times if stamp_lines else None)
@@ -0,0 +1,344 @@
+"""
+pain-lsp driver: a minimal LSP client over stdio and scripted editing sessions.
+
+Messages are JSON-RPC with `Content-Length` framing. A reader thread stamps
+every incoming message with `time.perf_counter()` as soon as it is parsed, so
+a request's latency is receive time minus send time, independent of when
+the session gets round to looking at the reply. Requests the server sends
+to the client (capability registration, progress tokens) are acknowledged
+with a null result.
+
+A session opens a generated document and then, for each edit, types a new
+line into a function body one keystroke per `didChange`, with a completion
+request fired mid-word the way an editor does. Once the burst is sent it
+waits for the first `publishDiagnostics` for the document (time to first
+diagnostic), then asks for hover on a call site and, if the server offers
+pull diagnostics, for `textDocument/diagnostic`.
+"""
+
+import bisect
+import json
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from harness.buildcache import BUILD_ROOT, CREATION_FLAGS
+from harness.synthetic import Program
+
+LSP_DIR = BUILD_ROOT.parent / "bench-lsp"
+
+# Typed into a function body during each edit; completion is requested right
+# after the character at COMPLETION_AT, mid-identifier
+TYPED_LINE = "    acc = acc + k"
+COMPLETION_AT = len("    acc = a")
+
+# TextDocumentSyncKind
+SYNC_FULL = 1
+SYNC_INCREMENTAL = 2
+
+class LspError(Exception):
+    """The server exited or broke the protocol"""
+
+class Reply(NamedTuple):
+    latency: float
+    result: Any
+    error: Optional[Dict]
+
+class LspClient:
+    """One pain-lsp process spoken to over stdin/stdout"""
+
+    def __init__(self, cmd: List[str]):
+        self.proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            creationflags=CREATION_FLAGS,
+        )
+        self._next_id = 1
+        self._write_lock = threading.Lock()
+        self._changed = threading.Condition()
+        self._sent: Dict[int, float] = {}
+        self._replies: Dict[int, Tuple[float, Dict]] = {}
+        # (receive time, uri, version or None) of every publishDiagnostics
+        self.published: List[Tuple[float, str, Optional[int]]] = []
+        self._closed = False
+        threading.Thread(target=self._pump, daemon=True).start()
+
+    def _read_message(self) -> Optional[Dict]:
+        length = None
+        while True:
+            header = self.proc.stdout.readline()
+            if not header:
+                return None
+            header = header.strip()
+            if not header:
+                break
+            name, _, value = header.decode("ascii", "replace").partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        if length is None:
+            raise LspError("message without Content-Length")
+        return json.loads(self.proc.stdout.read(length))
+
+    def _pump(self):
+        try:
+            while True:
+                message = self._read_message()
+                received = time.perf_counter()
+                if message is None:
+                    break
+                if "method" in message and "id" in message:
+                    self._send({"jsonrpc": "2.0", "id": message["id"], "result": None})
+                    continue
+                with self._changed:
+                    if "id" in message:
+                        self._replies[message["id"]] = (received, message)
+                    elif message.get("method") == "textDocument/publishDiagnostics":
+                        params = message.get("params", {})
+                        self.published.append((received, params.get("uri"), params.get("version")))
+                    self._changed.notify_all()
+        except (OSError, ValueError, LspError):
+            pass
+        with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+
+    def _send(self, payload: Dict) -> float:
+        body = json.dumps(payload).encode()
+        with self._write_lock:
+            sent = time.perf_counter()
+            self.proc.stdin.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+            self.proc.stdin.flush()
+        return sent
+
+    def request(self, method: str, params: Dict) -> int:
+        """Send a request without waiting for it; returns its id"""
+        request_id = self._next_id
+        self._next_id += 1
+        self._sent[request_id] = self._send({"jsonrpc": "2.0", "id": request_id, "method": method,
+                                             "params": params})
+        return request_id
+
+    def notify(self, method: str, params: Optional[Dict] = None) -> float:
+        """Send a notification; returns the time it was written"""
+        return self._send({"jsonrpc": "2.0", "method": method, "params": params or {}})
+
+    def wait(self, request_id: int, timeout: float) -> Optional[Reply]:
+        """The reply to a request, or None if it did not arrive in time"""
+        deadline = time.perf_counter() + timeout
+        with self._changed:
+            while request_id not in self._replies:
+                remaining = deadline - time.perf_counter()
+                if self._closed or remaining <= 0:
+                    return None
+                self._changed.wait(remaining)
+            received, message = self._replies.pop(request_id)
+        return Reply(received - self._sent.pop(request_id), message.get("result"), message.get("error"))
+
+    def call(self, method: str, params: Dict, timeout: float) -> Optional[Reply]:
+        return self.wait(self.request(method, params), timeout)
+
+    def wait_diagnostics(self, uri: str, since: float, version: int, timeout: float) -> Optional[float]:
+        """Seconds from `since` to the first diagnostics published for `uri` afterwards
+
+        When the server includes the document version, publications for
+        older versions are skipped.
+        """
+        deadline = since + timeout
+        seen = 0
+        with self._changed:
+            while True:
+                for received, published_uri, published_version in self.published[seen:]:
+                    if (received >= since and published_uri == uri
+                            and (published_version is None or published_version >= version)):
+                        return received - since
+                seen = len(self.published)
+                remaining = deadline - time.perf_counter()
+                if self._closed or remaining <= 0:
+                    return None
+                self._changed.wait(remaining)
+
+    def initialize(self, root: Path, timeout: float) -> Tuple[float, Dict]:
+        """LSP handshake; returns (seconds, server capabilities)"""
+        reply = self.call("initialize", {
+            "processId": None,
+            "rootUri": root.absolute().as_uri(),
+            "capabilities": {
+                "textDocument": {
+                    "synchronization": {"didSave": False},
+                    "completion": {"completionItem": {"snippetSupport": False}},
+                    "hover": {"contentFormat": ["plaintext", "markdown"]},
+                    "publishDiagnostics": {"versionSupport": True},
+                    "diagnostic": {},
+                },
+            },
+        }, timeout)
+        if reply is None or reply.error:
+            raise LspError(f"initialize failed: {reply.error if reply else 'no reply'}")
+        self.notify("initialized")
+        return reply.latency, (reply.result or {}).get("capabilities", {})
+
+    def close(self):
+        try:
+            if not self._closed:
+                self.call("shutdown", {}, timeout=10)
+                self.notify("exit")
+            self.proc.stdin.close()
+            self.proc.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            self.proc.kill()
+            self.proc.wait()
+
+def sync_kind(capabilities: Dict) -> int:
+    """The TextDocumentSyncKind the server asked for (full if it didn't say)"""
+    sync = capabilities.get("textDocumentSync", SYNC_FULL)
+    if isinstance(sync, dict):
+        sync = sync.get("change", SYNC_FULL)
+    return sync if sync in (SYNC_FULL, SYNC_INCREMENTAL) else SYNC_FULL
+
+class Document:
+    """Client-side copy of an open document, kept in step with the edits sent"""
+
+    def __init__(self, client: LspClient, path: Path, program: Program, sync: int):
+        self.client = client
+        self.uri = path.absolute().as_uri()
+        self.program = program
+        self.sync = sync
+        self.lines = program.text.split("\n")
+        self.version = 1
+        self._inserted: List[int] = []  # original line numbers a new line was inserted before
+
+    def line(self, original: int) -> int:
+        """Current line of a line of the generated program"""
+        return original + bisect.bisect_right(self._inserted, original)
+
+    def open(self) -> float:
+        return self.client.notify("textDocument/didOpen", {"textDocument": {
+            "uri": self.uri, "languageId": "pain", "version": self.version, "text": self.program.text,
+        }})
+
+    def _change(self, line: int, column: int, text: str) -> float:
+        """Insert `text` at (line, column) locally and on the server"""
+        current = self.lines[line]
+        self.lines[line:line + 1] = (current[:column] + text + current[column:]).split("\n")
+        self.version += 1
+        if self.sync == SYNC_INCREMENTAL:
+            position = {"line": line, "character": column}
+            change = {"range": {"start": position, "end": position}, "text": text}
+        else:
+            change = {"text": "\n".join(self.lines)}
+        return self.client.notify("textDocument/didChange", {
+            "textDocument": {"uri": self.uri, "version": self.version},
+            "contentChanges": [change],
+        })
+
+    def type_line(self, original: int) -> Tuple[float, int]:
+        """Type TYPED_LINE as a new line before a program line, one keystroke per change
+
+        Returns (time the last keystroke was sent, completion request id).
+        """
+        line = self.line(original)
+        self._change(line, 0, "\n")
+        bisect.insort(self._inserted, original)
+        completion = None
+        sent = 0.0
+        for column, char in enumerate(TYPED_LINE):
+            sent = self._change(line, column, char)
+            if column + 1 == COMPLETION_AT:
+                completion = self.client.request("textDocument/completion", {
+                    "textDocument": {"uri": self.uri},
+                    "position": {"line": line, "character": COMPLETION_AT},
+                })
+        return sent, completion
+
+    def position(self, original: int, column: int) -> Dict:
+        return {"textDocument": {"uri": self.uri},
+                "position": {"line": self.line(original), "character": column}}
+
+class SessionResult(NamedTuple):
+    """Latencies of one replayed session, in seconds"""
+    initialize: float
+    open_diagnostics: Optional[float]  # didOpen to first diagnostics
+    edit_diagnostics: List[float]  # last keystroke to first diagnostics, per edit
+    requests: Dict[str, List[float]]  # method -> latencies
+    failures: int  # errors and timeouts
+    sync: int
+
+def record_reply(result: Dict[str, List[float]], method: str, reply: Optional[Reply]) -> int:
+    """Add a reply's latency under `method`; returns 1 for a failure"""
+    if reply is None or reply.error:
+        return 1
+    result.setdefault(method, []).append(reply.latency)
+    return 0
+
+def write_workspace(program: Program) -> Path:
+    """Put the generated program on disk (servers may read it) and return its path"""
+    path = LSP_DIR / f"lines-{program.lines}" / "bench.pain"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(program.text)
+    return path
+
+def replay_session(client: LspClient, program: Program, edits: int, timeout: float) -> Tuple[SessionResult, Document]:
+    """Open the program and replay `edits` typing bursts with completion, hover and diagnostics"""
+    path = write_workspace(program)
+    init, capabilities = client.initialize(path.parent, timeout)
+    doc = Document(client, path, program, sync_kind(capabilities))
+    requests: Dict[str, List[float]] = {}
+    failures = 0
+
+    opened = doc.open()
+    open_diagnostics = client.wait_diagnostics(doc.uri, opened, doc.version, timeout)
+    failures += open_diagnostics is None
+
+    edit_diagnostics = []
+    callers = [f for f in program.functions if f.call_column >= 0] or program.functions
+    for i in range(edits):
+        # Spread the edits over the file so none of them is always near the top
+        target = program.functions[(i * 7919) % len(program.functions)]
+        # After `var acc` and `var k`, so the finished line type-checks
+        sent, completion = doc.type_line(target.body_line + 2)
+        failures += record_reply(requests, "textDocument/completion", client.wait(completion, timeout))
+        seconds = client.wait_diagnostics(doc.uri, sent, doc.version, timeout)
+        if seconds is None:
+            failures += 1
+        else:
+            edit_diagnostics.append(seconds)
+
+        caller = callers[(i * 104729) % len(callers)]
+        reply = client.call("textDocument/hover", doc.position(caller.call_line, max(0, caller.call_column)), timeout)
+        failures += record_reply(requests, "textDocument/hover", reply)
+        if capabilities.get("diagnosticProvider") is not None:
+            reply = client.call("textDocument/diagnostic", {"textDocument": {"uri": doc.uri}}, timeout)
+            failures += record_reply(requests, "textDocument/diagnostic", reply)
+
+    return SessionResult(init, open_diagnostics, edit_diagnostics, requests, failures, doc.sync), doc
+
+class PipelineResult(NamedTuple):
+    depth: int
+    latencies: List[float]
+    wall: float  # first send to last reply
+    failures: int
+
+def pipeline(client: LspClient, doc: Document, depth: int, timeout: float) -> PipelineResult:
+    """Send `depth` hover/completion requests back to back, then collect every reply"""
+    functions = doc.program.functions
+    start = time.perf_counter()
+    ids = []
+    for i in range(depth):
+        function = functions[(i * 31) % len(functions)]
+        if i % 2:
+            ids.append(client.request("textDocument/hover", doc.position(function.def_line, len("fn f"))))
+        else:
+            ids.append(client.request("textDocument/completion", doc.position(function.body_line + 1, len("    v"))))
+    latencies = []
+    failures = 0
+    for request_id in ids:
+        reply = client.wait(request_id, timeout)
+        if reply is None or reply.error:
+            failures += 1
+        else:
+            latencies.append(reply.latency)
+    return PipelineResult(depth, latencies, time.perf_counter() - start, failures)
@@ -0,0 +1,325 @@
+"""
+Declarative benchmark manifest (benches/benchmarks.toml).
+
+The manifest lists every benchmark with its per-language sources, the size
+classes it can run at, how `n` is passed to each program and the expected
+output for each `n`. Adding a benchmark only needs new source files and a
+manifest entry; compare.py picks it up without code changes.
+
+Parameter templates use `string.Template` syntax (`${n}`). Pain sources are
+templates themselves and are rendered to target/bench-src/ before a run; the
+other languages receive their parameters on the command line.
+
+`result` and `work` are small arithmetic expressions in `n` (see
+EXPR_FUNCTIONS) giving the expected output and the number of work units
+(calls, loop iterations) for any n, which the sweep mode relies on. `flops`
+and `bytes` count floating-point operations and memory traffic for throughput
+reports, and `template` adds further `${name}` variables computed from n.
+`batches` counts the batches one run processes, for per-batch latency.
+With `pauses = true` the program also prints a line containing "batch" after
+each batch; the harness timestamps them for the batch-latency distribution.
+
+Parallel kernels take `${workers}` in their args. For those, `weak` gives the
+problem size that keeps the work per worker constant (an expression in n and
+workers), which the weak-scaling report runs at.
+"""
+
+import functools
+import math
+import re
+import string
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from harness import reference
+from harness.scaling import MODELS, geometric_series
+
+try:
+    import tomllib  # Python >= 3.11
+except ModuleNotFoundError:
+    try:
+        import tomli as tomllib  # Python < 3.11: pip install tomli
+    except ModuleNotFoundError:
+        tomllib = None
+
+BENCH_DIR = Path("benches")
+DEFAULT_MANIFEST = BENCH_DIR / "benchmarks.toml"
+RENDER_DIR = Path("target/bench-src")
+
+LANGUAGE_KEYS = ("pain", "python", "python_mp", "numpy", "rust", "cpp")
+
+DEFAULT_ARGS = ["${n}"]
+
+def _fib(n: int) -> int:
+    a, b = 0, 1
+    for _ in range(int(n)):
+        a, b = b, a + b
+    return a
+
+# Functions available to `result` and `work` expressions
+EXPR_FUNCTIONS = {
+    "fib": _fib,
+    "factorial": lambda n: math.factorial(int(n)),
+    "log2": math.log2,
+    "sqrt": math.sqrt,
+    "min": min,
+    "max": max,
+    "round": round,
+    **reference.FUNCTIONS,
+}
+
+def evaluate(expr: str, n: float, **names):
+    """Evaluate a manifest expression for a given n (and any extra names, e.g. workers)"""
+    return eval(expr, {"__builtins__": {}}, {**EXPR_FUNCTIONS, **names, "n": n})
+
+class Sweep(NamedTuple):
+    """Geometric input-size series for --sweep"""
+    start: int
+    stop: Dict[str, int]
+    factor: float
+
+class ManifestError(Exception):
+    """Raised when benchmarks.toml is missing or malformed"""
+
+class Benchmark(NamedTuple):
+    """One manifest entry"""
+    name: str
+    description: str
+    sources: Dict[str, Path]
+    args: Dict[str, List[str]]
+    sizes: Dict[str, Dict[str, int]]
+    default_size: str
+    expected: Dict[int, str]
+    result: Optional[str] = None
+    sweep: Optional[Sweep] = None
+    work: Optional[str] = None
+    unit: str = "op"
+    models: List[str] = []
+    flops: Optional[str] = None
+    bytes: Optional[str] = None
+    template: Dict[str, str] = {}
+    weak: Optional[str] = None
+    batches: Optional[str] = None
+    pauses: bool = False
+
+    def n_for(self, size: Optional[str], lang: str) -> Optional[int]:
+        """Parameter for a language at a size class (default class if None)"""
+        size = size or self.default_size
+        return self.sizes.get(size, {}).get(lang)
+
+    def source(self, lang: str) -> Optional[Path]:
+        """Source path for a language, if the benchmark has one"""
+        return self.sources.get(lang)
+
+    def template_values(self, n: int, workers: int = 1) -> Dict[str, str]:
+        """`${name}` substitutions: n, workers and the manifest's `template` entries"""
+        values = {"n": str(n), "workers": str(workers)}
+        for name, expr in self.template.items():
+            values[name] = str(evaluate(expr, n, workers=workers))
+        return values
+
+    def argv(self, lang: str, n: int, workers: int = 1) -> List[str]:
+        """Command-line arguments for a language with the parameters filled in"""
+        template = self.args.get(lang, DEFAULT_ARGS)
+        values = self.template_values(n, workers)
+        return [string.Template(arg).substitute(values) for arg in template]
+
+    def parallel(self, lang: str) -> bool:
+        """Whether a language's program takes a worker count"""
+        return any("${workers}" in arg for arg in self.args.get(lang, []))
+
+    def weak_n(self, n: int, workers: int) -> int:
+        """Problem size for weak scaling at a worker count (n itself without `weak`)"""
+        return int(evaluate(self.weak, n, workers=workers)) if self.weak else n
+
+    def expected_output(self, n: int) -> Optional[str]:
+        """Expected stdout for a given n, if declared or computable"""
+        if n in self.expected:
+            return self.expected[n]
+        if self.result is not None:
+            return str(evaluate(self.result, n))
+        return None
+
+    def work_units(self, n: float) -> float:
+        """Calls/iterations performed at n (defaults to n itself)"""
+        return float(evaluate(self.work, n)) if self.work else float(n)
+
+    def flop_count(self, n: int) -> Optional[float]:
+        """Floating-point operations performed at n, if declared"""
+        return float(evaluate(self.flops, n)) if self.flops else None
+
+    def byte_count(self, n: int) -> Optional[float]:
+        """Bytes moved to and from memory at n, if declared"""
+        return float(evaluate(self.bytes, n)) if self.bytes else None
+
+    def batch_count(self, n: int) -> Optional[float]:
+        """Batches processed per run at n, if declared"""
+        return float(evaluate(self.batches, n)) if self.batches else None
+
+    def sweep_values(self, lang: str) -> List[int]:
+        """Sizes to run for a language in sweep mode"""
+        if self.sweep is None:
+            return []
+        stop = self.sweep.stop.get(lang, self.sweep.stop.get("*", 0))
+        return geometric_series(self.sweep.start, stop, self.sweep.factor)
+
+    def render_pain(self, n: int) -> Optional[Path]:
+        """Render the Pain template for n into target/bench-src and return its path"""
+        template_path = self.sources.get("pain")
+        if template_path is None or not template_path.exists():
+            return None
+        source = string.Template(template_path.read_text()).substitute(self.template_values(n))
+        rendered = RENDER_DIR / "pain" / f"{self.name}-{n}.pain"
+        rendered.parent.mkdir(parents=True, exist_ok=True)
+        if not rendered.exists() or rendered.read_text() != source:
+            rendered.write_text(source)
+        return rendered
+
+class Manifest:
+    """Lazily parsed view over benchmarks.toml"""
+
+    def __init__(self, raw: Dict, path: Path):
+        self._raw = raw
+        self.path = path
+        self._cache: Dict[str, Benchmark] = {}
+
+    def names(self) -> List[str]:
+        """Benchmark names in manifest order"""
+        return list(self._raw.get("benchmarks", {}).keys())
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._raw.get("benchmarks", {})
+
+    def get(self, name: str) -> Benchmark:
+        """Parse and validate one benchmark on first access"""
+        if name not in self._cache:
+            entries = self._raw.get("benchmarks", {})
+            if name not in entries:
+                raise ManifestError(f"{self.path}: unknown benchmark '{name}'")
+            self._cache[name] = _parse_entry(name, entries[name], self.path)
+        return self._cache[name]
+
+    def startup(self) -> Benchmark:
+        """The empty program used to measure per-language startup"""
+        if "startup" not in self._raw:
+            raise ManifestError(f"{self.path}: missing [startup] table")
+        if "startup" not in self._cache:
+            self._cache["startup"] = _parse_entry("empty", self._raw["startup"], self.path)
+        return self._cache["startup"]
+
+def _parse_entry(name: str, entry: Dict, path: Path) -> Benchmark:
+    """Validate one [benchmarks.<name>] table"""
+    where = f"{path}: benchmark '{name}'"
+    sources = entry.get("sources")
+    if not isinstance(sources, dict) or not sources:
+        raise ManifestError(f"{where}: 'sources' must map languages to files")
+    unknown = set(sources) - set(LANGUAGE_KEYS)
+    if unknown:
+        raise ManifestError(f"{where}: unknown language(s) {sorted(unknown)}")
+
+    raw_sizes = entry.get("sizes", {"default": 0})
+    sizes: Dict[str, Dict[str, int]] = {}
+    for size, value in raw_sizes.items():
+        if isinstance(value, int):
+            sizes[size] = {lang: value for lang in sources}
+        elif isinstance(value, dict):
+            # "*" covers every language that isn't listed explicitly
+            sizes[size] = {lang: int(value.get(lang, value.get("*"))) for lang in sources
+                           if lang in value or "*" in value}
+        else:
+            raise ManifestError(f"{where}: size '{size}' must be an integer or a per-language table")
+
+    default_size = entry.get("default_size", next(iter(sizes)))
+    if default_size not in sizes:
+        raise ManifestError(f"{where}: default_size '{default_size}' is not one of {list(sizes)}")
+
+    args = {lang: [str(a) for a in value] for lang, value in entry.get("args", {}).items()}
+    expected = {int(n): str(out) for n, out in entry.get("expected", {}).items()}
+
+    sweep = None
+    if "sweep" in entry:
+        raw_sweep = entry["sweep"]
+        try:
+            stop = raw_sweep["stop"]
+            sweep = Sweep(
+                start=int(raw_sweep["start"]),
+                stop={"*": int(stop)} if isinstance(stop, int) else {k: int(v) for k, v in stop.items()},
+                factor=float(raw_sweep.get("factor", 2.0)),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise ManifestError(f"{where}: sweep needs integer 'start' and 'stop' ({e})")
+        if sweep.start <= 0 or sweep.factor <= 1.0:
+            raise ManifestError(f"{where}: sweep needs start > 0 and factor > 1")
+
+    models = entry.get("models", [])
+    if isinstance(models, str):
+        models = [models]
+    unknown_models = set(models) - set(MODELS)
+    if unknown_models:
+        raise ManifestError(f"{where}: unknown model(s) {sorted(unknown_models)}, expected {list(MODELS)}")
+
+    template = {str(k): str(v) for k, v in entry.get("template", {}).items()}
+    bad_names = [k for k in template if not k.isidentifier() or k in ("n", "workers")]
+    if bad_names:
+        raise ManifestError(f"{where}: invalid template variable(s) {bad_names}")
+
+    return Benchmark(
+        name=name,
+        description=entry.get("description", ""),
+        sources={lang: BENCH_DIR / rel for lang, rel in sources.items()},
+        args=args,
+        sizes=sizes,
+        default_size=default_size,
+        expected=expected,
+        result=entry.get("result"),
+        sweep=sweep,
+        work=entry.get("work"),
+        unit=entry.get("unit", "op"),
+        models=list(models),
+        flops=entry.get("flops"),
+        bytes=entry.get("bytes"),
+        template=template,
+        weak=entry.get("weak"),
+        batches=entry.get("batches"),
+        pauses=bool(entry.get("pauses", False)),
+    )
+
+@functools.lru_cache(maxsize=None)
+def load_manifest(path: Path = DEFAULT_MANIFEST) -> Manifest:
+    """Read the manifest once; entries are validated when first used"""
+    if tomllib is None:
+        print("Error: reading benches/benchmarks.toml needs Python 3.11+ or tomli. "
+              "Install it with: pip install tomli")
+        sys.exit(1)
+    try:
+        with open(path, "rb") as f:
+            raw = tomllib.load(f)
+    except FileNotFoundError:
+        raise ManifestError(f"benchmark manifest not found: {path}")
+    except tomllib.TOMLDecodeError as e:
+        raise ManifestError(f"{path}: {e}")
+    return Manifest(raw, Path(path))
+
+def output_matches(output: str, expected: str) -> bool:
+    """Compare program output against the expected value.
+
+    Only the last line is checked, and a leading label is tolerated
+    (`Result: 6765`) so interpreters that decorate their output still match.
+    Numbers compare by value, so a float64 result printed as `6765.0` matches.
+    """
+    lines = output.strip().splitlines()
+    if not lines:
+        return False
+    last = lines[-1].strip()
+    if last == expected:
+        return True
+    if re.search(rf"(?<![\w.]){re.escape(expected)}\W*$", last) is not None:
+        return True
+    token = last.split()[-1].rstrip(",;")
+    if not re.fullmatch(r"-?\d+\.\d*(e[+-]?\d+)?|-?\d+e[+-]?\d+", token, re.IGNORECASE):
+        return False
+    try:
+        return float(token) == float(expected)
+    except ValueError:
+        return False
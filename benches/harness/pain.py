@@ -0,0 +1,157 @@
+"""
+Pain toolchain helpers: locating pain-compiler (and pain-lsp, painpkg) and
+building the per-backend artifacts compare.py measures.
+
+Backends:
+    interpreter  `pain-compiler run` on the default build
+    jit          `pain-compiler run` on a build with `--features jit`
+    aot          `pain-compiler build --executable --backend llvm`
+    pgo          `pain-compiler pgo-pipeline` (instrument, run, merge, rebuild)
+"""
+
+import functools
+import os
+import re
+import shutil
+import subprocess
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from harness.buildcache import BUILD_ROOT, CREATION_FLAGS, EXE_EXT
+
+PAIN_BACKENDS = ("interpreter", "jit", "aot", "pgo")
+
+# Backends that produce a native executable before the timed runs
+COMPILED_BACKENDS = ("aot", "pgo")
+
+MAIN_SIGNATURE = re.compile(r"^fn main\(\)\s*->\s*(\w+)", re.MULTILINE)
+
+JIT_TARGET_DIR = BUILD_ROOT / "pain-jit"
+ARTIFACT_DIR = BUILD_ROOT / "pain"
+
+def compiler_binary() -> Optional[Path]:
+    """Prebuilt pain-compiler from the workspace target dir, if any"""
+    for profile in ("release", "debug"):
+        exe_path = Path(f"target/{profile}/pain-compiler{EXE_EXT}")
+        if exe_path.exists():
+            return exe_path
+    return None
+
+@functools.lru_cache(maxsize=None)
+def jit_compiler_binary() -> Optional[Path]:
+    """pain-compiler built with the JIT feature, building it on first use"""
+    exe_path = JIT_TARGET_DIR / "release" / f"pain-compiler{EXE_EXT}"
+    build_cmd = [
+        "cargo", "build", "--release", "-p", "pain-compiler", "--features", "jit",
+        "--target-dir", str(JIT_TARGET_DIR),
+    ]
+    result = subprocess.run(build_cmd, capture_output=True, text=True, creationflags=CREATION_FLAGS)
+    if result.returncode != 0:
+        print(f"\n    Warning: Failed to build pain-compiler with --features jit: {result.stderr.strip()[-300:]}", end="")
+        return None
+    return exe_path if exe_path.exists() else None
+
+def pain_command(subcommand: str, source_file: Path, *extra: str, jit: bool = False) -> List[str]:
+    """Build a pain-compiler invocation, preferring a prebuilt binary over cargo run"""
+    exe_path = jit_compiler_binary() if jit else compiler_binary()
+    args = [subcommand, "--input", str(source_file.absolute()), *extra]
+    if exe_path is not None:
+        return [str(exe_path.absolute()), *args]
+    if jit:
+        return []
+    return ["cargo", "run", "--release", "--bin", "pain-compiler", "--", *args]
+
+def repl_command(jit: bool = False) -> List[str]:
+    """Command that starts the Pain REPL (the JIT build for jit=True)"""
+    exe_path = jit_compiler_binary() if jit else compiler_binary()
+    if exe_path is not None:
+        return [str(exe_path.absolute()), "repl"]
+    if jit:
+        return []
+    return ["cargo", "run", "--release", "--bin", "pain-compiler", "--", "repl"]
+
+# Front-end stages timed by `compare.py frontend`
+FRONTEND_STAGES = ("check", "ir", "exe")
+
+def frontend_command(stage: str, source_file: Path, output: Path) -> List[str]:
+    """pain-compiler invocation for one front-end stage; `output` gets the IR or executable"""
+    if stage == "check":
+        return pain_command("check", source_file)
+    if stage == "ir":
+        return pain_command("build", source_file, "--backend", "llvm", "--output", str(output.absolute()))
+    if stage == "exe":
+        return pain_command("build", source_file, "--executable", "--backend", "llvm",
+                            "--output", str(output.absolute()))
+    raise ValueError(f"unknown stage '{stage}' (expected one of {', '.join(FRONTEND_STAGES)})")
+
+def lsp_command() -> List[str]:
+    """Command that starts pain-lsp on stdio, preferring a prebuilt binary over cargo run"""
+    for profile in ("release", "debug"):
+        exe_path = Path(f"target/{profile}/pain-lsp{EXE_EXT}")
+        if exe_path.exists():
+            return [str(exe_path.absolute())]
+    return ["cargo", "run", "--quiet", "--release", "--bin", "pain-lsp"]
+
+def painpkg_command() -> List[str]:
+    """Command that runs painpkg from any directory, preferring a prebuilt binary over cargo run"""
+    for profile in ("release", "debug"):
+        exe_path = Path(f"target/{profile}/painpkg{EXE_EXT}")
+        if exe_path.exists():
+            return [str(exe_path.absolute())]
+    return ["cargo", "run", "--quiet", "--release", "--manifest-path", str(Path("Cargo.toml").absolute()),
+            "--bin", "painpkg", "--"]
+
+def backend_unavailable(backend: str) -> Optional[str]:
+    """Reason a backend can't run on this machine, or None if it should work"""
+    if backend not in PAIN_BACKENDS:
+        return f"unknown backend '{backend}' (expected one of {', '.join(PAIN_BACKENDS)})"
+    if backend == "jit" and not (os.environ.get("LLVM_SYS_211_PREFIX") or shutil.which("llvm-config")):
+        return "JIT needs LLVM 21 (set LLVM_SYS_211_PREFIX, see docs/JIT_SETUP.md)"
+    if backend in COMPILED_BACKENDS and not shutil.which("clang"):
+        return "LLVM executables need clang on PATH"
+    if backend == "pgo" and not shutil.which("llvm-profdata"):
+        return "PGO needs llvm-profdata on PATH"
+    return None
+
+def main_return_type(source_file: Path) -> Optional[str]:
+    """Declared return type of a Pain program's `main` (e.g. "int", "float64"), if found"""
+    match = MAIN_SIGNATURE.search(source_file.read_text())
+    return match.group(1) if match else None
+
+def build_executable(source_file: Path, backend: str, name: str) -> Tuple[Optional[Path], float]:
+    """Compile a Pain program to a native executable; returns (path, seconds spent)"""
+    out_dir = ARTIFACT_DIR / backend
+    out_dir.mkdir(parents=True, exist_ok=True)
+    exe_path = out_dir / f"{name}{EXE_EXT}"
+    if exe_path.exists():
+        exe_path.unlink()
+
+    if backend == "aot":
+        cmd = pain_command("build", source_file, "--executable", "--backend", "llvm",
+                           "--output", str(exe_path.absolute()))
+    elif backend == "pgo":
+        # Without --collect-command the pipeline trains on the program itself,
+        # i.e. on exactly the workload that is measured afterwards.
+        profile_dir = out_dir / f"{name}.profiles"
+        shutil.rmtree(profile_dir, ignore_errors=True)
+        profile_dir.mkdir(parents=True)
+        cmd = pain_command("pgo-pipeline", source_file, "--output", str(exe_path.absolute()),
+                           "--profile-dir", str(profile_dir.absolute()))
+    else:
+        raise ValueError(f"backend '{backend}' does not produce an executable")
+
+    start = time.perf_counter()
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600,
+                                creationflags=CREATION_FLAGS)
+    except (FileNotFoundError, subprocess.TimeoutExpired, OSError) as e:
+        print(f"\n    Warning: Failed to run pain-compiler for {backend}: {e}", end="")
+        return None, 0.0
+    elapsed = time.perf_counter() - start
+
+    if result.returncode != 0 or not exe_path.exists():
+        message = (result.stderr or result.stdout).strip()[-200:]
+        print(f"\n    Warning: pain-compiler {backend} build failed: {message}", end="")
+        return None, elapsed
+    return exe_path, elapsed
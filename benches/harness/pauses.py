@@ -0,0 +1,71 @@
+"""
+Batch latency and pause estimates for the allocation benchmarks.
+
+Pain exposes no collector statistics and has no clock, so pauses are observed
+from outside: a program with `pauses = true` prints a line containing
+"batch" after each equal-sized batch of work, and the launcher timestamps
+every stdout line as it arrives. The gaps between heartbeats are the
+per-batch latencies.
+
+Every batch does the same work, so the median batch is the steady-state
+cost. Whatever a batch takes beyond that median is time spent on something
+else: a collection, a heap resize, or page faults on fresh memory. The OS
+descheduling the process also shows up here, which is why Rust and C++,
+which have no collector, belong in the same table. The p99 and max excess
+are the pause estimates. Batches slower than STALL_FACTOR times the median
+are counted as stalls.
+
+If the program's stdout is block-buffered, the heartbeats arrive in bursts
+and the gaps mean nothing. That case is detected and reported as buffered.
+"""
+
+from typing import List, NamedTuple, Optional
+
+from harness.stats import percentile
+
+HEARTBEAT = "batch"
+
+STALL_FACTOR = 3.0
+
+# Median heartbeat gap below which the lines must have arrived together
+BUFFERED_GAP = 20e-6
+
+class PauseSummary(NamedTuple):
+    """Batch latencies pooled over all runs of one language"""
+    batches: int
+    median: float
+    p99: float
+    max: float
+    p99_pause: float  # p99 batch latency above the median batch
+    max_pause: float
+    stalls: float  # batches slower than STALL_FACTOR x median, per run
+    buffered: bool
+
+def batch_durations(stdout: str, line_times: Optional[List[float]]) -> Optional[List[float]]:
+    """Gaps between consecutive heartbeat lines, or None without timestamps"""
+    if line_times is None:
+        return None
+    stamps = [t for t, line in zip(line_times, stdout.splitlines()) if HEARTBEAT in line]
+    if len(stamps) < 2:
+        return None
+    return [later - earlier for earlier, later in zip(stamps, stamps[1:])]
+
+def summarize_batches(runs: List[List[float]]) -> Optional[PauseSummary]:
+    """Pool the batch latencies of several runs"""
+    durations = [d for run in runs for d in run]
+    if not durations:
+        return None
+    median = percentile(durations, 50)
+    p99 = percentile(durations, 99)
+    longest = max(durations)
+    stalls = sum(1 for d in durations if d > STALL_FACTOR * median) / len(runs)
+    return PauseSummary(
+        batches=len(durations),
+        median=median,
+        p99=p99,
+        max=longest,
+        p99_pause=max(0.0, p99 - median),
+        max_pause=max(0.0, longest - median),
+        stalls=stalls,
+        buffered=median < BUFFERED_GAP,
+    )
@@ -0,0 +1,140 @@
+"""
+Sampling profiles of benchmark runs for `compare.py --profile`.
+
+Native processes (pain-compiler for the interpreter and JIT, the Pain AOT/PGO
+executables, Rust and C++) run under `perf record` with call graphs. The
+samples are turned into folded stacks from `perf script` output, and the
+large perf.data file is deleted. Python baselines run under
+harness/stack_sampler.py, because perf only sees the interpreter loop of
+CPython, not the Python functions.
+
+Profiles are stored per commit, so two commits can be compared later:
+
+    target/bench-profile/<commit>/<benchmark>-n<n>/<language>-<backend>.folded
+    target/bench-profile/<commit>/<benchmark>-n<n>/<language>-<backend>.svg
+
+A working tree with uncommitted changes is stored under `<commit>-dirty`.
+"""
+
+import functools
+import platform
+import re
+import shutil
+import subprocess
+from collections import Counter
+from pathlib import Path
+from typing import List, Optional
+
+from harness.buildcache import BUILD_ROOT
+from harness.flamegraph import Stacks
+from harness.history import resolve_commit
+
+PROFILE_ROOT = BUILD_ROOT.parent / "bench-profile"
+
+STACK_SAMPLER = Path(__file__).with_name("stack_sampler.py")
+
+PERF_FREQUENCY = 4999  # Hz; odd so sampling doesn't lock step with periodic work
+PYTHON_INTERVAL = 0.001  # seconds between Python stack samples
+
+# `perf script` frame line: "<addr> <symbol>+0x<off> (<dso>)"
+FRAME_LINE = re.compile(r"^\s*[0-9a-f]+\s+(?P<symbol>.+?)\s+\((?P<dso>[^)]*)\)\s*$")
+
+@functools.lru_cache(maxsize=None)
+def perf_unavailable() -> Optional[str]:
+    """Why native processes can't be profiled here, or None if `perf record` works"""
+    if platform.system() != "Linux":
+        return "perf record is only available on Linux"
+    if shutil.which("perf") is None:
+        return "perf not found (install linux-tools for your kernel)"
+    data = PROFILE_ROOT / "probe.data"
+    data.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        result = subprocess.run(["perf", "record", "-q", "-g", "-o", str(data), "--", "true"],
+                                capture_output=True, text=True, timeout=30)
+    except (subprocess.TimeoutExpired, OSError) as e:
+        return f"perf record failed: {e}"
+    finally:
+        data.unlink(missing_ok=True)
+    if result.returncode != 0:
+        paranoid = Path("/proc/sys/kernel/perf_event_paranoid")
+        level = paranoid.read_text().strip() if paranoid.exists() else "?"
+        return (f"perf record cannot sample (perf_event_paranoid={level}; "
+                f"try: sudo sysctl kernel.perf_event_paranoid=1)")
+    return None
+
+def profile_dir(commit: str, bench: str, n: int) -> Path:
+    return PROFILE_ROOT / commit / f"{bench}-n{n}"
+
+def profile_name(language: str, backend: str) -> str:
+    """File stem of one row's profile, e.g. `pain-interpreter`, `c++-O3`"""
+    return f"{language}-{backend}".lower().replace(" ", "-")
+
+def current_commit() -> str:
+    """Short hash of HEAD, with `-dirty` when the working tree has changes"""
+    commit = resolve_commit("HEAD")[:12]
+    try:
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                                capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return commit
+    return f"{commit}-dirty" if status.returncode == 0 and status.stdout.strip() else commit
+
+def perf_command(cmd: List[str], data: Path) -> List[str]:
+    """Wrap a native command in `perf record` with DWARF call graphs.
+
+    Frame pointers are usually omitted in release builds, so the stack is
+    unwound from a copy of it taken with every sample instead.
+    """
+    return ["perf", "record", "-q", "-F", str(PERF_FREQUENCY), "--call-graph", "dwarf",
+            "-o", str(data), "--", *cmd]
+
+def python_command(cmd: List[str], folded: Path) -> List[str]:
+    """Run a `python <script> args...` command under the stack sampler instead"""
+    return [cmd[0], str(STACK_SAMPLER.absolute()), str(folded.absolute()), str(PYTHON_INTERVAL), *cmd[1:]]
+
+def collapse_perf(script_output: str) -> Stacks:
+    """Folded stacks from `perf script` output, rooted at the process name
+
+    Each sample is a header line followed by one frame per line, innermost
+    first, and a blank line. Symbols lose their `+0x..` offsets; frames perf
+    could not symbolize are named after their binary.
+    """
+    stacks: Counter = Counter()
+    comm = None
+    frames: List[str] = []
+
+    def flush():
+        if comm is not None and frames:
+            stacks[";".join([comm, *reversed(frames)])] += 1
+
+    for line in script_output.splitlines():
+        if not line.strip():
+            flush()
+            comm, frames = None, []
+        elif not line[0].isspace():
+            comm = line.split()[0]
+        else:
+            match = FRAME_LINE.match(line)
+            if match is None:
+                continue
+            symbol = re.sub(r"\+0x[0-9a-f]+$", "", match.group("symbol"))
+            if symbol == "[unknown]":
+                symbol = f"[{Path(match.group('dso')).name or 'unknown'}]"
+            frames.append(symbol.replace(";", ":"))
+    flush()
+    return dict(stacks)
+
+def read_perf(data: Path) -> Optional[Stacks]:
+    """Folded stacks of a perf.data file (deleted afterwards), or None if perf script fails"""
+    try:
+        result = subprocess.run(["perf", "script", "-i", str(data), "-F", "comm,ip,sym,dso"],
+                                capture_output=True, text=True, errors="replace", timeout=600)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        print(f"\n    Warning: perf script failed: {e}", end="")
+        return None
+    finally:
+        data.unlink(missing_ok=True)
+    if result.returncode != 0:
+        print(f"\n    Warning: perf script failed: {result.stderr.strip()[-200:]}", end="")
+        return None
+    return collapse_perf(result.stdout)
@@ -0,0 +1,280 @@
+"""
+Reference results for the numerical (Phase 2), ML (Phase 3) and HPC (Phase 4)
+benchmarks and the allocation stress suite.
+
+All inputs are small integers stored as float64, so every sum and product the
+kernels compute is exact and each language must print exactly the same
+checksum. The functions here are registered with the manifest's expression
+evaluator so `result`, `work`, `flops` and `bytes` can use them.
+
+Inputs shared by every implementation:
+    x[i]    = i % 7 + 1
+    y[i]    = i % 5 + 1
+    A[i][j] = (i + j) % 7 + 1                 (matmul, left)
+    B[i][j] = (i + j) % 5 + 1                 (matmul, right)
+    S[i][j] = (i + j) % 5 + 1, S[i][i] = 5n   (cholesky, SPD by diagonal dominance)
+    v[i]    = (i * 7919) % 1000               (reduce, int64)
+
+The MLP uses multiples of 1/8 and 1/4 (see the ML section below), so its
+activations and gradients are exact dyadic rationals and every summation order
+gives the same checksum. The n-body and Jacobi checksums depend on
+floating-point rounding, so their expected outputs are tabulated in
+benchmarks.toml instead.
+"""
+
+import functools
+import math
+
+# Element operations per run of a vector kernel; small vectors are repeated
+# until they reach this so cache-resident sizes still run long enough to time.
+VECTOR_WORK = 1 << 22
+
+AXPY_ALPHA = 2.0
+
+def vector_reps(n: int) -> int:
+    """Repetitions of a vector kernel at length n"""
+    return max(1, VECTOR_WORK // int(n))
+
+def _x(i: int) -> int:
+    return i % 7 + 1
+
+def _y(i: int) -> int:
+    return i % 5 + 1
+
+def dot_checksum(n: int) -> int:
+    """Sum of the dot product over all repetitions"""
+    n = int(n)
+    return vector_reps(n) * sum(_x(i) * _y(i) for i in range(n))
+
+def axpy_checksum(n: int) -> int:
+    """sum(y) after y += alpha * x has been applied once per repetition"""
+    n = int(n)
+    return sum(_y(i) for i in range(n)) + int(vector_reps(n) * AXPY_ALPHA) * sum(_x(i) for i in range(n))
+
+def norm_checksum(n: int) -> int:
+    """floor(1000 * sum of the 2-norm over all repetitions), accumulated left to right"""
+    n = int(n)
+    norm = math.sqrt(float(sum(_x(i) * _x(i) for i in range(n))))
+    total = 0.0
+    for _ in range(vector_reps(n)):
+        total += norm
+    return math.floor(total * 1000)
+
+def matmul_checksum(n: int) -> int:
+    """Sum of all entries of A @ B, from column sums of A and row sums of B"""
+    n = int(n)
+    total = 0
+    for k in range(n):
+        col_a = sum((i + k) % 7 + 1 for i in range(n))
+        row_b = sum((k + j) % 5 + 1 for j in range(n))
+        total += col_a * row_b
+    return total
+
+def cholesky_checksum(n: int) -> int:
+    """round(1e6 * sum(x)) for S x = S @ ones, whose solution is all ones"""
+    return int(n) * 1000000
+
+REDUCE_BINS = 16
+REDUCE_BIN_WIDTH = 64
+
+def reduce_checksum(n: int) -> int:
+    """sum + min + max + sum((b + 1) * hist[b]) of v, using its period of 1000"""
+    n = int(n)
+    period = [(i * 7919) % 1000 for i in range(min(n, 1000))]
+    full, rest = divmod(n, len(period)) if period else (0, 0)
+    counts = [full + (1 if i < rest else 0) for i in range(len(period))]
+    total = sum(v * c for v, c in zip(period, counts))
+    present = [v for v, c in zip(period, counts) if c]
+    hist = [0] * REDUCE_BINS
+    for v, c in zip(period, counts):
+        hist[v // REDUCE_BIN_WIDTH] += c
+    weighted = sum((b + 1) * h for b, h in enumerate(hist))
+    return total + min(present, default=0) + max(present, default=0) + weighted
+
+# Phase 3: MLP 16 -> 32 (ReLU) -> 4 and CSV preprocessing, at batch size n.
+# Each run processes ML_SAMPLES samples (at least one batch), like VECTOR_WORK.
+ML_SAMPLES = 4096
+MLP_IN = 16
+MLP_HIDDEN = 32
+MLP_OUT = 4
+SEGMENTS = ("north", "south", "east", "west", "central")
+
+def ml_reps(n: int) -> int:
+    """Batches per run at batch size n"""
+    return max(1, ML_SAMPLES // int(n))
+
+def mlp_w1(i: int, j: int) -> float:
+    return ((i * 3 + j * 5) % 7 - 3) / 8
+
+def mlp_b1(j: int) -> float:
+    return ((j * 5) % 9 - 4) / 8
+
+def mlp_w2(j: int, k: int) -> float:
+    return ((j * 2 + k * 3) % 5 - 2) / 8
+
+def mlp_b2(k: int) -> float:
+    return (k - 1) / 4
+
+def mlp_x(b: int, i: int) -> float:
+    return ((b * 7 + i * 3) % 11 - 5) / 4
+
+def mlp_y(b: int, k: int) -> float:
+    return float((b + k) % 3 - 1)
+
+@functools.lru_cache(maxsize=None)
+def _mlp_batch(n: int) -> tuple:
+    """(sum of outputs, sum of all gradients) for one batch of n samples"""
+    out_total = 0.0
+    grad_total = 0.0
+    for b in range(n):
+        z1 = [mlp_b1(j) + sum(mlp_x(b, i) * mlp_w1(i, j) for i in range(MLP_IN)) for j in range(MLP_HIDDEN)]
+        h = [max(z, 0.0) for z in z1]
+        out = [mlp_b2(k) + sum(h[j] * mlp_w2(j, k) for j in range(MLP_HIDDEN)) for k in range(MLP_OUT)]
+        out_total += sum(out)
+        dout = [out[k] - mlp_y(b, k) for k in range(MLP_OUT)]
+        # dW2 = h^T dout, db2 = dout, dW1 = x^T dz1, db1 = dz1
+        grad_total += sum(h) * sum(dout) + sum(dout)
+        dz1 = [sum(dout[k] * mlp_w2(j, k) for k in range(MLP_OUT)) if z1[j] > 0 else 0.0
+               for j in range(MLP_HIDDEN)]
+        grad_total += sum(mlp_x(b, i) for i in range(MLP_IN)) * sum(dz1) + sum(dz1)
+    return out_total, grad_total
+
+def mlp_forward_checksum(n: int) -> int:
+    """256 * sum of every output over all batches (outputs are multiples of 1/256)"""
+    return ml_reps(n) * int(_mlp_batch(int(n))[0] * 256)
+
+def mlp_backward_checksum(n: int) -> int:
+    """8192 * sum of every gradient entry over all batches (multiples of 1/8192)"""
+    return ml_reps(n) * int(_mlp_batch(int(n))[1] * 8192)
+
+def csv_text(n: int) -> str:
+    """The n-row CSV every preprocessing implementation generates (header included)"""
+    lines = ["id,age,income,segment"]
+    for i in range(int(n)):
+        lines.append(f"{i},{18 + (i * 37) % 60},{(i * 7919) % 100000}.{(i * 31) % 10},{SEGMENTS[(i * 3) % 5]}")
+    return "\n".join(lines) + "\n"
+
+def _scaled(values: list) -> list:
+    """floor(1000 * min-max normalized value); a constant column normalizes to 0"""
+    lo, hi = min(values), max(values)
+    if hi == lo:
+        return [0] * len(values)
+    return [math.floor((v - lo) / (hi - lo) * 1000.0) for v in values]
+
+def preprocess_checksum(n: int) -> int:
+    """Scaled normalized age + income plus the one-hot column (1-based), over all batches"""
+    n = int(n)
+    ages = [float(18 + (i * 37) % 60) for i in range(n)]
+    incomes = [float(f"{(i * 7919) % 100000}.{(i * 31) % 10}") for i in range(n)]
+    hot = sum((i * 3) % 5 + 1 for i in range(n))
+    return ml_reps(n) * (sum(_scaled(ages)) + sum(_scaled(incomes)) + hot)
+
+# --- Allocation stress --------------------------------------------------------
+#
+# Every allocation benchmark runs ALLOC_BATCHES batches and prints
+# "batch <b>" after each one; the harness timestamps those lines to get the
+# per-batch latency distribution (see harness/pauses.py).
+#   alloc_lists    n lists of 16 ints per batch: block[k] = b + i + k, sum block[i % 16]
+#   alloc_strings  n strings per batch, each 16 appends of str(b + i + k), sum lengths
+#   alloc_trees    one binary tree of depth n per batch, sum node counts
+#   alloc_mixed    a depth-n tree kept alive for the whole run, plus MIXED_TREES
+#                  short-lived trees of depth MIXED_DEPTH per batch
+
+ALLOC_BATCHES = 100
+MIXED_TREES = 16
+MIXED_DEPTH = 8
+
+def tree_nodes(depth: int) -> int:
+    """Nodes in a complete binary tree of the given depth (a single leaf has depth 0)"""
+    return (1 << (int(depth) + 1)) - 1
+
+def alloc_lists_checksum(n: int) -> int:
+    n = int(n)
+    b_sum = ALLOC_BATCHES * (ALLOC_BATCHES - 1) // 2
+    per_batch = n * (n - 1) // 2 + (n // 16) * 120 + (n % 16) * (n % 16 - 1) // 2
+    return n * b_sum + ALLOC_BATCHES * per_batch
+
+def _digits_before(x: int) -> int:
+    """Total decimal digits of 0, 1, ..., x - 1"""
+    total = min(x, 10)
+    width, start = 2, 10
+    while start < x:
+        end = min(x, start * 10)
+        total += (end - start) * width
+        width, start = width + 1, start * 10
+    return total
+
+def alloc_strings_checksum(n: int) -> int:
+    """Sum over (b, i) of the digits in b + i .. b + i + 15, grouped by s = b + i"""
+    n = int(n)
+    total = 0
+    for s in range(ALLOC_BATCHES + n - 1):
+        pairs = min(s, ALLOC_BATCHES - 1, n - 1, ALLOC_BATCHES + n - 2 - s) + 1
+        total += pairs * (_digits_before(s + 16) - _digits_before(s))
+    return total
+
+def alloc_trees_checksum(n: int) -> int:
+    return ALLOC_BATCHES * tree_nodes(n)
+
+def alloc_mixed_nodes(n: int) -> int:
+    """Nodes allocated by alloc_mixed: the long-lived tree plus every short-lived one"""
+    return tree_nodes(n) + ALLOC_BATCHES * MIXED_TREES * tree_nodes(MIXED_DEPTH)
+
+def pain_string(text: str) -> str:
+    """Pain string literal for text"""
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+
+def float_list(values) -> str:
+    """Pain list literal of float64 values"""
+    return "[" + ", ".join(repr(float(v)) for v in values) + "]"
+
+def mlp_template(n: int, name: str) -> str:
+    """Pain list literal of one MLP parameter or input for batch size n"""
+    n = int(n)
+    if name == "w1":
+        return float_list(mlp_w1(i, j) for i in range(MLP_IN) for j in range(MLP_HIDDEN))
+    if name == "b1":
+        return float_list(mlp_b1(j) for j in range(MLP_HIDDEN))
+    if name == "w2":
+        return float_list(mlp_w2(j, k) for j in range(MLP_HIDDEN) for k in range(MLP_OUT))
+    if name == "b2":
+        return float_list(mlp_b2(k) for k in range(MLP_OUT))
+    if name == "x":
+        return float_list(mlp_x(b, i) for b in range(n) for i in range(MLP_IN))
+    if name == "y":
+        return float_list(mlp_y(b, k) for b in range(n) for k in range(MLP_OUT))
+    raise ValueError(f"unknown MLP tensor '{name}'")
+
+def zeros(n: int) -> str:
+    """Pain list literal of n float zeros (Pain has no allocation builtin yet)"""
+    return "[" + ", ".join(["0.0"] * int(n)) + "]"
+
+def int_zeros(n: int) -> str:
+    """Pain list literal of n integer zeros"""
+    return "[" + ", ".join(["0"] * int(n)) + "]"
+
+FUNCTIONS = {
+    "vector_reps": vector_reps,
+    "dot_checksum": dot_checksum,
+    "axpy_checksum": axpy_checksum,
+    "norm_checksum": norm_checksum,
+    "matmul_checksum": matmul_checksum,
+    "cholesky_checksum": cholesky_checksum,
+    "reduce_checksum": reduce_checksum,
+    "ml_reps": ml_reps,
+    "mlp_forward_checksum": mlp_forward_checksum,
+    "mlp_backward_checksum": mlp_backward_checksum,
+    "preprocess_checksum": preprocess_checksum,
+    "alloc_batches": lambda n: ALLOC_BATCHES,
+    "mixed_trees": lambda n: MIXED_TREES,
+    "mixed_depth": lambda n: MIXED_DEPTH,
+    "tree_nodes": tree_nodes,
+    "alloc_lists_checksum": alloc_lists_checksum,
+    "alloc_strings_checksum": alloc_strings_checksum,
+    "alloc_trees_checksum": alloc_trees_checksum,
+    "alloc_mixed_nodes": alloc_mixed_nodes,
+    "csv_literal": lambda n: pain_string(csv_text(n)),
+    "mlp_template": mlp_template,
+    "zeros": zeros,
+    "int_zeros": int_zeros,
+}
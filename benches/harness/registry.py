@@ -0,0 +1,220 @@
+"""
+Synthetic painpkg registries for the resolver stress benchmark.
+
+`generate(n)` writes a registry in the layout of docs/REGISTRY.md: a
+hierarchical `index/` with one version per line (newest first) and
+`packages/<name>/<version>.toml` metadata. Every version's `repository` is a
+`file://` URL of a generated source tree, so installing needs no network.
+
+The shape aims at what a large internal registry looks like:
+
+- Version fan-out is heavy-tailed: most packages have a handful of versions,
+  a few have dozens.
+- Dependencies only point at earlier packages (no cycles), with a strong bias
+  towards the first ones. That gives popular core packages that almost
+  everything reaches through several paths (diamonds).
+- Older versions require older dependency versions, in caret, tilde, range
+  and exact forms, and about 2% of them require a version that doesn't exist.
+  A resolver that tries them has to backtrack.
+- The newest versions are mutually compatible, so the `app` project (which
+  depends on the deepest packages) always resolves.
+- The `conflict` project additionally depends on two packages that need
+  different majors of a shared base package in every version, so it can
+  never resolve. This is the exhaustive worst case.
+
+Every registry also holds PROBE_PACKAGE, a name no real registry has.
+Finding it with `painpkg search` proves painpkg reads the generated registry
+and not its default one.
+
+Generation is deterministic for a given (n, seed) and reused when the
+registry already exists.
+"""
+
+import json
+import random
+import shutil
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple
+
+from harness.buildcache import BUILD_ROOT
+
+REGISTRY_ROOT = BUILD_ROOT.parent / "bench-painpkg"
+
+# Bump when the generated layout changes so cached registries are rebuilt
+GENERATOR_VERSION = 2
+
+WORDS = (
+    "math", "linalg", "stats", "tensor", "io", "net", "http", "json", "pml", "csv", "log", "time",
+    "fs", "path", "text", "regex", "crypto", "hash", "rand", "sort", "graph", "tree", "cache", "pool",
+    "async", "sync", "cli", "term", "color", "image", "audio", "signal", "plot", "test", "bench", "mock",
+    "db", "sql", "kv", "queue",
+)
+
+MAX_VERSIONS = 60
+MAX_DEPENDENCIES = 6
+BROKEN_RATE = 0.02
+
+PROBE_PACKAGE = "zz-pain-bench-registry-probe"
+
+SemVer = Tuple[int, int, int]
+
+class Registry(NamedTuple):
+    """A generated registry and the two projects resolved against it"""
+    root: Path
+    packages: int
+    versions: int
+    edges: int  # dependency requirements over all versions
+    app: Path  # resolvable project
+    conflict: Path  # project that can never resolve
+
+    @property
+    def url(self) -> str:
+        return self.root.absolute().as_uri()
+
+def fmt(version: SemVer) -> str:
+    return ".".join(map(str, version))
+
+def index_path(name: str) -> Path:
+    """Index file of a package: index/p/pa/pain/pain-math (cargo-style for short names)"""
+    if len(name) <= 2:
+        return Path("index") / str(len(name)) / name
+    if len(name) == 3:
+        return Path("index") / "3" / name[0] / name
+    return Path("index") / name[0] / name[:2] / name[:4] / name
+
+def package_names(n: int, rng: random.Random) -> List[str]:
+    names = ["pain-std", "pain-core"][:n]
+    seen = set(names)
+    while len(names) < n:
+        name = f"{rng.choice(WORDS)}-{rng.choice(WORDS)}"
+        if name in seen:
+            name = f"{name}-{len(names)}"
+        seen.add(name)
+        names.append(name)
+    return names
+
+def version_series(rng: random.Random) -> List[SemVer]:
+    """Ascending versions with a heavy-tailed count: mostly patch bumps, some minor, few major"""
+    count = min(MAX_VERSIONS, int(rng.paretovariate(1.2)))
+    major, minor, patch = 0, 1, 0
+    versions = [(major, minor, patch)]
+    for _ in range(count - 1):
+        roll = rng.random()
+        if roll < 0.05:
+            major, minor, patch = major + 1, 0, 0
+        elif roll < 0.3:
+            minor, patch = minor + 1, 0
+        else:
+            patch += 1
+        versions.append((major, minor, patch))
+    return versions
+
+def requirement(rng: random.Random, target: SemVer, newest: bool) -> str:
+    """A requirement string that `target` satisfies; the newest versions always use caret"""
+    roll = 0.0 if newest else rng.random()
+    if roll < 0.7:
+        return f"^{fmt(target)}"
+    if roll < 0.85:
+        return f"~{fmt(target)}"
+    if roll < 0.95:
+        return f">={fmt(target)}, <{target[0] + 1}.0.0"
+    return f"={fmt(target)}"
+
+def write_package(root: Path, name: str, version: SemVer, dependencies: Dict[str, str]):
+    """Metadata file plus the file:// source tree it points at"""
+    source = root / "sources" / name / fmt(version)
+    (source / "src").mkdir(parents=True, exist_ok=True)
+    deps = "".join(f'{dep} = "{req}"\n' for dep, req in dependencies.items())
+    (source / "pain.toml").write_text(
+        f'[package]\nname = "{name}"\nversion = "{fmt(version)}"\n\n[dependencies]\n{deps}')
+    (source / "src" / "lib.pain").write_text(f"fn version() -> str:\n    return \"{fmt(version)}\"\n")
+    metadata = root / "packages" / name / f"{fmt(version)}.toml"
+    metadata.parent.mkdir(parents=True, exist_ok=True)
+    metadata.write_text(
+        f'name = "{name}"\n'
+        f'version = "{fmt(version)}"\n'
+        f'description = "Synthetic benchmark package {name}"\n'
+        f'repository = "{source.absolute().as_uri()}"\n'
+        f'license = "MIT OR Apache-2.0"\n'
+        f'authors = ["Pain Benchmarks <bench@example.com>"]\n'
+        f'\n[dependencies]\n{deps}')
+
+def write_index(root: Path, name: str, versions: List[SemVer]):
+    path = root / index_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(f"{fmt(v)}\n" for v in reversed(versions)))
+
+def write_project(path: Path, dependencies: Dict[str, str]):
+    path.mkdir(parents=True, exist_ok=True)
+    deps = "".join(f'{dep} = "{req}"\n' for dep, req in dependencies.items())
+    (path / "pain.toml").write_text(f'[package]\nname = "{path.name}"\nversion = "0.1.0"\n\n[dependencies]\n{deps}')
+    (path / "src").mkdir(exist_ok=True)
+    (path / "src" / "main.pain").write_text("fn main() -> int:\n    return 0\n")
+
+def generate(n: int, seed: int = 1) -> Registry:
+    """Registry of n packages (plus three conflict packages and the probe), generated on first use"""
+    root = REGISTRY_ROOT / f"n{n}-s{seed}"
+    summary_path = root / "registry.json"
+    if summary_path.exists():
+        summary = json.loads(summary_path.read_text())
+        if summary.get("generator") == GENERATOR_VERSION:
+            return Registry(root, summary["packages"], summary["versions"], summary["edges"],
+                            root / "app", root / "conflict")
+    shutil.rmtree(root, ignore_errors=True)
+    rng = random.Random(seed * 1_000_003 + n)
+
+    names = package_names(n, rng)
+    versions = [version_series(rng) for _ in names]
+    total_versions = 0
+    edges = 0
+    for i, name in enumerate(names):
+        # Popular packages come first: u**3 crowds the picks towards index 0
+        targets = sorted({int(i * rng.random() ** 3) for _ in range(min(i, rng.randint(0, MAX_DEPENDENCIES)))})
+        own = versions[i]
+        for k, version in enumerate(own):
+            newest = k == len(own) - 1
+            position = k / max(1, len(own) - 1)
+            dependencies = {}
+            for j in targets:
+                theirs = versions[j]
+                if not newest and rng.random() < BROKEN_RATE:
+                    dependencies[names[j]] = f"^{theirs[-1][0] + 5}.0.0"  # no such version
+                    continue
+                # Older versions were published against older dependency versions
+                pick = round(position * (len(theirs) - 1))
+                pick = len(theirs) - 1 if newest else max(0, pick - rng.randint(0, 2))
+                dependencies[names[j]] = requirement(rng, theirs[pick], newest)
+            write_package(root, name, version, dependencies)
+            edges += len(dependencies)
+        write_index(root, name, own)
+        total_versions += len(own)
+
+    # Every version of conflict-left needs base 1.x and every version of
+    # conflict-right needs 2.x; each also pulls in part of the registry
+    base_versions = [(1, 0, 0), (1, 1, 0), (1, 2, 0), (2, 0, 0), (2, 1, 0)]
+    for version in base_versions:
+        write_package(root, "conflict-base", version, {})
+    write_index(root, "conflict-base", base_versions)
+    side_versions = [(0, 1, k) for k in range(5)]
+    for side, major in (("conflict-left", 1), ("conflict-right", 2)):
+        for k, version in enumerate(side_versions):
+            dependencies = {"conflict-base": f"^{major}.0.0"}
+            for j in sorted({int(len(names) * rng.random()) for _ in range(3)}):
+                dependencies[names[j]] = f"^{fmt(versions[j][-1])}"
+            write_package(root, side, version, dependencies)
+            edges += len(dependencies)
+        write_index(root, side, side_versions)
+    total_versions += len(base_versions) + 2 * len(side_versions)
+
+    write_package(root, PROBE_PACKAGE, (0, 0, 1), {})
+    write_index(root, PROBE_PACKAGE, [(0, 0, 1)])
+    total_versions += 1
+
+    # The app depends on the last packages, which have the deepest trees
+    top = {names[j]: f"^{fmt(versions[j][-1])}" for j in range(max(0, n - 8), n)}
+    write_project(root / "app", top)
+    write_project(root / "conflict", {**top, "conflict-left": "^0.1.0", "conflict-right": "^0.1.0"})
+
+    summary = {"generator": GENERATOR_VERSION, "packages": n + 4, "versions": total_versions, "edges": edges}
+    summary_path.write_text(json.dumps(summary))
+    return Registry(root, n + 4, total_versions, edges, root / "app", root / "conflict")
@@ -0,0 +1,190 @@
+"""
+Complexity fitting for input-size sweeps.
+
+Each model is t(n) = a + b * f(n): `a` is the size-independent intercept
+(process startup, parsing) and `b` the cost per unit of f(n). Models are
+fitted by ordinary least squares; the exponential model additionally searches
+its base. Everything is pure Python so compare.py needs no NumPy.
+"""
+
+import math
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+class Fit(NamedTuple):
+    """A fitted time-vs-n model"""
+    model: str
+    intercept: float
+    slope: float
+    base: Optional[float]
+    r2: float
+    sse: float
+
+    def predict(self, n: float) -> float:
+        """Predicted time at n"""
+        return self.intercept + self.slope * basis(self.model, n, self.base)
+
+    def describe(self) -> str:
+        """Short human-readable formula"""
+        if self.model == "exp":
+            return f"exp (base {self.base:.3f})"
+        return self.model
+
+def basis(model: str, n: float, base: Optional[float] = None) -> float:
+    """f(n) for a model name"""
+    if model == "constant":
+        return 0.0
+    if model == "linear":
+        return n
+    if model == "nlogn":
+        return n * math.log2(n) if n > 1 else 0.0
+    if model == "quadratic":
+        return n * n
+    if model == "cubic":
+        return n * n * n
+    if model == "exp":
+        return (base or 2.0) ** n
+    raise ValueError(f"unknown model: {model}")
+
+MODELS = ("constant", "linear", "nlogn", "quadratic", "cubic", "exp")
+
+# Number of free parameters, used to penalize richer models when choosing
+MODEL_PARAMS = {"constant": 1, "linear": 2, "nlogn": 2, "quadratic": 2, "cubic": 2, "exp": 3}
+
+def least_squares(xs: Sequence[float], ys: Sequence[float]):
+    """Fit y = a + b*x, returning (a, b, sse)"""
+    n = len(xs)
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    if sxx == 0:
+        a, b = mean_y, 0.0
+    else:
+        b = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sxx
+        a = mean_y - b * mean_x
+    sse = sum((y - (a + b * x)) ** 2 for x, y in zip(xs, ys))
+    return a, b, sse
+
+def _r2(ys: Sequence[float], sse: float) -> float:
+    mean_y = sum(ys) / len(ys)
+    sst = sum((y - mean_y) ** 2 for y in ys)
+    return 1.0 - sse / sst if sst > 0 else 1.0
+
+def fit_model(model: str, ns: Sequence[float], ts: Sequence[float]) -> Fit:
+    """Fit one model to (n, time) points"""
+    if model == "constant":
+        mean_t = sum(ts) / len(ts)
+        sse = sum((t - mean_t) ** 2 for t in ts)
+        return Fit(model, mean_t, 0.0, None, 0.0, sse)
+    if model != "exp":
+        xs = [basis(model, n) for n in ns]
+        a, b, sse = least_squares(xs, ts)
+        return Fit(model, a, b, None, _r2(ts, sse), sse)
+
+    # Exponential: linear least squares for every candidate base, keep the best
+    best = None
+    base = 1.01
+    while base <= 4.0:
+        xs = [base ** n for n in ns]
+        if max(xs) < 1e300:
+            a, b, sse = least_squares(xs, ts)
+            if best is None or sse < best[3]:
+                best = (base, a, b, sse)
+        base *= 1.005
+    base, a, b, sse = best
+    return Fit(model, a, b, base, _r2(ts, sse), sse)
+
+def best_fit(ns: Sequence[float], ts: Sequence[float], candidates: Sequence[str] = MODELS) -> Fit:
+    """Choose among candidate models by the Bayesian information criterion"""
+    points = len(ns)
+    scored = []
+    for model in candidates:
+        fit = fit_model(model, ns, ts)
+        sse = max(fit.sse, 1e-30)
+        bic = points * math.log(sse / points) + MODEL_PARAMS[model] * math.log(points)
+        scored.append((bic, fit))
+    return min(scored, key=lambda item: item[0])[1]
+
+class WorkFit(NamedTuple):
+    """t(n) = intercept + per_unit * work(n)"""
+    intercept: float
+    per_unit: float
+    r2: float
+    work: Callable[[float], float]
+
+    def predict(self, n: float) -> float:
+        """Predicted time at n"""
+        return self.intercept + self.per_unit * self.work(n)
+
+def per_unit_cost(ns: Sequence[float], ts: Sequence[float], work: Callable[[float], float]) -> WorkFit:
+    """Fit t = a + b * work(n); b is the time per unit of work (call, iteration)"""
+    xs = [work(n) for n in ns]
+    a, b, sse = least_squares(xs, ts)
+    return WorkFit(a, b, _r2(ts, sse), work)
+
+def crossover(faster: Callable[[float], float], slower: Callable[[float], float],
+              lo: float, hi: float, step: float = 1.01) -> Optional[int]:
+    """Smallest integer n in [lo, hi] from which `faster(n)` is below `slower(n)`.
+
+    Returns `lo` if it is already faster at the start and None if it never
+    overtakes within the range.
+    """
+    n = float(lo)
+    while n <= hi:
+        if faster(round(n)) < slower(round(n)):
+            return int(round(n))
+        n = max(n * step, n + 1)
+    return None
+
+class PowerFit(NamedTuple):
+    """t(n) = coefficient * n^exponent"""
+    coefficient: float
+    exponent: float
+    r2: float  # on log-log axes
+
+    def predict(self, n: float) -> float:
+        """Predicted time at n"""
+        return self.coefficient * n ** self.exponent
+
+def power_law(ns: Sequence[float], ts: Sequence[float]) -> Optional[PowerFit]:
+    """Fit t = c * n^k by least squares on log-log axes
+
+    Points with t <= 0 are dropped; None if fewer than two remain.
+    """
+    points = [(math.log(n), math.log(t)) for n, t in zip(ns, ts) if n > 0 and t > 0]
+    if len(points) < 2:
+        return None
+    xs, ys = zip(*points)
+    a, b, sse = least_squares(xs, ys)
+    return PowerFit(math.exp(a), b, _r2(ys, sse))
+
+def local_exponents(ns: Sequence[float], ts: Sequence[float]) -> List[Optional[float]]:
+    """Exponent between each pair of neighbouring points: log(t2/t1) / log(n2/n1)"""
+    exponents: List[Optional[float]] = []
+    for (n1, t1), (n2, t2) in zip(zip(ns, ts), zip(ns[1:], ts[1:])):
+        if t1 > 0 and t2 > 0 and n2 > n1:
+            exponents.append(math.log(t2 / t1) / math.log(n2 / n1))
+        else:
+            exponents.append(None)
+    return exponents
+
+def geometric_series(start: int, stop: int, factor: float) -> List[int]:
+    """Distinct integers start, start*factor, ... up to stop (inclusive)"""
+    if start <= 0 or factor <= 1.0:
+        raise ValueError("geometric series needs start > 0 and factor > 1")
+    values: List[int] = []
+    value = float(start)
+    while round(value) <= stop:
+        n = int(round(value))
+        if not values or n != values[-1]:
+            values.append(n)
+        value *= factor
+    return values
+
+def fits_by_language(points: Dict[str, Dict[int, float]], candidates: Sequence[str]) -> Dict[str, Fit]:
+    """Best model per language from {language: {n: median time}}"""
+    fits = {}
+    for lang, by_n in points.items():
+        if len(by_n) >= 3:
+            ns = sorted(by_n)
+            fits[lang] = best_fit(ns, [by_n[n] for n in ns], candidates)
+    return fits
@@ -0,0 +1,140 @@
+"""
+Concurrent scheduling of independent benchmark jobs.
+
+A job is one (benchmark, row, n) measurement. Jobs run in a pool of worker
+threads, each owning one logical CPU taken from a distinct physical core. A
+worker pins itself with `os.sched_setaffinity(0, ...)`, which on Linux binds
+only the calling thread; every process it launches inherits the mask, so the
+benchmark programs never migrate and never share a core with each other. One
+physical core is left free for the harness and the rest of the system.
+
+Programs that run in parallel themselves (`${workers}`) need the whole
+machine: they are held back until the pool has drained and then run one at
+a time, unpinned.
+
+The run order is shuffled and interleaved across languages, so slow drift
+(thermal throttling, frequency scaling, a background job starting) is spread
+over every column instead of landing on whichever language ran last.
+"""
+
+import os
+import queue
+import random
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+CPU_ROOT = Path("/sys/devices/system/cpu")
+
+HAS_AFFINITY = hasattr(os, "sched_setaffinity")
+
+class Job(NamedTuple):
+    """One measurement to schedule; `group` is what runs are interleaved over (the language)"""
+    key: Tuple
+    group: str
+    exclusive: bool = False  # needs every CPU: runs alone after the pool has drained
+
+class Finished(NamedTuple):
+    """A completed job"""
+    job: Job
+    result: Any
+    cpu: Optional[int]  # the CPU it was pinned to; None if unpinned
+    index: int  # 1-based completion order
+
+def allowed_cpus() -> List[int]:
+    """CPUs this process may run on"""
+    if HAS_AFFINITY:
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+def physical_cores(cpus: Optional[List[int]] = None) -> List[List[int]]:
+    """Allowed logical CPUs grouped by physical core (SMT siblings together), in CPU order
+
+    Without sysfs topology every logical CPU counts as its own core.
+    """
+    cores: Dict[str, List[int]] = {}
+    for cpu in cpus if cpus is not None else allowed_cpus():
+        siblings = CPU_ROOT / f"cpu{cpu}" / "topology" / "thread_siblings_list"
+        try:
+            core = siblings.read_text().strip()
+        except OSError:
+            core = str(cpu)
+        cores.setdefault(core, []).append(cpu)
+    return list(cores.values())
+
+def default_jobs() -> int:
+    """Physical cores minus one for the harness, at least one"""
+    return max(1, len(physical_cores()) - 1)
+
+def pick_cpus(jobs: int) -> List[int]:
+    """One logical CPU per physical core for `jobs` workers, leaving the first core free if possible"""
+    cores = physical_cores()
+    if len(cores) > jobs:
+        cores = cores[1:]  # CPU 0's core takes most interrupts and runs the harness
+    return [core[0] for core in cores[:jobs]]
+
+def interleave(jobs: List[Job], rng: random.Random) -> List[Job]:
+    """Shuffle each group, then deal one job per group per round in a freshly shuffled group order"""
+    groups: Dict[str, List[Job]] = {}
+    for job in jobs:
+        groups.setdefault(job.group, []).append(job)
+    for members in groups.values():
+        rng.shuffle(members)
+    order = []
+    while groups:
+        names = list(groups)
+        rng.shuffle(names)
+        for name in names:
+            order.append(groups[name].pop())
+            if not groups[name]:
+                del groups[name]
+    return order
+
+def pin(cpu: Optional[int]) -> None:
+    """Bind the calling thread (and every process it starts from now on) to one CPU"""
+    if HAS_AFFINITY and cpu is not None:
+        os.sched_setaffinity(0, {cpu})
+
+def run_jobs(jobs: List[Job], run: Callable[[Job], Any], workers: int,
+             seed: Optional[int] = None) -> Iterator[Finished]:
+    """Run every job, yielding each one in the calling thread as it finishes
+
+    `workers` jobs run at once, one per pinned CPU; with `workers=1` jobs run
+    strictly one after another, pinned to a single core. Exclusive jobs
+    always run alone and unpinned, after everything else.
+    """
+    rng = random.Random(seed)
+    shared = interleave([job for job in jobs if not job.exclusive], rng)
+    exclusive = interleave([job for job in jobs if job.exclusive], rng)
+    cpus = pick_cpus(workers) if HAS_AFFINITY else [None] * workers
+    free: "queue.Queue[Optional[int]]" = queue.Queue()
+    for cpu in cpus:
+        free.put(cpu)
+    local = threading.local()
+
+    def pinned(job: Job) -> Tuple[Any, Optional[int]]:
+        # Each pool thread claims a CPU on its first job and keeps it
+        if not hasattr(local, "cpu"):
+            local.cpu = free.get()
+            pin(local.cpu)
+        return run(job), local.cpu
+
+    done = 0
+    if shared:
+        with ThreadPoolExecutor(max_workers=len(cpus)) as pool:
+            futures = {pool.submit(pinned, job): position for position, job in enumerate(shared)}
+            pending = set(futures)
+            while pending:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                # Report in submission order among jobs that finished together
+                for future in sorted(finished, key=futures.get):
+                    result, cpu = future.result()
+                    done += 1
+                    yield Finished(shared[futures[future]], result, cpu, done)
+
+    # The calling thread is never pinned, so exclusive jobs see every allowed CPU
+    for job in exclusive:
+        result = run(job)
+        done += 1
+        yield Finished(job, result, None, done)
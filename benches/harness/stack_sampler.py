@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Sampling profiler for the Python baselines (the Python side of `compare.py --profile`).
+
+Usage: stack_sampler.py <folded output> <interval seconds> <script> [script args...]
+
+Runs a benchmark script as `__main__` while a background thread takes the
+main thread's stack every `interval` seconds via `sys._current_frames()`.
+Stacks are written in folded form, one `frame;frame;...;leaf <count>` line per
+distinct stack, root first, which is what perf-based profiles are reduced to
+as well. A frame is `function (file:line)`, where line is the function's first
+line, so every sample of one function lands in the same frame.
+
+A sample is only taken when the sampler gets the GIL, so a long-running C call
+(e.g. one NumPy operation) shows up as fewer, longer gaps rather than being
+missed. Child processes (the multiprocessing baselines) are not sampled.
+
+Only the standard library is used: this runs under whichever `python` the
+benchmark runs under, not the harness interpreter.
+"""
+
+import os
+import runpy
+import sys
+import threading
+from collections import Counter
+
+def frame_name(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+def sample(thread_id: int, script: str, interval: float, stacks: Counter, stop: threading.Event):
+    """Count the main thread's stacks from the script's module frame down; runpy and startup are dropped"""
+    while not stop.wait(interval):
+        frame = sys._current_frames().get(thread_id)
+        names = []
+        while frame is not None:
+            names.append(frame_name(frame.f_code))
+            if frame.f_code.co_name == "<module>" and os.path.abspath(frame.f_code.co_filename) == script:
+                stacks[";".join(reversed(names))] += 1
+                break
+            frame = frame.f_back
+
+def main() -> int:
+    if len(sys.argv) < 4:
+        print(__doc__.strip().splitlines()[2], file=sys.stderr)
+        return 2
+    output, interval, script = sys.argv[1], float(sys.argv[2]), sys.argv[3]
+    sys.argv = [script, *sys.argv[4:]]
+    sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+
+    # The sampler can only look once the main thread hands over the GIL
+    sys.setswitchinterval(min(sys.getswitchinterval(), interval))
+    stacks: Counter = Counter()
+    stop = threading.Event()
+    sampler = threading.Thread(target=sample, daemon=True,
+                               args=(threading.get_ident(), os.path.abspath(script), interval, stacks, stop))
+    sampler.start()
+    status = 0
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as e:
+        status = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    finally:
+        stop.set()
+        sampler.join()
+        with open(output, "w") as f:
+            for stack, count in stacks.items():
+                f.write(f"{stack} {count}\n")
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
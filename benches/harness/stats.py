@@ -0,0 +1,157 @@
+"""
+Robust summary statistics for benchmark samples.
+
+Everything here is pure Python (no NumPy) so compare.py keeps running on a
+bare interpreter.
+"""
+
+import math
+import statistics
+from typing import List, NamedTuple, Optional, Tuple
+
+# Two-sided 95% normal quantile
+Z_95 = 1.959963984540054
+
+# Modified z-score above which a sample counts as an outlier (Iglewicz & Hoaglin)
+MAD_THRESHOLD = 3.5
+
+# Tukey fence multiplier for the IQR rule
+IQR_FENCE = 1.5
+
+OUTLIER_METHODS = ("mad", "iqr", "none")
+
+class Summary(NamedTuple):
+    """Summary of one sample set, computed after outlier rejection"""
+    count: int
+    median: float
+    mean: float
+    stddev: float
+    p90: float
+    p99: float
+    min: float
+    max: float
+    ci_low: float
+    ci_high: float
+    outliers: int
+
+    @property
+    def ci_width(self) -> float:
+        """Width of the median's confidence interval relative to the median"""
+        if self.median <= 0:
+            return float('inf')
+        return (self.ci_high - self.ci_low) / self.median
+
+def percentile(values: List[float], q: float) -> float:
+    """Percentile with linear interpolation between closest ranks (q in [0, 100])"""
+    ordered = sorted(values)
+    if not ordered:
+        raise ValueError("percentile of empty sample")
+    if len(ordered) == 1:
+        return ordered[0]
+    pos = (len(ordered) - 1) * q / 100.0
+    lower = math.floor(pos)
+    upper = math.ceil(pos)
+    frac = pos - lower
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * frac
+
+def median_ci(values: List[float], z: float = Z_95) -> Tuple[float, float]:
+    """Distribution-free confidence interval of the median.
+    
+    Uses the normal approximation to the binomial order-statistic ranks, so it
+    makes no assumption about the shape of the timing distribution. With fewer
+    than six samples the interval degenerates to the full sample range.
+    """
+    ordered = sorted(values)
+    n = len(ordered)
+    if n == 0:
+        raise ValueError("confidence interval of empty sample")
+    if n < 6:
+        return ordered[0], ordered[-1]
+    half = z * math.sqrt(n) / 2.0
+    lower = max(0, int(math.floor(n / 2.0 - half)) - 1)
+    upper = min(n - 1, int(math.ceil(n / 2.0 + half)))
+    return ordered[lower], ordered[upper]
+
+def find_outliers(values: List[float], method: str = "mad") -> List[bool]:
+    """Flag outliers with the MAD modified z-score or Tukey's IQR fences"""
+    if method not in OUTLIER_METHODS:
+        raise ValueError(f"unknown outlier method: {method}")
+    if method == "none" or len(values) < 4:
+        return [False] * len(values)
+    
+    if method == "mad":
+        center = statistics.median(values)
+        mad = statistics.median([abs(v - center) for v in values])
+        if mad == 0:
+            return [False] * len(values)
+        return [0.6745 * abs(v - center) / mad > MAD_THRESHOLD for v in values]
+    
+    q1 = percentile(values, 25)
+    q3 = percentile(values, 75)
+    iqr = q3 - q1
+    low = q1 - IQR_FENCE * iqr
+    high = q3 + IQR_FENCE * iqr
+    return [v < low or v > high for v in values]
+
+def summarize(values: List[float], method: str = "mad") -> Optional[Summary]:
+    """Reject outliers, then summarize what is left. Returns None for no data"""
+    if not values:
+        return None
+    flags = find_outliers(values, method)
+    kept = [v for v, flagged in zip(values, flags) if not flagged]
+    ci_low, ci_high = median_ci(kept)
+    return Summary(
+        count=len(kept),
+        median=statistics.median(kept),
+        mean=statistics.fmean(kept),
+        stddev=statistics.stdev(kept) if len(kept) > 1 else 0.0,
+        p90=percentile(kept, 90),
+        p99=percentile(kept, 99),
+        min=min(kept),
+        max=max(kept),
+        ci_low=ci_low,
+        ci_high=ci_high,
+        outliers=len(values) - len(kept),
+    )
+
+def normal_sf(z: float) -> float:
+    """Upper tail probability of the standard normal distribution"""
+    return 0.5 * math.erfc(z / math.sqrt(2.0))
+
+def mann_whitney_greater(baseline: List[float], candidate: List[float]) -> Tuple[float, float]:
+    """One-sided Mann-Whitney U test that `candidate` tends to be larger.
+    
+    Returns (U, p). Uses the normal approximation with tie and continuity
+    correction, which is adequate from roughly eight samples per side.
+    """
+    n1 = len(baseline)
+    n2 = len(candidate)
+    if n1 == 0 or n2 == 0:
+        raise ValueError("Mann-Whitney test needs samples on both sides")
+    
+    # Rank the pooled samples, giving tied values their average rank
+    pooled = sorted([(v, 0) for v in baseline] + [(v, 1) for v in candidate])
+    ranks = [0.0] * len(pooled)
+    tie_term = 0.0
+    i = 0
+    while i < len(pooled):
+        j = i
+        while j + 1 < len(pooled) and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        rank = (i + j) / 2.0 + 1.0
+        for k in range(i, j + 1):
+            ranks[k] = rank
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        i = j + 1
+    
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, pooled) if group == 1)
+    u = rank_sum - n2 * (n2 + 1) / 2.0
+    
+    n = n1 + n2
+    mean_u = n1 * n2 / 2.0
+    var_u = n1 * n2 / 12.0 * ((n + 1) - tie_term / (n * (n - 1))) if n > 1 else 0.0
+    if var_u <= 0:
+        return u, 0.5
+    z = (u - mean_u - 0.5) / math.sqrt(var_u)
+    return u, normal_sf(z)
@@ -0,0 +1,231 @@
+"""
+Per-builtin micro-benchmarks generated from docs/stdlib.md for `compare.py stdlib`.
+
+`documented()` reads the function tables of the stdlib reference. A row
+naming several functions (`min`, `max`) yields one entry per name, and
+overloads are told apart by parameter types: `abs(int)` and
+`abs(float64)` are separate builtins. Each one gets one generated benchmark
+per input variant:
+
+    scalar       math functions and conversions
+    short/long   string functions, on a SHORT_STRING / LONG_STRING character input
+    small/large  list functions, on a SMALL_LIST / LARGE_LIST element list
+
+A benchmark is a Pain program and a Python script with the same loop:
+`${n}` iterations, each calling the builtin once and folding the result into
+an integer checksum so the call can't be dropped. Python uses the nearest
+equivalent (`s[a:b]` for `substring`, `needle in s` for `contains`,
+`math.sqrt` for `sqrt`) in the same `while` loop, not a faster idiom. The
+LOOP benchmark runs the same loop with `acc = acc + i` as its body; its cost
+per iteration is subtracted to get the cost of the call.
+
+The call templates live in CASES, keyed like `substring(str, int, int)`. A
+documented builtin without a template is listed by `uncovered()` so the
+report shows what the suite is missing. I/O and PML are left out on purpose:
+`print` would measure the terminal, and PML has `compare.py pml`.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple
+
+from harness.buildcache import BUILD_ROOT
+from harness.manifest import Benchmark
+
+STDLIB_DOC = Path("docs/stdlib.md")
+SUITE_DIR = BUILD_ROOT.parent / "bench-stdlib"
+
+SKIPPED_SECTIONS = ("I/O", "PML (Pain Markup Language)")
+
+SHORT_STRING = 16
+LONG_STRING = 4096
+SMALL_LIST = 8
+LARGE_LIST = 10000
+
+LOOP = "loop"
+
+# `| `a`, `b` | `fn a(x: int) -> int` | description |`
+TABLE_ROW = re.compile(r"^\|\s*(?P<names>`[^|]+`)\s*\|\s*`fn (?P<name>\w+)\((?P<params>[^)]*)\)\s*->\s*(?P<ret>[^`]+)`")
+
+class Builtin(NamedTuple):
+    """One documented stdlib function (one overload)"""
+    name: str
+    params: Tuple[str, ...]  # parameter types
+    returns: str
+    section: str
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}({', '.join(self.params)})"
+
+class Case(NamedTuple):
+    """Loop body for one builtin, in Pain and Python; `setup` declares the variables it uses"""
+    variants: Tuple[str, ...]
+    pain: List[str]
+    python: List[str]
+    setup: str = ""  # "x" (float counter), "s" (string input), "items" (int list)
+
+def documented(doc: Path = STDLIB_DOC) -> List[Builtin]:
+    """Every function in the tables of docs/stdlib.md, in document order"""
+    builtins: List[Builtin] = []
+    section = ""
+    for line in doc.read_text(encoding="utf-8").splitlines():
+        if line.startswith("## "):
+            section = line[3:].strip()
+            continue
+        match = TABLE_ROW.match(line)
+        if match is None or section in SKIPPED_SECTIONS:
+            continue
+        params = tuple(p.split(":", 1)[1].strip() for p in match.group("params").split(",") if ":" in p)
+        for name in re.findall(r"`(\w+)`", match.group("names")):
+            builtin = Builtin(name, params, match.group("ret").strip(), section)
+            if builtin not in builtins:
+                builtins.append(builtin)
+    return builtins
+
+def float_case(call: str, python: str, test: str) -> Case:
+    """A math function of the float counter x, counted when `<call> <test>` holds"""
+    return Case(("scalar",), ["x = x + 0.25", f"if {call} {test}:", "    acc = acc + 1"],
+                ["x = x + 0.25", f"if {python} {test}:", "    acc = acc + 1"], setup="x")
+
+def string_case(pain: str, python: str) -> Case:
+    return Case(("short", "long"), [pain], [python], setup="s")
+
+CASES: Dict[str, Case] = {
+    "abs(int)": Case(("scalar",), ["acc = acc + abs(500 - i)"], ["acc = acc + abs(500 - i)"]),
+    "abs(float64)": float_case("abs(x - 1000.0)", "abs(x - 1000.0)", "> 500.0"),
+    "min(int, int)": Case(("scalar",), ["acc = acc + min(i, 500)"], ["acc = acc + min(i, 500)"]),
+    "max(int, int)": Case(("scalar",), ["acc = acc + max(i, 500)"], ["acc = acc + max(i, 500)"]),
+    "sqrt(float64)": float_case("sqrt(x)", "sqrt(x)", "> 100.0"),
+    "pow(float64, float64)": float_case("pow(x, 1.5)", "pow(x, 1.5)", "> 1000.0"),
+    "sin(float64)": float_case("sin(x)", "sin(x)", "> 0.0"),
+    "cos(float64)": float_case("cos(x)", "cos(x)", "> 0.0"),
+    "floor(float64)": float_case("floor(x)", "floor(x)", "== x"),
+    "ceil(float64)": float_case("ceil(x)", "ceil(x)", "== x"),
+    "len(str)": string_case("acc = acc + len(s)", "acc = acc + len(s)"),
+    "concat(str, str)": string_case("acc = acc + len(concat(s, s))", "acc = acc + len(s + s)"),
+    "substring(str, int, int)": string_case("acc = acc + len(substring(s, i % 8, i % 8 + half))",
+                                            "acc = acc + len(s[i % 8:i % 8 + half])"),
+    "contains(str, str)": string_case("if contains(s, needle):\n    acc = acc + 1",
+                                      "if needle in s:\n    acc = acc + 1"),
+    "starts_with(str, str)": string_case("if starts_with(s, prefix):\n    acc = acc + 1",
+                                         "if s.startswith(prefix):\n    acc = acc + 1"),
+    "ends_with(str, str)": string_case("if ends_with(s, suffix):\n    acc = acc + 1",
+                                       "if s.endswith(suffix):\n    acc = acc + 1"),
+    "trim(str)": string_case("acc = acc + len(trim(s))", "acc = acc + len(s.strip())"),
+    "to_int(str)": Case(("scalar",), ["acc = acc + to_int(digits)"], ["acc = acc + int(digits)"]),
+    "to_float(str)": Case(("scalar",), ["if to_float(decimal) > 3.0:", "    acc = acc + 1"],
+                          ["if float(decimal) > 3.0:", "    acc = acc + 1"]),
+    "to_string(int)": Case(("scalar",), ["acc = acc + len(to_string(i))"], ["acc = acc + len(str(i))"]),
+    "len(list[dynamic])": Case(("small", "large"), ["acc = acc + len(items)"], ["acc = acc + len(items)"],
+                               setup="items"),
+}
+
+LOOP_CASE = Case(("scalar",), ["acc = acc + i"], ["acc = acc + i"])
+
+def uncovered(builtins: List[Builtin]) -> List[Builtin]:
+    return [b for b in builtins if b.key not in CASES]
+
+def string_input(variant: str) -> str:
+    """ASCII text of the variant's length: blank padding for trim, `user` first and `name` last"""
+    length = SHORT_STRING if variant == "short" else LONG_STRING
+    filler = "lorem ipsum dolor sit amet " * (length // 27 + 1)
+    return f"  user{filler[:length - 12]}name  "
+
+def setup_lines(case: Case, variant: str) -> Tuple[List[str], List[str]]:
+    """Declarations before the loop, (Pain, Python)"""
+    if case.setup == "x":
+        return ["var x = 0.0"], ["x = 0.0"]
+    if case.setup == "s":
+        text = string_input(variant)
+        shared = [f'"{text}"', f"{len(text) // 2}", '"name"', '"  user"', '"name  "']
+        names = ["s", "half", "needle", "prefix", "suffix"]
+        return ([f"let {k} = {v}" for k, v in zip(names, shared)],
+                [f"{k} = {v}" for k, v in zip(names, shared)])
+    if case.setup == "items":
+        count = SMALL_LIST if variant == "small" else LARGE_LIST
+        literal = "[" + ", ".join(str(k) for k in range(count)) + "]"
+        return [f"let items = {literal}"], [f"items = {literal}"]
+    return ['let digits = "1234567"', 'let decimal = "3.14159"'], ['digits = "1234567"', 'decimal = "3.14159"']
+
+def indent(lines: List[str], depth: int) -> List[str]:
+    return ["    " * depth + part for line in lines for part in line.split("\n")]
+
+def pain_source(case: Case, variant: str) -> str:
+    setup, _ = setup_lines(case, variant)
+    return "\n".join([
+        "fn main() -> int:",
+        *indent(setup, 1),
+        "    var acc = 0",
+        "    var i = 0",
+        "    while i < ${n}:",
+        *indent(case.pain, 2),
+        "        i = i + 1",
+        "    return acc",
+    ]) + "\n"
+
+def python_source(key: str, case: Case, variant: str) -> str:
+    _, setup = setup_lines(case, variant)
+    return "\n".join([
+        "#!/usr/bin/env python3",
+        f'"""Generated by compare.py stdlib from {STDLIB_DOC}: {key} ({variant})"""',
+        "",
+        "from math import ceil, cos, floor, pow, sin, sqrt",
+        "",
+        "def kernel(n: int) -> int:",
+        *indent(setup, 1),
+        "    acc = 0",
+        "    i = 0",
+        "    while i < n:",
+        *indent(case.python, 2),
+        "        i = i + 1",
+        "    return acc",
+        "",
+        "def main():",
+        "    import os",
+        "    import sys",
+        "    import time",
+        "    n = int(sys.argv[1])",
+        "    start = time.perf_counter_ns()",
+        "    result = kernel(n)",
+        "    elapsed = time.perf_counter_ns() - start",
+        "    print(result)",
+        '    if os.environ.get("PAIN_BENCH_TIMING"):',
+        '        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)',
+        "",
+        'if __name__ == "__main__":',
+        "    main()",
+    ]) + "\n"
+
+def slug(key: str) -> str:
+    """File-name form of a builtin key: `substring(str, int, int)` -> `substring-str-int-int`"""
+    return re.sub(r"[^a-z0-9]+", "-", key.lower()).strip("-")
+
+def expected(python: str, counts: List[int]) -> Dict[int, str]:
+    """Checksums the generated Python kernel returns for each loop count"""
+    namespace: Dict = {"__name__": "stdlib_suite"}
+    exec(compile(python, "<stdlib kernel>", "exec"), namespace)
+    return {n: str(namespace["kernel"](n)) for n in counts}
+
+def generate(key: str, variant: str, counts: List[int]) -> Benchmark:
+    """Benchmark for one builtin (or LOOP) and input variant, sources written under target/bench-stdlib/"""
+    case = LOOP_CASE if key == LOOP else CASES[key]
+    name = f"stdlib-{slug(key)}-{variant}"
+    pain = SUITE_DIR / "pain" / f"{name}.pain"
+    python = SUITE_DIR / "python" / f"{name}.py"
+    pain.parent.mkdir(parents=True, exist_ok=True)
+    python.parent.mkdir(parents=True, exist_ok=True)
+    pain.write_text(pain_source(case, variant))
+    script = python_source(key, case, variant)
+    python.write_text(script)
+    return Benchmark(
+        name=name,
+        description=f"{key} ({variant})",
+        sources={"pain": pain, "python": python},
+        args={},
+        sizes={"calls": {"pain": counts[-1], "python": counts[-1]}},
+        default_size="calls",
+        expected=expected(script, counts),
+        work="n",
+        unit="call",
+    )
@@ -0,0 +1,166 @@
+"""
+Synthetic Pain programs of a requested size and shape.
+
+A program is a run of generated units followed by `main`. The shapes stress
+different parts of the front end:
+
+    functions    many small documented functions; f<i> calls f<i // 2>, so the
+                 call depth at run time stays logarithmic
+    nesting      functions whose bodies nest if/while blocks NESTING_DEPTH deep
+    classes      classes with CLASS_FIELDS fields and a getter and setter each
+    expressions  long arithmetic expressions, half of them deeply parenthesized
+    inference    chains of unannotated lets (ints, floats, lists, calls) for
+                 the type checker to infer
+    mixed        the above in rotation
+
+For the functions shape every function records where its interesting
+positions are, for drivers that edit the file or ask about it (hover,
+completion).
+"""
+
+from typing import Callable, Dict, List, NamedTuple
+
+# Lines per generated function, including its comment and the blank line after it
+FUNCTION_LINES = 11
+
+NESTING_DEPTH = 24
+CLASS_FIELDS = 16
+EXPRESSION_TERMS = 48
+INFERENCE_STEPS = 12
+
+class Function(NamedTuple):
+    """Positions inside one generated function (0-based lines and columns)"""
+    name: str
+    def_line: int
+    body_line: int  # first statement of the body; a good place to type
+    call_line: int  # the `return` that calls an earlier function
+    call_column: int  # start of the callee name on call_line; -1 for f0, which calls nothing
+
+class Program(NamedTuple):
+    text: str
+    lines: int
+    functions: List[Function]
+
+def function_source(i: int) -> List[str]:
+    """Source lines of function f<i>"""
+    callee = f"f{i // 2}(acc, b)" if i > 0 else "acc"
+    handoff = f"hand the result to f{i // 2}" if i > 0 else "return it"
+    return [
+        f"# Step {i}: fold b into a and {handoff}",
+        f"fn f{i}(a: int, b: int) -> int:",
+        f"    var acc = a + {i}",
+        "    var k = 0",
+        "    while k < b:",
+        f"        acc = acc + k * {i % 7 + 1}",
+        "        k = k + 1",
+        f"    if acc > {1000 + i}:",
+        "        acc = acc - b",
+        f"    return {callee}",
+        "",
+    ]
+
+def nesting_source(i: int) -> List[str]:
+    """Function n<i>: alternating if/while blocks NESTING_DEPTH levels deep"""
+    source = [f"fn n{i}(a: int) -> int:", "    var x = a"]
+    for level in range(1, NESTING_DEPTH + 1):
+        indent = "    " * level
+        # x only grows, so every while terminates
+        header = f"if x > {level - 1}:" if level % 2 else f"while x < {level * 3 + i % 5}:"
+        source.extend([indent + header, f"{indent}    x = x + {level}"])
+    return source + ["    return x", ""]
+
+def class_source(i: int) -> List[str]:
+    """Class C<i> with CLASS_FIELDS fields, a getter and setter per field and a total()"""
+    source = [f"# Record type {i}", f"class C{i}:"]
+    source += [f"    let v{j}: int" for j in range(CLASS_FIELDS)]
+    for j in range(CLASS_FIELDS):
+        previous = f"self.v{j - 1}" if j else "0"
+        source += [
+            "",
+            f"    fn get{j}() -> int:",
+            f"        return self.v{j} + {previous}",
+            "",
+            f"    fn set{j}(x: int):",
+            f"        self.v{j} = x",
+        ]
+    total = " + ".join(f"self.get{j}()" for j in range(CLASS_FIELDS))
+    return source + ["", "    fn total() -> int:", f"        return {total}", ""]
+
+def expression_terms(i: int, count: int) -> List[str]:
+    names = ("a", "b", "c")
+    return [f"{names[k % 3]} * {(i + k) % 9 + 1}" if k % 2 else f"({names[(k + 1) % 3]} - {k})"
+            for k in range(count)]
+
+def expression_source(i: int) -> List[str]:
+    """Function e<i>: one left-nested parenthesized chain and one flat sum"""
+    terms = expression_terms(i, EXPRESSION_TERMS)
+    nested = terms[0]
+    for k, term in enumerate(terms[1:]):
+        nested = f"({nested} {'+-'[k % 2]} {term})"
+    flat = " + ".join(terms) + " - x"
+    return [
+        f"fn e{i}(a: int, b: int, c: int) -> int:",
+        f"    let x = {nested}",
+        f"    let y = {flat}",
+        "    return x - y",
+        "",
+    ]
+
+def inference_source(i: int) -> List[str]:
+    """Function t<i>: INFERENCE_STEPS rounds of unannotated lets depending on each other"""
+    source = [f"fn t{i}(seed: int) -> int:", f"    let a0 = seed + {i}", "    let f0 = 0.5"]
+    for k in range(1, INFERENCE_STEPS + 1):
+        source += [
+            f"    let l{k} = [a{k - 1}, a{k - 1} + {k}, {k}]",
+            f"    let f{k} = f{k - 1} * 2.0 + {k}.25",
+            f"    let a{k} = l{k}[{k % 3}] + a{k - 1} * {k % 4 + 1}",
+        ]
+    if i > 0:
+        source.append(f"    let r = t{i // 2}(a{INFERENCE_STEPS} - a{INFERENCE_STEPS - 1})")
+        source.append(f"    return a{INFERENCE_STEPS} + r")
+    else:
+        source.append(f"    return a{INFERENCE_STEPS}")
+    return source + [""]
+
+UNITS: Dict[str, Callable[[int], List[str]]] = {
+    "functions": function_source,
+    "nesting": nesting_source,
+    "classes": class_source,
+    "expressions": expression_source,
+    "inference": inference_source,
+}
+
+SHAPES = (*UNITS, "mixed")
+
+def entry(shape: str, count: int) -> str:
+    """What main returns for a program of `count` units"""
+    if shape == "functions":
+        return f"f{count - 1}(1, 3)"
+    return {"nesting": "n0(1)", "expressions": "e0(1, 2, 3)", "inference": "t0(1)"}.get(shape, "0")
+
+def generate_program(lines: int, shape: str = "functions") -> Program:
+    """A valid program of about `lines` lines (at least one unit plus main)"""
+    if shape not in SHAPES:
+        raise ValueError(f"unknown shape '{shape}' (expected one of {', '.join(SHAPES)})")
+    source: List[str] = []
+    functions = []
+    i = 0
+    while not i or len(source) + 2 < lines:  # main adds two lines
+        if shape == "functions":
+            start = len(source)
+            source.extend(function_source(i))
+            call_line = start + 9
+            functions.append(Function(f"f{i}", start + 1, start + 2, call_line,
+                                      source[call_line].find("f", len("    return"))))
+        elif shape == "mixed":
+            # Rotate shapes but keep numbering per shape, so calls to i // 2 stay in range
+            kinds = list(UNITS)
+            source.extend(UNITS[kinds[i % len(kinds)]](i // len(kinds)))
+        else:
+            source.extend(UNITS[shape](i))
+        i += 1
+    source.extend([
+        "fn main() -> int:",
+        f"    return {entry(shape, i)}",
+    ])
+    return Program("\n".join(source) + "\n", len(source), functions)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+In-process call loop for warm mode (the Python side of `compare.py --warm`).
+
+Usage: timeit_loop.py <script> <calls> <budget seconds> [script args...]
+
+Loads a benchmark script once and calls its `main()` repeatedly in this
+process, like `timeit` but keeping every call's latency. stdout/stderr of each
+call are captured; the kernel time the script reports on stderr
+("bench-timing: execute_ns=...") is kept next to the wall time of the call.
+Prints one JSON object: the first call's output and the per-call nanoseconds.
+
+Only the standard library is used: this runs under whichever `python` the
+benchmark runs under, not the harness interpreter.
+"""
+
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import sys
+import time
+
+TIMING_PREFIX = "bench-timing: execute_ns="
+
+def load(script: str):
+    """Import a benchmark script as a module without running its __main__ block"""
+    sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+    spec = importlib.util.spec_from_file_location("warm_benchmark", script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def kernel_ns(stderr: str):
+    for line in stderr.splitlines():
+        if line.startswith(TIMING_PREFIX):
+            return int(line[len(TIMING_PREFIX):].split()[0])
+    return None
+
+def main():
+    script, calls, budget, *args = sys.argv[1:]
+    calls = int(calls)
+    deadline = time.perf_counter() + float(budget)
+    module = load(script)
+    os.environ["PAIN_BENCH_TIMING"] = "1"
+    sys.argv = [script, *args]
+
+    first_output = None
+    wall = []
+    kernel = []
+    for _ in range(calls):
+        out, err = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            start = time.perf_counter_ns()
+            module.main()
+            elapsed = time.perf_counter_ns() - start
+        if first_output is None:
+            first_output = out.getvalue().strip()
+        wall.append(elapsed)
+        kernel.append(kernel_ns(err.getvalue()))
+        if time.perf_counter() >= deadline:
+            break
+
+    print(json.dumps({"output": first_output or "", "wall_ns": wall, "kernel_ns": kernel}))
+
+if __name__ == "__main__":
+    main()
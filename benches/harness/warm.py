@@ -0,0 +1,182 @@
+"""
+Warm mode: steady-state latency of one long-lived process per language.
+
+Pain is driven through `pain-compiler repl` over stdin: the benchmark program
+is loaded once, then `main()` is evaluated again and again and each call is
+timed from writing the line to reading the echoed value. That round trip
+includes a pipe hop, so the latency of evaluating a bare literal is measured
+as well and reported as the floor. Python runs `main()` in-process through
+harness/timeit_loop.py.
+
+The per-call series is reduced to a warmup curve: the steady state is the
+median of the last quarter of calls, and the process counts as warm from the
+first call after which the rolling median stays within `tolerance` of it (or
+within its own noise, if that is wider).
+"""
+
+import csv
+import queue
+import statistics
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+from harness.buildcache import BUILD_ROOT, CREATION_FLAGS
+
+WARM_DIR = BUILD_ROOT.parent / "bench-warm"
+TIMEIT_LOOP = Path(__file__).with_name("timeit_loop.py")
+
+PROMPTS = (">>> ", "... ", ">>>", "...")
+
+# Marker evaluated after loading a program; its echo means the REPL is idle
+SYNC_VALUE = "1234567"
+
+class Session:
+    """A long-lived child process driven one line at a time over stdin/stdout"""
+
+    def __init__(self, cmd: List[str]):
+        self.proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            creationflags=CREATION_FLAGS,
+        )
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._errors: List[str] = []
+        threading.Thread(target=self._pump, daemon=True).start()
+        threading.Thread(target=self._drain_errors, daemon=True).start()
+
+    def _pump(self):
+        for line in self.proc.stdout:
+            self._lines.put(line)
+        self._lines.put(None)
+
+    def _drain_errors(self):
+        for line in self.proc.stderr:
+            self._errors.append(line)
+
+    def errors(self) -> str:
+        return "".join(self._errors).strip()
+
+    def send(self, text: str):
+        self.proc.stdin.write(text)
+        self.proc.stdin.flush()
+
+    def read_value(self, timeout: float) -> Optional[str]:
+        """Next non-empty output line with any REPL prompts stripped; None on EOF or timeout"""
+        deadline = time.perf_counter() + timeout
+        while True:
+            try:
+                line = self._lines.get(timeout=max(0.0, deadline - time.perf_counter()))
+            except queue.Empty:
+                return None
+            if line is None:
+                return None
+            line = line.strip()
+            while line.startswith(PROMPTS):
+                line = line[3:].lstrip()
+            if line:
+                return line
+
+    def call(self, expression: str, timeout: float = 60.0) -> "tuple[float, Optional[str]]":
+        """Evaluate one line; returns (seconds until its value was printed, value)"""
+        start = time.perf_counter()
+        self.send(expression + "\n")
+        value = self.read_value(timeout)
+        return time.perf_counter() - start, value
+
+    def close(self):
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self.proc.kill()
+            self.proc.wait()
+
+def repl_script(source: str) -> str:
+    """Program text as REPL input: a blank line closes every top-level definition"""
+    lines = []
+    for line in source.splitlines():
+        if line and not line[0].isspace() and lines and lines[-1] != "":
+            lines.append("")
+        lines.append(line.rstrip())
+    return "\n".join(lines) + "\n\n"
+
+def load_program(session: Session, source: str, timeout: float = 120.0) -> bool:
+    """Feed a program to the REPL and wait until it is ready for calls"""
+    session.send(repl_script(source))
+    session.send(SYNC_VALUE + "\n")
+    while True:
+        line = session.read_value(timeout)
+        if line is None:
+            return False
+        if line.endswith(SYNC_VALUE):
+            return True
+
+class WarmSummary(NamedTuple):
+    """Reduction of one per-call latency series"""
+    calls: int
+    first: float
+    steady: float  # median of the last quarter of calls
+    p99: float  # of the last quarter
+    warm_after: Optional[int]  # calls until the curve flattens; None if it never does
+    excess: float  # time spent above steady state before warm_after
+
+def rolling_median(values: List[float], window: int) -> List[float]:
+    """Median of each trailing window (shorter at the start)"""
+    return [statistics.median(values[max(0, i - window + 1):i + 1]) for i in range(len(values))]
+
+def summarize_curve(latencies: List[float], tolerance: float = 0.05) -> Optional[WarmSummary]:
+    """Steady state and warmup length of a latency series"""
+    if len(latencies) < 8:
+        return None
+    tail = sorted(latencies[-max(4, len(latencies) // 4):])
+    steady = statistics.median(tail)
+    p99 = tail[min(len(tail) - 1, int(0.99 * len(tail)))]
+    window = max(9, len(latencies) // 20)
+    smoothed = rolling_median(latencies, window)
+    # A rolling median of a flat but noisy series still wanders by about
+    # 1.25 * sigma / sqrt(window); don't call that drift
+    sigma = 1.4826 * statistics.median(abs(x - steady) for x in tail)
+    limit = steady + max(tolerance * steady, 3 * 1.25 * sigma / window ** 0.5)
+    warm_after = None
+    for i in range(len(smoothed) - 1, -1, -1):
+        if smoothed[i] > limit:
+            warm_after = i + 1
+            break
+    else:
+        warm_after = 0
+    if warm_after >= len(latencies) - len(tail):
+        warm_after = None  # still drifting inside the steady-state window
+    spent = latencies[:warm_after or 0]
+    excess = sum(spent) - steady * len(spent)
+    return WarmSummary(len(latencies), latencies[0], steady, p99, warm_after, max(0.0, excess))
+
+def curve_buckets(latencies: List[float]) -> List["tuple[int, int, float]"]:
+    """(first call, last call, median) over doubling ranges of call numbers: 1, 2-3, 4-7, ..."""
+    buckets = []
+    start = 0
+    size = 1
+    while start < len(latencies):
+        chunk = latencies[start:start + size]
+        buckets.append((start + 1, start + len(chunk), statistics.median(chunk)))
+        start += size
+        size *= 2
+    return buckets
+
+def write_series(name: str, label: str, latencies: List[float]) -> Path:
+    """Store a per-call series as CSV under target/bench-warm/ for external plotting"""
+    WARM_DIR.mkdir(parents=True, exist_ok=True)
+    slug = label.lower().replace(" ", "-").replace("+", "p")
+    path = WARM_DIR / f"{name}-{slug}.csv"
+    with path.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["call", "seconds"])
+        for i, seconds in enumerate(latencies, start=1):
+            writer.writerow([i, f"{seconds:.9f}"])
+    return path
@@ -0,0 +1,81 @@
+use criterion::{black_box, criterion_group, criterion_main, BenchmarkId, Criterion, Throughput};
+use pain_compiler::{parse, type_check_program, Interpreter};
+
+// Same templates compare.py renders; see benches/harness/reference.py for the inputs
+const MATMUL: &str = include_str!("pain/matmul.pain");
+const CHOLESKY: &str = include_str!("pain/cholesky.pain");
+const DOT: &str = include_str!("pain/dot.pain");
+const AXPY: &str = include_str!("pain/axpy.pain");
+const NORM: &str = include_str!("pain/norm.pain");
+
+fn zeros(n: usize) -> String {
+    format!("[{}]", vec!["0.0"; n].join(", "))
+}
+
+fn render(template: &str, n: usize, reps: usize) -> String {
+    template
+        .replace("${cells}", &zeros(n * n))
+        .replace("${zeros}", &zeros(n))
+        .replace("${reps}", &reps.to_string())
+        .replace("${n}", &n.to_string())
+}
+
+fn run_interpreter(source: &str) -> f64 {
+    let program = parse(source).unwrap();
+    type_check_program(&program).unwrap();
+
+    let mut interpreter = Interpreter::new().unwrap();
+    match interpreter.interpret(&program).unwrap() {
+        pain_runtime::Value::Float(result) => result,
+        _ => panic!("Expected float result"),
+    }
+}
+
+fn benchmark_matrix(c: &mut Criterion) {
+    let mut group = c.benchmark_group("matrix");
+    group.sample_size(10);
+
+    for n in [16usize, 32, 64] {
+        let matmul = render(MATMUL, n, 1);
+        group.throughput(Throughput::Elements((2 * n * n * n) as u64));
+        group.bench_with_input(BenchmarkId::new("matmul_interpreter", n), &matmul, |b, source| {
+            b.iter(|| run_interpreter(black_box(source)))
+        });
+
+        let cholesky = render(CHOLESKY, n, 1);
+        group.throughput(Throughput::Elements((n * n * n / 3 + 2 * n * n) as u64));
+        group.bench_with_input(BenchmarkId::new("cholesky_interpreter", n), &cholesky, |b, source| {
+            b.iter(|| run_interpreter(black_box(source)))
+        });
+    }
+
+    group.finish();
+}
+
+fn benchmark_vector(c: &mut Criterion) {
+    let mut group = c.benchmark_group("vector");
+    group.sample_size(10);
+
+    // One pass per iteration: criterion does the repetition itself
+    for n in [1024usize, 16384] {
+        group.throughput(Throughput::Bytes((16 * n) as u64));
+        group.bench_with_input(BenchmarkId::new("dot_interpreter", n), &render(DOT, n, 1), |b, source| {
+            b.iter(|| run_interpreter(black_box(source)))
+        });
+
+        group.throughput(Throughput::Bytes((24 * n) as u64));
+        group.bench_with_input(BenchmarkId::new("axpy_interpreter", n), &render(AXPY, n, 1), |b, source| {
+            b.iter(|| run_interpreter(black_box(source)))
+        });
+
+        group.throughput(Throughput::Bytes((8 * n) as u64));
+        group.bench_with_input(BenchmarkId::new("norm_interpreter", n), &render(NORM, n, 1), |b, source| {
+            b.iter(|| run_interpreter(black_box(source)))
+        });
+    }
+
+    group.finish();
+}
+
+criterion_group!(benches, benchmark_matrix, benchmark_vector);
+criterion_main!(benches);
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""Cholesky factorization and solve benchmark for NumPy (LAPACK potrf + two solves)"""
+
+import numpy as np
+
+def make_system(n: int):
+    i, j = np.indices((n, n))
+    s = ((i + j) % 5 + 1).astype(np.float64)
+    np.fill_diagonal(s, 5.0 * n)
+    # Right-hand side S @ ones, so the exact solution is all ones
+    b = s.sum(axis=1)
+    return s, b
+
+def cholesky_solve(s: np.ndarray, b: np.ndarray) -> np.ndarray:
+    l = np.linalg.cholesky(s)
+    # NumPy has no triangular solver; scipy.linalg.solve_triangular would be
+    # faster but is not a dependency of the suite.
+    z = np.linalg.solve(l, b)
+    return np.linalg.solve(l.T, z)
+
+def main():
+    import os
+    import sys
+    import time
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    s, b = make_system(n)
+    start = time.perf_counter_ns()
+    x = cholesky_solve(s, b)
+    elapsed = time.perf_counter_ns() - start
+    print(round(float(x.sum()) * 1000000))
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""2D Jacobi heat stencil benchmark for NumPy (one sliced update per step)"""
+
+import numpy as np
+
+STEPS = 50
+
+def jacobi(n: int) -> np.ndarray:
+    a = np.zeros((n, n))
+    a[0, :] = 100.0
+    b = a.copy()
+    for _ in range(STEPS):
+        np.multiply(a[:-2, 1:-1] + a[2:, 1:-1] + a[1:-1, :-2] + a[1:-1, 2:], 0.25, out=b[1:-1, 1:-1])
+        a, b = b, a
+    return a
+
+def checksum(grid: np.ndarray) -> int:
+    # Left to right like the other languages; np.sum's pairwise order would
+    # change the last bits
+    total = 0.0
+    for cell in grid.ravel().tolist():
+        total += cell
+    return int(total * 1000.0 + 0.5)
+
+def main():
+    import os
+    import sys
+    import time
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 128
+    start = time.perf_counter_ns()
+    grid = jacobi(n)
+    elapsed = time.perf_counter_ns() - start
+    print(checksum(grid))
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
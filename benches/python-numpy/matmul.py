@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""Dense matrix multiplication benchmark for NumPy (A @ B, BLAS-backed)"""
+
+import numpy as np
+
+def make_matrices(n: int):
+    i, j = np.indices((n, n))
+    a = ((i + j) % 7 + 1).astype(np.float64)
+    b = ((i + j) % 5 + 1).astype(np.float64)
+    return a, b
+
+def main():
+    import os
+    import sys
+    import time
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    a, b = make_matrices(n)
+    start = time.perf_counter_ns()
+    c = a @ b
+    elapsed = time.perf_counter_ns() - start
+    print(int(c.sum()))
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""MLP benchmarks (forward pass, backprop step) for NumPy
+
+Usage: mlp.py <forward|backward> <batch>
+Same network, inputs and repetition scheme as python/mlp.py, with one matrix
+product per layer for the whole batch.
+"""
+
+import numpy as np
+
+SAMPLES = 4096
+IN, HIDDEN, OUT = 16, 32, 4
+
+def make_params() -> tuple:
+    i = np.arange(IN)[:, None]
+    j = np.arange(HIDDEN)
+    k = np.arange(OUT)
+    w1 = ((i * 3 + j * 5) % 7 - 3) / 8
+    b1 = ((j * 5) % 9 - 4) / 8
+    w2 = ((j[:, None] * 2 + k * 3) % 5 - 2) / 8
+    b2 = (k - 1) / 4
+    return w1, b1, w2, b2
+
+def make_batch(batch: int) -> tuple:
+    b = np.arange(batch)[:, None]
+    x = ((b * 7 + np.arange(IN) * 3) % 11 - 5) / 4
+    y = ((b + np.arange(OUT)) % 3 - 1).astype(np.float64)
+    return x, y
+
+def forward(x: np.ndarray, params: tuple) -> float:
+    w1, b1, w2, b2 = params
+    h = np.maximum(x @ w1 + b1, 0.0)
+    return float((h @ w2 + b2).sum())
+
+def backward(x: np.ndarray, y: np.ndarray, params: tuple) -> float:
+    w1, b1, w2, b2 = params
+    z1 = x @ w1 + b1
+    h = np.maximum(z1, 0.0)
+    dout = h @ w2 + b2 - y
+    dw2 = h.T @ dout
+    db2 = dout.sum(axis=0)
+    dz1 = (dout @ w2.T) * (z1 > 0.0)
+    dw1 = x.T @ dz1
+    db1 = dz1.sum(axis=0)
+    return float(dw1.sum() + db1.sum() + dw2.sum() + db2.sum())
+
+def main():
+    import os
+    import sys
+    import time
+    mode = sys.argv[1] if len(sys.argv) > 1 else "forward"
+    batch = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    reps = max(1, SAMPLES // batch)
+    params = make_params()
+    x, y = make_batch(batch)
+    start = time.perf_counter_ns()
+    total = 0.0
+    if mode == "forward":
+        for _ in range(reps):
+            total += forward(x, params)
+        scale = 256
+    elif mode == "backward":
+        for _ in range(reps):
+            total += backward(x, y, params)
+        scale = 8192
+    else:
+        sys.exit(f"unknown mode: {mode}")
+    elapsed = time.perf_counter_ns() - start
+    print(int(total * scale))
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""All-pairs gravitational n-body benchmark for NumPy
+
+Vectorized over the bodies being accelerated, looping over the attracting
+body j, so every body sums its forces in the same order as the scalar versions.
+"""
+
+import math
+
+import numpy as np
+
+STEPS = 10
+DT = 0.01
+EPS2 = 0.01
+
+def simulate(pos: np.ndarray, vel: np.ndarray, mass: float):
+    n = pos.shape[1]
+    for _ in range(STEPS):
+        acc = np.zeros_like(pos)
+        for j in range(n):
+            delta = pos[:, j:j + 1] - pos
+            d2 = delta[0] * delta[0] + delta[1] * delta[1] + delta[2] * delta[2] + EPS2
+            acc += delta * (mass / (d2 * np.sqrt(d2)))
+        vel += acc * DT
+        pos += vel * DT
+
+def checksum(pos: np.ndarray) -> int:
+    total = 0.0
+    for x, y, z in pos.T.tolist():
+        total += x * x + y * y + z * z
+    return math.floor(total * 1000000.0 + 0.5)
+
+def main():
+    import os
+    import sys
+    import time
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    index = np.arange(n)
+    pos = np.stack([index % 7 - 3, index % 11 - 5, index % 13 - 6]).astype(np.float64)
+    vel = np.zeros_like(pos)
+    start = time.perf_counter_ns()
+    simulate(pos, vel, 1.0 / n)
+    elapsed = time.perf_counter_ns() - start
+    print(checksum(pos))
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""CSV preprocessing benchmark (parse, min-max normalize, one-hot) for NumPy
+
+Usage: preprocess.py <rows>
+Same CSV and checksum as python/preprocess.py. Rows are split in Python (as
+np.loadtxt would), then normalization and one-hot encoding are vectorized.
+"""
+
+import numpy as np
+
+SAMPLES = 4096
+SEGMENTS = ("north", "south", "east", "west", "central")
+
+def make_csv(rows: int) -> str:
+    lines = ["id,age,income,segment"]
+    for i in range(rows):
+        lines.append(f"{i},{18 + (i * 37) % 60},{(i * 7919) % 100000}.{(i * 31) % 10},{SEGMENTS[(i * 3) % 5]}")
+    return "\n".join(lines) + "\n"
+
+def normalize(values: np.ndarray) -> np.ndarray:
+    lo, hi = values.min(), values.max()
+    if hi == lo:
+        return np.zeros_like(values)
+    return (values - lo) / (hi - lo)
+
+def preprocess(text: str) -> tuple:
+    """Parse and transform; returns (normalized age, normalized income, one-hot matrix)"""
+    fields = [line.split(",") for line in text.splitlines()[1:]]
+    ages = np.array([row[1] for row in fields], dtype=np.float64)
+    incomes = np.array([row[2] for row in fields], dtype=np.float64)
+    index = {name: k for k, name in enumerate(SEGMENTS)}
+    codes = np.array([index[row[3]] for row in fields], dtype=np.int64)
+    one_hot = np.eye(len(SEGMENTS))[codes]
+    return normalize(ages), normalize(incomes), one_hot
+
+def checksum(ages: np.ndarray, incomes: np.ndarray, one_hot: np.ndarray) -> int:
+    scaled = np.floor(ages * 1000.0).sum() + np.floor(incomes * 1000.0).sum()
+    return int(scaled) + int((one_hot @ np.arange(1, len(SEGMENTS) + 1)).sum())
+
+def main():
+    import os
+    import sys
+    import time
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    reps = max(1, SAMPLES // rows)
+    text = make_csv(rows)
+    start = time.perf_counter_ns()
+    total = 0
+    for _ in range(reps):
+        total += checksum(*preprocess(text))
+    elapsed = time.perf_counter_ns() - start
+    print(total)
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
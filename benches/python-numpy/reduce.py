@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""Large reductions (sum, min, max, 16-bin histogram) benchmark for NumPy"""
+
+import numpy as np
+
+BINS = 16
+BIN_WIDTH = 64
+
+def reduce_values(values: np.ndarray) -> int:
+    hist = np.bincount(values // BIN_WIDTH, minlength=BINS)
+    weights = np.arange(1, BINS + 1, dtype=np.int64)
+    return int(values.sum()) + int(values.min()) + int(values.max()) + int(hist @ weights)
+
+def main():
+    import os
+    import sys
+    import time
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    values = (np.arange(n, dtype=np.int64) * 7919) % 1000
+    start = time.perf_counter_ns()
+    result = reduce_values(values)
+    elapsed = time.perf_counter_ns() - start
+    print(result)
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Vector operation benchmarks (dot, axpy, norm) for NumPy
+
+Usage: vector_ops.py <dot|axpy|norm> <n>
+Same repetition scheme as python/vector_ops.py, with one vectorized call per
+repetition.
+"""
+
+import math
+
+import numpy as np
+
+VECTOR_WORK = 1 << 22
+ALPHA = 2.0
+
+def dot(x: np.ndarray, y: np.ndarray, reps: int) -> float:
+    total = 0.0
+    for _ in range(reps):
+        total += float(np.dot(x, y))
+    return total
+
+def axpy(x: np.ndarray, y: np.ndarray, reps: int) -> float:
+    scaled = np.empty_like(x)
+    for _ in range(reps):
+        np.multiply(x, ALPHA, out=scaled)
+        y += scaled
+    return float(y.sum())
+
+def norm(x: np.ndarray, reps: int) -> float:
+    total = 0.0
+    for _ in range(reps):
+        total += math.sqrt(float(np.dot(x, x)))
+    return math.floor(total * 1000)
+
+def main():
+    import os
+    import sys
+    import time
+    op = sys.argv[1] if len(sys.argv) > 1 else "dot"
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 65536
+    reps = max(1, VECTOR_WORK // n)
+    index = np.arange(n)
+    x = (index % 7 + 1).astype(np.float64)
+    y = (index % 5 + 1).astype(np.float64)
+    start = time.perf_counter_ns()
+    if op == "dot":
+        result = dot(x, y, reps)
+    elif op == "axpy":
+        result = axpy(x, y, reps)
+    elif op == "norm":
+        result = norm(x, reps)
+    else:
+        sys.exit(f"unknown operation: {op}")
+    elapsed = time.perf_counter_ns() - start
+    print(int(result))
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""List allocation churn benchmark for Python
+
+Usage: alloc_lists.py <n>
+Each of the 100 batches builds and drops n lists of 16 ints
+(block[k] = b + i + k) and sums block[i % 16]. A "batch <b>" line after each
+batch lets the harness time batches and spot collector pauses.
+"""
+
+BATCHES = 100
+
+def churn(b: int, count: int) -> int:
+    total = 0
+    for i in range(count):
+        v = b + i
+        block = [v, v + 1, v + 2, v + 3, v + 4, v + 5, v + 6, v + 7,
+                 v + 8, v + 9, v + 10, v + 11, v + 12, v + 13, v + 14, v + 15]
+        total += block[i % 16]
+    return total
+
+def main():
+    import os
+    import sys
+    import time
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    start = time.perf_counter_ns()
+    total = 0
+    for b in range(BATCHES):
+        total += churn(b, n)
+        print(f"batch {b}", flush=True)
+    elapsed = time.perf_counter_ns() - start
+    print(total)
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
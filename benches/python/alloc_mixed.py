@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Long-lived plus short-lived allocation benchmark for Python
+
+Usage: alloc_mixed.py <depth>
+A binary tree of the given depth stays alive for the whole run. Each of the
+100 batches meanwhile builds, counts and drops 16 trees of depth 8, so every
+collection has a large old heap next to a stream of garbage. A "batch <b>"
+line after each batch lets the harness time batches.
+"""
+
+BATCHES = 100
+TREES = 16
+DEPTH = 8
+
+class Node:
+    __slots__ = ("left", "right")
+
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
+
+def make(depth: int) -> Node:
+    if depth == 0:
+        return Node(None, None)
+    return Node(make(depth - 1), make(depth - 1))
+
+def check(node: Node) -> int:
+    if node.left is None:
+        return 1
+    return 1 + check(node.left) + check(node.right)
+
+def main():
+    import os
+    import sys
+    import time
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    start = time.perf_counter_ns()
+    long_lived = make(depth)
+    total = 0
+    for b in range(BATCHES):
+        for _ in range(TREES):
+            total += check(make(DEPTH))
+        print(f"batch {b}", flush=True)
+    total += check(long_lived)
+    elapsed = time.perf_counter_ns() - start
+    print(total)
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
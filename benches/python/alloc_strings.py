@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""String concatenation churn benchmark for Python
+
+Usage: alloc_strings.py <n>
+Each of the 100 batches builds n strings by appending str(b + i + k) for
+k = 0..15 one piece at a time, and sums their lengths. A "batch <b>" line
+after each batch lets the harness time batches.
+"""
+
+BATCHES = 100
+
+def churn(b: int, count: int) -> int:
+    total = 0
+    for i in range(count):
+        s = ""
+        for k in range(16):
+            s = s + str(b + i + k)
+        total += len(s)
+    return total
+
+def main():
+    import os
+    import sys
+    import time
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    start = time.perf_counter_ns()
+    total = 0
+    for b in range(BATCHES):
+        total += churn(b, n)
+        print(f"batch {b}", flush=True)
+    elapsed = time.perf_counter_ns() - start
+    print(total)
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Binary-tree allocation benchmark for Python
+
+Usage: alloc_trees.py <depth>
+Each of the 100 batches builds a complete binary tree of the given depth,
+counts its nodes and drops it. A "batch <b>" line after each batch lets the
+harness time batches and spot collector pauses.
+"""
+
+BATCHES = 100
+
+class Node:
+    __slots__ = ("left", "right")
+
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
+
+def make(depth: int) -> Node:
+    if depth == 0:
+        return Node(None, None)
+    return Node(make(depth - 1), make(depth - 1))
+
+def check(node: Node) -> int:
+    if node.left is None:
+        return 1
+    return 1 + check(node.left) + check(node.right)
+
+def main():
+    import os
+    import sys
+    import time
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    start = time.perf_counter_ns()
+    total = 0
+    for b in range(BATCHES):
+        total += check(make(depth))
+        print(f"batch {b}", flush=True)
+    elapsed = time.perf_counter_ns() - start
+    print(total)
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
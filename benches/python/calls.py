@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Call overhead and recursion depth benchmark for Python
+
+Usage: calls.py <mode> <n>, modes as in harness/call_suite.py. The recursion
+modes run under the default recursion limit, as production code would.
+"""
+
+def f0():
+    return 1
+
+def f1(a0):
+    return a0
+
+def f2(a0, a1):
+    return a0 + a1
+
+def f3(a0, a1, a2):
+    return a0 + a1 + a2
+
+def f4(a0, a1, a2, a3):
+    return a0 + a1 + a2 + a3
+
+def f5(a0, a1, a2, a3, a4):
+    return a0 + a1 + a2 + a3 + a4
+
+def f6(a0, a1, a2, a3, a4, a5):
+    return a0 + a1 + a2 + a3 + a4 + a5
+
+def f7(a0, a1, a2, a3, a4, a5, a6):
+    return a0 + a1 + a2 + a3 + a4 + a5 + a6
+
+def f8(a0, a1, a2, a3, a4, a5, a6, a7):
+    return a0 + a1 + a2 + a3 + a4 + a5 + a6 + a7
+
+class Counter:
+    def __init__(self, step):
+        self.step = step
+
+    def add(self, x):
+        return x + self.step
+
+def depth(n):
+    if n == 0:
+        return 0
+    return 1 + depth(n - 1)
+
+def depth_tail(n, acc):
+    if n == 0:
+        return acc
+    return depth_tail(n - 1, acc + 1)
+
+def run_depth_tail(n):
+    return depth_tail(n, 0)
+
+def run_loop(n):
+    acc = 0
+    i = 0
+    while i < n:
+        acc = acc + i
+        i = i + 1
+    return acc
+
+def run_call0(n):
+    acc = 0
+    i = 0
+    while i < n:
+        acc = acc + f0()
+        i = i + 1
+    return acc
+
+def run_call1(n):
+    acc = 0
+    i = 0
+    while i < n:
+        acc = acc + f1(i)
+        i = i + 1
+    return acc
+
+def run_call2(n):
+    acc = 0
+    i = 0
+    while i < n:
+        acc = acc + f2(i, i)
+        i = i + 1
+    return acc
+
+def run_call3(n):
+    acc = 0
+    i = 0
+    while i < n:
+        acc = acc + f3(i, i, i)
+        i = i + 1
+    return acc
+
+def run_call4(n):
+    acc = 0
+    i = 0
+    while i < n:
+        acc = acc + f4(i, i, i, i)
+        i = i + 1
+    return acc
+
+def run_call5(n):
+    acc = 0
+    i = 0
+    while i < n:
+        acc = acc + f5(i, i, i, i, i)
+        i = i + 1
+    return acc
+
+def run_call6(n):
+    acc = 0
+    i = 0
+    while i < n:
+        acc = acc + f6(i, i, i, i, i, i)
+        i = i + 1
+    return acc
+
+def run_call7(n):
+    acc = 0
+    i = 0
+    while i < n:
+        acc = acc + f7(i, i, i, i, i, i, i)
+        i = i + 1
+    return acc
+
+def run_call8(n):
+    acc = 0
+    i = 0
+    while i < n:
+        acc = acc + f8(i, i, i, i, i, i, i, i)
+        i = i + 1
+    return acc
+
+def run_method(n):
+    c = Counter(1)
+    acc = 0
+    i = 0
+    while i < n:
+        acc = acc + c.add(i)
+        i = i + 1
+    return acc
+
+CASES = [run_loop, run_call0, run_call1, run_call2, run_call3, run_call4, run_call5, run_call6, run_call7, run_call8, run_method, depth, run_depth_tail]
+
+def main():
+    import os
+    import sys
+    import time
+    mode = int(sys.argv[1])
+    n = int(sys.argv[2])
+    start = time.perf_counter_ns()
+    result = CASES[mode](n)
+    elapsed = time.perf_counter_ns() - start
+    print(result)
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Cholesky factorization and solve benchmark for Python (pure Python, flat row-major lists)"""
+
+import math
+
+def make_system(n: int):
+    s = [float((i + j) % 5 + 1) for i in range(n) for j in range(n)]
+    for i in range(n):
+        s[i * n + i] = 5.0 * n
+    # Right-hand side S @ ones, so the exact solution is all ones
+    b = [sum(s[i * n:(i + 1) * n]) for i in range(n)]
+    return s, b
+
+def cholesky_solve(s: list, b: list, n: int) -> list:
+    # Factor S = L L^T in place (lower triangle)
+    l = list(s)
+    for j in range(n):
+        acc = l[j * n + j]
+        for k in range(j):
+            acc -= l[j * n + k] * l[j * n + k]
+        d = math.sqrt(acc)
+        l[j * n + j] = d
+        for i in range(j + 1, n):
+            acc = l[i * n + j]
+            for k in range(j):
+                acc -= l[i * n + k] * l[j * n + k]
+            l[i * n + j] = acc / d
+    # Forward substitution L z = b, then back substitution L^T x = z
+    z = [0.0] * n
+    for i in range(n):
+        acc = b[i]
+        for k in range(i):
+            acc -= l[i * n + k] * z[k]
+        z[i] = acc / l[i * n + i]
+    x = [0.0] * n
+    for i in range(n - 1, -1, -1):
+        acc = z[i]
+        for k in range(i + 1, n):
+            acc -= l[k * n + i] * x[k]
+        x[i] = acc / l[i * n + i]
+    return x
+
+def main():
+    import os
+    import sys
+    import time
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    s, b = make_system(n)
+    start = time.perf_counter_ns()
+    x = cholesky_solve(s, b, n)
+    elapsed = time.perf_counter_ns() - start
+    print(round(sum(x) * 1000000))
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
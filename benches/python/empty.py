@@ -0,0 +1,8 @@
+#!/usr/bin/env python3
+"""Empty program for Python: measures interpreter startup only"""
+
+def main():
+    print(0)
+
+if __name__ == "__main__":
+    main()
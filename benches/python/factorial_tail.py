@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""Tail-recursive factorial benchmark for Python"""
+
+def fact_tail(n: int, acc: int) -> int:
+    if n <= 1:
+        return acc
+    return fact_tail(n - 1, n * acc)
+
+def fact(n: int) -> int:
+    return fact_tail(n, 1)
+
+def main():
+    import os
+    import sys
+    import time
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    start = time.perf_counter_ns()
+    result = fact(n)
+    elapsed = time.perf_counter_ns() - start
+    print(result)
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
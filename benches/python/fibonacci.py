@@ -7,10 +7,16 @@ def fib(n: int) -> int:
     return fib(n - 1) + fib(n - 2)
 
 def main():
+    import os
     import sys
+    import time
     n = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    start = time.perf_counter_ns()
     result = fib(n)
+    elapsed = time.perf_counter_ns() - start
     print(result)
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""2D Jacobi heat stencil benchmark for Python (pure Python, flat row-major lists)"""
+
+STEPS = 50
+
+def make_grid(n: int) -> list:
+    grid = [0.0] * (n * n)
+    for j in range(n):
+        grid[j] = 100.0
+    return grid
+
+def sweep_rows(src, dst, n: int, lo: int, hi: int):
+    for i in range(lo, hi):
+        row = i * n
+        for j in range(1, n - 1):
+            dst[row + j] = (src[row - n + j] + src[row + n + j] + src[row + j - 1] + src[row + j + 1]) * 0.25
+
+def jacobi(n: int) -> list:
+    a = make_grid(n)
+    b = list(a)
+    for _ in range(STEPS):
+        sweep_rows(a, b, n, 1, n - 1)
+        a, b = b, a
+    return a
+
+def checksum(grid) -> int:
+    total = 0.0
+    for cell in grid:
+        total += cell
+    return int(total * 1000.0 + 0.5)
+
+def main():
+    import os
+    import sys
+    import time
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 128
+    start = time.perf_counter_ns()
+    grid = jacobi(n)
+    elapsed = time.perf_counter_ns() - start
+    print(checksum(grid))
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
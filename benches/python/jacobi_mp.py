@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""2D Jacobi heat stencil benchmark for Python: worker processes over shared memory
+
+Usage: jacobi_mp.py <n> [workers]
+Both grids live in shared memory. Each worker owns a block of interior rows and
+sweeps it every step with the pure-Python kernel from jacobi.py; a barrier
+separates the steps. Workers are started before the timer.
+"""
+
+import os
+import sys
+from multiprocessing import Barrier, Process
+from multiprocessing.shared_memory import SharedMemory
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from jacobi import STEPS, checksum, make_grid, sweep_rows  # noqa: E402
+
+def _worker(names: tuple, n: int, lo: int, hi: int, barrier):
+    blocks = [SharedMemory(name=name) for name in names]
+    grids = [block.buf.cast("d") for block in blocks]
+    barrier.wait()  # start
+    for step in range(STEPS):
+        sweep_rows(grids[step % 2], grids[(step + 1) % 2], n, lo, hi)
+        barrier.wait()
+    for grid in grids:
+        grid.release()
+    for block in blocks:
+        block.close()
+
+def main():
+    import time
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 128
+    workers = max(1, int(sys.argv[2])) if len(sys.argv) > 2 else 1
+    blocks = [SharedMemory(create=True, size=n * n * 8) for _ in range(2)]
+    try:
+        grids = [block.buf.cast("d") for block in blocks]
+        initial = make_grid(n)
+        for grid in grids:
+            for k, value in enumerate(initial):
+                grid[k] = value
+        interior = n - 2
+        barrier = Barrier(workers + 1)
+        procs = [
+            Process(target=_worker, args=(tuple(b.name for b in blocks), n,
+                                          1 + interior * w // workers, 1 + interior * (w + 1) // workers, barrier))
+            for w in range(workers)
+        ]
+        for proc in procs:
+            proc.start()
+        barrier.wait()  # all workers attached
+        start = time.perf_counter_ns()
+        for _ in range(STEPS):
+            barrier.wait()
+        elapsed = time.perf_counter_ns() - start
+        for proc in procs:
+            proc.join()
+        result = checksum(grids[STEPS % 2])
+        for grid in grids:
+            grid.release()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+    print(result)
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""Config load for Python: parse a JSON or TOML file with the stdlib and exit
+
+With `-` instead of a path nothing is parsed, which measures interpreter
+startup plus the parser import.
+"""
+
+def main():
+    import os
+    import sys
+    import time
+    fmt, path = sys.argv[1], sys.argv[2]
+    if fmt == "json":
+        import json
+        load = json.load
+    else:
+        import tomllib
+        load = tomllib.load
+    if path == "-":
+        print(0)
+        return
+    start = time.perf_counter_ns()
+    with open(path, "rb") as f:
+        doc = load(f)
+    elapsed = time.perf_counter_ns() - start
+    print(doc["meta"]["sections"])
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
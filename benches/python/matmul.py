@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Dense matrix multiplication benchmark for Python (pure Python, flat row-major lists)"""
+
+def make_matrices(n: int):
+    a = [float((i + j) % 7 + 1) for i in range(n) for j in range(n)]
+    b = [float((i + j) % 5 + 1) for i in range(n) for j in range(n)]
+    return a, b
+
+def matmul(a: list, b: list, n: int) -> list:
+    c = [0.0] * (n * n)
+    for i in range(n):
+        row = i * n
+        for k in range(n):
+            aik = a[row + k]
+            col = k * n
+            for j in range(n):
+                c[row + j] += aik * b[col + j]
+    return c
+
+def main():
+    import os
+    import sys
+    import time
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    a, b = make_matrices(n)
+    start = time.perf_counter_ns()
+    c = matmul(a, b, n)
+    elapsed = time.perf_counter_ns() - start
+    print(int(sum(c)))
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
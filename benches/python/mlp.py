@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""MLP benchmarks (forward pass, backprop step) for Python (pure Python)
+
+Usage: mlp.py <forward|backward> <batch>
+A 16 -> 32 (ReLU) -> 4 network on flat row-major lists, one sample at a time.
+Each run processes SAMPLES samples as max(1, SAMPLES // batch) batches.
+`forward` prints 256 * the sum of all outputs; `backward` runs the forward
+pass, the squared-error gradient and backprop for the whole batch and prints
+8192 * the sum of every gradient entry (dW1, db1, dW2, db2).
+"""
+
+SAMPLES = 4096
+IN, HIDDEN, OUT = 16, 32, 4
+
+def make_params() -> tuple:
+    w1 = [((i * 3 + j * 5) % 7 - 3) / 8 for i in range(IN) for j in range(HIDDEN)]
+    b1 = [((j * 5) % 9 - 4) / 8 for j in range(HIDDEN)]
+    w2 = [((j * 2 + k * 3) % 5 - 2) / 8 for j in range(HIDDEN) for k in range(OUT)]
+    b2 = [(k - 1) / 4 for k in range(OUT)]
+    return w1, b1, w2, b2
+
+def make_batch(batch: int) -> tuple:
+    x = [((b * 7 + i * 3) % 11 - 5) / 4 for b in range(batch) for i in range(IN)]
+    y = [float((b + k) % 3 - 1) for b in range(batch) for k in range(OUT)]
+    return x, y
+
+def layer1(x, w1, b1, row: int) -> list:
+    """Pre-activations of the hidden layer for sample `row`"""
+    z1 = list(b1)
+    base = row * IN
+    for i in range(IN):
+        xi = x[base + i]
+        offset = i * HIDDEN
+        for j in range(HIDDEN):
+            z1[j] += xi * w1[offset + j]
+    return z1
+
+def layer2(h, w2, b2) -> list:
+    out = list(b2)
+    for j in range(HIDDEN):
+        hj = h[j]
+        offset = j * OUT
+        for k in range(OUT):
+            out[k] += hj * w2[offset + k]
+    return out
+
+def forward(x, params, batch: int) -> float:
+    w1, b1, w2, b2 = params
+    total = 0.0
+    for row in range(batch):
+        h = [z if z > 0.0 else 0.0 for z in layer1(x, w1, b1, row)]
+        total += sum(layer2(h, w2, b2))
+    return total
+
+def backward(x, y, params, batch: int) -> float:
+    w1, b1, w2, b2 = params
+    dw1 = [0.0] * (IN * HIDDEN)
+    db1 = [0.0] * HIDDEN
+    dw2 = [0.0] * (HIDDEN * OUT)
+    db2 = [0.0] * OUT
+    for row in range(batch):
+        z1 = layer1(x, w1, b1, row)
+        h = [z if z > 0.0 else 0.0 for z in z1]
+        out = layer2(h, w2, b2)
+        dout = [out[k] - y[row * OUT + k] for k in range(OUT)]
+        for j in range(HIDDEN):
+            for k in range(OUT):
+                dw2[j * OUT + k] += h[j] * dout[k]
+        for k in range(OUT):
+            db2[k] += dout[k]
+        for j in range(HIDDEN):
+            if z1[j] <= 0.0:
+                continue
+            dz = 0.0
+            for k in range(OUT):
+                dz += dout[k] * w2[j * OUT + k]
+            db1[j] += dz
+            for i in range(IN):
+                dw1[i * HIDDEN + j] += x[row * IN + i] * dz
+    return sum(dw1) + sum(db1) + sum(dw2) + sum(db2)
+
+def main():
+    import os
+    import sys
+    import time
+    mode = sys.argv[1] if len(sys.argv) > 1 else "forward"
+    batch = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    reps = max(1, SAMPLES // batch)
+    params = make_params()
+    x, y = make_batch(batch)
+    start = time.perf_counter_ns()
+    total = 0.0
+    if mode == "forward":
+        for _ in range(reps):
+            total += forward(x, params, batch)
+        scale = 256
+    elif mode == "backward":
+        for _ in range(reps):
+            total += backward(x, y, params, batch)
+        scale = 8192
+    else:
+        sys.exit(f"unknown mode: {mode}")
+    elapsed = time.perf_counter_ns() - start
+    print(int(total * scale))
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
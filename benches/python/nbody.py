@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""All-pairs gravitational n-body benchmark for Python (pure Python)
+
+Body i starts at (i % 7 - 3, i % 11 - 5, i % 13 - 6) at rest with mass 1/n;
+STEPS symplectic Euler steps with softening EPS2. The checksum is the sum of
+squared distances from the origin (the centre of mass itself never moves).
+"""
+
+import math
+
+STEPS = 10
+DT = 0.01
+EPS2 = 0.01
+
+def make_bodies(n: int) -> list:
+    """Flat [x, y, z, vx, vy, vz] * n"""
+    state = [0.0] * (6 * n)
+    for i in range(n):
+        state[6 * i] = float(i % 7) - 3.0
+        state[6 * i + 1] = float(i % 11) - 5.0
+        state[6 * i + 2] = float(i % 13) - 6.0
+    return state
+
+def accelerate(state, n: int, mass: float, lo: int, hi: int) -> list:
+    """Accelerations [ax, ay, az] for bodies lo..hi"""
+    acc = []
+    for i in range(lo, hi):
+        xi = state[6 * i]
+        yi = state[6 * i + 1]
+        zi = state[6 * i + 2]
+        ax = ay = az = 0.0
+        for j in range(n):
+            dx = state[6 * j] - xi
+            dy = state[6 * j + 1] - yi
+            dz = state[6 * j + 2] - zi
+            d2 = dx * dx + dy * dy + dz * dz + EPS2
+            s = mass / (d2 * math.sqrt(d2))
+            ax += dx * s
+            ay += dy * s
+            az += dz * s
+        acc += (ax, ay, az)
+    return acc
+
+def advance(state, acc, lo: int, hi: int):
+    """Kick then drift bodies lo..hi"""
+    for k, i in enumerate(range(lo, hi)):
+        for d in range(3):
+            state[6 * i + 3 + d] += acc[3 * k + d] * DT
+            state[6 * i + d] += state[6 * i + 3 + d] * DT
+
+def checksum(state, n: int) -> int:
+    total = 0.0
+    for i in range(n):
+        x, y, z = state[6 * i], state[6 * i + 1], state[6 * i + 2]
+        total += x * x + y * y + z * z
+    return math.floor(total * 1000000.0 + 0.5)
+
+def main():
+    import os
+    import sys
+    import time
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    state = make_bodies(n)
+    mass = 1.0 / n
+    start = time.perf_counter_ns()
+    for _ in range(STEPS):
+        acc = accelerate(state, n, mass, 0, n)
+        advance(state, acc, 0, n)
+    elapsed = time.perf_counter_ns() - start
+    print(checksum(state, n))
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
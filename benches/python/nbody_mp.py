@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""All-pairs n-body benchmark for Python: worker processes over shared memory
+
+Usage: nbody_mp.py <n> [workers]
+Body state lives in shared memory. Every step each worker computes the
+accelerations of its own bodies against all bodies, waits at a barrier until
+everyone has read the old positions, then advances its bodies and waits again.
+Workers are started before the timer.
+"""
+
+import os
+import sys
+from multiprocessing import Barrier, Process
+from multiprocessing.shared_memory import SharedMemory
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from nbody import STEPS, accelerate, advance, checksum, make_bodies  # noqa: E402
+
+def _worker(name: str, n: int, lo: int, hi: int, barrier):
+    block = SharedMemory(name=name)
+    state = block.buf.cast("d")
+    mass = 1.0 / n
+    barrier.wait()  # start
+    for _ in range(STEPS):
+        acc = accelerate(state, n, mass, lo, hi)
+        barrier.wait()  # everyone has read the old positions
+        advance(state, acc, lo, hi)
+        barrier.wait()
+    state.release()
+    block.close()
+
+def main():
+    import time
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    workers = max(1, int(sys.argv[2])) if len(sys.argv) > 2 else 1
+    block = SharedMemory(create=True, size=6 * n * 8)
+    try:
+        state = block.buf.cast("d")
+        for k, value in enumerate(make_bodies(n)):
+            state[k] = value
+        barrier = Barrier(workers + 1)
+        procs = [
+            Process(target=_worker, args=(block.name, n, n * w // workers, n * (w + 1) // workers, barrier))
+            for w in range(workers)
+        ]
+        for proc in procs:
+            proc.start()
+        barrier.wait()  # all workers attached
+        start = time.perf_counter_ns()
+        for _ in range(STEPS):
+            barrier.wait()
+            barrier.wait()
+        elapsed = time.perf_counter_ns() - start
+        for proc in procs:
+            proc.join()
+        result = checksum(state, n)
+        state.release()
+    finally:
+        block.close()
+        block.unlink()
+    print(result)
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
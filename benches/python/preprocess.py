@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""CSV preprocessing benchmark (parse, min-max normalize, one-hot) for Python (pure Python)
+
+Usage: preprocess.py <rows>
+The CSV text (id,age,income,segment) is generated up front; each of the
+max(1, SAMPLES // rows) repetitions parses it, normalizes age and income to
+[0, 1] and one-hot encodes the segment. The checksum adds floor(1000 * each
+normalized value) and the 1-based index of each hot column.
+"""
+
+import math
+
+SAMPLES = 4096
+SEGMENTS = ("north", "south", "east", "west", "central")
+
+def make_csv(rows: int) -> str:
+    lines = ["id,age,income,segment"]
+    for i in range(rows):
+        lines.append(f"{i},{18 + (i * 37) % 60},{(i * 7919) % 100000}.{(i * 31) % 10},{SEGMENTS[(i * 3) % 5]}")
+    return "\n".join(lines) + "\n"
+
+def normalize(values: list) -> list:
+    lo, hi = min(values), max(values)
+    if hi == lo:
+        return [0.0] * len(values)
+    span = hi - lo
+    return [(v - lo) / span for v in values]
+
+def preprocess(text: str) -> tuple:
+    """Parse and transform; returns (normalized age, normalized income, one-hot rows)"""
+    ages = []
+    incomes = []
+    segments = []
+    for line in text.splitlines()[1:]:
+        _, age, income, segment = line.split(",")
+        ages.append(float(age))
+        incomes.append(float(income))
+        segments.append(segment)
+    index = {name: k for k, name in enumerate(SEGMENTS)}
+    one_hot = []
+    for segment in segments:
+        row = [0.0] * len(SEGMENTS)
+        row[index[segment]] = 1.0
+        one_hot.append(row)
+    return normalize(ages), normalize(incomes), one_hot
+
+def checksum(ages: list, incomes: list, one_hot: list) -> int:
+    total = sum(math.floor(v * 1000.0) for v in ages) + sum(math.floor(v * 1000.0) for v in incomes)
+    for row in one_hot:
+        total += int(sum((k + 1) * hot for k, hot in enumerate(row)))
+    return total
+
+def main():
+    import os
+    import sys
+    import time
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    reps = max(1, SAMPLES // rows)
+    text = make_csv(rows)
+    start = time.perf_counter_ns()
+    total = 0
+    for _ in range(reps):
+        total += checksum(*preprocess(text))
+    elapsed = time.perf_counter_ns() - start
+    print(total)
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""Large reductions (sum, min, max, 16-bin histogram) benchmark for Python (pure Python)"""
+
+BINS = 16
+BIN_WIDTH = 64
+
+def reduce_values(values) -> tuple:
+    total = 0
+    lo = None
+    hi = None
+    hist = [0] * BINS
+    for x in values:
+        total += x
+        if lo is None or x < lo:
+            lo = x
+        if hi is None or x > hi:
+            hi = x
+        hist[x // BIN_WIDTH] += 1
+    return total, lo, hi, hist
+
+def checksum(total: int, lo: int, hi: int, hist: list) -> int:
+    return total + lo + hi + sum((b + 1) * count for b, count in enumerate(hist))
+
+def main():
+    import os
+    import sys
+    import time
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    values = [(i * 7919) % 1000 for i in range(n)]
+    start = time.perf_counter_ns()
+    result = checksum(*reduce_values(values))
+    elapsed = time.perf_counter_ns() - start
+    print(result)
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Large reductions benchmark for Python: process pool over shared memory
+
+Usage: reduce_mp.py <n> [workers]
+The values live in one multiprocessing.shared_memory block; each worker reduces
+a slice with the pure-Python kernel from reduce.py and the parent combines the
+partial results. The pool is started before the timer, as a service would keep
+it warm.
+"""
+
+import os
+import sys
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from reduce import BINS, checksum, reduce_values  # noqa: E402
+
+_shm = None
+_values = None
+
+def _attach(name: str):
+    global _shm, _values
+    _shm = SharedMemory(name=name)
+    _values = _shm.buf.cast("q")
+
+def _reduce_slice(bounds: tuple) -> tuple:
+    lo, hi = bounds
+    return reduce_values(_values[lo:hi])
+
+def main():
+    import time
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    workers = max(1, int(sys.argv[2])) if len(sys.argv) > 2 else 1
+    shm = SharedMemory(create=True, size=max(8, n * 8))
+    try:
+        values = shm.buf.cast("q")
+        for i in range(n):
+            values[i] = (i * 7919) % 1000
+        slices = [(n * w // workers, n * (w + 1) // workers) for w in range(workers)]
+        with Pool(workers, initializer=_attach, initargs=(shm.name,)) as pool:
+            pool.map(int, range(workers))  # make sure every worker is up
+            start = time.perf_counter_ns()
+            partials = [p for p in pool.map(_reduce_slice, slices) if p[1] is not None]
+            total = sum(p[0] for p in partials)
+            lo = min(p[1] for p in partials)
+            hi = max(p[2] for p in partials)
+            hist = [sum(p[3][b] for p in partials) for b in range(BINS)]
+            result = checksum(total, lo, hi, hist)
+            elapsed = time.perf_counter_ns() - start
+        values.release()
+    finally:
+        shm.close()
+        shm.unlink()
+    print(result)
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -10,10 +10,16 @@ def sum_n(n: int) -> int:
     return result
 
 def main():
+    import os
     import sys
+    import time
     n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    start = time.perf_counter_ns()
     result = sum_n(n)
+    elapsed = time.perf_counter_ns() - start
     print(result)
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Vector operation benchmarks (dot, axpy, norm) for Python (pure Python lists)
+
+Usage: vector_ops.py <dot|axpy|norm> <n>
+Short vectors are repeated so every size performs about VECTOR_WORK element
+operations (see benches/harness/reference.py).
+"""
+
+import math
+
+VECTOR_WORK = 1 << 22
+ALPHA = 2.0
+
+def dot(x: list, y: list, reps: int) -> float:
+    total = 0.0
+    for _ in range(reps):
+        acc = 0.0
+        for i in range(len(x)):
+            acc += x[i] * y[i]
+        total += acc
+    return total
+
+def axpy(x: list, y: list, reps: int) -> float:
+    n = len(x)
+    for _ in range(reps):
+        for i in range(n):
+            y[i] += ALPHA * x[i]
+    return sum(y)
+
+def norm(x: list, reps: int) -> float:
+    total = 0.0
+    for _ in range(reps):
+        acc = 0.0
+        for i in range(len(x)):
+            acc += x[i] * x[i]
+        total += math.sqrt(acc)
+    return math.floor(total * 1000)
+
+def main():
+    import os
+    import sys
+    import time
+    op = sys.argv[1] if len(sys.argv) > 1 else "dot"
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 65536
+    reps = max(1, VECTOR_WORK // n)
+    x = [float(i % 7 + 1) for i in range(n)]
+    y = [float(i % 5 + 1) for i in range(n)]
+    start = time.perf_counter_ns()
+    if op == "dot":
+        result = dot(x, y, reps)
+    elif op == "axpy":
+        result = axpy(x, y, reps)
+    elif op == "norm":
+        result = norm(x, reps)
+    else:
+        sys.exit(f"unknown operation: {op}")
+    elapsed = time.perf_counter_ns() - start
+    print(int(result))
+    if os.environ.get("PAIN_BENCH_TIMING"):
+        print(f"bench-timing: execute_ns={elapsed}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
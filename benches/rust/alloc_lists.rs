@@ -0,0 +1,41 @@
+// List allocation churn benchmark for Rust
+//
+// Usage: alloc_lists <n>
+// Each of the 100 batches builds and drops n Vecs of 16 ints
+// (block[k] = b + i + k) and sums block[i % 16]; "batch <b>" follows each batch.
+
+use std::hint::black_box;
+
+const BATCHES: i64 = 100;
+
+fn churn(b: i64, count: i64) -> i64 {
+    let mut total = 0;
+    for i in 0..count {
+        let v = b + i;
+        let block = vec![
+            v, v + 1, v + 2, v + 3, v + 4, v + 5, v + 6, v + 7,
+            v + 8, v + 9, v + 10, v + 11, v + 12, v + 13, v + 14, v + 15,
+        ];
+        // Keep the allocation: without this LLVM folds the Vec away
+        total += black_box(&block)[(i % 16) as usize];
+    }
+    total
+}
+
+fn main() {
+    let n = std::env::args()
+        .nth(1)
+        .and_then(|s| s.parse().ok())
+        .unwrap_or(10000);
+    let start = std::time::Instant::now();
+    let mut total = 0;
+    for b in 0..BATCHES {
+        total += churn(b, n);
+        println!("batch {}", b);
+    }
+    let elapsed = start.elapsed();
+    println!("{}", total);
+    if std::env::var_os("PAIN_BENCH_TIMING").is_some() {
+        eprintln!("bench-timing: execute_ns={}", elapsed.as_nanos());
+    }
+}
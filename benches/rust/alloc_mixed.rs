@@ -0,0 +1,51 @@
+// Long-lived plus short-lived allocation benchmark for Rust
+//
+// Usage: alloc_mixed <depth>
+// A binary tree of the given depth lives for the whole run while each of the
+// 100 batches builds, counts and drops 16 trees of depth 8; "batch <b>"
+// follows each batch.
+
+const BATCHES: i64 = 100;
+const TREES: i64 = 16;
+const DEPTH: u32 = 8;
+
+struct Node {
+    left: Option<Box<Node>>,
+    right: Option<Box<Node>>,
+}
+
+fn make(depth: u32) -> Box<Node> {
+    if depth == 0 {
+        return Box::new(Node { left: None, right: None });
+    }
+    Box::new(Node { left: Some(make(depth - 1)), right: Some(make(depth - 1)) })
+}
+
+fn check(node: &Node) -> i64 {
+    match (&node.left, &node.right) {
+        (Some(left), Some(right)) => 1 + check(left) + check(right),
+        _ => 1,
+    }
+}
+
+fn main() {
+    let depth = std::env::args()
+        .nth(1)
+        .and_then(|s| s.parse().ok())
+        .unwrap_or(16);
+    let start = std::time::Instant::now();
+    let long_lived = make(depth);
+    let mut total = 0;
+    for b in 0..BATCHES {
+        for _ in 0..TREES {
+            total += check(&make(DEPTH));
+        }
+        println!("batch {}", b);
+    }
+    total += check(&long_lived);
+    let elapsed = start.elapsed();
+    println!("{}", total);
+    if std::env::var_os("PAIN_BENCH_TIMING").is_some() {
+        eprintln!("bench-timing: execute_ns={}", elapsed.as_nanos());
+    }
+}
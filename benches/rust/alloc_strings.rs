@@ -0,0 +1,37 @@
+// String concatenation churn benchmark for Rust
+//
+// Usage: alloc_strings <n>
+// Each of the 100 batches builds n Strings by appending (b + i + k).to_string()
+// for k = 0..15 and sums their lengths; "batch <b>" follows each batch.
+
+const BATCHES: i64 = 100;
+
+fn churn(b: i64, count: i64) -> i64 {
+    let mut total = 0;
+    for i in 0..count {
+        let mut s = String::new();
+        for k in 0..16 {
+            s = s + &(b + i + k).to_string();
+        }
+        total += s.len() as i64;
+    }
+    total
+}
+
+fn main() {
+    let n = std::env::args()
+        .nth(1)
+        .and_then(|s| s.parse().ok())
+        .unwrap_or(5000);
+    let start = std::time::Instant::now();
+    let mut total = 0;
+    for b in 0..BATCHES {
+        total += churn(b, n);
+        println!("batch {}", b);
+    }
+    let elapsed = start.elapsed();
+    println!("{}", total);
+    if std::env::var_os("PAIN_BENCH_TIMING").is_some() {
+        eprintln!("bench-timing: execute_ns={}", elapsed.as_nanos());
+    }
+}
@@ -0,0 +1,44 @@
+// Binary-tree allocation benchmark for Rust
+//
+// Usage: alloc_trees <depth>
+// Each of the 100 batches builds a complete binary tree of the given depth,
+// counts its nodes and drops it; "batch <b>" follows each batch.
+
+const BATCHES: i64 = 100;
+
+struct Node {
+    left: Option<Box<Node>>,
+    right: Option<Box<Node>>,
+}
+
+fn make(depth: u32) -> Box<Node> {
+    if depth == 0 {
+        return Box::new(Node { left: None, right: None });
+    }
+    Box::new(Node { left: Some(make(depth - 1)), right: Some(make(depth - 1)) })
+}
+
+fn check(node: &Node) -> i64 {
+    match (&node.left, &node.right) {
+        (Some(left), Some(right)) => 1 + check(left) + check(right),
+        _ => 1,
+    }
+}
+
+fn main() {
+    let depth = std::env::args()
+        .nth(1)
+        .and_then(|s| s.parse().ok())
+        .unwrap_or(12);
+    let start = std::time::Instant::now();
+    let mut total = 0;
+    for b in 0..BATCHES {
+        total += check(&make(depth));
+        println!("batch {}", b);
+    }
+    let elapsed = start.elapsed();
+    println!("{}", total);
+    if std::env::var_os("PAIN_BENCH_TIMING").is_some() {
+        eprintln!("bench-timing: execute_ns={}", elapsed.as_nanos());
+    }
+}
@@ -0,0 +1,136 @@
+// Call overhead and recursion depth benchmark for Rust
+//
+// Usage: calls <mode> <n>, modes as in harness/call_suite.py. Callees are
+// #[inline(never)] and contain a compiler fence, a side effect that emits no
+// code, so LLVM can neither inline nor drop or hoist a call. The direct
+// recursion passes its result through `opaque` so it can't become a loop.
+// Tail calls are left to the optimizer, which is the point; `opaque` on the
+// accumulator only stops it from folding the resulting loop into `n`.
+
+use std::hint::black_box;
+use std::sync::atomic::{compiler_fence, Ordering};
+
+/// A value LLVM can't see through. Unlike black_box it stays in a register,
+/// so it doesn't pin a stack slot that would block the tail call.
+#[inline(always)]
+fn opaque(mut value: i64) -> i64 {
+    unsafe { std::arch::asm!("/* {0} */", inout(reg) value, options(pure, nomem, nostack)) };
+    value
+}
+
+#[inline(never)]
+fn f0() -> i64 {
+    compiler_fence(Ordering::SeqCst);
+    1
+}
+
+#[inline(never)]
+fn f1(a0: i64) -> i64 {
+    compiler_fence(Ordering::SeqCst);
+    a0
+}
+
+#[inline(never)]
+fn f2(a0: i64, a1: i64) -> i64 {
+    compiler_fence(Ordering::SeqCst);
+    a0 + a1
+}
+
+#[inline(never)]
+fn f3(a0: i64, a1: i64, a2: i64) -> i64 {
+    compiler_fence(Ordering::SeqCst);
+    a0 + a1 + a2
+}
+
+#[inline(never)]
+fn f4(a0: i64, a1: i64, a2: i64, a3: i64) -> i64 {
+    compiler_fence(Ordering::SeqCst);
+    a0 + a1 + a2 + a3
+}
+
+#[inline(never)]
+fn f5(a0: i64, a1: i64, a2: i64, a3: i64, a4: i64) -> i64 {
+    compiler_fence(Ordering::SeqCst);
+    a0 + a1 + a2 + a3 + a4
+}
+
+#[inline(never)]
+fn f6(a0: i64, a1: i64, a2: i64, a3: i64, a4: i64, a5: i64) -> i64 {
+    compiler_fence(Ordering::SeqCst);
+    a0 + a1 + a2 + a3 + a4 + a5
+}
+
+#[inline(never)]
+fn f7(a0: i64, a1: i64, a2: i64, a3: i64, a4: i64, a5: i64, a6: i64) -> i64 {
+    compiler_fence(Ordering::SeqCst);
+    a0 + a1 + a2 + a3 + a4 + a5 + a6
+}
+
+#[inline(never)]
+fn f8(a0: i64, a1: i64, a2: i64, a3: i64, a4: i64, a5: i64, a6: i64, a7: i64) -> i64 {
+    compiler_fence(Ordering::SeqCst);
+    a0 + a1 + a2 + a3 + a4 + a5 + a6 + a7
+}
+
+struct Counter {
+    step: i64,
+}
+
+impl Counter {
+    #[inline(never)]
+    fn add(&self, x: i64) -> i64 {
+        compiler_fence(Ordering::SeqCst);
+        x + self.step
+    }
+}
+
+#[inline(never)]
+fn depth(n: i64) -> i64 {
+    if n == 0 {
+        return 0;
+    }
+    1 + opaque(depth(n - 1))
+}
+
+#[inline(never)]
+fn depth_tail(n: i64, acc: i64) -> i64 {
+    if n == 0 {
+        return acc;
+    }
+    depth_tail(n - 1, opaque(acc + 1))
+}
+
+fn run(mode: usize, n: i64) -> i64 {
+    let n = black_box(n);
+    let counter = Counter { step: black_box(1) };
+    let mut acc: i64 = 0;
+    match mode {
+        0 => (0..n).for_each(|i| acc = acc.wrapping_add(opaque(i))),
+        1 => (0..n).for_each(|_| acc = acc.wrapping_add(f0())),
+        2 => (0..n).for_each(|i| acc = acc.wrapping_add(f1(i))),
+        3 => (0..n).for_each(|i| acc = acc.wrapping_add(f2(i, i))),
+        4 => (0..n).for_each(|i| acc = acc.wrapping_add(f3(i, i, i))),
+        5 => (0..n).for_each(|i| acc = acc.wrapping_add(f4(i, i, i, i))),
+        6 => (0..n).for_each(|i| acc = acc.wrapping_add(f5(i, i, i, i, i))),
+        7 => (0..n).for_each(|i| acc = acc.wrapping_add(f6(i, i, i, i, i, i))),
+        8 => (0..n).for_each(|i| acc = acc.wrapping_add(f7(i, i, i, i, i, i, i))),
+        9 => (0..n).for_each(|i| acc = acc.wrapping_add(f8(i, i, i, i, i, i, i, i))),
+        10 => (0..n).for_each(|i| acc = acc.wrapping_add(counter.add(i))),
+        11 => acc = depth(n),
+        _ => acc = depth_tail(n, 0),
+    }
+    acc
+}
+
+fn main() {
+    let mut args = std::env::args().skip(1);
+    let mode: usize = args.next().and_then(|s| s.parse().ok()).unwrap_or(0);
+    let n: i64 = args.next().and_then(|s| s.parse().ok()).unwrap_or(1000);
+    let start = std::time::Instant::now();
+    let result = run(mode, n);
+    let elapsed = start.elapsed();
+    println!("{}", result);
+    if std::env::var_os("PAIN_BENCH_TIMING").is_some() {
+        eprintln!("bench-timing: execute_ns={}", elapsed.as_nanos());
+    }
+}
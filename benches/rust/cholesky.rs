@@ -0,0 +1,67 @@
+// Cholesky factorization and solve benchmark for Rust (flat row-major Vec<f64>)
+
+fn make_system(n: usize) -> (Vec<f64>, Vec<f64>) {
+    let mut s = vec![0.0; n * n];
+    for i in 0..n {
+        for j in 0..n {
+            s[i * n + j] = ((i + j) % 5 + 1) as f64;
+        }
+        s[i * n + i] = 5.0 * n as f64;
+    }
+    // Right-hand side S @ ones, so the exact solution is all ones
+    let b = (0..n).map(|i| s[i * n..(i + 1) * n].iter().sum()).collect();
+    (s, b)
+}
+
+fn cholesky_solve(s: &[f64], b: &[f64], n: usize) -> Vec<f64> {
+    // Factor S = L L^T in place (lower triangle)
+    let mut l = s.to_vec();
+    for j in 0..n {
+        let mut acc = l[j * n + j];
+        for k in 0..j {
+            acc -= l[j * n + k] * l[j * n + k];
+        }
+        let d = acc.sqrt();
+        l[j * n + j] = d;
+        for i in (j + 1)..n {
+            let mut acc = l[i * n + j];
+            for k in 0..j {
+                acc -= l[i * n + k] * l[j * n + k];
+            }
+            l[i * n + j] = acc / d;
+        }
+    }
+    // Forward substitution L z = b, then back substitution L^T x = z
+    let mut z = vec![0.0; n];
+    for i in 0..n {
+        let mut acc = b[i];
+        for k in 0..i {
+            acc -= l[i * n + k] * z[k];
+        }
+        z[i] = acc / l[i * n + i];
+    }
+    let mut x = vec![0.0; n];
+    for i in (0..n).rev() {
+        let mut acc = z[i];
+        for k in (i + 1)..n {
+            acc -= l[k * n + i] * x[k];
+        }
+        x[i] = acc / l[i * n + i];
+    }
+    x
+}
+
+fn main() {
+    let n = std::env::args()
+        .nth(1)
+        .and_then(|s| s.parse().ok())
+        .unwrap_or(64);
+    let (s, b) = make_system(n);
+    let start = std::time::Instant::now();
+    let x = cholesky_solve(std::hint::black_box(&s), std::hint::black_box(&b), n);
+    let elapsed = start.elapsed();
+    println!("{}", (x.iter().sum::<f64>() * 1000000.0).round() as i64);
+    if std::env::var_os("PAIN_BENCH_TIMING").is_some() {
+        eprintln!("bench-timing: execute_ns={}", elapsed.as_nanos());
+    }
+}
@@ -0,0 +1,5 @@
+// Empty program for Rust: measures process startup only
+
+fn main() {
+    println!("0");
+}
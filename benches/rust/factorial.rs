@@ -12,7 +12,12 @@ fn main() {
         .nth(1)
         .and_then(|s| s.parse().ok())
         .unwrap_or(15);
+    let start = std::time::Instant::now();
     let result = fact(n);
+    let elapsed = start.elapsed();
     println!("{}", result);
+    if std::env::var_os("PAIN_BENCH_TIMING").is_some() {
+        eprintln!("bench-timing: execute_ns={}", elapsed.as_nanos());
+    }
 }
 
@@ -0,0 +1,26 @@
+// Tail-recursive factorial benchmark for Rust
+
+fn fact_tail(n: i64, acc: i64) -> i64 {
+    if n <= 1 {
+        return acc;
+    }
+    fact_tail(n - 1, n * acc)
+}
+
+fn fact(n: i64) -> i64 {
+    fact_tail(n, 1)
+}
+
+fn main() {
+    let n = std::env::args()
+        .nth(1)
+        .and_then(|s| s.parse().ok())
+        .unwrap_or(15);
+    let start = std::time::Instant::now();
+    let result = fact(n);
+    let elapsed = start.elapsed();
+    println!("{}", result);
+    if std::env::var_os("PAIN_BENCH_TIMING").is_some() {
+        eprintln!("bench-timing: execute_ns={}", elapsed.as_nanos());
+    }
+}
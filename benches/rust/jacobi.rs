@@ -0,0 +1,58 @@
+// 2D Jacobi heat stencil benchmark for Rust, rows split across threads each step
+//
+// Usage: jacobi <n> [workers]
+// n x n grid, top edge held at 100, other edges at 0, STEPS sweeps of
+// u'[i][j] = (up + down + left + right) * 0.25.
+
+const STEPS: usize = 50;
+
+fn sweep_rows(src: &[f64], dst: &mut [f64], n: usize, first_row: usize) {
+    for (r, row) in dst.chunks_mut(n).enumerate() {
+        let i = first_row + r;
+        for j in 1..n - 1 {
+            row[j] = (src[(i - 1) * n + j] + src[(i + 1) * n + j]
+                + src[i * n + j - 1] + src[i * n + j + 1]) * 0.25;
+        }
+    }
+}
+
+fn jacobi(n: usize, workers: usize) -> Vec<f64> {
+    let mut a = vec![0.0; n * n];
+    for j in 0..n {
+        a[j] = 100.0;
+    }
+    let mut b = a.clone();
+    let interior = n - 2;
+    for _ in 0..STEPS {
+        std::thread::scope(|scope| {
+            // Hand each worker a disjoint block of interior rows of the destination
+            let mut rest = &mut b[n..(n - 1) * n];
+            let mut row = 1;
+            for w in 0..workers {
+                let hi = 1 + interior * (w + 1) / workers;
+                let (block, tail) = rest.split_at_mut((hi - row) * n);
+                rest = tail;
+                let src = &a;
+                let first_row = row;
+                scope.spawn(move || sweep_rows(src, block, n, first_row));
+                row = hi;
+            }
+        });
+        std::mem::swap(&mut a, &mut b);
+    }
+    a
+}
+
+fn main() {
+    let mut args = std::env::args().skip(1);
+    let n: usize = args.next().and_then(|s| s.parse().ok()).unwrap_or(128);
+    let workers: usize = args.next().and_then(|s| s.parse().ok()).unwrap_or(1).max(1);
+    let start = std::time::Instant::now();
+    let grid = jacobi(n, workers);
+    let elapsed = start.elapsed();
+    let total: f64 = grid.iter().sum();
+    println!("{}", (total * 1000.0 + 0.5).floor() as i64);
+    if std::env::var_os("PAIN_BENCH_TIMING").is_some() {
+        eprintln!("bench-timing: execute_ns={}", elapsed.as_nanos());
+    }
+}
@@ -0,0 +1,43 @@
+// Dense matrix multiplication benchmark for Rust (flat row-major Vec<f64>, i-k-j loop order)
+
+fn make_matrices(n: usize) -> (Vec<f64>, Vec<f64>) {
+    let mut a = vec![0.0; n * n];
+    let mut b = vec![0.0; n * n];
+    for i in 0..n {
+        for j in 0..n {
+            a[i * n + j] = ((i + j) % 7 + 1) as f64;
+            b[i * n + j] = ((i + j) % 5 + 1) as f64;
+        }
+    }
+    (a, b)
+}
+
+fn matmul(a: &[f64], b: &[f64], n: usize) -> Vec<f64> {
+    let mut c = vec![0.0; n * n];
+    for i in 0..n {
+        let row = &mut c[i * n..(i + 1) * n];
+        for k in 0..n {
+            let aik = a[i * n + k];
+            let col = &b[k * n..(k + 1) * n];
+            for j in 0..n {
+                row[j] += aik * col[j];
+            }
+        }
+    }
+    c
+}
+
+fn main() {
+    let n = std::env::args()
+        .nth(1)
+        .and_then(|s| s.parse().ok())
+        .unwrap_or(64);
+    let (a, b) = make_matrices(n);
+    let start = std::time::Instant::now();
+    let c = matmul(std::hint::black_box(&a), std::hint::black_box(&b), n);
+    let elapsed = start.elapsed();
+    println!("{}", c.iter().sum::<f64>() as i64);
+    if std::env::var_os("PAIN_BENCH_TIMING").is_some() {
+        eprintln!("bench-timing: execute_ns={}", elapsed.as_nanos());
+    }
+}
@@ -0,0 +1,141 @@
+// MLP benchmarks (forward pass, backprop step) for Rust
+//
+// Usage: mlp <forward|backward> <batch>
+// A 16 -> 32 (ReLU) -> 4 network applied layer by layer to the whole batch
+// (row-major activations). Each run processes SAMPLES samples as
+// max(1, SAMPLES / batch) batches; black_box keeps them from being folded.
+
+use std::hint::black_box;
+
+const SAMPLES: usize = 4096;
+const IN: usize = 16;
+const HIDDEN: usize = 32;
+const OUT: usize = 4;
+
+struct Params {
+    w1: Vec<f64>,
+    b1: Vec<f64>,
+    w2: Vec<f64>,
+    b2: Vec<f64>,
+}
+
+fn make_params() -> Params {
+    let m = |v: usize, modulus: usize, offset: f64| (v % modulus) as f64 - offset;
+    Params {
+        w1: (0..IN * HIDDEN).map(|p| m((p / HIDDEN) * 3 + (p % HIDDEN) * 5, 7, 3.0) / 8.0).collect(),
+        b1: (0..HIDDEN).map(|j| m(j * 5, 9, 4.0) / 8.0).collect(),
+        w2: (0..HIDDEN * OUT).map(|p| m((p / OUT) * 2 + (p % OUT) * 3, 5, 2.0) / 8.0).collect(),
+        b2: (0..OUT).map(|k| (k as f64 - 1.0) / 4.0).collect(),
+    }
+}
+
+// z1 = x W1 + b1 and h = relu(z1) for every sample in the batch
+fn hidden(x: &[f64], p: &Params, z1: &mut [f64], h: &mut [f64]) {
+    let batch = x.len() / IN;
+    for b in 0..batch {
+        let z = &mut z1[b * HIDDEN..(b + 1) * HIDDEN];
+        z.copy_from_slice(&p.b1);
+        for i in 0..IN {
+            let xi = x[b * IN + i];
+            let w = &p.w1[i * HIDDEN..(i + 1) * HIDDEN];
+            for j in 0..HIDDEN {
+                z[j] += xi * w[j];
+            }
+        }
+        for j in 0..HIDDEN {
+            h[b * HIDDEN + j] = z[j].max(0.0);
+        }
+    }
+}
+
+// out = h W2 + b2
+fn output(h: &[f64], p: &Params, out: &mut [f64]) {
+    let batch = h.len() / HIDDEN;
+    for b in 0..batch {
+        let o = &mut out[b * OUT..(b + 1) * OUT];
+        o.copy_from_slice(&p.b2);
+        for j in 0..HIDDEN {
+            let hj = h[b * HIDDEN + j];
+            for k in 0..OUT {
+                o[k] += hj * p.w2[j * OUT + k];
+            }
+        }
+    }
+}
+
+fn forward(x: &[f64], p: &Params, z1: &mut [f64], h: &mut [f64], out: &mut [f64]) -> f64 {
+    hidden(x, p, z1, h);
+    output(h, p, out);
+    out.iter().sum()
+}
+
+fn backward(x: &[f64], y: &[f64], p: &Params, z1: &mut [f64], h: &mut [f64], out: &mut [f64]) -> f64 {
+    hidden(x, p, z1, h);
+    output(h, p, out);
+    let batch = x.len() / IN;
+    let mut dw1 = vec![0.0; IN * HIDDEN];
+    let mut db1 = vec![0.0; HIDDEN];
+    let mut dw2 = vec![0.0; HIDDEN * OUT];
+    let mut db2 = vec![0.0; OUT];
+    let mut dz = [0.0; HIDDEN];
+    for b in 0..batch {
+        let mut dout = [0.0; OUT];
+        for k in 0..OUT {
+            dout[k] = out[b * OUT + k] - y[b * OUT + k];
+            db2[k] += dout[k];
+        }
+        for j in 0..HIDDEN {
+            let hj = h[b * HIDDEN + j];
+            let mut acc = 0.0;
+            for k in 0..OUT {
+                dw2[j * OUT + k] += hj * dout[k];
+                acc += dout[k] * p.w2[j * OUT + k];
+            }
+            dz[j] = if z1[b * HIDDEN + j] > 0.0 { acc } else { 0.0 };
+            db1[j] += dz[j];
+        }
+        for i in 0..IN {
+            let xi = x[b * IN + i];
+            for j in 0..HIDDEN {
+                dw1[i * HIDDEN + j] += xi * dz[j];
+            }
+        }
+    }
+    dw1.iter().sum::<f64>() + db1.iter().sum::<f64>() + dw2.iter().sum::<f64>() + db2.iter().sum::<f64>()
+}
+
+fn main() {
+    let mut args = std::env::args().skip(1);
+    let mode = args.next().unwrap_or_else(|| "forward".to_string());
+    let batch: usize = args.next().and_then(|s| s.parse().ok()).unwrap_or(64);
+    let reps = std::cmp::max(1, SAMPLES / batch);
+    let params = make_params();
+    let x: Vec<f64> = (0..batch * IN).map(|p| ((((p / IN) * 7 + (p % IN) * 3) % 11) as f64 - 5.0) / 4.0).collect();
+    let y: Vec<f64> = (0..batch * OUT).map(|p| ((p / OUT + p % OUT) % 3) as f64 - 1.0).collect();
+    let (mut z1, mut h, mut out) = (vec![0.0; batch * HIDDEN], vec![0.0; batch * HIDDEN], vec![0.0; batch * OUT]);
+    let start = std::time::Instant::now();
+    let mut total = 0.0;
+    let scale = match mode.as_str() {
+        "forward" => {
+            for _ in 0..reps {
+                total += forward(black_box(&x), &params, &mut z1, &mut h, &mut out);
+            }
+            256.0
+        }
+        "backward" => {
+            for _ in 0..reps {
+                total += backward(black_box(&x), &y, &params, &mut z1, &mut h, &mut out);
+            }
+            8192.0
+        }
+        _ => {
+            eprintln!("unknown mode: {}", mode);
+            std::process::exit(1);
+        }
+    };
+    let elapsed = start.elapsed();
+    println!("{}", (total * scale) as i64);
+    if std::env::var_os("PAIN_BENCH_TIMING").is_some() {
+        eprintln!("bench-timing: execute_ns={}", elapsed.as_nanos());
+    }
+}
@@ -0,0 +1,75 @@
+// All-pairs gravitational n-body benchmark for Rust, bodies split across threads each step
+//
+// Usage: nbody <n> [workers]
+// Body i starts at (i % 7 - 3, i % 11 - 5, i % 13 - 6) at rest with mass 1/n;
+// STEPS symplectic Euler steps with softening EPS2. The checksum is the sum of
+// squared distances from the origin (the centre of mass itself never moves).
+
+const STEPS: usize = 10;
+const DT: f64 = 0.01;
+const EPS2: f64 = 0.01;
+
+fn accelerate(x: &[f64], y: &[f64], z: &[f64], mass: f64, lo: usize, acc: &mut [[f64; 3]]) {
+    for (k, a) in acc.iter_mut().enumerate() {
+        let i = lo + k;
+        let (mut ax, mut ay, mut az) = (0.0, 0.0, 0.0);
+        for j in 0..x.len() {
+            let dx = x[j] - x[i];
+            let dy = y[j] - y[i];
+            let dz = z[j] - z[i];
+            let d2 = dx * dx + dy * dy + dz * dz + EPS2;
+            let s = mass / (d2 * d2.sqrt());
+            ax += dx * s;
+            ay += dy * s;
+            az += dz * s;
+        }
+        *a = [ax, ay, az];
+    }
+}
+
+fn main() {
+    let mut args = std::env::args().skip(1);
+    let n: usize = args.next().and_then(|s| s.parse().ok()).unwrap_or(256);
+    let workers: usize = args.next().and_then(|s| s.parse().ok()).unwrap_or(1).max(1);
+    let mut x: Vec<f64> = (0..n).map(|i| (i % 7) as f64 - 3.0).collect();
+    let mut y: Vec<f64> = (0..n).map(|i| (i % 11) as f64 - 5.0).collect();
+    let mut z: Vec<f64> = (0..n).map(|i| (i % 13) as f64 - 6.0).collect();
+    let mut v = vec![[0.0f64; 3]; n];
+    let mut acc = vec![[0.0f64; 3]; n];
+    let mass = 1.0 / n as f64;
+
+    let start = std::time::Instant::now();
+    for _ in 0..STEPS {
+        std::thread::scope(|scope| {
+            let mut rest = &mut acc[..];
+            let mut lo = 0;
+            for w in 0..workers {
+                let hi = n * (w + 1) / workers;
+                let (block, tail) = rest.split_at_mut(hi - lo);
+                rest = tail;
+                let (x, y, z) = (&x, &y, &z);
+                let first = lo;
+                scope.spawn(move || accelerate(x, y, z, mass, first, block));
+                lo = hi;
+            }
+        });
+        for i in 0..n {
+            for d in 0..3 {
+                v[i][d] += acc[i][d] * DT;
+            }
+            x[i] += v[i][0] * DT;
+            y[i] += v[i][1] * DT;
+            z[i] += v[i][2] * DT;
+        }
+    }
+    let elapsed = start.elapsed();
+
+    let mut total = 0.0;
+    for i in 0..n {
+        total += x[i] * x[i] + y[i] * y[i] + z[i] * z[i];
+    }
+    println!("{}", (total * 1000000.0 + 0.5).floor() as i64);
+    if std::env::var_os("PAIN_BENCH_TIMING").is_some() {
+        eprintln!("bench-timing: execute_ns={}", elapsed.as_nanos());
+    }
+}
@@ -0,0 +1,80 @@
+// CSV preprocessing benchmark (parse, min-max normalize, one-hot) for Rust
+//
+// Usage: preprocess <rows>
+// The CSV text (id,age,income,segment) is generated up front; each of the
+// max(1, SAMPLES / rows) repetitions parses it, normalizes age and income to
+// [0, 1] and one-hot encodes the segment. The checksum adds floor(1000 * each
+// normalized value) and the 1-based index of each hot column.
+
+use std::hint::black_box;
+
+const SAMPLES: usize = 4096;
+const SEGMENTS: [&str; 5] = ["north", "south", "east", "west", "central"];
+
+fn make_csv(rows: usize) -> String {
+    let mut text = String::from("id,age,income,segment\n");
+    for i in 0..rows {
+        text += &format!(
+            "{},{},{}.{},{}\n",
+            i,
+            18 + (i * 37) % 60,
+            (i * 7919) % 100000,
+            (i * 31) % 10,
+            SEGMENTS[(i * 3) % 5]
+        );
+    }
+    text
+}
+
+fn normalize(values: &mut [f64]) {
+    let lo = values.iter().cloned().fold(f64::INFINITY, f64::min);
+    let hi = values.iter().cloned().fold(f64::NEG_INFINITY, f64::max);
+    for v in values.iter_mut() {
+        *v = if hi == lo { 0.0 } else { (*v - lo) / (hi - lo) };
+    }
+}
+
+fn preprocess(text: &str) -> i64 {
+    let mut ages = Vec::new();
+    let mut incomes = Vec::new();
+    let mut codes = Vec::new();
+    for line in text.lines().skip(1) {
+        let mut fields = line.split(',');
+        let _id = fields.next();
+        ages.push(fields.next().unwrap().parse::<f64>().unwrap());
+        incomes.push(fields.next().unwrap().parse::<f64>().unwrap());
+        let segment = fields.next().unwrap();
+        codes.push(SEGMENTS.iter().position(|&s| s == segment).unwrap());
+    }
+    normalize(&mut ages);
+    normalize(&mut incomes);
+    let mut one_hot = vec![0.0; codes.len() * SEGMENTS.len()];
+    for (row, &code) in codes.iter().enumerate() {
+        one_hot[row * SEGMENTS.len() + code] = 1.0;
+    }
+
+    let mut total: i64 = 0;
+    for (&age, &income) in ages.iter().zip(&incomes) {
+        total += (age * 1000.0).floor() as i64 + (income * 1000.0).floor() as i64;
+    }
+    for row in one_hot.chunks(SEGMENTS.len()) {
+        total += row.iter().enumerate().map(|(k, hot)| (k + 1) as f64 * hot).sum::<f64>() as i64;
+    }
+    total
+}
+
+fn main() {
+    let rows: usize = std::env::args().nth(1).and_then(|s| s.parse().ok()).unwrap_or(64);
+    let reps = std::cmp::max(1, SAMPLES / rows);
+    let text = make_csv(rows);
+    let start = std::time::Instant::now();
+    let mut total: i64 = 0;
+    for _ in 0..reps {
+        total += preprocess(black_box(&text));
+    }
+    let elapsed = start.elapsed();
+    println!("{}", total);
+    if std::env::var_os("PAIN_BENCH_TIMING").is_some() {
+        eprintln!("bench-timing: execute_ns={}", elapsed.as_nanos());
+    }
+}
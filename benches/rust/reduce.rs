@@ -0,0 +1,73 @@
+// Large reductions (sum, min, max, 16-bin histogram) benchmark for Rust, split across threads
+//
+// Usage: reduce <n> [workers]
+// v[i] = (i * 7919) % 1000; the checksum combines all four results.
+
+const BINS: usize = 16;
+const BIN_WIDTH: i64 = 64;
+
+#[derive(Clone, Copy)]
+struct Partial {
+    sum: i64,
+    min: i64,
+    max: i64,
+    hist: [i64; BINS],
+}
+
+impl Partial {
+    fn new() -> Self {
+        Partial { sum: 0, min: i64::MAX, max: i64::MIN, hist: [0; BINS] }
+    }
+}
+
+fn reduce_range(v: &[i64]) -> Partial {
+    let mut p = Partial::new();
+    for &x in v {
+        p.sum += x;
+        p.min = p.min.min(x);
+        p.max = p.max.max(x);
+        p.hist[(x / BIN_WIDTH) as usize] += 1;
+    }
+    p
+}
+
+fn reduce(v: &[i64], workers: usize) -> i64 {
+    let n = v.len();
+    let partials: Vec<Partial> = std::thread::scope(|scope| {
+        let handles: Vec<_> = (0..workers)
+            .map(|w| {
+                let chunk = &v[n * w / workers..n * (w + 1) / workers];
+                scope.spawn(move || reduce_range(chunk))
+            })
+            .collect();
+        handles.into_iter().map(|h| h.join().unwrap()).collect()
+    });
+    let mut total = Partial::new();
+    for p in &partials {
+        total.sum += p.sum;
+        total.min = total.min.min(p.min);
+        total.max = total.max.max(p.max);
+        for b in 0..BINS {
+            total.hist[b] += p.hist[b];
+        }
+    }
+    let mut checksum = total.sum + total.min + total.max;
+    for b in 0..BINS {
+        checksum += (b as i64 + 1) * total.hist[b];
+    }
+    checksum
+}
+
+fn main() {
+    let mut args = std::env::args().skip(1);
+    let n: usize = args.next().and_then(|s| s.parse().ok()).unwrap_or(1000000);
+    let workers: usize = args.next().and_then(|s| s.parse().ok()).unwrap_or(1).max(1);
+    let v: Vec<i64> = (0..n).map(|i| ((i * 7919) % 1000) as i64).collect();
+    let start = std::time::Instant::now();
+    let result = reduce(std::hint::black_box(&v), workers);
+    let elapsed = start.elapsed();
+    println!("{}", result);
+    if std::env::var_os("PAIN_BENCH_TIMING").is_some() {
+        eprintln!("bench-timing: execute_ns={}", elapsed.as_nanos());
+    }
+}
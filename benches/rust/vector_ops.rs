@@ -0,0 +1,70 @@
+// Vector operation benchmarks (dot, axpy, norm) for Rust
+//
+// Usage: vector_ops <dot|axpy|norm> <n>
+// Short vectors are repeated so every size performs about VECTOR_WORK element
+// operations; black_box keeps the repetitions from being folded together.
+
+use std::hint::black_box;
+
+const VECTOR_WORK: usize = 1 << 22;
+const ALPHA: f64 = 2.0;
+
+fn dot(x: &[f64], y: &[f64], reps: usize) -> f64 {
+    let mut total = 0.0;
+    for _ in 0..reps {
+        let (x, y) = (black_box(x), black_box(y));
+        let mut acc = 0.0;
+        for i in 0..x.len() {
+            acc += x[i] * y[i];
+        }
+        total += acc;
+    }
+    total
+}
+
+fn axpy(x: &[f64], y: &mut [f64], reps: usize) -> f64 {
+    for _ in 0..reps {
+        let x = black_box(x);
+        for (yi, xi) in y.iter_mut().zip(x) {
+            *yi += ALPHA * xi;
+        }
+    }
+    y.iter().sum()
+}
+
+fn norm(x: &[f64], reps: usize) -> f64 {
+    let mut total = 0.0;
+    for _ in 0..reps {
+        let x = black_box(x);
+        let mut acc = 0.0;
+        for i in 0..x.len() {
+            acc += x[i] * x[i];
+        }
+        total += acc.sqrt();
+    }
+    (total * 1000.0).floor()
+}
+
+fn main() {
+    let mut args = std::env::args().skip(1);
+    let op = args.next().unwrap_or_else(|| "dot".to_string());
+    let n: usize = args.next().and_then(|s| s.parse().ok()).unwrap_or(65536);
+    let reps = std::cmp::max(1, VECTOR_WORK / n);
+    let x: Vec<f64> = (0..n).map(|i| (i % 7 + 1) as f64).collect();
+    let mut y: Vec<f64> = (0..n).map(|i| (i % 5 + 1) as f64).collect();
+    let start = std::time::Instant::now();
+    let result = match op.as_str() {
+        "dot" => dot(&x, &y, reps),
+        "axpy" => axpy(&x, &mut y, reps),
+        "norm" => norm(&x, reps),
+        _ => {
+            eprintln!("unknown operation: {}", op);
+            std::process::exit(1);
+        }
+    };
+    let elapsed = start.elapsed();
+    println!("{}", result as i64);
+    if std::env::var_os("PAIN_BENCH_TIMING").is_some() {
+        eprintln!("bench-timing: execute_ns={}", elapsed.as_nanos());
+    }
+}
@@ -4,13 +4,34 @@ Convert PNG icons to ICO (Windows) and ICNS (macOS) formats.
 
 This script reads PNG icons from the module-specific linux/ folders and
 generates ready-to-use binaries for both pain-compiler and pain-lsp.
+
+Runs are incremental: a manifest under target/icons/ records a hash of each
+icon set's source PNGs and settings together with the outputs written, and an
+unchanged set whose outputs are intact is skipped. Sources are only decoded
+when a size is actually built, and the sizes of every set that does need
+rebuilding are rendered in parallel in a process pool.
+
+ICNS files are assembled in memory from PNG elements, so they are produced on
+any platform without iconutil. A source PNG whose size matches an ICNS slot
+exactly is embedded as-is, without decoding or re-encoding it.
+
+Every ICO and ICNS is read back with Pillow before it is written, and a file
+that is missing a size or has an entry that won't decode is an error.
 """
 
+import argparse
+import hashlib
+import io
+import json
+import os
+import struct
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 try:
-    from PIL import Image
+    from PIL import IcnsImagePlugin, Image
 except ImportError:
     print("Error: PIL (Pillow) is required. Install it with: pip install Pillow")
     sys.exit(1)
@@ -21,14 +42,30 @@ ICO_SIZES = [16, 32, 48, 64, 128, 256]
 # Icon sizes for ICNS (macOS) - ICNS format requires specific sizes
 ICNS_SIZES = [16, 32, 64, 128, 256, 512, 1024]
 
+# PNG element types of the ICNS container per pixel size; retina variants
+# (e.g. ic11 = 16x16@2x) share the bytes of the same-sized plain entry
+ICNS_TYPES = {
+    16: [b"icp4"],
+    32: [b"icp5", b"ic11"],
+    64: [b"icp6", b"ic12"],
+    128: [b"ic07"],
+    256: [b"ic08", b"ic13"],
+    512: [b"ic09", b"ic14"],
+    1024: [b"ic10"],
+}
+
 try:
     RESAMPLE = Image.Resampling.LANCZOS  # Pillow >= 10
 except AttributeError:
     RESAMPLE = Image.LANCZOS  # Pillow < 10
 
+# Bump when a change here alters the generated files, so every set is rebuilt
+PIPELINE_VERSION = 2
 
+
+@lru_cache(maxsize=None)
 def _load_image(path: Path):
-    """Load PNG as RGBA/RGB to keep Windows happy."""
+    """Load PNG as RGBA/RGB to keep Windows happy (decoded once per process)."""
     with Image.open(path) as img:
         if img.mode not in ("RGBA", "RGB"):
             img = img.convert("RGBA" if img.mode in ("LA", "P") else "RGB")
@@ -38,7 +75,7 @@ def _load_image(path: Path):
 
 
 def _collect_sources(png_dir: Path, base_name: str):
-    """Return dict[size] = Image for every available PNG."""
+    """Return dict[size] = Path for every available PNG, without decoding any."""
     sources = {}
     for path in png_dir.glob(f"{base_name}_*x*.png"):
         size_tag = path.stem.rsplit("_", 1)[-1]
@@ -50,139 +87,256 @@ def _collect_sources(png_dir: Path, base_name: str):
             continue
         if width != height:
             continue
-        sources[width] = _load_image(path)
+        sources[width] = path
     fallback = png_dir / f"{base_name}.png"
     if fallback.exists():
-        img = _load_image(fallback)
-        sources[max(img.size)] = img
+        with Image.open(fallback) as img:  # reads the header only
+            sources[max(img.size)] = fallback
     return sources
 
 
-def create_ico_from_pngs(png_dir: Path, output_path: Path, base_name: str):
-    """Create ICO file from multiple PNG sizes."""
-    print(f"  Looking for PNG files in: {png_dir}")
-    print(f"  Base name: {base_name}")
-    source_images = _collect_sources(png_dir, base_name)
-    if not source_images:
-        print(f"ERROR: No PNG files found for {base_name} in {png_dir}")
-        print(f"  Expected pattern: {base_name}_*x*.png or {base_name}.png")
-        if png_dir.exists():
-            print(f"  Directory exists. Contents:")
-            for item in png_dir.iterdir():
-                print(f"    - {item.name}")
-        else:
-            print(f"  Directory does not exist!")
-        return False
-    print(f"  Found {len(source_images)} PNG source(s): {sorted(source_images.keys())}")
-    entries = []
-    sorted_sizes = sorted(source_images)
+def _report_missing_sources(png_dir: Path, base_name: str):
+    print(f"ERROR: No PNG files found for {base_name} in {png_dir}")
+    print(f"  Expected pattern: {base_name}_*x*.png or {base_name}.png")
+    if png_dir.exists():
+        print(f"  Directory exists. Contents:")
+        for item in png_dir.iterdir():
+            print(f"    - {item.name}")
+    else:
+        print(f"  Directory does not exist!")
+
+
+def _plan_sizes(sources, sizes):
+    """(size, source size) for every output size: an exact match, else the next larger source."""
+    sorted_sizes = sorted(sources)
     largest = sorted_sizes[-1]
-    for size in ICO_SIZES:
-        if size in source_images:
-            img = source_images[size]
+    plan = []
+    for size in sizes:
+        if size in sources:
+            plan.append((size, size))
         else:
-            larger = next((s for s in sorted_sizes if s > size), largest)
-            base_img = source_images[larger]
-            img = base_img.resize((size, size), RESAMPLE)
-            print(f"Info: {base_name} lacks {size}x{size}, resized from {larger}x{larger}")
-        if img.width != size or img.height != size:
-            img = img.resize((size, size), RESAMPLE)
-        entries.append((size, img))
-    entries.sort(key=lambda item: item[0], reverse=True)
-    ordered_images = [img for _, img in entries]
+            plan.append((size, next((s for s in sorted_sizes if s > size), largest)))
+    return plan
+
+
+def _render_size(size: int, source: Path):
+    """Pool task: decode a source and resize it to size x size if needed."""
+    img = _load_image(source)
+    if img.width != size or img.height != size:
+        img = img.resize((size, size), RESAMPLE)
+    return img
+
+
+def _png_entry(size: int, source: Path):
+    """Pool task: PNG bytes for one ICNS size, the source file itself when it already matches."""
+    data = source.read_bytes()
+    with Image.open(io.BytesIO(data)) as img:  # header only
+        if img.format == "PNG" and img.size == (size, size):
+            return data
+    buffer = io.BytesIO()
+    _render_size(size, source).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _encode_icns(entries):
+    """ICNS container for dict[size] = PNG bytes: a header, then one typed element per slot."""
+    elements = b"".join(
+        icns_type + struct.pack(">I", 8 + len(entries[size])) + entries[size]
+        for size in sorted(entries)
+        for icns_type in ICNS_TYPES[size]
+    )
+    return b"icns" + struct.pack(">I", 8 + len(elements)) + elements
+
+
+def _encode_ico(images):
+    """ICO bytes holding every image, largest first; (bytes, all sizes written)."""
+    ordered_images = sorted(images, key=lambda img: img.width, reverse=True)
+    buffer = io.BytesIO()
     try:
         if len(ordered_images) == 1:
-            ordered_images[0].save(output_path, format='ICO')
+            ordered_images[0].save(buffer, format='ICO')
         else:
             ordered_images[0].save(
-                output_path,
+                buffer,
                 format='ICO',
                 sizes=[(img.width, img.height) for img in ordered_images],
                 append_images=ordered_images[1:]
             )
-        print(
-            f"[OK] Created {output_path} with {len(ordered_images)} sizes: "
-            f"{[f'{img.width}x{img.height}' for img in ordered_images]}"
-        )
-        return True
+        return buffer.getvalue(), True
     except Exception as e:
         print(f"Error creating ICO: {e}")
-        ordered_images[0].save(output_path, format='ICO')
-        print(f"[WARN] Created {output_path} with only first size due to error")
-        return False
-
+        buffer = io.BytesIO()
+        ordered_images[0].save(buffer, format='ICO')
+        return buffer.getvalue(), False
+
+
+def _missing_ico_sizes(data):
+    """ICO_SIZES that ICO bytes don't hold as a decodable square image."""
+    missing = []
+    with Image.open(io.BytesIO(data)) as img:
+        available = img.info.get("sizes", set())
+        for size in ICO_SIZES:
+            if (size, size) not in available:
+                missing.append(size)
+                continue
+            img.size = (size, size)
+            img.load()
+            if img.size != (size, size):
+                missing.append(size)
+    return missing
+
+
+def _missing_icns_sizes(data):
+    """ICNS_SIZES that ICNS bytes don't hold as a decodable element."""
+    found = set()
+    icns = IcnsImagePlugin.IcnsFile(io.BytesIO(data))
+    for width, height, scale in icns.itersizes():
+        img = icns.getimage((width, height, scale))
+        if img.size == (width * scale, height * scale) and width == height:
+            found.add(width * scale)
+    return [size for size in ICNS_SIZES if size not in found]
+
+
+def _check_output(label: str, kind: str, missing):
+    if missing:
+        print(f"ERROR: {kind} for {label} lacks sizes {missing} when read back")
+        sys.exit(1)
+
+
+def _report_ico(target: Path, sizes):
+    print(f"[OK] Created {target} with {len(sizes)} sizes: {[f'{s}x{s}' for s in sorted(sizes, reverse=True)]}")
+
+
+def _file_digest(path: Path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _fingerprint(config, sources):
+    """Hash of everything an icon set's outputs depend on."""
+    digest = hashlib.sha256()
+    settings = {
+        "pipeline": PIPELINE_VERSION,
+        "pillow": getattr(Image, "__version__", ""),
+        "ico": ICO_SIZES,
+        "icns": ICNS_SIZES,
+        "resample": int(RESAMPLE),
+        "outputs": [str(p) for p in config.get("windows", []) + config.get("macos", [])],
+    }
+    digest.update(json.dumps(settings, sort_keys=True).encode())
+    for size in sorted(sources):
+        digest.update(f"{size}:{sources[size].name}:{_file_digest(sources[size])}".encode())
+    return digest.hexdigest()
+
+
+def _load_manifest(path: Path):
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
 
-def create_icns_from_pngs(png_dir: Path, output_path: Path, base_name: str):
-    """Create ICNS file from multiple PNG sizes."""
-    import tempfile
-    import shutil
 
-    temp_dir = Path(tempfile.mkdtemp())
-    try:
-        iconset_dir = temp_dir / f"{base_name}.iconset"
-        iconset_dir.mkdir()
-
-        size_map = {
-            16: ("icon_16x16.png", "icon_16x16@2x.png"),
-            32: ("icon_32x32.png", "icon_32x32@2x.png"),
-            64: ("icon_64x64.png", "icon_64x64@2x.png"),
-            128: ("icon_128x128.png", "icon_128x128@2x.png"),
-            256: ("icon_256x256.png", "icon_256x256@2x.png"),
-            512: ("icon_512x512.png", "icon_512x512@2x.png"),
-        }
-
-        created_files = []
-        for size in ICNS_SIZES:
-            png_path = png_dir / f"{base_name}_{size}x{size}.png"
-            if png_path.exists():
-                img = Image.open(png_path)
-
-                if size in size_map:
-                    filenames = size_map[size]
-                    target_path = iconset_dir / filenames[0]
-                    img.save(target_path)
-                    created_files.append(target_path)
-
-                    if size * 2 <= 1024:
-                        double_size = size * 2
-                        double_png = png_dir / f"{base_name}_{double_size}x{double_size}.png"
-                        if double_png.exists():
-                            double_img = Image.open(double_png)
-                            target_2x = iconset_dir / filenames[1]
-                            double_img.save(target_2x)
-                            created_files.append(target_2x)
-
-        if not created_files:
-            print(f"Error: No PNG files found for {base_name}")
+def _up_to_date(entry, fingerprint):
+    """Whether a manifest entry matches the sources and every output it recorded is untouched."""
+    if not entry or entry.get("fingerprint") != fingerprint:
+        return False
+    for output, digest in entry.get("outputs", {}).items():
+        path = Path(output)
+        if not path.exists() or _file_digest(path) != digest:
             return False
+    return True
 
-        if sys.platform == 'darwin':
-            import subprocess
 
-            result = subprocess.run(
-                ['iconutil', '-c', 'icns', str(iconset_dir), '-o', str(output_path)],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode != 0:
-                print(f"Error creating ICNS: {result.stderr}")
-                return False
-        else:
-            print(f"Warning: ICNS creation requires macOS iconutil command.")
-            print(f"  Created iconset at {iconset_dir}")
-            print(f"  Run on macOS: iconutil -c icns {iconset_dir} -o {output_path}")
-            return False
+def create_ico_from_pngs(png_dir: Path, output_path: Path, base_name: str):
+    """Create ICO file from multiple PNG sizes."""
+    print(f"  Looking for PNG files in: {png_dir}")
+    print(f"  Base name: {base_name}")
+    sources = _collect_sources(png_dir, base_name)
+    if not sources:
+        _report_missing_sources(png_dir, base_name)
+        return False
+    print(f"  Found {len(sources)} PNG source(s): {sorted(sources.keys())}")
+    images = [_render_size(size, sources[source]) for size, source in _plan_sizes(sources, ICO_SIZES)]
+    data, complete = _encode_ico(images)
+    output_path.write_bytes(data)
+    if not complete:
+        print(f"[WARN] Created {output_path} with only first size due to error")
+        return False
+    _check_output(base_name, "ICO", _missing_ico_sizes(data))
+    _report_ico(output_path, ICO_SIZES)
+    return True
 
-        print(f"[OK] Created {output_path}")
-        return True
-    finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
+
+def create_icns_from_pngs(png_dir: Path, output_path: Path, base_name: str):
+    """Create ICNS file from multiple PNG sizes."""
+    sources = _collect_sources(png_dir, base_name)
+    if not sources:
+        print(f"Error: No PNG files found for {base_name}")
+        return False
+    entries = {size: _png_entry(size, sources[source]) for size, source in _plan_sizes(sources, ICNS_SIZES)}
+    data = _encode_icns(entries)
+    _check_output(base_name, "ICNS", _missing_icns_sizes(data))
+    output_path.write_bytes(data)
+    print(f"[OK] Created {output_path}")
+    return True
+
+
+def _build_sets(pending, jobs: int):
+    """Render every pending set's ICO sizes and ICNS files in a pool; returns dict[label] = outputs."""
+    built = {}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        renders = {}
+        pngs = {}
+        for config, sources, _ in pending:
+            renders[config["label"]] = [
+                pool.submit(_render_size, size, sources[source]) for size, source in _plan_sizes(sources, ICO_SIZES)
+            ]
+            if config.get("macos"):
+                pngs[config["label"]] = {
+                    size: pool.submit(_png_entry, size, sources[source])
+                    for size, source in _plan_sizes(sources, ICNS_SIZES)
+                }
+
+        for config, sources, _ in pending:
+            label = config["label"]
+            outputs = {}
+            data, complete = _encode_ico([future.result() for future in renders[label]])
+            if not complete:
+                print(f"ERROR: Failed to create ICO for {label}")
+                sys.exit(1)
+            _check_output(label, "ICO", _missing_ico_sizes(data))
+            for target in config.get("windows", []):
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(data)
+                if not target.exists():
+                    print(f"ERROR: Icon file was not created: {target}")
+                    sys.exit(1)
+                _report_ico(target, ICO_SIZES)
+                print(f"Verified: {target} exists ({target.stat().st_size} bytes)")
+                outputs[str(target)] = hashlib.sha256(data).hexdigest()
+            if label in pngs:
+                data = _encode_icns({size: future.result() for size, future in pngs[label].items()})
+                _check_output(label, "ICNS", _missing_icns_sizes(data))
+                for target in config["macos"]:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    target.write_bytes(data)
+                    print(f"[OK] Created {target} ({len(data)} bytes)")
+                    outputs[str(target)] = hashlib.sha256(data).hexdigest()
+            built[label] = outputs
+    return built
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Convert PNG icons to ICO and ICNS")
+    parser.add_argument("--force", action="store_true",
+                        help="rebuild every icon set even if its sources are unchanged")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
     script_dir = Path(__file__).resolve().parent
     workspace_root = script_dir.parent
     project_root = workspace_root / "pain-compiler"
+    manifest_path = workspace_root / "target" / "icons" / "manifest.json"
 
     icon_configs = [
         {
@@ -206,6 +360,8 @@ def main():
         },
     ]
 
+    manifest = _load_manifest(manifest_path)
+    pending = []
     for config in icon_configs:
         print(f"\nProcessing {config['label']} icons...")
         linux_dir = config["linux"]
@@ -217,24 +373,29 @@ def main():
             print("ERROR: Skipping this icon set")
             sys.exit(1)
 
-        for target in config.get("windows", []):
-            target.parent.mkdir(parents=True, exist_ok=True)
-            success = create_ico_from_pngs(linux_dir, target, config["base"])
-            if not success:
-                print(f"ERROR: Failed to create {target}")
-                sys.exit(1)
-            if not target.exists():
-                print(f"ERROR: Icon file was not created: {target}")
-                sys.exit(1)
-            print(f"Verified: {target} exists ({target.stat().st_size} bytes)")
-
-        for target in config.get("macos", []):
-            target.parent.mkdir(parents=True, exist_ok=True)
-            create_icns_from_pngs(linux_dir, target, config["base"])
+        sources = _collect_sources(linux_dir, config["base"])
+        if not sources:
+            _report_missing_sources(linux_dir, config["base"])
+            sys.exit(1)
+        print(f"  Found {len(sources)} PNG source(s): {sorted(sources.keys())}")
+        fingerprint = _fingerprint(config, sources)
+        if not args.force and _up_to_date(manifest.get(config["label"]), fingerprint):
+            print(f"[OK] {config['label']} icons are up to date, skipping")
+            continue
+        for size, source in _plan_sizes(sources, sorted(set(ICO_SIZES) | set(ICNS_SIZES))):
+            if size != source:
+                print(f"Info: {config['base']} lacks {size}x{size}, resized from {source}x{source}")
+        pending.append((config, sources, fingerprint))
+
+    if pending:
+        built = _build_sets(pending, max(1, args.jobs))
+        for config, _, fingerprint in pending:
+            manifest[config["label"]] = {"fingerprint": fingerprint, "outputs": built[config["label"]]}
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(json.dumps(manifest, indent=2))
 
     print("\n[OK] Icon conversion complete!")
 
 
 if __name__ == "__main__":
     main()
-